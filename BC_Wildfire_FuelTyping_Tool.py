@@ -1,22 +1,15 @@
 # -*- coding: utf-8 -*-
 __author__ = ['Gregory A. Greene, map.n.trowel@gmail.com']
 
-import os
-import time
 from datetime import datetime
 import PySimpleGUI as sg
 import bcwft2018
-import fiona
+from bcwft_pipeline import output_fields, has_output_fields, run_fuel_typing, available_cpus
 import pandas as pd
 import numpy as np
-import geopandas as gpd
 import ProcessFeatures as pf
-import multiprocessing as mp
-from multiprocessing import current_process, Value, Lock
 from typing import Union
 import traceback
-import logging
-import warnings
 
 coastInteriorToolTip = '''A code indicating that the stand is located in the Coast or Interior Region of the Province.
 The Coast Region is defined as the mainland west of the Cascade and Coast Mountains, including the off-shore
@@ -205,89 +198,6 @@ def valuesValid(inValues: dict,
         return 'ERROR: Unable to assess validity of input data'
 
 
-def read_and_process_features(process_all: bool,
-                              feature_slice: slice,
-                              season: str,
-                              fields_to_extract: list,
-                              gdb_path: str,
-                              feature_class: str,
-                              counter: Value,
-                              lock: Lock) -> gpd.GeoDataFrame:
-    """
-    Function to read data from the feature class, filter the fields, and run the fuel typing algorithm
-    :param process_all: If True, process all features. If false, only process features without "FuelType" values
-    :param feature_slice: A slice representing the rows to process in the VRI dataset
-    :param season: season for fuel typing assignments. Options: "growing", "dormant"
-    :param fields_to_extract: the fields in the VRI dataset that are needed for BCWFT fuel typing
-    :param gdb_path: path to the gdb containing the VRI dataset
-    :param feature_class: name of the VRI feature class
-    :param counter: the shared multiprocessing counter object to track the number of features processed
-    :param lock: the shared multiprocessing lock object
-    :return: a geopandas GeoDataframe object containing the fuel type data for the current feature slice
-    """
-    process_id = current_process().name
-    print(f'\t[{process_id}] Processing chunk: {feature_slice}')
-
-    # Get a geodataframe object of the current VRI feature slice
-    with warnings.catch_warnings():
-        warnings.simplefilter('ignore')
-        slice_gdf = gpd.read_file(gdb_path, layer=feature_class, columns=fields_to_extract, rows=feature_slice)
-
-    # Ensure all values in date columns are datetime objects
-    slice_gdf['EARLIEST_NONLOGGING_DIST_DATE'] = pd.to_datetime(slice_gdf['EARLIEST_NONLOGGING_DIST_DATE'],
-                                                                errors='coerce')
-    slice_gdf['HARVEST_DATE'] = pd.to_datetime(slice_gdf['HARVEST_DATE'],
-                                               errors='coerce')
-
-    # Reorder the columns
-    slice_gdf = slice_gdf[fields_to_extract]
-
-    # Instantiate the bcwft2018 FuelTyping class
-    bcwft = bcwft2018.FuelTyping()
-
-    # Run fuel typing
-    if process_all:
-        # Add the BCWFT fields to the geodataframe
-        slice_gdf[['BCWFT_rowRef', 'FuelType', 'FT_Modifier']] = None
-        # Get the fuel types
-        for index, row in slice_gdf.iterrows():
-            try:
-                result = bcwft.getFuelType(season, *row[:32])
-                if not isinstance(result, type(None)):
-                    slice_gdf.at[index, 'BCWFT_rowRef'] = result[0]
-                    slice_gdf.at[index, 'FuelType'] = result[1]
-                    slice_gdf.at[index, 'FT_Modifier'] = result[2]
-                else:
-                    slice_gdf.at[index, 'BCWFT_rowRef'] = None
-                    slice_gdf.at[index, 'FuelType'] = 'NoneTypeReturn-ERROR'
-                    slice_gdf.at[index, 'FT_Modifier'] = None
-            except Exception as err:
-                # Assign FuelType as error
-                slice_gdf.at[index, 'FuelType'] = 'FuelTyping-Error'
-                # Print error messages
-                print(row, feature_slice)
-                print(f'An exception occurred: {err}')
-                print(logging.error(traceback.format_exc()))
-                # Allow the code to continue
-                pass
-    else:
-        # Get a subset of slice_gdf that contains no data values
-        partial_gdf = slice_gdf[slice_gdf['FuelType'].isna()]
-        # Get the fuel types
-        for index, row in partial_gdf.iterrows():
-            (partial_gdf.at[index, 'BCWFT_rowRef'],
-             partial_gdf.at[index, 'FuelType'],
-             partial_gdf.at[index, 'FT_Modifier']) = bcwft.getFuelType(season, *row[:32])
-        # Add the new data to the geodataframe
-        slice_gdf.update(partial_gdf)
-
-    # Update the counter in a thread-safe manner
-    with lock:
-        counter.value += len(slice_gdf)
-
-    return slice_gdf
-
-
 def main():
     # Remove stale tasks and set initial values for tool functions
     # sg.theme('DarkAmber')   # Add a touch of color if desired (other themes available)
@@ -455,15 +365,18 @@ def main():
         [sg.Listbox(ftList, size=(50, 10), key='inVRI', enable_events=True)],
         [sg.T('')],
         [sg.T('Select Season:')],
-        [sg.Combo(['Trees Growing -or- Standing Dead Grass', 'Trees Dormant -or- Matted Grass'], size=(50, 1),
+        [sg.Combo(['Trees Growing -or- Standing Dead Grass', 'Trees Dormant -or- Matted Grass',
+                   'Both Seasons (Growing and Dormant)'], size=(50, 1),
                   key='vriSeason',
                   background_color='white', enable_events=True, disabled=True)],
         [sg.T('')],
         [sg.T('Modelling Options:'),
          sg.Radio('Process Entire VRI Dataset', "radioProcessData", key='doAllData', default=True),
          sg.Radio('Process Unclassified Data Only', "radioProcessData", key='doNullData')],
-        [sg.T('Number of Processors for Multiprocessing:'),
-         sg.In('1', size=(10, 1), key='num_processors', background_color='white', enable_events=True)],
+        [sg.T('Number of Processors for Multiprocessing ("auto" to pick from the dataset):'),
+         sg.In('auto', size=(10, 1), key='num_processors', background_color='white', enable_events=True)],
+        [sg.T('Number of Future Years to Project Fuel Types to:'),
+         sg.In('0', size=(10, 1), key='projection_years', background_color='white', enable_events=True)],
         [sg.Button('Model Fuel Types', disabled=True)],
         [sg.T('')],
         [sg.T('')],
@@ -602,7 +515,9 @@ def main():
                 window['vriSeason'].update(disabled=True)
 
         if event == 'vriSeason':
-            if 'Growing' in values['vriSeason']:
+            if 'Both' in values['vriSeason']:
+                season = 'both'
+            elif 'Growing' in values['vriSeason']:
                 season = 'growing'
             else:
                 season = 'dormant'
@@ -610,102 +525,48 @@ def main():
             window['Model Fuel Types'].update(disabled=False)
 
         if event == 'Model Fuel Types':
-            if not values['num_processors'] != '':
-                try:
-                    int(values['num_processors'])
-                except Exception:
-                    sg.popup('Number of Processors must be an integer value')
-                if int(values['num_processors']) > mp.cpu_count:
-                    window['inVRI'].update(f'{mp.cpu_count}')
+            num_processors = values['num_processors'].strip().lower()
+            if num_processors not in ['', 'auto'] and not (num_processors.isdigit() and int(num_processors) > 0):
+                sg.popup('Number of Processors must be a positive integer value, or "auto"')
+            elif not (values['projection_years'].strip() or '0').isdigit():
+                sg.popup('Number of Future Years must be a non-negative integer value')
             else:
                 try:
-                    # Start timer
-                    start = time.time()
-
                     # Get the necessary input parameters
                     gdb_path = values['inVRI_Source']
                     feature_class = values['inVRI'][0]
-                    output_feature_class = os.path.join(gdb_path, feature_class + '_FuelTypes')
-                    output_gpkg = os.path.join(os.path.dirname(gdb_path), feature_class + '_FuelTypes.gpkg')
-                    num_processors = int(values['num_processors'])
-
-                    # Get the number of features in the VRI dataset
-                    with fiona.open(fp=gdb_path, layer=feature_class) as src:
-                        total_features = len(src)
-                        schema = src.schema
-                        columns = list(schema['properties'].keys())
-
-                    if values['doAllData']:
-                        process_all = True
-                        valid_data = True
-                        fields_to_extract = fldList[3:]
-                    elif values['doNullData']:
-                        if any(column in columns for column in fldList[:3]):
-                            process_all = False
-                            valid_data = True
-                            fields_to_extract = fldList
-                        else:
-                            valid_data = False
-
-                    if valid_data:
-                        # Set up the feature slices for the dataset
-                        slice_size = 5000
-                        feature_slices = [slice(i, min(i + slice_size, total_features)) for i in
-                                          range(0, total_features, slice_size)]
-
-                        # Initialize the counter and lock
-                        counter = mp.Manager().Value('i', 0)  # use Manager to create a shared counter
-                        lock = mp.Manager().Lock()  # use Manager to create a shared lock
-
-                        # Add input parameters to args
-                        args = [(process_all, feature_slice, season, fields_to_extract + ['geometry'],
-                                 gdb_path, feature_class, counter, lock)
-                                for feature_slice in feature_slices]
-
+                    if num_processors in ['', 'auto']:
+                        # Pick the number of processors and the chunk sizes from the dataset (see plan_chunks)
+                        num_processors = None
+                    elif int(num_processors) > available_cpus():
+                        num_processors = available_cpus()
+                        window['num_processors'].update(f'{num_processors}')
+                    else:
+                        num_processors = int(num_processors)
+                    projection_years = int(values['projection_years'].strip() or 0)
+
+                    def show_progress(processed, total):
+                        window['featCountProg'].update(f'{total - processed} Features Remaining')
+                        window['progBar'].update(BAR_MAX * processed / total)
+                        window['progPcnt'].update(f'{round(100 * processed / total, 1)}%')
+                        window.refresh()
+
+                    if values['doNullData'] and not has_output_fields(gdb_path, feature_class, season):
+                        sg.popup(f'None of the necessary Fuel Typing fields\n{output_fields(season)}\n'
+                                 'are in the dataset.\n'
+                                 'You must process the entire dataset.')
+                        window['doAllData'].update(True)
+                    else:
                         print('Reading the VRI Dataset and Assigning Fuel Types')
-                        with mp.Pool(num_processors) as pool:
-                            result_async = pool.starmap_async(read_and_process_features, args)
-
-                            # Periodically print the counter value while workers are running
-                            while not result_async.ready():
-                                time.sleep(1)  # Wait for 1 second between updates
-                                BAR_MAX = total_features
-                                REMAINING = total_features
-                                # Track progress
-                                PROGRESS = ((BAR_MAX - REMAINING) / BAR_MAX) + (counter.value / REMAINING)
-                                window['featCountProg'].update(f'{REMAINING - counter.value} Features Remaining')
-                                window['progBar'].update(PROGRESS)
-                                window['progPcnt'].update(f'{round(100 * PROGRESS, 1)}%')
-
-                            # Wait for all workers to complete
-                            geo_dataframes = result_async.get()
-
-                        merged_gdf = gpd.GeoDataFrame(pd.concat(geo_dataframes, ignore_index=True))
-
-                        with fiona.open(gdb_path, layer=feature_class) as src:
-                            crs = src.crs
-                        merged_gdf.crs = crs
-
-                        try:
-                            merged_gdf.to_file(output_feature_class, driver='FileGDB')
-                        except Exception:
-                            merged_gdf.to_file(output_gpkg, driver='GPKG')
-
-                        # DELETE TEMPORARY DATA
-                        del BAR_MAX, REMAINING, PROGRESS
-
-                        # End timer
-                        end = time.time()
+                        stats = run_fuel_typing(gdb_path, feature_class, season, num_processors, None,
+                                                process_all=bool(values['doAllData']),
+                                                projection_years=projection_years, progress=show_progress)
                         print(f'Fuel typing finished at: {datetime.now().strftime("%H:%M:%S")}')
 
                         # Print elapsed time
-                        total_time = round((end - start) / 60, 3)
+                        total_time = round(stats.seconds / 60, 3)
                         print(f'Fuel typing completed in: {total_time} minutes')
                         sg.popup(f'Fuel typing complete!\nFinished in: {total_time} minutes')
-                    else:
-                        sg.popup(f'None of the necessary Fuel Typing fields\n{fldList[:3]}\nare in the dataset.\n'
-                                 'You must process the entire dataset.')
-                        window['doAllData'].update(True)
 
                 except Exception:
                     print(traceback.format_exc())
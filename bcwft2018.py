@@ -6,17 +6,218 @@ Created on Wed Jan 25 12:15:00 2022
 """
 __author__ = ['Gregory A. Greene, map.n.trowel@gmail.com']
 
-import inspect
-import pandas as pd
+import sys
+import copy
+import time
+import warnings
+import threading
+import numpy as np
 from numpy import nan, datetime64
 from datetime import datetime as dt
+from typing import NamedTuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import bcwft_tree
+import bcwft_table
+
+# pandas, pyarrow and Numba are optional, and only imported when they are used: pandas when a batch has dates
+# NumPy cannot parse, pyarrow when a pyarrow batch is classified, and Numba when the flat node table is first walked.
+# The scalar classifier and the NumPy batch engine import with NumPy alone.
+
+
+# Input fields of FuelTyping.classify_frame, grouped by how they are read
+_CODE_FIELDS = ['COAST_INTERIOR_CD', 'BCLCS_LEVEL_1', 'BCLCS_LEVEL_2', 'BCLCS_LEVEL_3', 'BCLCS_LEVEL_4',
+                'BCLCS_LEVEL_5', 'BEC_ZONE_CODE', 'BEC_SUBZONE', 'EARLIEST_NONLOGGING_DIST_TYPE',
+                'INVENTORY_STANDARD_CD', 'LAND_COVER_CLASS_CD_1', 'SPECIES_CD_1', 'SPECIES_CD_2', 'SPECIES_CD_3',
+                'SPECIES_CD_4', 'SPECIES_CD_5', 'SPECIES_CD_6']
+_NUMBER_FIELDS = ['CROWN_CLOSURE', 'PROJ_HEIGHT_1', 'PROJ_AGE_1', 'VRI_LIVE_STEMS_PER_HA', 'VRI_DEAD_STEMS_PER_HA',
+                  'STAND_PERCENTAGE_DEAD', 'NON_PRODUCTIVE_CD', 'SPECIES_PCT_1', 'SPECIES_PCT_2', 'SPECIES_PCT_3',
+                  'SPECIES_PCT_4', 'SPECIES_PCT_5', 'SPECIES_PCT_6']
+_DATE_FIELDS = ['EARLIEST_NONLOGGING_DIST_DATE', 'HARVEST_DATE']
+_SPECIES_FIELDS = [f'SPECIES_CD_{i}' for i in range(1, 7)]
+
+# Membership bits of StandBatch.membership (also written to bcwft_tree.py by bcwft_codegen.py)
+_CONIFER_BITS = (1 << 0, 1 << 1, 1 << 2, 1 << 3, 1 << 4, 1 << 5)  # SPECIES_CD_1 to SPECIES_CD_6 is a conifer
+_DRY_SUBZONE = 1 << 6
+_WET_SUBZONE = 1 << 7
+_DRY_ZONE = 1 << 8
+_BOREAL_ZONE = 1 << 9
+
+# Conifer species groups tested by the dominant conifer checks of the decision tree (see _dom_conifers)
+_DOM_CONIFER_GROUPS = bcwft_tree.DOM_CONIFER_GROUPS
+
+# Fuel type and growing season rule ID of each rule ID, indexed by the leaves returned by the decision tree
+_FUEL_TYPES = np.asarray(bcwft_tree.FUEL_TYPES, dtype=object)
+_GROWING_RULES = np.asarray(bcwft_tree.GROWING_RULES, dtype='int16')
+
+# Columns of the flat node table of the decision tree (see bcwft_tree.NODES)
+_FLAT_NODES = np.asarray(bcwft_tree.NODES, dtype='float64')
+_NODE_OP, _NODE_FEATURE, _NODE_YES, _NODE_NO, _NODE_NULL = _FLAT_NODES[:, [0, 1, 3, 4, 5]].T.astype('int32')
+_NODE_VALUE = np.ascontiguousarray(_FLAT_NODES[:, 2])
+
+# Fuel type modifier feature and value of each rule ID of the flat node table (see bcwft_tree.MODIFIERS)
+_MODIFIER_FEATURE = np.full(len(_FUEL_TYPES), -1, dtype='int32')
+_MODIFIER_VALUE = np.full(len(_FUEL_TYPES), nan)
+_MODIFIER_FEATURE[list(bcwft_tree.MODIFIERS)] = [feature for feature, value in bcwft_tree.MODIFIERS.values()]
+_MODIFIER_VALUE[list(bcwft_tree.MODIFIERS)] = [value for feature, value in bcwft_tree.MODIFIERS.values()]
+
+# Dictionary of the FuelType results of pyarrow batches, indexed by rule ID, with the error fuel types appended
+# (rule ID 0 is the leaf of stands that reached no leaf)
+_ARROW_FUEL_TYPES = ['NoneTypeReturn-ERROR'] + list(bcwft_tree.FUEL_TYPES[1:]) + ['FuelTyping-Error']
+
+# Fuel types of the Projection rule IDs, where -1 (rejected inputs) indexes the last fuel type
+_PROJECTION_FUEL_TYPES = np.asarray(_ARROW_FUEL_TYPES, dtype=object)
+
+# Distinct fuel types counted by ensembles, and the index of the fuel type of each Projection rule ID
+_ENSEMBLE_FUEL_TYPES, _ENSEMBLE_FUEL_TYPE_INDEX = np.unique(_PROJECTION_FUEL_TYPES.astype(str), return_inverse=True)
+_ENSEMBLE_FUEL_TYPES = _ENSEMBLE_FUEL_TYPES.astype(object)
+
+
+class StandRecord(NamedTuple):
+    """
+    Immutable record of the inputs and derived bcwft variables of a stand
+    """
+    season: str
+    COAST_INTERIOR_CD: str
+    BCLCS_LEVEL_1: str
+    BCLCS_LEVEL_2: str
+    BCLCS_LEVEL_3: str
+    BCLCS_LEVEL_4: str
+    BCLCS_LEVEL_5: str
+    BEC_ZONE_CODE: str
+    BEC_SUBZONE: str
+    EARLIEST_NONLOGGING_DIST_TYPE: str
+    EARLIEST_NONLOGGING_DIST_DATE: dt
+    HARVEST_DATE: dt
+    CROWN_CLOSURE: int
+    PROJ_HEIGHT_1: float
+    PROJ_AGE_1: int
+    VRI_LIVE_STEMS_PER_HA: int
+    VRI_DEAD_STEMS_PER_HA: int
+    STAND_PERCENTAGE_DEAD: int
+    INVENTORY_STANDARD_CD: str
+    NON_PRODUCTIVE_CD: str
+    LAND_COVER_CLASS_CD_1: str
+    SPECIES_CD_1: str
+    SPECIES_PCT_1: float
+    SPECIES_CD_2: str
+    SPECIES_PCT_2: float
+    SPECIES_CD_3: str
+    SPECIES_PCT_3: float
+    SPECIES_CD_4: str
+    SPECIES_PCT_4: float
+    SPECIES_CD_5: str
+    SPECIES_PCT_5: float
+    SPECIES_CD_6: str
+    SPECIES_PCT_6: float
+    # Derived bcwft variables (see FuelTyping.deriveVariables)
+    is_vegetated: bool = None
+    is_forested: bool = None
+    is_logged: bool = None
+    is_burned: bool = None
+    harv_lag: int = None
+    dist_lag: int = None
+    pct_cnfr: float = None
+    dry_wet: str = None
+    stocking: float = None
+    dom_conifers: dict = None
+
+
+# Number of input fields of a StandRecord (the season and the fldList[3:] fields), and the marker for NaN values
+# in result cache keys
+_N_INPUTS = StandRecord._fields.index('is_vegetated')
+_NAN_KEY = 'NaN'
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of the FuelTyping result cache
+    """
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class ThreadInfo(NamedTuple):
+    """
+    Throughput of a thread of a multi-threaded FuelTyping.classify_frame call
+    """
+    thread: str
+    chunks: int
+    stands: int
+    seconds: float
+    stands_per_second: float
+
+
+# Smallest number of stands in the chunks of a multi-threaded classify_frame call
+_THREAD_CHUNK_SIZE = 10000
+
+
+class Projection(NamedTuple):
+    """
+    Fuel types of a batch of stands projected across years (see FuelTyping.project_frame)
+    """
+    years: np.ndarray  # the projected years
+    rules: np.ndarray  # int16 year-by-stand matrix of rule IDs (0 if no leaf was reached, -1 if inputs were rejected)
+    modifiers: np.ndarray  # year-by-stand matrix of fuel type modifiers (NaN if none)
+
+    def fuel_types(self) -> np.ndarray:
+        """
+        Function to get the year-by-stand matrix of fuel types ("FuelTyping-Error" if the inputs were rejected,
+        "NoneTypeReturn-ERROR" if no leaf was reached).
+        :return: an object array
+        """
+        return _PROJECTION_FUEL_TYPES[self.rules]
+
+
+class InputError(NamedTuple):
+    """
+    Error distribution of an input field of an ensemble (see FuelTyping.ensemble_frame)
+    """
+    scale: float  # standard deviation of normal errors, or half-width of uniform errors
+    relative: bool = False  # if True, the scale is a fraction of each value instead of the field's units
+    distribution: str = 'normal'  # "normal" or "uniform"
+
+
+class Ensemble(NamedTuple):
+    """
+    Fuel type frequencies of the replicates of a batch of stands (see FuelTyping.ensemble_frame)
+    """
+    fuel_types: np.ndarray  # the fuel types counted, labelling the columns of counts
+    counts: np.ndarray  # int32 stand-by-fuel type matrix of the number of replicates getting each fuel type
+    modal: np.ndarray  # the most frequent fuel type of each stand (ties go to the first in fuel_types)
+    confidence: np.ndarray  # the share of the replicates of each stand getting its modal fuel type
+
+
+# Error distributions of the ensemble inputs used by default (relative errors of the heights, ages and stems/ha,
+# and errors of 10 percentage points in crown closure). Pass the error model of the inventory to ensemble_frame to
+# override them.
+DEFAULT_INPUT_ERRORS = {'PROJ_HEIGHT_1': InputError(0.1, relative=True),
+                        'PROJ_AGE_1': InputError(0.1, relative=True),
+                        'CROWN_CLOSURE': InputError(10.0),
+                        'VRI_LIVE_STEMS_PER_HA': InputError(0.2, relative=True),
+                        'VRI_DEAD_STEMS_PER_HA': InputError(0.2, relative=True)}
+
+# Input fields an ensemble can perturb, and their upper bounds (the lower bound is 0)
+_ENSEMBLE_FIELDS = {'CROWN_CLOSURE': 100.0, 'PROJ_HEIGHT_1': np.inf, 'PROJ_AGE_1': np.inf,
+                    'VRI_LIVE_STEMS_PER_HA': np.inf, 'VRI_DEAD_STEMS_PER_HA': np.inf, 'STAND_PERCENTAGE_DEAD': 100.0}
+
+# Largest number of replicates classified at once by ensemble_frame
+_ENSEMBLE_CHUNK_SIZE = 500000
 
 
 class FuelTyping:
     """
     Class for the BC Wildfire Fuel Typing Algorithm
     """
-    def __init__(self):
+    def __init__(self, cache_size: int = 0):
+        """
+        :param cache_size: maximum number of results kept in the least-recently-used cache of classifyStand and
+            getFuelType, so repeated attribute combinations skip the decision tree (0 disables the cache)
+        """
         # Instantiate VRI Variables
         self.COAST_INTERIOR_CD = None
         self.BCLCS_LEVEL_1 = None
@@ -121,74 +322,88 @@ class FuelTyping:
 
         self.borealBECzonse = ['BBWS', 'SWB']  # LIST OF BOREAL BEC ZONES
 
-    def verifyInputs(self):
-        if not isinstance(self.season, str):
+        ## Instantiate the result cache
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cacheLock = threading.Lock()
+        self._cacheHits = 0
+        self._cacheMisses = 0
+        self._cacheEvictions = 0
+
+    def verifyInputs(self, stand: StandRecord = None) -> None:
+        """
+        Function to verify the data types of the stand inputs.
+        :param stand: the stand record to verify (the FuelTyping instance attributes are verified if None)
+        :return: None
+        """
+        s = self if stand is None else stand
+        if not isinstance(s.season, str):
             raise TypeError('The "season" parameter must be string data type.')
-        elif self.season not in ['growing', 'dormant']:
-            raise ValueError('The "season" parameter must be either "growing" or "dormant".')
-        if not isinstance(self.COAST_INTERIOR_CD, (str, type(None))):
+        elif s.season not in ['growing', 'dormant', 'both']:
+            raise ValueError('The "season" parameter must be either "growing", "dormant" or "both".')
+        if not isinstance(s.COAST_INTERIOR_CD, (str, type(None))):
             raise TypeError('The "COAST_INTERIOR_CD" parameter must be string data type.')
-        if not isinstance(self.BCLCS_LEVEL_1, (str, type(None), type(nan))):
+        if not isinstance(s.BCLCS_LEVEL_1, (str, type(None), type(nan))):
             raise TypeError('The "BCLCS_LEVEL_1" parameter must be string data type.')
-        if not isinstance(self.BCLCS_LEVEL_2, (str, type(None), type(nan))):
+        if not isinstance(s.BCLCS_LEVEL_2, (str, type(None), type(nan))):
             raise TypeError('The "BCLCS_LEVEL_2" parameter must be string data type.')
-        if not isinstance(self.BCLCS_LEVEL_3, (str, type(None), type(nan))):
+        if not isinstance(s.BCLCS_LEVEL_3, (str, type(None), type(nan))):
             raise TypeError('The "BCLCS_LEVEL_3" parameter must be string data type.')
-        if not isinstance(self.BCLCS_LEVEL_4, (str, type(None), type(nan))):
+        if not isinstance(s.BCLCS_LEVEL_4, (str, type(None), type(nan))):
             raise TypeError('The "BCLCS_LEVEL_4" parameter must be string data type.')
-        if not isinstance(self.BCLCS_LEVEL_5, (str, type(None), type(nan))):
+        if not isinstance(s.BCLCS_LEVEL_5, (str, type(None), type(nan))):
             raise TypeError('The "BCLCS_LEVEL_5" parameter must be string data type.')
-        if not isinstance(self.BEC_ZONE_CODE, str):
+        if not isinstance(s.BEC_ZONE_CODE, str):
             raise TypeError('The "BEC_ZONE_CODE" parameter must be string data type.')
-        if not isinstance(self.BEC_SUBZONE, str):
+        if not isinstance(s.BEC_SUBZONE, str):
             raise TypeError('The "BEC_SUBZONE" parameter must be string data type.')
-        if not isinstance(self.EARLIEST_NONLOGGING_DIST_TYPE, (str, type(None))):
+        if not isinstance(s.EARLIEST_NONLOGGING_DIST_TYPE, (str, type(None))):
             raise TypeError('The "EARLIEST_NONLOGGING_DIST_TYPE" parameter must be string data type.')
-        if not isinstance(self.EARLIEST_NONLOGGING_DIST_DATE, (dt, type(None))):
+        if not isinstance(s.EARLIEST_NONLOGGING_DIST_DATE, (dt, type(None))):
             raise TypeError('The "EARLIEST_NONLOGGING_DIST_DATE" parameter must be datetime data type.')
-        if not isinstance(self.HARVEST_DATE, (dt, type(None))):
+        if not isinstance(s.HARVEST_DATE, (dt, type(None))):
             raise TypeError('The "HARVEST_DATE" parameter must be datetime data type.')
-        if not isinstance(self.CROWN_CLOSURE, (int, float, type(None))):
+        if not isinstance(s.CROWN_CLOSURE, (int, float, type(None))):
             raise TypeError('The "CROWN_CLOSURE" parameter must be int or float data type.')
-        if not isinstance(self.PROJ_HEIGHT_1, (float, type(None))):
+        if not isinstance(s.PROJ_HEIGHT_1, (float, type(None))):
             raise TypeError('The "PROJ_HEIGHT_1" parameter must be float data type.')
-        if not isinstance(self.PROJ_AGE_1, (int, float, type(None))):
+        if not isinstance(s.PROJ_AGE_1, (int, float, type(None))):
             raise TypeError('The "PROJ_AGE_1" parameter must be int or float data type.')
-        if not isinstance(self.VRI_LIVE_STEMS_PER_HA, (int, float, type(None))):
+        if not isinstance(s.VRI_LIVE_STEMS_PER_HA, (int, float, type(None))):
             raise TypeError('The "VRI_LIVE_STEMS_PER_HA" parameter must be int or float data type.')
-        if not isinstance(self.VRI_DEAD_STEMS_PER_HA, (int, float, type(None))):
+        if not isinstance(s.VRI_DEAD_STEMS_PER_HA, (int, float, type(None))):
             raise TypeError('The "VRI_DEAD_STEMS_PER_HA" parameter must be int or float data type.')
-        if not isinstance(self.STAND_PERCENTAGE_DEAD, (int, float, type(None))):
+        if not isinstance(s.STAND_PERCENTAGE_DEAD, (int, float, type(None))):
             raise TypeError('The "STAND_PERCENTAGE_DEAD" parameter must be int or float data type.')
-        if not isinstance(self.INVENTORY_STANDARD_CD, (str, type(None), type(nan))):
+        if not isinstance(s.INVENTORY_STANDARD_CD, (str, type(None), type(nan))):
             raise TypeError('The "INVENTORY_STANDARD_CD" parameter must be string data type.')
-        if not isinstance(self.NON_PRODUCTIVE_CD, (int, type(None), type(nan))):
+        if not isinstance(s.NON_PRODUCTIVE_CD, (int, type(None), type(nan))):
             raise TypeError('The "NON_PRODUCTIVE_CD" parameter must be integer data type.')
-        if not isinstance(self.LAND_COVER_CLASS_CD_1, (str, type(None), type(nan))):
+        if not isinstance(s.LAND_COVER_CLASS_CD_1, (str, type(None), type(nan))):
             raise TypeError('The "LAND_COVER_CLASS_CD_1" parameter must be string data type.')
-        if not isinstance(self.SPECIES_CD_1, (str, type(None))):
+        if not isinstance(s.SPECIES_CD_1, (str, type(None))):
             raise TypeError('The "SPECIES_CD_1" parameter must be a string data type.')
-        if not isinstance(self.SPECIES_PCT_1, (int, float, type(None))):
+        if not isinstance(s.SPECIES_PCT_1, (int, float, type(None))):
             raise TypeError('The "SPECIES_PCT_1" parameter must be int or float data type.')
-        if not isinstance(self.SPECIES_CD_2, (str, type(None))):
+        if not isinstance(s.SPECIES_CD_2, (str, type(None))):
             raise TypeError('The "SPECIES_CD_2" parameter must be a string data type.')
-        if not isinstance(self.SPECIES_PCT_2, (int, float, type(None))):
+        if not isinstance(s.SPECIES_PCT_2, (int, float, type(None))):
             raise TypeError('The "SPECIES_PCT_2" parameter must be int or float data type.')
-        if not isinstance(self.SPECIES_CD_3, (str, type(None))):
+        if not isinstance(s.SPECIES_CD_3, (str, type(None))):
             raise TypeError('The "SPECIES_CD_3" parameter must be string data type.')
-        if not isinstance(self.SPECIES_PCT_3, (int, float, type(None))):
+        if not isinstance(s.SPECIES_PCT_3, (int, float, type(None))):
             raise TypeError('The "SPECIES_PCT_3" parameter must be int or float data type.')
-        if not isinstance(self.SPECIES_CD_4, (str, type(None))):
+        if not isinstance(s.SPECIES_CD_4, (str, type(None))):
             raise TypeError('The "SPECIES_CD_4" parameter must be string data type.')
-        if not isinstance(self.SPECIES_PCT_4, (int, float, (type(None)))):
+        if not isinstance(s.SPECIES_PCT_4, (int, float, (type(None)))):
             raise TypeError('The "SPECIES_PCT_4" parameter must be int or float data type.')
-        if not isinstance(self.SPECIES_CD_5, (str, (type(None)))):
+        if not isinstance(s.SPECIES_CD_5, (str, (type(None)))):
             raise TypeError('The "SPECIES_CD_5" parameter must be string data type.')
-        if not isinstance(self.SPECIES_PCT_5, (int, float, type(None))):
+        if not isinstance(s.SPECIES_PCT_5, (int, float, type(None))):
             raise TypeError('The "SPECIES_PCT_5" parameter must be int or float data type.')
-        if not isinstance(self.SPECIES_CD_6, (str, type(None))):
+        if not isinstance(s.SPECIES_CD_6, (str, type(None))):
             raise TypeError('The "SPECIES_CD_6" parameter must be string data type.')
-        if not isinstance(self.SPECIES_PCT_6, (int, float, type(None))):
+        if not isinstance(s.SPECIES_PCT_6, (int, float, type(None))):
             raise TypeError('The "SPECIES_PCT_6" parameter must be int or float data type.')
 
         return
@@ -198,12 +413,7 @@ class FuelTyping:
         Function to check if the area is vegetated.
         :return: None
         """
-        if self.BCLCS_LEVEL_1 == 'V':
-            self.is_vegetated = True
-        elif self.BCLCS_LEVEL_1 == 'N':
-            self.is_vegetated = False
-        else:
-            self.is_vegetated = None
+        self.is_vegetated = _is_vegetated(self.BCLCS_LEVEL_1)
         return
 
     def isForested(self) -> None:
@@ -211,12 +421,7 @@ class FuelTyping:
         Function to check if area is forested (has >=10% crown closure).
         :return: None
         """
-        if self.BCLCS_LEVEL_2 == 'T':
-            self.is_forested = True
-        elif self.BCLCS_LEVEL_2 == 'N':
-            self.is_forested = False
-        else:
-            self.is_forested = None
+        self.is_forested = _is_forested(self.BCLCS_LEVEL_2)
         return
 
     def isLogged(self) -> None:
@@ -224,10 +429,7 @@ class FuelTyping:
         Function to check if the area is logged.
         :return: None
         """
-        if self.HARVEST_DATE is not None:
-            self.is_logged = True
-        else:
-            self.is_logged = False
+        self.is_logged = _is_logged(self.HARVEST_DATE)
         return
 
     def isBurned(self) -> None:
@@ -235,11 +437,7 @@ class FuelTyping:
         Function to check if the area has been burned.
         :return: None
         """
-        ## Determine if the polygon is burned
-        if self.EARLIEST_NONLOGGING_DIST_TYPE in ['B', 'BE', 'BG', 'BW', 'BR', 'NB']:
-            self.is_burned = True
-        else:
-            self.is_burned = False
+        self.is_burned = _is_burned(self.EARLIEST_NONLOGGING_DIST_TYPE)
         return
 
     def getHarvLag(self) -> None:
@@ -247,22 +445,9 @@ class FuelTyping:
         Function to get the number of years since the area was harvested.
         :return: None
         """
-        # Get the current year
-        currentYear = dt.now().year
         if isinstance(self.HARVEST_DATE, str):
-            self.HARVEST_DATE = self.HARVEST_DATE.split('+')[0]
-            self.HARVEST_DATE = pd.to_datetime(self.HARVEST_DATE,
-                                               errors='coerce')
-        if self.HARVEST_DATE is not None:
-            if self.HARVEST_DATE.year > currentYear:
-                self.harv_lag = 0
-            else:
-                # Calculate difference between harvest date and current year
-                self.harv_lag = currentYear - pd.to_datetime(self.HARVEST_DATE, format='%Y-%m-%d').year
-        else:
-            self.harv_lag = None
-        del currentYear
-
+            self.HARVEST_DATE = _parse_date(self.HARVEST_DATE)
+        self.harv_lag = _years_since(self.HARVEST_DATE, dt.now().year)
         return
 
     def getDistLag(self) -> None:
@@ -270,20 +455,9 @@ class FuelTyping:
         Function to get the number of years since the area was last disturbed (non harvest).
         :return: None
         """
-        ## Determine number of years since burn
-        currentYear = dt.now().year
         if isinstance(self.EARLIEST_NONLOGGING_DIST_DATE, str):
-            self.EARLIEST_NONLOGGING_DIST_DATE = self.EARLIEST_NONLOGGING_DIST_DATE.split('+')[0]
-            self.EARLIEST_NONLOGGING_DIST_DATE = pd.to_datetime(self.EARLIEST_NONLOGGING_DIST_DATE,
-                                                                errors='coerce')
-        if self.EARLIEST_NONLOGGING_DIST_DATE is not None:
-            if self.EARLIEST_NONLOGGING_DIST_DATE.year > currentYear:
-                self.dist_lag = 0
-            else:
-                self.dist_lag = currentYear - self.EARLIEST_NONLOGGING_DIST_DATE.year
-        else:
-            self.dist_lag = None
-
+            self.EARLIEST_NONLOGGING_DIST_DATE = _parse_date(self.EARLIEST_NONLOGGING_DIST_DATE)
+        self.dist_lag = _years_since(self.EARLIEST_NONLOGGING_DIST_DATE, dt.now().year)
         return
 
     def getPrcntConifer(self) -> None:
@@ -291,35 +465,7 @@ class FuelTyping:
         Function to calculate tbe percentage of conifer trees in forested areas.
         :return: None
         """
-        # Create pandas DataFrame if inData isn't one
-        pct_cnfr = 0
-        # If species code is a conifer, add its percentage to sum
-        if (self.SPECIES_CD_1 is not None) and (type(self.SPECIES_PCT_1) in (int, float, complex)) and (
-                self.SPECIES_CD_1 in self.coniferList):
-            pct_cnfr += self.SPECIES_PCT_1
-        if (self.SPECIES_CD_2 is not None) and (type(self.SPECIES_PCT_2) in (int, float, complex)) and (
-                self.SPECIES_CD_2 in self.coniferList):
-            pct_cnfr += self.SPECIES_PCT_2
-        if (self.SPECIES_CD_3 is not None) and (type(self.SPECIES_PCT_3) in (int, float, complex)) and (
-                self.SPECIES_CD_3 in self.coniferList):
-            pct_cnfr += self.SPECIES_PCT_3
-        if (self.SPECIES_CD_4 is not None) and (type(self.SPECIES_PCT_4) in (int, float, complex)) and (
-                self.SPECIES_CD_4 in self.coniferList):
-            pct_cnfr += self.SPECIES_PCT_4
-        if (self.SPECIES_CD_5 is not None) and (type(self.SPECIES_PCT_5) in (int, float, complex)) and (
-                self.SPECIES_CD_5 in self.coniferList):
-            pct_cnfr += self.SPECIES_PCT_5
-        if (self.SPECIES_CD_6 is not None) and (type(self.SPECIES_PCT_6) in (int, float, complex)) and (
-                self.SPECIES_CD_6 in self.coniferList):
-            pct_cnfr += self.SPECIES_PCT_6
-
-        # Change pct_cnfr to 100% if it evaluates to >100%
-        if pct_cnfr > 100:
-            pct_cnfr = 100
-
-        # Assign final value to self.pct_cnfr
-        self.pct_cnfr = pct_cnfr
-
+        self.pct_cnfr = _prcnt_conifer(self, self.coniferList)
         return
 
     def getDryWet(self) -> None:
@@ -327,18 +473,7 @@ class FuelTyping:
         Function to check if BEC subzone is dry or wet
         :return: None
         """
-        # Create dry/wet dictionary
-        dryWet = {
-            'd': 'dry',
-            'x': 'dry',
-            'm': 'wet',
-            'w': 'wet',
-            'v': 'wet',
-            'u': 'undifferentiated'}
-
-        # Lookup first letter of subzone and return if dry or wet
-        self.dry_wet = dryWet.get(self.BEC_SUBZONE[0], 'Invalid Subzone')
-
+        self.dry_wet = _dry_wet(self.BEC_SUBZONE)
         return
 
     def getStocking(self) -> None:
@@ -346,1516 +481,63 @@ class FuelTyping:
         Function to get the number of live and dead stems in the stand (i.e., stocking)
         :return: None
         """
-        liveStems = 0
-        if self.VRI_LIVE_STEMS_PER_HA is not None:
-            liveStems = self.VRI_LIVE_STEMS_PER_HA
-
-        deadStems = 0
-        if self.VRI_DEAD_STEMS_PER_HA is not None:
-            deadStems = self.VRI_DEAD_STEMS_PER_HA
-
-        self.stocking = liveStems + deadStems
-
+        self.stocking = _stocking(self.VRI_LIVE_STEMS_PER_HA, self.VRI_DEAD_STEMS_PER_HA)
         return
 
-    def checkDomConifers(self, checkList: list) -> bool:
+    def deriveVariables(self, stand: StandRecord, reference_date=None) -> StandRecord:
+        """
+        Function to derive the bcwft variables of a stand without modifying the FuelTyping instance.
+        :param stand: the stand record
+        :param reference_date: the date (or year) harvest and disturbance lags are measured to (default: today)
+        :return: a copy of the stand record with the derived bcwft variables assigned
+        """
+        currentYear = _reference_year(reference_date)
+        return stand._replace(is_vegetated=_is_vegetated(stand.BCLCS_LEVEL_1),
+                              is_forested=_is_forested(stand.BCLCS_LEVEL_2),
+                              is_logged=_is_logged(stand.HARVEST_DATE),
+                              is_burned=_is_burned(stand.EARLIEST_NONLOGGING_DIST_TYPE),
+                              harv_lag=_years_since(stand.HARVEST_DATE, currentYear),
+                              dist_lag=_years_since(stand.EARLIEST_NONLOGGING_DIST_DATE, currentYear),
+                              pct_cnfr=_prcnt_conifer(stand, self.coniferList),
+                              dry_wet=_dry_wet(stand.BEC_SUBZONE),
+                              stocking=_stocking(stand.VRI_LIVE_STEMS_PER_HA, stand.VRI_DEAD_STEMS_PER_HA),
+                              dom_conifers=_dom_conifers(stand, self.coniferList))
+
+    def checkDomConifers(self, checkList: list, stand: StandRecord = None) -> bool:
         """
         Function to check if the dominant conifers in a stand match species in a list.
         :param checkList:
+        :param stand: the stand record to check (the FuelTyping instance attributes are checked if None)
         :return: true or false
         """
-        sppCdList = [self.SPECIES_CD_1, self.SPECIES_CD_2, self.SPECIES_CD_3,
-                     self.SPECIES_CD_4, self.SPECIES_CD_5, self.SPECIES_CD_6]
-        sppPrcntList = [self.SPECIES_PCT_1, self.SPECIES_PCT_2, self.SPECIES_PCT_3,
-                        self.SPECIES_PCT_4, self.SPECIES_PCT_5, self.SPECIES_PCT_6]
-        spDF = pd.DataFrame([sppPrcntList], columns=sppCdList).iloc[0]
-
-        # GET LIST OF CONIFER SPECIES AT SITE IF THEY MATCH SPECIES IN CHECKLIST
-        cnfrList = [i for i in sppCdList if i in checkList]
-        if not cnfrList:
-            cnfrPrcnt = 0  # ASSIGN AS 0 IF NO CONIFER SPECIES IN CHECKLIST FOUND AT SITE
-        else:
-            cnfrPrcnt = spDF[cnfrList].max()  # GET MAXIMUM PERCENTAGE OF CONIFERS IN CHECKLIST
+        s = self if stand is None else stand
+        if getattr(s, 'dom_conifers', None) is not None and tuple(checkList) in s.dom_conifers:
+            return s.dom_conifers[tuple(checkList)]
+        return _dom_conifer_match(_species(s), checkList, self.coniferList)
 
-        # GET LIST OF ALL OTHER CONIFERS AT SITE
-        altCnfrList = [i for i in sppCdList if ((not i in checkList) and (i in self.coniferList))]
-        if not altCnfrList:
-            altCnfrPrcnt = 0  # ASSIGN AS 0 IF NO OTHER CONIFER SPECIES FOUND AT SITE
-        else:
-            altCnfrPrcnt = spDF[altCnfrList].max()  # GET MAXIMUM PERCENTAGE OF ALL OTHER CONIFERS
+    def decisionTree(self, stand: StandRecord = None) -> tuple:
+        """
+        The fuel typing decision tree, generated from the rule specification bcwft_rules.DECISION_TREE
+        (see bcwft_codegen.py).
+        Each leaf returns a fixed rule ID. The rule IDs are described in bcwft_rules.RULE_TABLE, which also maps them
+        to the decisionTree line numbers previously reported as the row reference.
+        :param stand: the stand record to classify (the FuelTyping instance attributes are classified if None)
+        :return: a tuple of (rule ID, fuel type, fuel type modifier), or a tuple of the growing and dormant season
+            tuples if the season is "both"
+        """
+        if stand is None:
+            # Create a stand record from the instance attributes set by verifyInputs, isVegetated, etc.
+            stand = StandRecord(*[getattr(self, fld) for fld in StandRecord._fields[:-1]],
+                                dom_conifers=_dom_conifers(self, self.coniferList))
 
-        # Compare species and return result
-        if cnfrPrcnt != 0 and cnfrPrcnt == altCnfrPrcnt:
-            if sppCdList.index(cnfrList[0]) < sppCdList.index(altCnfrList[0]):
-                return True
-            else:
-                return False
-        elif cnfrPrcnt > altCnfrPrcnt:
-            return True
-        else:
-            return False
-
-    def decisionTree(self):
-        """
-        The fuel typing decision tree.
-        """
-        #### NON-VEGETATED SITE
-        if (not self.is_vegetated) or (self.is_vegetated is None):
-            #### SITE LOGGED
-            if self.is_logged:
-                #### SITE HARVESTED WITHIN LAST 6 YEARS
-                if self.harv_lag <= 6:
-                    if self.COAST_INTERIOR_CD == 'C':
-                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-3', None
-                    else:
-                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-1', None
-                #### SITE HARVESTED WITHIN LAST 7-24 YEARS
-                elif self.harv_lag <= 24:
-                    if self.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']:
-                        if self.season == 'dormant':
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                        else:
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                    else:
-                        if self.season == 'dormant':
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                        else:
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                #### SITE HARVESTED LONGER THAN 24 YEARS AGO
-                else:
-                    if self.BEC_ZONE_CODE in ['CMA', 'IMA']:
-                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'N', None
-                    elif self.BEC_ZONE_CODE in ['BAFA', 'MH']:
-                        if self.season == 'dormant':
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                        else:
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                    elif self.BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH'] and self.dry_wet == 'wet':
-                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                    elif self.BEC_ZONE_CODE in ['BWBS']:
-                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-2', None
-                    elif self.BEC_ZONE_CODE == 'SWB':
-                        if self.season == 'dormant':
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-1', 50
-                        else:
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-2', 50
-                    elif (self.BEC_ZONE_CODE == 'SBS') or (self.BEC_ZONE_CODE == 'IDF' and self.dry_wet == 'wet') or (
-                            self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'dry'):
-                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                    elif self.BEC_ZONE_CODE in ['SBPS', 'MS', 'ESSF'] or (
-                            self.BEC_ZONE_CODE in ['IDF', 'CDF'] and self.dry_wet == 'dry'):
-                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                    elif self.BEC_ZONE_CODE in ['PP', 'BG']:
-                        if self.season == 'dormant':
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                        else:
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                    elif self.BEC_ZONE_CODE == 'CWH' and self.dry_wet == 'dry':
-                        if self.season == 'dormant':
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-1', 40
-                        else:
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-2', 40
-            #### SITE UNLOGGED
-            else:
-                #### SITE RECENTLY BURNED
-                if self.is_burned and (self.dist_lag is not None) and (self.dist_lag < 11):
-                    if self.dist_lag <= 3:
-                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'N', None
-                    elif self.dist_lag <= 6:
-                        if self.season == 'dormant':
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                        else:
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                    elif self.dist_lag <= 10:
-                        if self.season == 'dormant':
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                        else:
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                #### SITE NOT RECENTLY BURNED
-                else:
-                    if self.BCLCS_LEVEL_2 in ['L', None]:
-                        if self.SPECIES_CD_1 is not None:
-                            if self.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']:
-                                if self.season == 'dormant':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                else:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                            else:
-                                if self.season == 'dormant':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                else:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                        else:
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'N', None
-                    else:
-                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'N', None
-
-        #### SITE VEGETATED
-        elif self.is_vegetated:
-            #### SITE FORESTED
-            if self.is_forested:
-                #### SITE RECENTLY BURNED
-                if self.is_burned and (self.dist_lag is not None) and (self.dist_lag <= 10):
-                    if (self.pct_cnfr is not None) and (self.pct_cnfr >= 60):
-                        if (self.CROWN_CLOSURE is not None) and (self.CROWN_CLOSURE > 40):
-                            if self.dist_lag <= 3:
-                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'N', None
-                            elif self.dist_lag <= 6:
-                                if self.season == 'dormant':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                else:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                            else:  # if self.dist_lag <= 10:
-                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                        else:  # if self.CROWN_CLOSURE is None or self.CROWN_CLOSURE <= 40:
-                            if self.dist_lag <= 1:
-                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'N', None
-                            elif self.dist_lag <= 6:
-                                if self.season == 'dormant':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                else:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                            else:  # if self.dist_lag <= 10:
-                                if self.season == 'dormant':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                else:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                    else:
-                        if self.dist_lag <= 1:
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'N', None
-                        else:  # if self.dist_lag <= 10:
-                            if self.season == 'dormant':
-                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                            else:
-                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                #### SITE NOT RECENTLY BURNED
-                else:
-                    if (self.SPECIES_CD_1 is None) or (self.SPECIES_PCT_1 is None) or (self.SPECIES_PCT_1 == 0):
-                        return (inspect.getframeinfo(inspect.currentframe()).lineno,
-                                'VegForestNoBurn_Species-ERROR',
-                                None)
-                    #### PURE/SINGLE SPECIES STANDS
-                    elif self.SPECIES_PCT_1 >= 80:
-                        if self.SPECIES_CD_1 in self.coniferList:
-                            #### PURE LODGEPOLE PINE STANDS
-                            if self.SPECIES_CD_1 in ['PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P']:
-                                if self.harv_lag is not None and self.harv_lag <= 7:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-1', None
-                                else:
-                                    if self.BCLCS_LEVEL_5 == 'SP':  #### SPARSE STANDS
-                                        if (self.BEC_ZONE_CODE in ['CWH', 'CDF', 'MH']) or (
-                                                self.BEC_ZONE_CODE in ['ICH'] and self.dry_wet == 'wet'):
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                            else:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                    else:  #### DENSE OR OPEN STANDS
-                                        if self.PROJ_HEIGHT_1 < 4:
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                            else:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                                        elif self.PROJ_HEIGHT_1 <= 12:
-                                            if self.stocking > 8000:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-4', None
-                                            else:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                        elif self.PROJ_HEIGHT_1 > 12:
-                                            if self.CROWN_CLOSURE < 40:
-                                                if self.BEC_ZONE_CODE in ['BG', 'PP', 'IDF', 'MS']:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-7', None
-                                                elif self.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-5', None
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-3', None
-                                            else:
-                                                if self.EARLIEST_NONLOGGING_DIST_TYPE == 'IBM':  #### MOUNTAIN PINE BEETLE STANDS
-                                                    if self.dist_lag <= 5:
-                                                        if self.STAND_PERCENTAGE_DEAD is not None and self.STAND_PERCENTAGE_DEAD > 50:
-                                                            return inspect.getframeinfo(
-                                                                inspect.currentframe()).lineno, 'M-3', 65
-                                                        elif self.STAND_PERCENTAGE_DEAD is not None and self.STAND_PERCENTAGE_DEAD >= 25:
-                                                            return inspect.getframeinfo(
-                                                                inspect.currentframe()).lineno, 'C-2', None
-                                                        else:
-                                                            return inspect.getframeinfo(
-                                                                inspect.currentframe()).lineno, 'C-3', None
-                                                    else:
-                                                        if self.STAND_PERCENTAGE_DEAD is not None and self.STAND_PERCENTAGE_DEAD > 50:
-                                                            return inspect.getframeinfo(
-                                                                inspect.currentframe()).lineno, 'C-2', None
-                                                        elif self.STAND_PERCENTAGE_DEAD is not None and self.STAND_PERCENTAGE_DEAD >= 25:
-                                                            return inspect.getframeinfo(
-                                                                inspect.currentframe()).lineno, 'C-3', None
-                                                        else:
-                                                            return inspect.getframeinfo(
-                                                                inspect.currentframe()).lineno, 'C-3', None
-                                                else:  #### NON MOUNTAIN PINE BEETLE STANDS
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-3', None
-                            #### PURE PONDEROSA PINE STANDS
-                            elif self.SPECIES_CD_1 == 'PY':
-                                if self.BCLCS_LEVEL_5 in ['DE', 'OP']:  #### DENSE OR OPEN STANDS
-                                    if self.harv_lag is not None and self.harv_lag <= 10:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-1', None
-                                    else:
-                                        if self.PROJ_HEIGHT_1 < 4:
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                            else:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                                        elif self.PROJ_HEIGHT_1 <= 12:
-                                            if self.stocking > 8000:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-4', None
-                                            elif self.stocking >= 3000:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                            else:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                        elif self.PROJ_HEIGHT_1 <= 17:
-                                            if self.BCLCS_LEVEL_5 == 'DE':
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                            elif self.BCLCS_LEVEL_5 == 'OP':
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                elif self.BCLCS_LEVEL_5 == 'SP':  #### SPARSE STANDS
-                                    if self.STAND_PERCENTAGE_DEAD is not None and self.STAND_PERCENTAGE_DEAD >= 40:
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                                    else:
-                                        if self.harv_lag is not None and self.harv_lag <= 10:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-1', None
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                            #### PURE OTHER PINE STANDS
-                            elif self.SPECIES_CD_1 in ['PA', 'PF', 'PW']:
-                                if self.BCLCS_LEVEL_5 == 'DE':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                elif self.BCLCS_LEVEL_5 in ['SP', 'OP']:
-                                    if self.stocking >= 900:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                    elif self.stocking >= 600:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                            #### PURE DOUGLAS-FIR STANDS
-                            elif self.SPECIES_CD_1 in ['FD', 'FDC', 'FDI', 'F']:
-                                #### SITE HARVESTED WITHIN LAST 6 YEARS
-                                if self.harv_lag is not None and self.harv_lag <= 6:
-                                    if (self.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (
-                                            self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'wet'):
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-3', None
-                                    else:  # if (self.BEC_ZONE_CODE in self.dryBECzones) or (self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'dry'):
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-1', None
-                                #### SITE HARVESTED LONGER THAN 6 YEARS AGO
-                                else:
-                                    if self.PROJ_HEIGHT_1 is not None and self.PROJ_HEIGHT_1 < 4:
-                                        if (self.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (
-                                                self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'wet'):
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                            else:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                                        else:
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                            else:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                                    elif self.PROJ_HEIGHT_1 is not None and self.PROJ_HEIGHT_1 >= 4:
-                                        if self.CROWN_CLOSURE is not None and self.CROWN_CLOSURE > 55:
-                                            if self.PROJ_HEIGHT_1 <= 12:
-                                                if (self.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (
-                                                        self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'wet'):
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-3', None
-                                                else:  # if (self.BEC_ZONE_CODE in self.dryBECzones) or (self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'dry'):
-                                                    if ((self.STAND_PERCENTAGE_DEAD is not None)
-                                                            and (self.STAND_PERCENTAGE_DEAD > 34)):
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'C-4', None
-                                                    else:
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'C-3', None
-                                            elif self.PROJ_HEIGHT_1 > 12:
-                                                if (self.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (
-                                                        self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'wet'):
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-5', None
-                                                else:  # if (self.BEC_ZONE_CODE in self.dryBECzones) or (self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'dry'):
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-7', None
-                                        elif self.CROWN_CLOSURE is None or self.CROWN_CLOSURE >= 26:
-                                            if (self.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (
-                                                    self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'wet'):
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                            else:  # if (self.COAST_INTERIOR_CD == 'I'):
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                        else:  # if self.CROWN_CLOSURE < 26:
-                                            if (self.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (
-                                                    self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'wet'):
-                                                if self.season == 'dormant':
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'D-1', None
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'D-2', None
-                                            else:
-                                                if self.season == 'dormant':
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'O-1a', None
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'O-1b', None
-                                    else:
-                                        return inspect.getframeinfo(
-                                            inspect.currentframe()).lineno, 'VegForestNoBurnPureFd_ProjHeight-ERROR', None
-                            #### PURE ENGELMANN SPRUCE STANDS
-                            elif self.SPECIES_CD_1 == 'SE':
-                                if self.harv_lag is not None and self.harv_lag <= 10:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-2', None
-                                else:
-                                    if self.BCLCS_LEVEL_5 == 'SP':
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                                    elif self.BCLCS_LEVEL_5 == 'DE':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-2', None
-                                    elif self.BCLCS_LEVEL_5 == 'OP':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                            #### PURE SITKA SPRUCE STANDS
-                            elif self.SPECIES_CD_1 == 'SS':
-                                if self.harv_lag is not None and self.harv_lag <= 6:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-3', None
-                                else:
-                                    if self.BCLCS_LEVEL_5 == 'SP':
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                                    elif self.BCLCS_LEVEL_5 in ['DE', 'OP']:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                            #### PURE BLACK OR WHITE SPRUCE STANDS
-                            elif self.SPECIES_CD_1 in ['SB', 'SW']:
-                                if self.harv_lag is not None and self.harv_lag <= 10:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-2', None
-                                else:
-                                    if self.BCLCS_LEVEL_5 in ['DE', 'OP']:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-2', None
-                                    elif self.BCLCS_LEVEL_5 == 'SP':
-                                        if self.BEC_ZONE_CODE in ['BWBS', 'SWB']:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-1', None
-                                        else:
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-1', 30
-                                            else:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-2', 30
-                            #### PURE SPRUCE (UNKNOWN OR HYBRID) STANDS
-                            elif self.SPECIES_CD_1.startswith(
-                                    'S'):  # in ['SX','SXB','SXE','SXL','SXS','SXW','SXX','S']:
-                                if self.harv_lag is not None and self.harv_lag <= 7:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-2', None
-                                else:
-                                    if self.BEC_ZONE_CODE in ['BWBS', 'SWB']:
-                                        if self.BCLCS_LEVEL_5 in ['DE', 'OP']:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-2', None
-                                        else:  # if self.BCLCS_LEVEL_5 == 'SP':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-1', None
-                                    else:
-                                        if self.BCLCS_LEVEL_5 == 'SP':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                        else:  # if self.BCLCS_LEVEL_5 in ['DE','OP']:
-                                            if self.BEC_ZONE_CODE in ['CWH', 'CDF']:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                            else:  # if self.COAST_INTERIOR_CD == 'I' and self.SPECIES_CD_1 != 'SS':
-                                                if self.PROJ_HEIGHT_1 < 4:
-                                                    if self.season == 'dormant':
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'O-1a', None
-                                                    else:
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'O-1b', None
-                                                elif self.PROJ_HEIGHT_1 >= 4:
-                                                    if self.BCLCS_LEVEL_5 == 'OP':
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'C-3', None
-                                                    elif self.BCLCS_LEVEL_5 == 'DE':
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'C-2', None
-                                                    else:
-                                                        return (inspect.getframeinfo(inspect.currentframe()).lineno,
-                                                                'VegForestPureOtherSpruceInterior_NoBCLCSLv5-ERROR',
-                                                                None)
-                                                else:
-                                                    return (inspect.getframeinfo(inspect.currentframe()).lineno,
-                                                            'VegForestPureOtherSpruceInterior_ProjHeight-ERROR',
-                                                            None)
-                            #### PURE REDCEDAR, YELLOW CEDAR OR HEMLOCK STANDS
-                            elif self.SPECIES_CD_1 in ['C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM']:
-                                if self.harv_lag is not None and self.harv_lag <= 6:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-3', None
-                                else:
-                                    if self.BCLCS_LEVEL_5 == 'DE':
-                                        if self.PROJ_HEIGHT_1 < 4:
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                            else:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                                        elif self.PROJ_HEIGHT_1 <= 15:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                        elif self.PROJ_HEIGHT_1 > 15:
-                                            if self.PROJ_AGE_1 < 60:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                            elif self.PROJ_AGE_1 <= 99:
-                                                if self.season == 'dormant':
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'M-1', 30
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'M-2', 30
-                                            else:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                    elif self.BCLCS_LEVEL_5 == 'OP':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                    elif self.BCLCS_LEVEL_5 == 'SP':
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                            #### PURE TRUE FIR STANDS
-                            elif self.SPECIES_CD_1.startswith('B'):
-                                if self.SPECIES_CD_1 == 'BG':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                elif self.SPECIES_CD_1 == 'BA':
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-1', 30
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-2', 30
-                                else:
-                                    if self.BCLCS_LEVEL_5 == 'SP':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                            #### PURE YEW STANDS
-                            elif self.SPECIES_CD_1 in ['T', 'TW']:
-                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                            #### PURE JUNIPER STANDS
-                            elif self.SPECIES_CD_1 in ['J', 'JR']:
-                                if self.season == 'dormant':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                else:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                            else:
-                                return (inspect.getframeinfo(inspect.currentframe()).lineno,
-                                        'VegForestedPureSpeciesStand_Species-ERROR',
-                                        None)
-                        else:  #### DECIDUOUS/BROADLEAF OR LARCH STAND
-                            if self.season == 'dormant':
-                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                            else:
-                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                                #### MIXED-SPECIES STANDS
-                    elif self.SPECIES_PCT_1 < 80:
-                        #### MIXED-SPECIES DECIDUOUS STANDS
-                        if self.pct_cnfr <= 20:
-                            if self.season == 'dormant':
-                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                            else:
-                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                        #### MIXED-SPECIES CONIFER OR MIXEDWOOD STANDS
-                        elif self.pct_cnfr > 20:
-                            #### 21-40% CONIFER = DECIDUOUS DOMINATED MIXEDWOOD STANDS
-                            if self.pct_cnfr <= 40:
-                                if self.harv_lag is not None and self.harv_lag <= 6:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-2', None
-                                else:  # self.harv_lag > 6 or self.HARVEST_DATE is None:
-                                    #### DOMINANT CONIFER = BLACK, WHITE, ENGELMANN, OR HYBRID SPRUCE
-                                    if self.checkDomConifers(['SB', 'SW', 'SE', 'SX', 'SXB',
-                                                              'SXE', 'SXL', 'SXS', 'SXW', 'SXX']):
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(
-                                                inspect.currentframe()).lineno, 'M-1', self.pct_cnfr
-                                        else:
-                                            return inspect.getframeinfo(
-                                                inspect.currentframe()).lineno, 'M-2', self.pct_cnfr
-                                    #### DOMINANT CONIFER = UNKNOWN SPRUCE
-                                    elif self.checkDomConifers(['S']):
-                                        if self.COAST_INTERIOR_CD == 'C':
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.5
-                                            else:
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.5
-                                        else:  # if self.COAST_INTERIOR_CD == 'I':
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-1', self.pct_cnfr
-                                            else:
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-2', self.pct_cnfr
-                                    #### DOMINANT CONIFER = ANY OTHER CONIFER
-                                    else:
-                                        if self.BCLCS_LEVEL_5 == 'SP':
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.5
-                                            else:
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.5
-                                        else:
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.7
-                                            else:
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.7
-                            #### 41-65% CONIFER = CONIFER_DOMINATED MIXEDWOOD STANDS
-                            elif self.pct_cnfr <= 65:
-                                if self.harv_lag is not None and self.harv_lag <= 6:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-1', None
-                                else:
-                                    #### DOMINANT CONIFER = LODGEPOLE PINE
-                                    if self.checkDomConifers(['PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P']):
-                                        if self.BCLCS_LEVEL_5 == 'SP':
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.6
-                                            else:
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.6
-                                        elif self.BCLCS_LEVEL_5 == 'OP':
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.7
-                                            else:
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.7
-                                        elif self.BCLCS_LEVEL_5 == 'DE':
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.8
-                                            else:
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.8
-                                    #### DOMINANT CONIFER = PONDEROSA PINE
-                                    elif self.checkDomConifers(['PY']):
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(
-                                                inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.6
-                                        else:
-                                            return inspect.getframeinfo(
-                                                inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.6
-                                    #### DOMINANT CONIFER = OTHER PINE
-                                    elif self.checkDomConifers(['PA', 'PF', 'PW']):
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(
-                                                inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.5
-                                        else:
-                                            return inspect.getframeinfo(
-                                                inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.5
-                                    #### DOMINANT CONIFER = DOUGLAS-FIR
-                                    elif self.checkDomConifers(['F', 'FD', 'FDC', 'FDI']):
-                                        if self.BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH']:
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.5
-                                            else:
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.5
-                                        else:
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.6
-                                            else:
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.6
-                                    #### DOMINANT CONIFER = ENGELMANN SPRUCE
-                                    elif self.checkDomConifers(['SE']):
-                                        if self.BCLCS_LEVEL_5 == 'SP':
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.6
-                                            else:
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.6
-                                        elif self.BCLCS_LEVEL_5 in ['OP', 'DE']:
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.9
-                                            else:
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.9
-                                    #### DOMINANT CONIFER = SITKA SPRUCE
-                                    elif self.checkDomConifers(['SS']):
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(
-                                                inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.4
-                                        else:
-                                            return inspect.getframeinfo(
-                                                inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.4
-                                    #### DOMINANT CONIFER = BLACK OR WHITE SPRUCE
-                                    elif self.checkDomConifers(['SB', 'SW']):
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(
-                                                inspect.currentframe()).lineno, 'M-1', self.pct_cnfr
-                                        else:
-                                            return inspect.getframeinfo(
-                                                inspect.currentframe()).lineno, 'M-2', self.pct_cnfr
-                                    #### DOMINANT CONIFER = UNKNOWN OR HYBRID SPRUCE
-                                    elif self.checkDomConifers(['SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX', 'S']):
-                                        if self.BEC_ZONE_CODE in ['BWBS', 'SWB']:
-                                            if self.BCLCS_LEVEL_5 in ['DE', 'OP']:
-                                                if self.season == 'dormant':
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'M-1', self.pct_cnfr
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'M-2', self.pct_cnfr
-                                            elif self.BCLCS_LEVEL_5 in ['SP']:
-                                                if self.season == 'dormant':
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.6
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.6
-                                        else:
-                                            if self.BCLCS_LEVEL_5 in ['SP']:
-                                                if self.season == 'dormant':
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.6
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.6
-                                            elif self.BCLCS_LEVEL_5 in ['DE', 'OP']:
-                                                if self.COAST_INTERIOR_CD == 'I':
-                                                    if self.season == 'dormant':
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.8
-                                                    else:
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.8
-                                                elif self.COAST_INTERIOR_CD == 'C':
-                                                    if self.season == 'dormant':
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.5
-                                                    else:
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.5
-                                            else:
-                                                return (inspect.getframeinfo(inspect.currentframe()).lineno,
-                                                        'VegForestMixedSpeciesCnfrLT65_BCLCSLv5-ERROR',
-                                                        None)
-                                    #### DOMINANT CONIFER = REDCEDAR, YELLOW CEDAR OR HEMLOCK
-                                    elif self.checkDomConifers(['C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM']):
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(
-                                                inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.4
-                                        else:
-                                            return inspect.getframeinfo(
-                                                inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.4
-                                    #### DOMINANT CONIFER = FIR
-                                    elif self.checkDomConifers(['B', 'BA', 'BG', 'BL']):
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(
-                                                inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.6
-                                        else:
-                                            return inspect.getframeinfo(
-                                                inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.6
-                                    #### DOMINANT CONIFER = YEW
-                                    elif self.checkDomConifers(['T', 'TW']):
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                    #### DOMINANT CONIFER = JUNIPER
-                                    elif self.checkDomConifers(['J', 'JR']):
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                            #### 66-80% CONIFER = CONIFER_DOMINATED MIXEDWOOD STANDS
-                            elif self.pct_cnfr <= 80:
-                                if self.harv_lag is not None and self.harv_lag <= 6:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-1', None
-                                else:  # self.harv_lag > 6 or self.HARVEST_DATE is None:
-                                    #### DOMINANT CONIFER = LODGEPOLE PINE
-                                    if self.checkDomConifers(['PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P']):
-                                        if self.BCLCS_LEVEL_5 in ['SP']:
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.5
-                                            else:
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.5
-                                        elif self.BCLCS_LEVEL_5 in ['OP']:
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.7
-                                            else:
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.7
-                                        elif self.BCLCS_LEVEL_5 in ['DE']:
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.8
-                                            else:
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.8
-                                    #### DOMINANT CONIFER = PONDEROSA PINE
-                                    elif self.checkDomConifers(['PY']):
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                    #### DOMINANT CONIFER = OTHER PINE
-                                    elif self.checkDomConifers(['PA', 'PF', 'PW']):
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                    #### DOMINANT CONIFER = DOUGLAS-FIR
-                                    elif self.checkDomConifers(['F', 'FD', 'FDC', 'FDI']):
-                                        if (self.BEC_ZONE_CODE in ['CWH', 'CDF']) or (
-                                                self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'wet'):
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                        else:
-                                            if self.BCLCS_LEVEL_5 in ['DE']:
-                                                if self.season == 'dormant':
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.7
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.7
-                                            else:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                    #### DOMINANT CONIFER = ENGELMANN SPRUCE
-                                    elif self.checkDomConifers(['SE']):
-                                        if self.BCLCS_LEVEL_5 in ['SP']:
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.6
-                                            else:
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.6
-                                        elif self.BCLCS_LEVEL_5 in ['OP', 'DE']:
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.7
-                                            else:
-                                                return inspect.getframeinfo(
-                                                    inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.7
-                                    #### DOMINANT CONIFER = SITKA SPRUCE
-                                    elif self.checkDomConifers(['SS']):
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                    #### DOMINANT CONIFER = BLACK OR WHITE SPRUCE
-                                    elif self.checkDomConifers(['SB', 'SW']):
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(
-                                                inspect.currentframe()).lineno, 'M-1', self.pct_cnfr
-                                        else:
-                                            return inspect.getframeinfo(
-                                                inspect.currentframe()).lineno, 'M-2', self.pct_cnfr
-                                    #### DOMINANT CONIFER = UNKNOWN OR HYBRID SPRUCE
-                                    elif self.checkDomConifers(['SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX', 'S']):
-                                        if self.BEC_ZONE_CODE in ['BWBS', 'SWB']:
-                                            if self.BCLCS_LEVEL_5 in ['DE', 'OP']:
-                                                if self.season == 'dormant':
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'M-1', self.pct_cnfr
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'M-2', self.pct_cnfr
-                                            if self.BCLCS_LEVEL_5 in ['SP']:
-                                                if self.season == 'dormant':
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.6
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.6
-                                        else:
-                                            if self.BCLCS_LEVEL_5 in ['SP']:
-                                                if self.season == 'dormant':
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.6
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.6
-                                            else:  # self.BCLCS_LEVEL_5 in ['DE','OP']:
-                                                if self.COAST_INTERIOR_CD == 'I':
-                                                    if self.season == 'dormant':
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'M-1', self.pct_cnfr * 0.8
-                                                    else:
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'M-2', self.pct_cnfr * 0.8
-                                                else:  # self.COAST_INTERIOR_CD == 'C':
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-5', None
-                                    #### DOMINANT CONIFER = REDCEDAR, YELLOW CEDAR OR HEMLOCK
-                                    elif self.checkDomConifers(['C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM']):
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                    #### DOMINANT CONIFER = FIR
-                                    elif self.checkDomConifers(['B', 'BA', 'BG', 'BL']):
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                    #### DOMINANT CONIFER = YEW
-                                    elif self.checkDomConifers(['T', 'TW']):
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                    #### DOMINANT CONIFER = JUNIPER
-                                    elif self.checkDomConifers(['J', 'JR']):
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                            #### 81-100% CONIFER = PURE CONIFER, MIXED-SPECIES STANDS
-                            elif self.pct_cnfr <= 100:
-                                #### DOMINANT CONIFER = LODGEPONE PINE
-                                if self.SPECIES_CD_1 in ['P', 'PL', 'PLI', 'PLC', 'PJ', 'PXJ']:
-                                    if self.harv_lag is not None and self.harv_lag <= 7:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-1', None
-                                    else:
-                                        if self.BCLCS_LEVEL_5 in ['SP']:
-                                            if (self.BEC_ZONE_CODE in ['CWH', 'CDF', 'MH']) or (
-                                                    self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'wet'):
-                                                if self.season == 'dormant':
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'D-1', None
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'D-2', None
-                                            else:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                        else:  # if self.BCLCS_LEVEL_5 in ['DE','OP']:
-                                            if self.PROJ_HEIGHT_1 < 4:
-                                                if self.season == 'dormant':
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'O-1a', None
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'O-1b', None
-                                            elif self.PROJ_HEIGHT_1 >= 4:
-                                                if self.SPECIES_CD_2.startswith('S') or self.SPECIES_CD_2.startswith(
-                                                        'B'):
-                                                    if self.PROJ_HEIGHT_1 <= 12:
-                                                        if self.stocking > 8000:
-                                                            return inspect.getframeinfo(
-                                                                inspect.currentframe()).lineno, 'C-4', None
-                                                        else:  # self.stocking <= 8000 or (self.VRI_LIVE_STEMS_PER_HA is None and self.VRI_DEAD_STEMS_PER_HA is None):
-                                                            return inspect.getframeinfo(
-                                                                inspect.currentframe()).lineno, 'C-3', None
-                                                    else:  # self.PROJ_HEIGHT_1 > 12:
-                                                        if self.CROWN_CLOSURE < 40:
-                                                            if self.BEC_ZONE_CODE in ['BG', 'PP', 'IDF', 'MS']:
-                                                                return inspect.getframeinfo(
-                                                                    inspect.currentframe()).lineno, 'C-7', None
-                                                            elif self.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']:
-                                                                return inspect.getframeinfo(
-                                                                    inspect.currentframe()).lineno, 'C-5', None
-                                                            else:
-                                                                return inspect.getframeinfo(
-                                                                    inspect.currentframe()).lineno, 'C-3', None
-                                                        else:  # self.CROWN_CLOSURE >= 40 or self.CROWN_CLOSURE is None:
-                                                            if self.EARLIEST_NONLOGGING_DIST_TYPE == 'IBM':
-                                                                if self.dist_lag <= 5:
-                                                                    if self.BCLCS_LEVEL_5 in ['DE']:
-                                                                        if ((self.STAND_PERCENTAGE_DEAD is not None)
-                                                                                and (self.STAND_PERCENTAGE_DEAD > 50)):
-                                                                            return inspect.getframeinfo(
-                                                                                inspect.currentframe()).lineno, 'M-3', 65
-                                                                        elif ((self.STAND_PERCENTAGE_DEAD is not None)
-                                                                              and (self.STAND_PERCENTAGE_DEAD >= 25)):
-                                                                            return inspect.getframeinfo(
-                                                                                inspect.currentframe()).lineno, 'C-2', None
-                                                                        else:  # self.STAND_PERCENTAGE_DEAD < 25:
-                                                                            return inspect.getframeinfo(
-                                                                                inspect.currentframe()).lineno, 'C-2', None
-                                                                    else:  # self.BCLCS_LEVEL_5 in ['OP']:
-                                                                        if ((self.STAND_PERCENTAGE_DEAD is not None)
-                                                                                and (self.STAND_PERCENTAGE_DEAD > 50)):
-                                                                            return inspect.getframeinfo(
-                                                                                inspect.currentframe()).lineno, 'M-3', 65
-                                                                        elif ((self.STAND_PERCENTAGE_DEAD is not None)
-                                                                              and (self.STAND_PERCENTAGE_DEAD >= 25)):
-                                                                            return inspect.getframeinfo(
-                                                                                inspect.currentframe()).lineno, 'C-2', None
-                                                                        else:  # self.STAND_PERCENTAGE_DEAD < 25:
-                                                                            return inspect.getframeinfo(
-                                                                                inspect.currentframe()).lineno, 'C-3', None
-                                                                else:  # self.dist_lag > 5:
-                                                                    if self.BCLCS_LEVEL_5 in ['DE']:
-                                                                        if ((self.STAND_PERCENTAGE_DEAD is not None)
-                                                                                and (self.STAND_PERCENTAGE_DEAD > 50)):
-                                                                            return inspect.getframeinfo(
-                                                                                inspect.currentframe()).lineno, 'C-2', None
-                                                                        elif ((self.STAND_PERCENTAGE_DEAD is not None)
-                                                                              and (self.STAND_PERCENTAGE_DEAD >= 25)):
-                                                                            return inspect.getframeinfo(
-                                                                                inspect.currentframe()).lineno, 'C-2', None
-                                                                        else:  # self.STAND_PERCENTAGE_DEAD < 25:
-                                                                            return inspect.getframeinfo(
-                                                                                inspect.currentframe()).lineno, 'C-3', None
-                                                                    else:  # self.BCLCS_LEVEL_5 in ['OP']:
-                                                                        if ((self.STAND_PERCENTAGE_DEAD is not None)
-                                                                                and (self.STAND_PERCENTAGE_DEAD > 50)):
-                                                                            return inspect.getframeinfo(
-                                                                                inspect.currentframe()).lineno, 'C-2', None
-                                                                        elif ((self.STAND_PERCENTAGE_DEAD is not None)
-                                                                              and (self.STAND_PERCENTAGE_DEAD >= 25)):
-                                                                            return inspect.getframeinfo(
-                                                                                inspect.currentframe()).lineno, 'C-3', None
-                                                                        else:  # self.STAND_PERCENTAGE_DEAD < 25:
-                                                                            return inspect.getframeinfo(
-                                                                                inspect.currentframe()).lineno, 'C-3', None
-                                                            else:
-                                                                return inspect.getframeinfo(
-                                                                    inspect.currentframe()).lineno, 'C-3', None
-                                                else:
-                                                    if self.CROWN_CLOSURE < 40:
-                                                        if self.BEC_ZONE_CODE in ['IDF', 'PP', 'BG', 'SBPS', 'MS']:
-                                                            return inspect.getframeinfo(
-                                                                inspect.currentframe()).lineno, 'C-7', None
-                                                        elif self.BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH']:
-                                                            return inspect.getframeinfo(
-                                                                inspect.currentframe()).lineno, 'C-5', None
-                                                        else:
-                                                            return inspect.getframeinfo(
-                                                                inspect.currentframe()).lineno, 'C-3', None
-                                                    else:  # self.CROWN_CLOSURE >= 40:
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'C-3', None
-                                #### DOMINANT CONIFER = PONDEROSA PINE
-                                elif self.SPECIES_CD_1 in ['PY']:
-                                    if (self.harv_lag is not None) and (self.harv_lag <= 7):
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-1', None
-                                    else:  # self.harv_lag > 7:
-                                        if self.PROJ_HEIGHT_1 < 4:
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                            else:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                                        else:  # self.PROJ_HEIGHT_1 >= 4:
-                                            if self.BCLCS_LEVEL_5 in ['DE']:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                            else:  # self.BCLCS_LEVEL_5 in ['OP','SP']:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                #### DOMINANT CONIFER = OTHER PINE
-                                elif self.SPECIES_CD_1 in ['PA', 'PF', 'PW']:
-                                    if self.BCLCS_LEVEL_5 in ['DE']:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                    else:  # self.BCLCS_LEVEL_5 in ['OP','SP']:
-                                        if self.stocking >= 900:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                        elif self.stocking >= 600:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                #### DOMINANT CONIFER = DOUGLAS-FIR
-                                elif self.SPECIES_CD_1.startswith('F'):
-                                    if self.harv_lag is not None and self.harv_lag <= 6:
-                                        if (self.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (
-                                                self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'wet'):
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-3', None
-                                        else:  # if (self.BEC_ZONE_CODE in self.dryBECzones) or (self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'dry'):
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-1', None
-                                    else:  # self.harv_lag > 6:
-                                        if self.PROJ_HEIGHT_1 < 4:
-                                            if (self.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (
-                                                    self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'wet'):
-                                                if self.season == 'dormant':
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'D-1', None
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'D-2', None
-                                            else:
-                                                if self.season == 'dormant':
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'O-1a', None
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'O-1b', None
-                                        else:  # self.PROJ_HEIGHT_1 >= 4:
-                                            if self.CROWN_CLOSURE > 55:
-                                                if self.PROJ_HEIGHT_1 <= 12:
-                                                    if (self.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (
-                                                            self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'wet'):
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'C-5', None
-                                                    else:  # if (self.BEC_ZONE_CODE in self.dryBECzones) or (self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'dry'):
-                                                        if ((self.STAND_PERCENTAGE_DEAD is not None) and
-                                                                (self.STAND_PERCENTAGE_DEAD > 34)):
-                                                            return inspect.getframeinfo(
-                                                                inspect.currentframe()).lineno, 'C-4', None
-                                                        else:
-                                                            if self.SPECIES_CD_2 == 'PY':
-                                                                return inspect.getframeinfo(
-                                                                    inspect.currentframe()).lineno, 'C-7', None
-                                                            else:
-                                                                return inspect.getframeinfo(
-                                                                    inspect.currentframe()).lineno, 'C-3', None
-                                                elif self.PROJ_HEIGHT_1 > 12:
-                                                    if (self.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (
-                                                            self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'wet'):
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'C-5', None
-                                                    else:  # (self.BEC_ZONE_CODE in self.dryBECzones) or (self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'dry'):
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'C-7', None
-                                            elif self.CROWN_CLOSURE >= 26 or self.CROWN_CLOSURE is None:
-                                                if (self.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (
-                                                        self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'wet'):
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-5', None
-                                                else:  # self.COAST_INTERIOR_CD = 'I' and ((self.BEC_ZONE_CODE in self.dryBECzones) or (self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'dry')):
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-7', None
-                                            else:
-                                                if (self.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (
-                                                        self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'wet'):
-                                                    if self.season == 'dormant':
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'D-1', None
-                                                    else:
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'D-2', None
-                                                else:
-                                                    if self.season == 'dormant':
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'O-1a', None
-                                                    else:
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'O-1b', None
-                                #### DOMINANT CONIFER = SPRUCE
-                                elif self.SPECIES_CD_1.startswith('S'):
-                                    if self.harv_lag is not None and self.harv_lag <= 6:
-                                        if (self.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (
-                                                self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'wet'):
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-3', None
-                                        else:  # (self.COAST_INTERIOR_CD = 'I') or (self.BEC_ZONE_CODE in self.dryBECzones):
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-2', None
-                                    else:  # (self.harv_lag > 6):
-                                        if self.SPECIES_CD_1 == 'SE':
-                                            if self.BCLCS_LEVEL_5 in ['SP']:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                            else:  # self.BCLCS_LEVEL_5 in ['DE','OP']:
-                                                if self.SPECIES_CD_2 in ['BL', 'B', 'PL', 'P', 'PLI']:
-                                                    if self.BCLCS_LEVEL_5 in ['DE']:
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'C-2', None
-                                                    else:  # self.BCLCS_LEVEL_5 in ['OP']:
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'C-3', None
-                                                elif self.SPECIES_CD_2 in ['HW', 'HM', 'CW', 'YC']:
-                                                    if self.BCLCS_LEVEL_5 in ['DE']:
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'C-3', None
-                                                    else:  # self.BCLCS_LEVEL_5 in ['OP']:
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'C-5', None
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-3', None
-                                        elif self.SPECIES_CD_1 in ['SS']:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                        elif self.SPECIES_CD_1 in ['SB']:
-                                            if self.BCLCS_LEVEL_5 in ['DE', 'OP']:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-2', None
-                                            else:  # self.BCLCS_LEVEL_5 in ['SP']:
-                                                if self.BEC_ZONE_CODE in ['BWBS']:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-1', None
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-3', None
-                                        else:  # if self.SPECIES_CD_1 in ['SX','SXB','SXE','SXL','SXS','SXW','SXX','SW','S']:
-                                            if self.BEC_ZONE_CODE in ['BWBS']:
-                                                if self.BCLCS_LEVEL_5 in ['DE']:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-2', None
-                                                elif self.BCLCS_LEVEL_5 in ['OP']:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-3', None
-                                                else:  # self.BCLCS_LEVEL_5 in ['SP']:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-1', None
-                                            else:
-                                                if self.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']:
-                                                    if (self.SPECIES_CD_2 in ['BL',
-                                                                              'B']) or self.SPECIES_CD_2.startswith(
-                                                            'P'):
-                                                        if self.BCLCS_LEVEL_5 in ['SP']:
-                                                            return inspect.getframeinfo(
-                                                                inspect.currentframe()).lineno, 'C-7', None
-                                                        else:
-                                                            return inspect.getframeinfo(
-                                                                inspect.currentframe()).lineno, 'C-3', None
-                                                    else:
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'C-5', None
-                                                else:  # (self.COAST_INTERIOR_CD = 'I') and (not self.BEC_ZONE_CODE in self.borealBECzones):
-                                                    if self.BCLCS_LEVEL_5 in ['SP']:
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'C-7', None
-                                                    else:
-                                                        if self.BCLCS_LEVEL_5 in ['DE']:
-                                                            return inspect.getframeinfo(
-                                                                inspect.currentframe()).lineno, 'C-2', None
-                                                        else:  # self.BCLCS_LEVEL_5 in ['OP']:
-                                                            if self.STAND_PERCENTAGE_DEAD is not None and self.STAND_PERCENTAGE_DEAD > 34:
-                                                                return inspect.getframeinfo(
-                                                                    inspect.currentframe()).lineno, 'C-2', None
-                                                            else:  # (self.STAND_PERCENTAGE_DEAD <= 34) or (self.STAND_PERCENTAGE_DEAD is None):
-                                                                if (self.SPECIES_CD_2 in ['PL', 'PLI', 'P']):
-                                                                    return inspect.getframeinfo(
-                                                                        inspect.currentframe()).lineno, 'C-2', None
-                                                                else:
-                                                                    return inspect.getframeinfo(
-                                                                        inspect.currentframe()).lineno, 'C-3', None
-                                ##### DOMINANT CONIFER = REDCEDAR, YELLOW CEDAR OR HEMLOCK
-                                elif self.SPECIES_CD_1.startswith('C') or self.SPECIES_CD_1.startswith(
-                                        'Y') or self.SPECIES_CD_1.startswith('H'):
-                                    if self.harv_lag is not None and self.harv_lag <= 6:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-3', None
-                                    else:  # self.harv_lag > 6:
-                                        if self.BCLCS_LEVEL_5 == 'DE':
-                                            if self.PROJ_HEIGHT_1 < 4:
-                                                if self.season == 'dormant':
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'D-1', None
-                                                else:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'D-2', None
-                                            elif self.PROJ_HEIGHT_1 <= 15:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                            else:  # (self.PROJ_HEIGHT_1 > 15) and (self.BCLCS_LEVEL_5 in ['DE']):
-                                                if self.PROJ_AGE_1 < 60:
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-3', None
-                                                elif self.PROJ_AGE_1 <= 99:
-                                                    if self.season == 'dormant':
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'M-1', 40
-                                                    else:
-                                                        return inspect.getframeinfo(
-                                                            inspect.currentframe()).lineno, 'M-2', 40
-                                                else:  # (self.PROJ_AGE_1 > 99) or (self.BCLCS_LEVEL_5 in ['DE']) or (self.BCLCS_LEVEL_5 is None):
-                                                    return inspect.getframeinfo(
-                                                        inspect.currentframe()).lineno, 'C-5', None
-                                        elif self.BCLCS_LEVEL_5 in ['OP']:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                        else:  # self.BCLCS_LEVEL_5 in ['SP']:
-                                            if self.season == 'dormant':
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                            else:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                                ##### DOMINANT CONIFER = GRAND FIR
-                                elif self.SPECIES_CD_1 in ['BG']:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                ##### DOMINANT CONIFER = AMABALIS FIR
-                                elif self.SPECIES_CD_1 in ['BA']:
-                                    if self.SPECIES_CD_2 in ['SE', 'SW', 'S']:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                    else:
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-1', 40
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-2', 40
-                                ##### DOMINANT CONIFER = OTHER FIR
-                                elif self.SPECIES_CD_1 in ['B', 'BL']:
-                                    if self.COAST_INTERIOR_CD == 'C':
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-1', 40
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-2', 40
-                                    else:  # self.COAST_INTERIOR_CD == 'I':
-                                        if self.BCLCS_LEVEL_5 in ['SP']:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                        elif self.BCLCS_LEVEL_5 in ['DE']:
-                                            if self.SPECIES_CD_2 in ['SE', 'SW', 'S']:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-2', None
-                                            else:
-                                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                        else:  # self.BCLCS_LEVEL_5 in ['OP']:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                ##### DOMINANT CONIFER = YEW
-                                elif self.SPECIES_CD_1 in ['T', 'TW']:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                ##### DOMINANT CONIFER = JUNIPER
-                                elif self.SPECIES_CD_1 in ['J', 'JR']:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-
-            #### NON-FORESTED SITE
-            else:
-                #### SITE RECENTLY BURNED
-                if self.is_burned and (self.dist_lag is not None) and (self.dist_lag < 11):
-                    if self.dist_lag <= 1:
-                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'N', None
-                    elif self.dist_lag <= 3:
-                        if self.season == 'dormant':
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                        else:
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                    else:  # self.dist_lag <= 10:
-                        if self.season == 'dormant':
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                        else:
-                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                #### SITE NOT RECENTLY BURNED
-                else:
-                    #### SITE LOGGED
-                    if self.is_logged:
-                        if self.SPECIES_CD_1 is not None:
-                            if self.harv_lag <= 7:
-                                if str(self.SPECIES_CD_1).startswith('P'):
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-1', None
-                                elif str(self.SPECIES_CD_1).startswith('S') or str(self.SPECIES_CD_1).startswith('B'):
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-2', None
-                                elif (self.SPECIES_CD_1 in ['CW', 'YC']) or str(self.SPECIES_CD_1).startswith('H'):
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-3', None
-                                elif str(self.SPECIES_CD_1).startswith('FD'):
-                                    if self.BEC_ZONE_CODE in ['CWH', 'ICH']:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-3', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-1', None
-                                else:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-1', None
-                            elif self.harv_lag <= 24:
-                                if (self.BEC_ZONE_CODE in ['CWH', 'MH']) or (
-                                        self.BEC_ZONE_CODE == 'ICH' and self.dry_wet == 'wet'):
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                                else:  # (self.BEC_ZONE_CODE in self.dryBECzones) or (self.dry_wet == 'dry'):
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                            else:  # if self.harv_lag > 24:
-                                if self.BEC_ZONE_CODE in ['CMA', 'IMA']:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'N', None
-                                elif self.BEC_ZONE_CODE == 'BAFA':
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                                elif self.BEC_ZONE_CODE == 'CWH':
-                                    if self.dry_wet == 'dry':
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-1', 40
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-2', 40
-                                    else:  # self.dry_wet == 'wet':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                elif self.BEC_ZONE_CODE == 'BWBS':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-2', None
-                                elif self.BEC_ZONE_CODE == 'SWB':
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-1', 50
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-2', 50
-                                elif self.BEC_ZONE_CODE == 'SBS':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                elif self.BEC_ZONE_CODE == 'SBPS':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                elif self.BEC_ZONE_CODE == 'MS':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                elif self.BEC_ZONE_CODE == 'IDF':
-                                    if self.dry_wet == 'dry':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                    else:  # self.dry_wet == 'wet':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                elif self.BEC_ZONE_CODE == 'PP':
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                                elif self.BEC_ZONE_CODE == 'BG':
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                                elif self.BEC_ZONE_CODE == 'MH':
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                                elif self.BEC_ZONE_CODE == 'ESSF':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                elif self.BEC_ZONE_CODE == 'CDF':
-                                    if self.dry_wet == 'dry':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                    else:  # self.dry_wet == 'wet':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                elif self.BEC_ZONE_CODE == 'ICH':
-                                    if self.dry_wet == 'dry':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                    else:  # self.dry_wet == 'wet':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                else:
-                                    return (inspect.getframeinfo(inspect.currentframe()).lineno,
-                                            'VegNonForestUnburnedLoggedGT24HasSpecies_BEC-ERROR',
-                                            None)
-                        else:  # if self.SPECIES_CD_1 is None:
-                            if self.harv_lag <= 5:
-                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'S-1', None
-                            elif self.harv_lag <= 24:
-                                if self.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']:
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                                else:  # (self.BEC_ZONE_CODE in self.dryBECzones) or (self.dry_wet == 'dry'):
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                            else:  # self.harv_lag > 24:
-                                if self.BEC_ZONE_CODE in ['CMA', 'IMA']:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'N', None
-                                elif self.BEC_ZONE_CODE == 'BAFA':
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                                elif self.BEC_ZONE_CODE == 'CWH':
-                                    if self.dry_wet == 'dry':
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-1', 40
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-2', 40
-                                    else:  # self.dry_wet == 'wet':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                elif self.BEC_ZONE_CODE == 'BWBS':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-2', None
-                                elif self.BEC_ZONE_CODE == 'SWB':
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-1', 25
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-2', 25
-                                elif self.BEC_ZONE_CODE == 'SBS':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-3', None
-                                elif self.BEC_ZONE_CODE == 'SBPS':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                elif self.BEC_ZONE_CODE == 'MS':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                elif self.BEC_ZONE_CODE == 'IDF':
-                                    if self.dry_wet == 'dry':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                    else:  # self.dry_wet == 'wet':
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-1', 50
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-2', 50
-                                elif self.BEC_ZONE_CODE == 'PP':
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                                elif self.BEC_ZONE_CODE == 'BG':
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                                elif self.BEC_ZONE_CODE == 'MH':
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                                elif self.BEC_ZONE_CODE == 'ESSF':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                elif self.BEC_ZONE_CODE == 'CDF':
-                                    if self.dry_wet == 'dry':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-7', None
-                                    else:  # self.dry_wet == 'wet':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                elif self.BEC_ZONE_CODE == 'ICH':
-                                    if self.dry_wet == 'dry':
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-1', 40
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'M-2', 40
-                                    else:  # self.dry_wet == 'wet':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'C-5', None
-                                else:
-                                    return (inspect.getframeinfo(inspect.currentframe()).lineno,
-                                            'VegNonForestUnburnedLoggedGT24NoSpecies_BEC-ERROR',
-                                            None)
-                    #### SITE NOT LOGGED
-                    else:  # not isLogged(df):
-                        if self.SPECIES_CD_1 is not None:
-                            if self.BEC_ZONE_CODE in ['CMA', 'IMA']:
-                                return inspect.getframeinfo(inspect.currentframe()).lineno, 'N', None
-                            elif self.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH', 'BAFA']:
-                                if self.season == 'dormant':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                else:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                            else:
-                                if self.season == 'dormant':
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                else:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                        else:
-                            if self.INVENTORY_STANDARD_CD == 'F':
-                                if self.NON_PRODUCTIVE_CD in [11, 12, 13]:
-                                    if self.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']:
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                                    else:  # (self.BEC_ZONE_CODE in self.dryBECzones) or (self.dry_wet == 'dry'):
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                                elif self.NON_PRODUCTIVE_CD == 35:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'W', None
-                                elif self.NON_PRODUCTIVE_CD == 42:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'N', None
-                                elif self.NON_PRODUCTIVE_CD in [60, 62, 63]:
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                                elif self.NON_PRODUCTIVE_CD is None:
-                                    if self.BEC_ZONE_CODE in ['CMA', 'IMA']:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'N', None
-                                    elif self.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']:
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                                    else:  # (self.BEC_ZONE_CODE in self.dryBECzones) or (self.dry_wet == 'dry'):
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                                else:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'N', None
-                            else:  # self.INVENTORY_STANDARD_CD in ['V','I','L']:
-                                if self.LAND_COVER_CLASS_CD_1 in ['LA', 'RE', 'RI', 'OC']:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'W', None
-                                elif self.LAND_COVER_CLASS_CD_1 == 'HG':
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                                elif self.LAND_COVER_CLASS_CD_1 in ['BY', 'BM', 'BL']:
-                                    if self.season == 'dormant':
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                    else:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                                elif self.LAND_COVER_CLASS_CD_1 in ['SL', 'ST', 'HE', 'HF', None]:
-                                    if self.BEC_ZONE_CODE in ['CMA', 'IMA']:
-                                        return inspect.getframeinfo(inspect.currentframe()).lineno, 'N', None
-                                    elif self.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']:
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-1', None
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'D-2', None
-                                    else:  # (self.BEC_ZONE_CODE in self.dryBECzones) or (self.dry_wet == 'dry'):
-                                        if self.season == 'dormant':
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1a', None
-                                        else:
-                                            return inspect.getframeinfo(inspect.currentframe()).lineno, 'O-1b', None
-                                else:
-                                    return inspect.getframeinfo(inspect.currentframe()).lineno, 'N', None
+        # The tree is evaluated once, and the season only picks between the paired leaves
+        result = bcwft_tree.decision_tree(stand, self)
+        if result is None:
+            return None
+        leaf, modifier = result
+        if stand.season == 'both':
+            return _season_result(leaf, modifier, 'growing'), _season_result(leaf, modifier, 'dormant')
+        return _season_result(leaf, modifier, stand.season)
 
     def getFuelType(self,
                     season: str,
@@ -1890,10 +572,12 @@ class FuelTyping:
                     SPECIES_CD_5: str,
                     SPECIES_PCT_5: float,
                     SPECIES_CD_6: str,
-                    SPECIES_PCT_6: float) -> tuple:
+                    SPECIES_PCT_6: float,
+                    reference_date=None) -> tuple:
         """
         Function to generate the fuel type with the BC Wildfire Fuel Typing algorithm
-        :param season:
+        :param season: season for fuel typing assignments. Options: "growing", "dormant", or "both" to get the
+            results of both seasons from a single evaluation
         :param COAST_INTERIOR_CD:
         :param BCLCS_LEVEL_1:
         :param BCLCS_LEVEL_2:
@@ -1926,58 +610,1380 @@ class FuelTyping:
         :param SPECIES_PCT_5:
         :param SPECIES_CD_6:
         :param SPECIES_PCT_6:
+        :param reference_date: the date (or year) harvest and disturbance lags are measured to (default: today)
+        :return: a tuple containing
+            1: the rule ID of the decision tree leaf (see bcwft_rules.RULE_TABLE),
+            2: the fuel type, and
+            3: the fuel type modifier
+            If the season is "both", a tuple of the growing season and dormant season tuples is returned.
+        """
+        # Create an immutable record of the stand inputs
+        stand = StandRecord(season, COAST_INTERIOR_CD, BCLCS_LEVEL_1, BCLCS_LEVEL_2, BCLCS_LEVEL_3, BCLCS_LEVEL_4,
+                            BCLCS_LEVEL_5, BEC_ZONE_CODE, BEC_SUBZONE, EARLIEST_NONLOGGING_DIST_TYPE,
+                            EARLIEST_NONLOGGING_DIST_DATE, HARVEST_DATE, CROWN_CLOSURE, PROJ_HEIGHT_1, PROJ_AGE_1,
+                            VRI_LIVE_STEMS_PER_HA, VRI_DEAD_STEMS_PER_HA, STAND_PERCENTAGE_DEAD, INVENTORY_STANDARD_CD,
+                            NON_PRODUCTIVE_CD, LAND_COVER_CLASS_CD_1, SPECIES_CD_1, SPECIES_PCT_1, SPECIES_CD_2,
+                            SPECIES_PCT_2, SPECIES_CD_3, SPECIES_PCT_3, SPECIES_CD_4, SPECIES_PCT_4, SPECIES_CD_5,
+                            SPECIES_PCT_5, SPECIES_CD_6, SPECIES_PCT_6)
+
+        # Run the fuel typing algorithm on the stand record
+        return self.classifyStand(stand, reference_date)
+
+    def classifyStand(self, stand: StandRecord, reference_date=None) -> tuple:
+        """
+        Function to generate the fuel type of a stand record with the BC Wildfire Fuel Typing algorithm.
+        The FuelTyping instance is not modified, so a single instance can be shared between threads.
+        :param stand: the stand record (any derived bcwft variables it contains are recalculated)
+        :param reference_date: the date (or year) harvest and disturbance lags are measured to (default: today)
         :return: a tuple containing
-            1: the line number where the code exited the decision tree,
+            1: the rule ID of the decision tree leaf (see bcwft_rules.RULE_TABLE),
             2: the fuel type, and
             3: the fuel type modifier
         """
-        self.season = season
-        self.COAST_INTERIOR_CD = COAST_INTERIOR_CD
-        self.BCLCS_LEVEL_1 = BCLCS_LEVEL_1
-        self.BCLCS_LEVEL_2 = BCLCS_LEVEL_2
-        self.BCLCS_LEVEL_3 = BCLCS_LEVEL_3
-        self.BCLCS_LEVEL_4 = BCLCS_LEVEL_4
-        self.BCLCS_LEVEL_5 = BCLCS_LEVEL_5
-        self.BEC_ZONE_CODE = BEC_ZONE_CODE
-        self.BEC_SUBZONE = BEC_SUBZONE
-        self.EARLIEST_NONLOGGING_DIST_TYPE = EARLIEST_NONLOGGING_DIST_TYPE
-        self.EARLIEST_NONLOGGING_DIST_DATE = EARLIEST_NONLOGGING_DIST_DATE
-        self.HARVEST_DATE = HARVEST_DATE
-        self.CROWN_CLOSURE = CROWN_CLOSURE
-        self.PROJ_HEIGHT_1 = PROJ_HEIGHT_1
-        self.PROJ_AGE_1 = PROJ_AGE_1
-        self.VRI_LIVE_STEMS_PER_HA = VRI_LIVE_STEMS_PER_HA
-        self.VRI_DEAD_STEMS_PER_HA = VRI_DEAD_STEMS_PER_HA
-        self.STAND_PERCENTAGE_DEAD = STAND_PERCENTAGE_DEAD
-        self.INVENTORY_STANDARD_CD = INVENTORY_STANDARD_CD
-        self.NON_PRODUCTIVE_CD = NON_PRODUCTIVE_CD
-        self.LAND_COVER_CLASS_CD_1 = LAND_COVER_CLASS_CD_1
-        self.SPECIES_CD_1 = SPECIES_CD_1
-        self.SPECIES_PCT_1 = SPECIES_PCT_1
-        self.SPECIES_CD_2 = SPECIES_CD_2
-        self.SPECIES_PCT_2 = SPECIES_PCT_2
-        self.SPECIES_CD_3 = SPECIES_CD_3
-        self.SPECIES_PCT_3 = SPECIES_PCT_3
-        self.SPECIES_CD_4 = SPECIES_CD_4
-        self.SPECIES_PCT_4 = SPECIES_PCT_4
-        self.SPECIES_CD_5 = SPECIES_CD_5
-        self.SPECIES_PCT_5 = SPECIES_PCT_5
-        self.SPECIES_CD_6 = SPECIES_CD_6
-        self.SPECIES_PCT_6 = SPECIES_PCT_6
+        if self.cache_size <= 0:
+            return self._classifyStand(stand, reference_date)
+
+        # Look up the result of stands with the same inputs, season and reference year
+        referenceYear = _reference_year(reference_date)
+        key = (_cache_key(stand), referenceYear)
+        with self._cacheLock:
+            if key in self._cache:
+                self._cacheHits += 1
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            self._cacheMisses += 1
+
+        # Exceptions are not cached, so invalid stands raise on every call
+        result = self._classifyStand(stand, referenceYear)
+
+        with self._cacheLock:
+            self._cache[key] = result
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+                self._cacheEvictions += 1
+        return result
 
+    def _classifyStand(self, stand: StandRecord, reference_date=None) -> tuple:
+        """
+        Function to generate the fuel type of a stand record without the result cache.
+        """
         # Verify inputs
-        self.verifyInputs()
+        self.verifyInputs(stand)
 
         # Process the input variables
-        self.isVegetated()
-        self.isForested()
-        self.isLogged()
-        self.isBurned()
-        self.getHarvLag()
-        self.getDistLag()
-        self.getPrcntConifer()
-        self.getDryWet()
-        self.getStocking()
+        stand = self.deriveVariables(stand, reference_date)
 
         # Run the fuel typing algorithm via the decision tree
-        return self.decisionTree()
+        return self.decisionTree(stand)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Function to get the hit, miss and eviction counts of the result cache.
+        :return: a CacheInfo tuple
+        """
+        with self._cacheLock:
+            return CacheInfo(self._cacheHits, self._cacheMisses, self._cacheEvictions, self.cache_size,
+                             len(self._cache))
+
+    def cache_clear(self) -> None:
+        """
+        Function to empty the result cache and reset its statistics.
+        :return: None
+        """
+        with self._cacheLock:
+            self._cache.clear()
+            self._cacheHits = self._cacheMisses = self._cacheEvictions = 0
+        return
+
+    def classify_frame(self, data, season: str, reference_date=None, evaluator: str = 'masks',
+                       n_threads: int = 1, thread_info: list = None) -> tuple:
+        """
+        Function to generate fuel types for a batch of stands with the BC Wildfire Fuel Typing algorithm.
+        The decision tree is evaluated over whole columns, giving the same results as calling getFuelType on each
+        row. Missing codes (None or NaN) are read as None, and missing numbers as NaN. None dates are read as None,
+        and other missing dates (NaT, the nulls of datetime and pyarrow columns, or invalid dates) as NaT: a NaT
+        harvest date is logged, as in getFuelType and the pandas rows of the original fuel typing tool.
+        :param data: a StandBatch, or a pandas DataFrame, a dictionary of arrays or a pyarrow Table or RecordBatch
+            containing the fldList[3:] columns
+        :param season: season for fuel typing assignments. Options: "growing", "dormant", or "both" to get the
+            results of both seasons from a single evaluation
+        :param reference_date: the date (or year) harvest and disturbance lags are measured to (default: the
+            reference date of a StandBatch, otherwise today)
+        :param evaluator: how the decision tree is evaluated. Options: "masks" (boolean masks over the stands
+            reaching each branch), "flat" (each stand walks the flat node table, with a Numba-compiled kernel if
+            Numba is installed), "table" (the features of each stand are binned and looked up in the decision tree
+            compiled into a lookup table, see bcwft_table.py)
+        :param n_threads: number of threads classifying chunks of the batch in parallel. The chunks are evaluated
+            by NumPy kernels that release the GIL, so the threads share the batch without copying it to other
+            processes.
+        :param thread_info: optional list the ThreadInfo of each thread of a multi-threaded call is appended to.
+            The list belongs to the call, so concurrent calls on a shared instance each get their own throughput.
+        :return: a tuple of three aligned object arrays containing
+            1: the rule ID of the decision tree leaf each stand reached (None if no leaf was reached),
+            2: the fuel type ("FuelTyping-Error" if the inputs were rejected, "NoneTypeReturn-ERROR" if no
+               leaf was reached), and
+            3: the fuel type modifier
+            If the season is "both", a tuple of the growing season and dormant season tuples is returned.
+            The results of a pyarrow Table or RecordBatch are pyarrow arrays instead (int16 rule IDs,
+            dictionary-encoded fuel types and float64 fuel type modifiers, with None as null), which can be appended
+            to the input table without converting to Python objects.
+        """
+        _check_season_evaluator(season, evaluator)
+        if n_threads > 1 and _batch_length(data, self.fldList[3]) > _THREAD_CHUNK_SIZE:
+            return self._threaded_classify_frame(data, season, reference_date, evaluator, n_threads, thread_info)
+
+        stands = self._as_stand_batch(data, reference_date)
+        tree = self._evaluate(stands, evaluator)
+
+        # The tree is evaluated once, and the season only picks between the paired leaves
+        seasonArrays = self._season_arrow_arrays if _is_arrow(data) else self._season_arrays
+        if season == 'both':
+            return seasonArrays(tree, 'growing'), seasonArrays(tree, 'dormant')
+        return seasonArrays(tree, season)
+
+    def _threaded_classify_frame(self, data, season: str, reference_date, evaluator: str, n_threads: int,
+                                 thread_info: list = None) -> tuple:
+        """
+        Function to classify a batch in chunks on a pool of threads, appending the throughput of each thread to
+        thread_info (if given).
+        :return: the results of classify_frame
+        """
+        n = _batch_length(data, self.fldList[3])
+        chunkSize = max(_THREAD_CHUNK_SIZE, -(-n // (4 * n_threads)))
+        if not isinstance(data, StandBatch):
+            # The reference year is fixed once, so every chunk gets the same year
+            reference_date = _reference_year(reference_date)
+
+        stats = {}
+        statsLock = threading.Lock()
+
+        def classify(start):
+            stop = min(start + chunkSize, n)
+            t = time.perf_counter()
+            chunk = data.slice(start, stop) if isinstance(data, StandBatch) else _slice_batch(data, start, stop)
+            result = self.classify_frame(chunk, season, reference_date, evaluator)
+            seconds = time.perf_counter() - t
+            with statsLock:
+                chunks, stands, total = stats.get(threading.current_thread().name, (0, 0, 0.0))
+                stats[threading.current_thread().name] = (chunks + 1, stands + stop - start, total + seconds)
+            return result
+
+        with ThreadPoolExecutor(max_workers=n_threads, thread_name_prefix='bcwft') as pool:
+            results = list(pool.map(classify, range(0, n, chunkSize)))
+
+        if thread_info is not None:
+            thread_info.extend(ThreadInfo(thread, chunks, stands, seconds, stands / seconds if seconds else nan)
+                               for thread, (chunks, stands, seconds) in sorted(stats.items()))
+        if season == 'both':
+            return tuple(_concat_results([result[k] for result in results]) for k in range(2))
+        return _concat_results(results)
+
+    def classify_iter(self, records, season: str, reference_date=None, batch_size: int = 50000,
+                      evaluator: str = 'masks'):
+        """
+        Generator to classify a stream of stands in fixed-size micro-batches with classify_frame, so memory use
+        depends on the batch size rather than the size of the input.
+        :param records: an iterable of stands or batches of stands. Each item is either
+            a stand: a dictionary of fldList[3:] values, or a tuple or list of the fldList[3:] values in order, or
+            a batch: a pandas DataFrame, a dictionary of arrays, or a pyarrow RecordBatch or Table.
+            Stands are buffered into micro-batches of batch_size, and batches longer than batch_size are sliced.
+        :param season: season for fuel typing assignments. Options: "growing", "dormant", or "both"
+        :param reference_date: the date (or year) harvest and disturbance lags are measured to (default: today).
+            The reference year is fixed when the first micro-batch is classified, so it is the same for the whole
+            stream.
+        :param batch_size: maximum number of stands in each micro-batch
+        :param evaluator: how the decision tree is evaluated (see classify_frame)
+        :return: yields a result tuple of classify_frame for each micro-batch, in the order of the input stands
+            (pyarrow arrays for the micro-batches of pyarrow batches)
+        """
+        if batch_size < 1:
+            raise ValueError('The "batch_size" parameter must be a positive integer.')
+        referenceYear = _reference_year(reference_date)
+
+        for batch in _micro_batches(records, self.fldList[3:], batch_size):
+            yield self.classify_frame(batch, season, referenceYear, evaluator)
+
+    def project_frame(self, data, season: str, years: int, reference_date=None, height_growth=None,
+                      evaluator: str = 'masks'):
+        """
+        Function to project the fuel types of a batch of stands across future years, as the stands age and their
+        harvest and disturbance lags grow. The inputs are read and the year-invariant bcwft variables (species
+        composition, zone and subzone flags, vegetation classes) are derived once, then each year only advances
+        harv_lag, dist_lag, PROJ_AGE_1 and optionally PROJ_HEIGHT_1 before the decision tree is evaluated.
+        Each year gives the same results as classify_frame with that year as the reference date and the stands aged
+        to that year.
+        :param data: a StandBatch, or a pandas DataFrame, a dictionary of arrays or a pyarrow Table or RecordBatch
+            containing the fldList[3:] columns
+        :param season: season for fuel typing assignments. Options: "growing", "dormant", or "both"
+        :param years: number of years to project past the reference year
+        :param reference_date: the date (or year) of the first projected year (default: the reference date of a
+            StandBatch, otherwise today)
+        :param height_growth: optional function of (stands, years) returning the PROJ_HEIGHT_1 of the stands a number
+            of years after the reference year, where stands is the StandBatch of that year (with PROJ_AGE_1 and the
+            lags advanced, and the inventory PROJ_HEIGHT_1). Heights stay at their inventory values without it.
+        :param evaluator: how the decision tree is evaluated (see classify_frame)
+        :return: a Projection of the reference year and the following years. If the season is "both", a tuple of
+            the growing season and dormant season Projections is returned.
+        """
+        _check_season_evaluator(season, evaluator)
+        if years < 0:
+            raise ValueError('The "years" parameter must be a non-negative integer.')
+        stands = self._as_stand_batch(data, reference_date)
+
+        seasons = ['growing', 'dormant'] if season == 'both' else [season]
+        rules = {s: np.empty((years + 1, len(stands)), dtype='int16') for s in seasons}
+        modifiers = np.empty((years + 1, len(stands)))
+        for k in range(years + 1):
+            tree = self._evaluate(stands.projected(k, height_growth), evaluator)
+            for s in seasons:
+                rules[s][k] = np.where(tree.failed, -1, tree.leaf if s == 'dormant' else _GROWING_RULES[tree.leaf])
+            modifiers[k] = tree.modifier
+
+        projectedYears = np.arange(stands.reference_year, stands.reference_year + years + 1)
+        projections = tuple(Projection(projectedYears, rules[s], modifiers) for s in seasons)
+        return projections if season == 'both' else projections[0]
+
+    def ensemble_frame(self, data, season: str, replicates: int = 100, errors: dict = None, reference_date=None,
+                       seed=None, evaluator: str = 'masks'):
+        """
+        Function to estimate how stable the fuel types of a batch of stands are under the estimation errors of their
+        inputs. Each stand is replicated, the replicates' inputs are perturbed with random errors, and all the
+        replicates are classified together by the batch engine. Perturbed values are kept between 0 and their
+        upper bounds (100 for percentages), and missing values are not perturbed.
+        :param data: a StandBatch, or a pandas DataFrame, a dictionary of arrays or a pyarrow Table or RecordBatch
+            containing the fldList[3:] columns
+        :param season: season for fuel typing assignments. Options: "growing", "dormant", or "both"
+        :param replicates: number of perturbed replicates of each stand
+        :param errors: a dictionary of {field: InputError} of the fields to perturb (default: DEFAULT_INPUT_ERRORS).
+            Options: CROWN_CLOSURE, PROJ_HEIGHT_1, PROJ_AGE_1, VRI_LIVE_STEMS_PER_HA, VRI_DEAD_STEMS_PER_HA,
+            STAND_PERCENTAGE_DEAD
+        :param reference_date: the date (or year) harvest and disturbance lags are measured to (default: the
+            reference date of a StandBatch, otherwise today)
+        :param seed: seed of the random number generator (see numpy.random.default_rng), for repeatable ensembles
+        :param evaluator: how the decision tree is evaluated (see classify_frame)
+        :return: an Ensemble of the fuel type counts, modal fuel type and confidence of each stand. If the season is
+            "both", a tuple of the growing season and dormant season Ensembles is returned (from the same
+            replicates).
+        """
+        _check_season_evaluator(season, evaluator)
+        if replicates < 1:
+            raise ValueError('The "replicates" parameter must be a positive integer.')
+        errors = DEFAULT_INPUT_ERRORS if errors is None else errors
+        for fld, error in errors.items():
+            if fld not in _ENSEMBLE_FIELDS:
+                raise ValueError(f'The "errors" parameter can only perturb the fields: {list(_ENSEMBLE_FIELDS)}')
+            elif error.distribution not in ['normal', 'uniform']:
+                raise ValueError(f'The error distribution of {fld} must be either "normal" or "uniform".')
+        stands = self._as_stand_batch(data, reference_date)
+        rng = np.random.default_rng(seed)
+
+        seasons = ['growing', 'dormant'] if season == 'both' else [season]
+        nFuelTypes = len(_ENSEMBLE_FUEL_TYPES)
+        counts = {s: np.empty((len(stands), nFuelTypes), dtype='int32') for s in seasons}
+        chunkSize = max(1, _ENSEMBLE_CHUNK_SIZE // replicates)
+        for start in range(0, len(stands), chunkSize):
+            chunk = stands.slice(start, start + chunkSize).repeat(replicates)
+            for fld, error in errors.items():
+                setattr(chunk, fld, _perturb(getattr(chunk, fld), error, _ENSEMBLE_FIELDS[fld], rng))
+            chunk.stocking = chunk.VRI_LIVE_STEMS_PER_HA + chunk.VRI_DEAD_STEMS_PER_HA
+            tree = self._evaluate(chunk, evaluator)
+
+            # Count the fuel types of the replicates of each stand
+            n = len(chunk) // replicates
+            offsets = np.repeat(np.arange(n) * nFuelTypes, replicates)
+            for s in seasons:
+                rules = np.where(tree.failed, -1, tree.leaf if s == 'dormant' else _GROWING_RULES[tree.leaf])
+                counts[s][start:start + n] = np.bincount(offsets + _ENSEMBLE_FUEL_TYPE_INDEX[rules],
+                                                         minlength=n * nFuelTypes).reshape(n, nFuelTypes)
+
+        ensembles = []
+        for s in seasons:
+            modal = counts[s].argmax(axis=1)
+            ensembles.append(Ensemble(_ENSEMBLE_FUEL_TYPES, counts[s], _ENSEMBLE_FUEL_TYPES[modal],
+                                      counts[s][np.arange(len(stands)), modal] / replicates))
+        return tuple(ensembles) if season == 'both' else ensembles[0]
+
+    def _as_stand_batch(self, data, reference_date) -> 'StandBatch':
+        """
+        Function to get the StandBatch of a batch, with the lags calculated to a reference date (if not None).
+        :return: a StandBatch object
+        """
+        if not isinstance(data, StandBatch):
+            return self.stand_batch(data, reference_date)
+        elif reference_date is not None:
+            return data.with_reference_year(_reference_year(reference_date))
+        return data
+
+    def _evaluate(self, stands: 'StandBatch', evaluator: str) -> '_MaskTree':
+        """
+        Function to evaluate the decision tree over a batch of stands with an evaluator (see classify_frame).
+        :return: the _MaskTree of the leaves reached by the stands
+        """
+        if evaluator in ['flat', 'table']:
+            return self._flat_decision_tree(stands, lookup=evaluator == 'table')
+        return self._batch_decision_tree(stands)
+
+    def _season_arrays(self, tree: '_MaskTree', season: str) -> tuple:
+        """
+        Function to get the rule IDs, fuel types and fuel type modifiers of a season from the leaves of a batch.
+        :return: a tuple of three aligned object arrays (see classify_frame)
+        """
+        rules = tree.leaf if season == 'dormant' else _GROWING_RULES[tree.leaf]
+
+        rowRef = rules.astype(object)
+        rowRef[rules == 0] = None
+
+        fuelType = _FUEL_TYPES[rules]
+        fuelType[rules == 0] = 'NoneTypeReturn-ERROR'
+        fuelType[tree.failed] = 'FuelTyping-Error'
+
+        ftModifier = tree.modifier.astype(object)
+        ftModifier[np.isnan(tree.modifier)] = None
+
+        return rowRef, fuelType, ftModifier
+
+    def _season_arrow_arrays(self, tree: '_MaskTree', season: str) -> tuple:
+        """
+        Function to get the rule IDs, fuel types and fuel type modifiers of a season from the leaves of a batch as
+        pyarrow arrays.
+        :return: a tuple of three aligned pyarrow arrays (see classify_frame)
+        """
+        import pyarrow as pa
+
+        rules = tree.leaf if season == 'dormant' else _GROWING_RULES[tree.leaf]
+
+        rowRef = pa.array(rules, mask=rules == 0)
+        fuelType = pa.DictionaryArray.from_arrays(
+            np.where(tree.failed, len(_ARROW_FUEL_TYPES) - 1, rules).astype('int16'), _ARROW_FUEL_TYPES)
+        ftModifier = pa.array(tree.modifier, from_pandas=True)
+
+        return rowRef, fuelType, ftModifier
+
+    def validate_batch(self, data) -> np.ndarray:
+        """
+        Function to check a batch of stands against the fldList/fldDTypes schema and the treeList, becZones and
+        becSubzones code lists, without raising on invalid stands.
+        :param data: a pandas DataFrame or a dictionary of arrays containing the fldList[3:] columns
+        :return: a uint64 array of problem bits for each stand. Bit i is set when the value of field
+            fldList[3 + i] is invalid (see describe_problems), so 0 means the stand passed every check.
+        """
+        missingFields = [fld for fld in self.fldList[3:] if fld not in data]
+        if missingFields:
+            raise KeyError(f'The input data is missing the fields: {missingFields}')
+
+        codeLists = {'BEC_ZONE_CODE': self.becZones, 'BEC_SUBZONE': self.becSubzones}
+        for fld in _SPECIES_FIELDS:
+            codeLists[fld] = self.treeList
+
+        problems = np.zeros(len(data[self.fldList[3]]), dtype='uint64')
+        for bit, (fld, dType) in enumerate(zip(self.fldList[3:], self.fldDTypes[3:])):
+            values = data[fld]
+            values = _to_numpy(values)
+            if dType in ['object', 'str']:
+                # BEC zone and subzone codes are required
+                invalid = _invalid_codes(values, codeLists.get(fld), fld in ['BEC_ZONE_CODE', 'BEC_SUBZONE'])
+            elif dType.startswith('datetime64'):
+                invalid = _invalid_dates(values)
+            else:
+                invalid = _invalid_numbers(values, dType.startswith('int'))
+            problems[invalid] |= np.uint64(1 << bit)
+
+        return problems
+
+    def describe_problems(self, problems: int) -> list:
+        """
+        Function to get the names of the fields flagged by validate_batch.
+        :param problems: the problem bits of a stand (or several stands combined with a bitwise or)
+        :return: a list of field names
+        """
+        problems = int(problems)
+        return [fld for bit, fld in enumerate(self.fldList[3:]) if (problems >> bit) & 1]
+
+    def stand_batch(self, data, reference_date=None) -> 'StandBatch':
+        """
+        Function to read the fldList[3:] columns of a batch into a StandBatch and derive the bcwft variables.
+        :param data: a pandas DataFrame, a dictionary of arrays, or a pyarrow Table or RecordBatch. The columns of
+            a pyarrow batch are read without converting to Python objects, and dictionary-encoded string columns
+            keep their dictionaries.
+        :param reference_date: the date (or year) harvest and disturbance lags are measured to (default: today)
+        :return: a StandBatch object
+        """
+        arrow = _is_arrow(data)
+        missingFields = [fld for fld in self.fldList[3:] if fld not in (data.schema.names if arrow else data)]
+        if missingFields:
+            raise KeyError(f'The input data is missing the fields: {missingFields}')
+
+        stands = StandBatch(data.num_rows if arrow else len(data[self.fldList[3]]))
+        column = data.column if arrow else data.__getitem__
+
+        # Codes are dictionary-encoded, with None or NaN flagged as null. The species code fields share categories.
+        encode = stands.encode_arrow if arrow else stands.encode
+        for fld in _CODE_FIELDS:
+            if not fld.startswith('SPECIES_CD_'):
+                encode([fld], [column(fld)])
+        encode(_SPECIES_FIELDS, [column(fld) for fld in _SPECIES_FIELDS])
+
+        # Numbers are read as floats, with missing values as NaN
+        for fld in _NUMBER_FIELDS:
+            values = column(fld)
+            if arrow:
+                values = values.cast('float64').to_numpy(zero_copy_only=False)
+            elif _is_series(values):
+                values = values.to_numpy(dtype='float64', na_value=nan)
+            setattr(stands, fld, np.asarray(values, dtype='float64'))
+
+        # Dates are only needed as years, with missing or invalid dates flagged as null. None dates are also flagged
+        # as none: like getFuelType, only a None harvest date is unlogged, and other missing dates (NaT, and the nulls
+        # of datetime and pyarrow columns, which pandas reads as NaT) are logged, with NaN lags.
+        for fld in _DATE_FIELDS:
+            years, stands.null[fld] = _arrow_date_years(column(fld)) if arrow else _date_years(column(fld))
+            stands.none[fld] = np.zeros(len(stands), dtype=bool) if arrow else _is_none(column(fld))
+            setattr(stands, fld, years)
+
+        # Precompute the membership bits
+        membership = np.zeros(len(stands), dtype='uint16')
+        for fld, bit in zip(_SPECIES_FIELDS, _CONIFER_BITS):
+            membership |= np.where(stands.isin(fld, self.coniferList), bit, 0).astype('uint16')
+        membership |= np.where(stands.startswith('BEC_SUBZONE', ('d', 'x')), _DRY_SUBZONE, 0).astype('uint16')
+        membership |= np.where(stands.startswith('BEC_SUBZONE', ('m', 'w', 'v')), _WET_SUBZONE, 0).astype('uint16')
+        membership |= np.where(stands.isin('BEC_ZONE_CODE', self.dryBECzones), _DRY_ZONE, 0).astype('uint16')
+        membership |= np.where(stands.isin('BEC_ZONE_CODE', self.borealBECzonse), _BOREAL_ZONE, 0).astype('uint16')
+        stands.membership = membership
+
+        # Derive the bcwft variables
+        stands.is_vegetated = stands.eq('BCLCS_LEVEL_1', 'V')
+        stands.is_forested = stands.eq('BCLCS_LEVEL_2', 'T')
+        stands.is_logged = ~stands.none['HARVEST_DATE']
+        stands.is_burned = stands.isin('EARLIEST_NONLOGGING_DIST_TYPE', ['B', 'BE', 'BG', 'BW', 'BR', 'NB'])
+        stands.set_reference_year(_reference_year(reference_date))
+
+        pct_cnfr = np.zeros(len(stands))
+        for i, bit in enumerate(_CONIFER_BITS, start=1):
+            pct_cnfr += np.where(stands.member(bit), getattr(stands, f'SPECIES_PCT_{i}'), 0)
+        stands.pct_cnfr = np.where(pct_cnfr > 100, 100, pct_cnfr)
+        stands.dom_conifers = self._batch_dom_conifers(stands)
+
+        stands.stocking = stands.VRI_LIVE_STEMS_PER_HA + stands.VRI_DEAD_STEMS_PER_HA
+
+        # Stands getFuelType would reject before reaching the decision tree
+        stands.failed = (stands.null['BEC_ZONE_CODE'] | stands.null['BEC_SUBZONE']) | stands.eq('BEC_SUBZONE', '')
+
+        return stands
+
+    def _batch_dom_conifers(self, stands: 'StandBatch') -> dict:
+        """
+        Function to build the species composition index of a batch of stands, used by the dominant conifer checks
+        of the decision tree. Follows the same rules as checkDomConifers.
+        :param stands: a StandBatch object
+        :return: a dictionary of {species group: boolean array} for each group in _DOM_CONIFER_GROUPS
+        """
+        sppCd = np.column_stack([getattr(stands, fld) for fld in _SPECIES_FIELDS])
+        sppPrcnt = np.column_stack([getattr(stands, f'SPECIES_PCT_{i}') for i in range(1, 7)])
+
+        # The species code fields share categories, so groups are matched once per category
+        codes = stands.categories[_SPECIES_FIELDS[0]]
+        isConifer = np.column_stack([stands.member(bit) for bit in _CONIFER_BITS])
+        hasPrcnt = ~np.isnan(sppPrcnt)
+
+        def maxPrcnt(inList):
+            # Maximum percentage of the matching species, skipping NaN. 0 if no species match.
+            valid = inList & hasPrcnt
+            prcnt = np.where(valid, sppPrcnt, -np.inf).max(axis=1)
+            return np.where(valid.any(axis=1), prcnt, np.where(inList.any(axis=1), nan, 0))
+
+        domConifers = {}
+        for group in _DOM_CONIFER_GROUPS:
+            inCheck = np.isin(codes, group)[sppCd]
+            inAlt = ~inCheck & isConifer
+            cnfrPrcnt = maxPrcnt(inCheck)
+            altCnfrPrcnt = maxPrcnt(inAlt)
+
+            # Ties are won by the species listed first
+            tie = (cnfrPrcnt != 0) & (cnfrPrcnt == altCnfrPrcnt)
+            domConifers[group] = np.where(tie, inCheck.argmax(axis=1) < inAlt.argmax(axis=1),
+                                          cnfrPrcnt > altCnfrPrcnt)
+        return domConifers
+
+    def _batch_decision_tree(self, s: 'StandBatch') -> '_MaskTree':
+        """
+        The fuel typing decision tree evaluated as boolean masks over a batch of stands, generated from the same rule
+        specification as decisionTree, with the same leaves.
+        """
+        tree = _MaskTree(len(s))
+        tree.failed |= s.failed
+        bcwft_tree.mask_decision_tree(s, tree, ~s.failed, self)
+        return tree
+
+    def _flat_decision_tree(self, s: 'StandBatch', lookup: bool = False) -> '_MaskTree':
+        """
+        The fuel typing decision tree evaluated by walking each stand through the flat node table (or by looking up
+        the leaves of the binned features in the lookup table compiled from it), generated from the same rule
+        specification as decisionTree, with the same leaves.
+        """
+        features, codeSets = bcwft_tree.flat_inputs(s)
+        if lookup:
+            rules = bcwft_table.lookup_table().classify(features, codeSets)
+        else:
+            rules = _flat_traverse(features, codeSets)
+
+        tree = _MaskTree(len(s))
+        tree.failed |= s.failed | (rules == -1)
+        tree.leaf = np.where(tree.failed, 0, rules).astype('int16')
+
+        # Modifiers are either constants, or a constant times a feature
+        modFeature = _MODIFIER_FEATURE[tree.leaf]
+        modValue = _MODIFIER_VALUE[tree.leaf]
+        featureValue = features[np.arange(len(s)), np.maximum(modFeature, 0)]
+        tree.modifier = np.where(modFeature >= 0, featureValue * modValue, modValue)
+        return tree
+
+
+class StandBatch:
+    """
+    Struct-of-arrays container for the input columns and derived bcwft variables of a batch of stands.
+    Code fields are dictionary-encoded as small integer arrays indexing StandBatch.categories[field] (null codes
+    are encoded as ""), dates are stored as int16 years (with None dates also flagged in StandBatch.none), and the
+    conifer, dry/wet subzone, dry zone and boreal zone checks are precomputed as bits of StandBatch.membership.
+    """
+    def __init__(self, n: int):
+        self.n = n
+        self.null = {}
+        self.none = {}
+        self.categories = {}
+        self.membership = np.zeros(n, dtype='uint16')
+
+    def __len__(self):
+        return self.n
+
+    def encode(self, fields: list, columns: list) -> None:
+        """
+        Function to dictionary-encode code fields, sharing one set of categories between the fields.
+        :param fields: names of the code fields
+        :param columns: the values of each field
+        :return: None
+        """
+        values = np.concatenate([np.asarray(column, dtype=object) for column in columns])
+        isnull = np.equal(values, None) | np.not_equal(values, values)
+        categories, codes = np.unique(np.where(isnull, '', values).astype(str), return_inverse=True)
+        codes = codes.astype(_code_dtype(len(categories)))
+        for k, fld in enumerate(fields):
+            self.null[fld] = isnull[k * self.n:(k + 1) * self.n]
+            self.categories[fld] = categories
+            setattr(self, fld, codes[k * self.n:(k + 1) * self.n])
+        return
+
+    def encode_arrow(self, fields: list, columns: list) -> None:
+        """
+        Function to dictionary-encode pyarrow code columns, sharing one set of categories between the fields.
+        Dictionary-encoded columns are read from their dictionaries and indices, other columns are
+        dictionary-encoded by pyarrow first, so only the distinct codes are converted to NumPy strings.
+        :param fields: names of the code fields
+        :param columns: the pyarrow arrays (or chunked arrays) of each field
+        :return: None
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        dictionaries, indices, nulls = [], [], []
+        for column in columns:
+            if isinstance(column, pa.ChunkedArray):
+                column = column.unify_dictionaries() if pa.types.is_dictionary(column.type) else column
+                column = column.combine_chunks()
+            if not pa.types.is_dictionary(column.type):
+                column = pc.dictionary_encode(column)
+            nulls.append(column.is_null().to_numpy(zero_copy_only=False))
+            indices.append(column.indices.fill_null(0).to_numpy(zero_copy_only=False))
+            dictionaries.append(pc.cast(column.dictionary, pa.string()).fill_null('').to_numpy(zero_copy_only=False)
+                                .astype(str))
+
+        # Null codes are encoded as "", the first of the sorted categories
+        categories = np.unique(np.concatenate([[''], *dictionaries]))
+        codeType = _code_dtype(len(categories))
+        for fld, dictionary, index, isnull in zip(fields, dictionaries, indices, nulls):
+            codes = np.searchsorted(categories, dictionary).astype(codeType)[index]
+            codes[isnull] = 0
+            self.null[fld] = isnull
+            self.categories[fld] = categories
+            setattr(self, fld, codes)
+        return
+
+    def decode(self, fld: str) -> np.ndarray:
+        """
+        Function to get the values of a code field, with null codes as None.
+        :param fld: name of the code field
+        :return: an object array
+        """
+        values = self.categories[fld].astype(object)[getattr(self, fld)]
+        values[self.null[fld]] = None
+        return values
+
+    def isin(self, fld: str, values) -> np.ndarray:
+        """
+        Function to check which stands have a code in a list of values.
+        :return: a boolean array
+        """
+        return np.isin(self.categories[fld], values)[getattr(self, fld)]
+
+    def eq(self, fld: str, value: str) -> np.ndarray:
+        """
+        Function to check which stands have a code equal to a value.
+        :return: a boolean array
+        """
+        return (self.categories[fld] == value)[getattr(self, fld)]
+
+    def startswith(self, fld: str, prefix) -> np.ndarray:
+        """
+        Function to check which stands have a code starting with a prefix (or a tuple of prefixes).
+        :return: a boolean array
+        """
+        categories = self.categories[fld]
+        if isinstance(prefix, str):
+            prefix = (prefix,)
+        match = np.zeros(len(categories), dtype=bool)
+        for p in prefix:
+            match |= np.char.startswith(categories, p)
+        return match[getattr(self, fld)]
+
+    def member(self, bit: int) -> np.ndarray:
+        """
+        Function to check which stands have a membership bit set.
+        :return: a boolean array
+        """
+        return (self.membership & bit) != 0
+
+    def set_reference_year(self, year: int) -> None:
+        """
+        Function to calculate the harvest and disturbance lags (years since the HARVEST_DATE and
+        EARLIEST_NONLOGGING_DIST_DATE years, 0 for future dates, NaN for missing dates) to a reference year.
+        :param year: the reference year
+        :return: None
+        """
+        self.reference_year = year
+        self.harv_lag = np.where(self.null['HARVEST_DATE'], nan,
+                                 np.maximum(year - self.HARVEST_DATE.astype('int32'), 0))
+        self.dist_lag = np.where(self.null['EARLIEST_NONLOGGING_DIST_DATE'], nan,
+                                 np.maximum(year - self.EARLIEST_NONLOGGING_DIST_DATE.astype('int32'), 0))
+        return
+
+    def slice(self, start: int, stop: int) -> 'StandBatch':
+        """
+        Function to get the stands from start to stop of the batch. The arrays are views of the arrays of the batch,
+        and the categories are shared.
+        :return: a StandBatch object
+        """
+        batch = copy.copy(self)
+        batch.n = len(range(self.n)[start:stop])
+        for name, value in vars(self).items():
+            if isinstance(value, np.ndarray) and len(value) == self.n:
+                setattr(batch, name, value[start:stop])
+            elif isinstance(value, dict) and name != 'categories':
+                setattr(batch, name, {k: v[start:stop] for k, v in value.items()})
+        return batch
+
+    def repeat(self, repeats: int) -> 'StandBatch':
+        """
+        Function to get a batch repeating each stand of the batch, with the repeats of each stand next to each other.
+        The categories are shared.
+        :param repeats: number of repeats of each stand
+        :return: a StandBatch object
+        """
+        batch = copy.copy(self)
+        batch.n = self.n * repeats
+        for name, value in vars(self).items():
+            if isinstance(value, np.ndarray) and len(value) == self.n:
+                setattr(batch, name, np.repeat(value, repeats))
+            elif isinstance(value, dict) and name != 'categories':
+                setattr(batch, name, {k: np.repeat(v, repeats) for k, v in value.items()})
+        return batch
+
+    def projected(self, years: int, height_growth=None) -> 'StandBatch':
+        """
+        Function to get a copy of the batch projected a number of years past its reference year: the lags are
+        calculated to the later year, and the stands are aged. The other arrays are shared with the original batch.
+        :param years: number of years to project
+        :param height_growth: optional function of (stands, years) returning the projected PROJ_HEIGHT_1 (see
+            FuelTyping.project_frame), not called for 0 years
+        :return: a StandBatch object
+        """
+        batch = self.with_reference_year(self.reference_year + years)
+        batch.PROJ_AGE_1 = self.PROJ_AGE_1 + years
+        if height_growth is not None and years:
+            batch.PROJ_HEIGHT_1 = np.asarray(height_growth(batch, years), dtype='float64')
+        return batch
+
+    def with_reference_year(self, year: int) -> 'StandBatch':
+        """
+        Function to get a copy of the batch with the lags calculated to another reference year.
+        The input arrays are shared with the original batch.
+        :param year: the reference year
+        :return: a StandBatch object
+        """
+        batch = copy.copy(self)
+        batch.set_reference_year(year)
+        return batch
+
+
+class _MaskTree:
+    """
+    Collects the decision tree leaves reached by a batch of stands. Seasonal leaves are collected as their dormant
+    season rule IDs (see bcwft_tree.GROWING_RULES).
+    """
+    def __init__(self, n: int):
+        self.leaf = np.zeros(n, dtype='int16')
+        self.modifier = np.full(n, nan)
+        self.failed = np.zeros(n, dtype=bool)
+
+    def split(self, mask: np.ndarray, cond: np.ndarray, fails: np.ndarray = None) -> tuple:
+        """
+        Function to split a mask into the stands that meet a condition and those that do not.
+        :param mask: stands reaching the condition
+        :param cond: the condition
+        :param fails: stands for which decisionTree raises an exception when evaluating the condition
+        :return: a tuple of (stands meeting the condition, remaining stands)
+        """
+        if fails is not None:
+            self.failed |= mask & fails
+            mask = mask & ~fails
+        return mask & cond, mask & ~cond
+
+    def put(self, mask: np.ndarray, leaf: int, modifier=None) -> None:
+        """
+        Function to assign a leaf to stands.
+        :param mask: stands reaching the leaf
+        :param leaf: the rule ID of the leaf
+        :param modifier: the fuel type modifier (a number, or an array of values for each stand)
+        :return: None
+        """
+        self.leaf[mask] = leaf
+        if modifier is not None:
+            self.modifier[mask] = modifier[mask] if isinstance(modifier, np.ndarray) else modifier
+        return
+
+
+def _season_result(leaf: int, modifier, season: str) -> tuple:
+    """
+    Function to get the result of a season from the leaf returned by the decision tree.
+    :param leaf: the leaf (the rule ID of the dormant season, see bcwft_tree.GROWING_RULES)
+    :param modifier: the fuel type modifier
+    :param season: the season (any season other than "dormant" gets the growing season result)
+    :return: a tuple of (rule ID, fuel type, fuel type modifier)
+    """
+    rule = leaf if season == 'dormant' else bcwft_tree.GROWING_RULES[leaf]
+    return rule, bcwft_tree.FUEL_TYPES[rule], modifier
+
+
+def _flat_rows(features: np.ndarray, codeSets: np.ndarray, op: np.ndarray, feature: np.ndarray, value: np.ndarray,
+               yes: np.ndarray, no: np.ndarray, null: np.ndarray, rules: np.ndarray) -> None:
+    """
+    Function to walk each stand through the flat node table, one stand at a time (compiled with Numba if installed).
+    :param features: the features of each stand (see bcwft_tree.flat_inputs)
+    :param codeSets: the codes in each code set (see bcwft_tree.flat_inputs)
+    :param op, feature, value, yes, no, null: the columns of the flat node table
+    :param rules: the output array of the rule ID reached by each stand
+    :return: None
+    """
+    for i in range(features.shape[0]):
+        k = 0
+        while op[k] != bcwft_tree.OP_LEAF:
+            v = features[i, feature[k]]
+            if v != v:
+                k = null[k]
+                continue
+            o = op[k]
+            if o == bcwft_tree.OP_IN:
+                met = codeSets[int(value[k]), int(v)]
+            elif o == bcwft_tree.OP_EQ:
+                met = v == value[k]
+            elif o == bcwft_tree.OP_NE:
+                met = v != value[k]
+            elif o == bcwft_tree.OP_LT:
+                met = v < value[k]
+            elif o == bcwft_tree.OP_LE:
+                met = v <= value[k]
+            elif o == bcwft_tree.OP_GT:
+                met = v > value[k]
+            elif o == bcwft_tree.OP_GE:
+                met = v >= value[k]
+            else:
+                met = True
+            k = yes[k] if met else no[k]
+        rules[i] = value[k]
+    return
+
+
+# Numba-compiled _flat_rows (see _flat_rows_kernel)
+_FLAT_ROWS_KERNEL = None
+
+
+def _flat_rows_kernel():
+    """
+    Function to get _flat_rows compiled by Numba, importing Numba on first use.
+    :return: the compiled function, or None if Numba is not installed
+    """
+    global _FLAT_ROWS_KERNEL
+    if _FLAT_ROWS_KERNEL is None:
+        try:
+            import numba
+        except ImportError:  # The flat node table is traversed with NumPy instead
+            _FLAT_ROWS_KERNEL = False
+        else:
+            _FLAT_ROWS_KERNEL = numba.njit(nogil=True, cache=True)(_flat_rows)
+    return _FLAT_ROWS_KERNEL or None
+
+
+def _flat_traverse(features: np.ndarray, codeSets: np.ndarray) -> np.ndarray:
+    """
+    Function to get the rule ID of the flat node table leaf reached by each stand. Without Numba, all stands step
+    down the table together, one level per iteration, so the cost grows with the depth of the table and not with the
+    number of branches.
+    :param features: the features of each stand (see bcwft_tree.flat_inputs)
+    :param codeSets: the codes in each code set (see bcwft_tree.flat_inputs)
+    :return: an int16 array of rule IDs (0: no leaf reached, -1: decisionTree raises an exception)
+    """
+    kernel = _flat_rows_kernel()
+    if kernel is not None:
+        rules = np.empty(len(features), dtype='int16')
+        kernel(features, codeSets, _NODE_OP, _NODE_FEATURE, _NODE_VALUE, _NODE_YES, _NODE_NO, _NODE_NULL, rules)
+        return rules
+
+    node = np.zeros(len(features), dtype='int32')
+    rows = np.arange(len(features))
+    while len(rows):
+        k = node[rows]
+        op = _NODE_OP[k]
+        value = _NODE_VALUE[k]
+        v = features[rows, _NODE_FEATURE[k]]
+        isNull = np.isnan(v)
+        with np.errstate(invalid='ignore'):
+            met = np.select([op == bcwft_tree.OP_EQ, op == bcwft_tree.OP_NE, op == bcwft_tree.OP_LT,
+                             op == bcwft_tree.OP_LE, op == bcwft_tree.OP_GT, op == bcwft_tree.OP_GE],
+                            [v == value, v != value, v < value, v <= value, v > value, v >= value], default=True)
+        isIn = (op == bcwft_tree.OP_IN) & ~isNull
+        met[isIn] = codeSets[value[isIn].astype('intp'), v[isIn].astype('intp')]
+
+        k = np.where(isNull, _NODE_NULL[k], np.where(met, _NODE_YES[k], _NODE_NO[k]))
+        node[rows] = k
+        rows = rows[_NODE_OP[k] != bcwft_tree.OP_LEAF]
+    return _NODE_VALUE[node].astype('int16')
+
+
+def _micro_batches(records, fields: list, batch_size: int):
+    """
+    Generator to regroup a stream of stands and batches of stands into batches of at most batch_size stands
+    (see FuelTyping.classify_iter).
+    :param records: an iterable of stands (dictionaries, tuples or lists) and batches (pandas DataFrames,
+        dictionaries of arrays, pyarrow RecordBatches or Tables)
+    :param fields: the fields of each stand, in the order of the tuple values
+    :param batch_size: maximum number of stands in each batch
+    :return: yields pandas DataFrames, dictionaries of arrays or lists, or pyarrow Tables or RecordBatches, in the
+        order of the input stands
+    """
+    rows = []
+    for item in records:
+        if not _is_batch(item, fields[0]):
+            if isinstance(item, dict):
+                item = tuple(item[fld] for fld in fields)
+            elif len(item) != len(fields):
+                raise ValueError(f'Stands must have {len(fields)} values, not {len(item)}.')
+            rows.append(item)
+            if len(rows) == batch_size:
+                yield dict(zip(fields, map(list, zip(*rows))))
+                rows = []
+            continue
+
+        # Batches keep their own boundaries, so the buffered stands are classified first
+        if rows:
+            yield dict(zip(fields, map(list, zip(*rows))))
+            rows = []
+        n = _batch_length(item, fields[0])
+        for start in range(0, n, batch_size):
+            yield _slice_batch(item, start, min(start + batch_size, n))
+    if rows:
+        yield dict(zip(fields, map(list, zip(*rows))))
+
+
+def _batch_length(batch, fld: str) -> int:
+    """
+    Function to get the number of stands in a batch.
+    :param batch: a StandBatch, a pandas DataFrame, a dictionary of arrays, or a pyarrow Table or RecordBatch
+    :param fld: a field of the batch
+    :return: the number of stands
+    """
+    if _is_arrow(batch):
+        return batch.num_rows
+    elif isinstance(batch, StandBatch) or _is_frame(batch):
+        return len(batch)
+    return len(batch[fld])
+
+
+def _concat_results(results: list) -> tuple:
+    """
+    Function to join the result tuples of the chunks of a batch (see classify_frame).
+    :return: a tuple of three aligned arrays
+    """
+    if results and _is_arrow_array(results[0][0]):
+        import pyarrow as pa
+        return tuple(pa.concat_arrays([result[k] for result in results]) for k in range(3))
+    return tuple(np.concatenate([result[k] for result in results]) for k in range(3))
+
+
+def _perturb(values: np.ndarray, error: InputError, upper: float, rng: np.random.Generator) -> np.ndarray:
+    """
+    Function to add random errors to the values of an input field, keeping them between 0 and an upper bound.
+    :param values: the values (NaN if missing, which stay NaN)
+    :param error: the error distribution
+    :param upper: the upper bound of the values
+    :param rng: the random number generator
+    :return: the perturbed values
+    """
+    if error.distribution == 'uniform':
+        noise = rng.uniform(-error.scale, error.scale, len(values))
+    else:
+        noise = rng.normal(0, error.scale, len(values))
+    if error.relative:
+        noise *= values
+    return np.clip(values + noise, 0, upper)
+
+
+def _check_season_evaluator(season: str, evaluator: str) -> None:
+    """
+    Function to check the season and evaluator parameters of the batch engine.
+    :return: None
+    """
+    if not isinstance(season, str):
+        raise TypeError('The "season" parameter must be string data type.')
+    elif season not in ['growing', 'dormant', 'both']:
+        raise ValueError('The "season" parameter must be either "growing", "dormant" or "both".')
+    if evaluator not in ['masks', 'flat', 'table']:
+        raise ValueError('The "evaluator" parameter must be either "masks", "flat" or "table".')
+    return
+
+
+def _is_batch(item, fld: str) -> bool:
+    """
+    Function to check if an item of a record stream is a batch of stands rather than a single stand.
+    :param item: the item
+    :param fld: a field whose values are arrays in a dictionary of arrays
+    :return: True if the item is a batch
+    """
+    if _is_frame(item) or _is_arrow(item):
+        return True
+    return isinstance(item, dict) and np.ndim(item.get(fld)) > 0
+
+
+def _slice_batch(batch, start: int, stop: int):
+    """
+    Function to get the stands from start to stop of a batch.
+    :return: a pandas DataFrame, a dictionary of arrays, or a pyarrow Table or RecordBatch
+    """
+    if _is_frame(batch):
+        return batch.iloc[start:stop]
+    elif _is_arrow(batch):
+        return batch.slice(start, stop - start)
+    return {fld: values.iloc[start:stop] if _is_series(values) else values[start:stop]
+            for fld, values in batch.items()}
+
+
+def _is_vegetated(BCLCS_LEVEL_1: str) -> bool:
+    """
+    Function to check if the area is vegetated.
+    :return: True, False, or None if BCLCS_LEVEL_1 is neither "V" nor "N"
+    """
+    if BCLCS_LEVEL_1 == 'V':
+        return True
+    elif BCLCS_LEVEL_1 == 'N':
+        return False
+    return None
+
+
+def _is_forested(BCLCS_LEVEL_2: str) -> bool:
+    """
+    Function to check if area is forested (has >=10% crown closure).
+    :return: True, False, or None if BCLCS_LEVEL_2 is neither "T" nor "N"
+    """
+    if BCLCS_LEVEL_2 == 'T':
+        return True
+    elif BCLCS_LEVEL_2 == 'N':
+        return False
+    return None
+
+
+def _is_logged(HARVEST_DATE: dt) -> bool:
+    """
+    Function to check if the area is logged. Only a None harvest date is unlogged: a NaT harvest date (the missing
+    dates of a pandas DataFrame) is logged, with a NaN harvest lag (see _years_since).
+    :return: True or False
+    """
+    return HARVEST_DATE is not None
+
+
+def _is_burned(EARLIEST_NONLOGGING_DIST_TYPE: str) -> bool:
+    """
+    Function to check if the area has been burned.
+    :return: True or False
+    """
+    return EARLIEST_NONLOGGING_DIST_TYPE in ['B', 'BE', 'BG', 'BW', 'BR', 'NB']
+
+
+def _parse_date(date: str) -> dt:
+    """
+    Function to convert a date string (with an optional "+" time zone suffix) to a datetime. ISO 8601 dates are parsed
+    by datetime, other formats by pandas.
+    :return: the datetime, or NaT if the string is not a valid date
+    """
+    date = date.split('+')[0]
+    try:
+        return dt.fromisoformat(date)
+    except ValueError:
+        import pandas as pd
+        return pd.to_datetime(date, errors='coerce')
+
+
+def _reference_year(reference_date) -> int:
+    """
+    Function to get the year that harvest and disturbance lags are measured to.
+    :param reference_date: a year, a date or datetime, a date string, or None for the current date
+    :return: the reference year
+    """
+    if reference_date is None:
+        return dt.now().year
+    elif isinstance(reference_date, (int, np.integer)):
+        return int(reference_date)
+    elif isinstance(reference_date, str):
+        reference_date = _parse_date(reference_date)
+    elif isinstance(reference_date, np.datetime64):
+        reference_date = reference_date.astype('datetime64[D]').item()
+    if reference_date is None or reference_date != reference_date:  # NaT != NaT
+        raise ValueError('reference_date is not a valid date')
+    return reference_date.year
+
+
+# The range of datetime64[ns] values (which dates are parsed to, so dates outside it are invalid)
+_MIN_DATE, _MAX_DATE = np.datetime64('1677-09-21T00:12:43', 's'), np.datetime64('2262-04-11T23:47:16', 's')
+
+
+def _date_years(values) -> tuple:
+    """
+    Function to convert a column of dates to years, parsing the whole column at once. Dates are parsed by NumPy, and by
+    pandas if NumPy cannot parse them all.
+    :param values: datetime64 values, or objects (datetimes, date strings with an optional "+" time zone suffix,
+        None or NaT)
+    :return: a tuple of (int16 array of years, boolean array flagging missing or invalid dates)
+    """
+    values = _to_numpy(values)
+    if not np.issubdtype(values.dtype, np.datetime64):
+        values = _parse_dates(values)
+    isnull = np.isnat(values)
+    years = np.where(isnull, 0, values.astype('datetime64[Y]').astype('int64') + 1970).astype('int16')
+    return years, isnull
+
+
+def _parse_dates(values: np.ndarray) -> np.ndarray:
+    """
+    Function to parse a column of dates to datetime64 values.
+    :param values: objects (datetimes, date strings with an optional "+" time zone suffix, None or NaT)
+    :return: a datetime64 array, NaT for missing or invalid dates
+    """
+    dates = np.array([value.split('+')[0] if isinstance(value, str) else value for value in values.ravel()],
+                     dtype=object)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')  # NumPy warns about time zones, which pandas converts to UTC
+            parsed = dates.astype('datetime64[s]')
+    except (ValueError, TypeError, OverflowError, Warning):
+        import pandas as pd
+        dates = pd.Series(dates, dtype=object)
+        return np.asarray(pd.DatetimeIndex(pd.to_datetime(dates, errors='coerce')).tz_localize(None),
+                          dtype='datetime64[ns]')
+    return np.where((parsed < _MIN_DATE) | (parsed > _MAX_DATE), np.datetime64('NaT'), parsed)
+
+
+def _arrow_date_years(values) -> tuple:
+    """
+    Function to convert a pyarrow column of dates to years. Timestamp and date columns are read by pyarrow, other
+    columns are parsed like _date_years.
+    :param values: a pyarrow array or chunked array
+    :return: a tuple of (int16 array of years, boolean array flagging missing or invalid dates)
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if not (pa.types.is_timestamp(values.type) or pa.types.is_date(values.type)):
+        return _date_years(values.to_numpy(zero_copy_only=False))
+    years = pc.year(values)
+    isnull = years.is_null().to_numpy(zero_copy_only=False)
+    return years.fill_null(0).to_numpy(zero_copy_only=False).astype('int16'), isnull
+
+
+def _is_arrow(data) -> bool:
+    """
+    Function to check if a batch is a pyarrow Table or RecordBatch (which can only be if pyarrow is imported).
+    :return: True if the batch is a pyarrow Table or RecordBatch
+    """
+    pa = sys.modules.get('pyarrow')
+    return pa is not None and isinstance(data, (pa.Table, pa.RecordBatch))
+
+
+def _is_arrow_array(values) -> bool:
+    """
+    Function to check if an array is a pyarrow array (which can only be if pyarrow is imported).
+    :return: True if the array is a pyarrow array
+    """
+    pa = sys.modules.get('pyarrow')
+    return pa is not None and isinstance(values, pa.Array)
+
+
+def _is_frame(data) -> bool:
+    """
+    Function to check if a batch is a pandas DataFrame (which can only be if pandas is imported).
+    :return: True if the batch is a pandas DataFrame
+    """
+    pd = sys.modules.get('pandas')
+    return pd is not None and isinstance(data, pd.DataFrame)
+
+
+def _is_series(values) -> bool:
+    """
+    Function to check if a column is a pandas Series (which can only be if pandas is imported).
+    :return: True if the column is a pandas Series
+    """
+    pd = sys.modules.get('pandas')
+    return pd is not None and isinstance(values, pd.Series)
+
+
+def _to_numpy(values) -> np.ndarray:
+    """
+    Function to get a column (a pandas Series, or an array or list) as a NumPy array.
+    :return: a NumPy array
+    """
+    return values.to_numpy() if _is_series(values) else np.asarray(values)
+
+
+def _is_none(values) -> np.ndarray:
+    """
+    Function to flag the None values of a column (a pandas Series, or an array or list). Only object columns hold
+    None: the missing values of other columns are NaN or NaT.
+    :return: a boolean array
+    """
+    values = _to_numpy(values)
+    if values.dtype.kind == 'O':
+        return np.equal(values, None)
+    return np.zeros(values.shape, dtype=bool)
+
+
+def _code_dtype(n: int) -> str:
+    """
+    Function to get the smallest integer data type of the codes of n categories.
+    :return: the data type name
+    """
+    return 'uint8' if n <= 256 else 'uint16' if n <= 65536 else 'int32'
+
+
+def _is_null(values: np.ndarray) -> np.ndarray:
+    """
+    Function to flag None, NaN and NaT values.
+    :return: a boolean array
+    """
+    if values.dtype.kind in 'mM':
+        return np.isnat(values)
+    elif values.dtype.kind == 'f':
+        return np.isnan(values)
+    elif values.dtype.kind == 'O':
+        return np.equal(values, None) | np.not_equal(values, values)
+    return np.zeros(values.shape, dtype=bool)
+
+
+def _invalid_codes(values: np.ndarray, codeList: list = None, required: bool = False) -> np.ndarray:
+    """
+    Function to flag code values that are not strings, or not in a list of valid codes.
+    :param values: the code values
+    :param codeList: the valid codes (any string is valid if None)
+    :param required: if True, missing codes are invalid
+    :return: a boolean array
+    """
+    isnull = _is_null(values)
+    if values.dtype.kind in 'US':
+        isStr = np.ones(values.shape, dtype=bool)
+    elif values.dtype.kind == 'O':
+        isStr = np.frompyfunc(lambda value: isinstance(value, str), 1, 1)(values).astype(bool)
+    else:
+        isStr = np.zeros(values.shape, dtype=bool)
+    invalid = ~(isStr | isnull)
+    if required:
+        invalid |= isnull
+    if codeList is not None:
+        invalid |= isStr & ~np.isin(np.where(isStr, values, '').astype(str), codeList)
+    return invalid
+
+
+def _invalid_numbers(values: np.ndarray, integer: bool = False) -> np.ndarray:
+    """
+    Function to flag values that are not numbers, or not whole numbers.
+    :param values: the numeric values
+    :param integer: if True, numbers with a fractional part are invalid
+    :return: a boolean array
+    """
+    if values.dtype.kind in 'iub':
+        return np.zeros(values.shape, dtype=bool)
+    isnull = _is_null(values)
+    if values.dtype.kind == 'O':
+        isNumber = np.frompyfunc(lambda value: isinstance(value, (int, float, np.number)) and
+                                 not isinstance(value, (bool, np.bool_)), 1, 1)(values).astype(bool)
+        invalid = ~(isNumber | isnull)
+        values = np.where(isNumber & ~isnull, values, nan).astype('float64')
+    elif values.dtype.kind == 'f':
+        invalid = np.zeros(values.shape, dtype=bool)
+    else:
+        return ~isnull
+    if integer:
+        invalid |= ~np.isnan(values) & (values != np.floor(values))
+    return invalid
+
+
+def _invalid_dates(values: np.ndarray) -> np.ndarray:
+    """
+    Function to flag date values that cannot be read as dates.
+    :return: a boolean array
+    """
+    if values.dtype.kind == 'M':
+        return np.zeros(values.shape, dtype=bool)
+    return _date_years(values)[1] & ~_is_null(values)
+
+
+def _cache_key(stand: StandRecord) -> tuple:
+    """
+    Function to build the result cache key of a stand from its inputs.
+    Values are paired with their types, since verifyInputs and getPrcntConifer treat equal values of different
+    types differently, NaN values are replaced with a marker so equal keys compare equal, and dates are reduced to
+    their years (the only part of a date the algorithm uses).
+    :param stand: the stand record
+    :return: a hashable tuple
+    """
+    key = []
+    for value in stand[:_N_INPUTS]:
+        if isinstance(value, dt):
+            key.append((type(value), None if value != value else value.year))  # NaT != NaT
+        elif value != value:
+            key.append((type(value), _NAN_KEY))
+        else:
+            key.append((type(value), value))
+    return tuple(key)
+
+
+def _years_since(date: dt, currentYear: int) -> int:
+    """
+    Function to get the number of years between a date and the current year.
+    :return: the number of years (0 for future dates), None if there is no date, or NaN if the date is NaT (which
+        fails every comparison of the decision tree)
+    """
+    if date is None:
+        return None
+    elif date != date:  # NaT != NaT
+        return nan
+    elif date.year > currentYear:
+        return 0
+    return currentYear - date.year
+
+
+def _prcnt_conifer(stand, coniferList: list) -> float:
+    """
+    Function to calculate tbe percentage of conifer trees in the stand, capped at 100%.
+    :param stand: an object with the SPECIES_CD_# and SPECIES_PCT_# attributes
+    :param coniferList: list of conifer species codes
+    :return: the percentage of conifer trees
+    """
+    pct_cnfr = 0
+    # If species code is a conifer, add its percentage to sum
+    for spCd, spPrcnt in _species(stand):
+        if (spCd is not None) and (type(spPrcnt) in (int, float, complex)) and (spCd in coniferList):
+            pct_cnfr += spPrcnt
+
+    # Change pct_cnfr to 100% if it evaluates to >100%
+    if pct_cnfr > 100:
+        pct_cnfr = 100
+
+    return pct_cnfr
+
+
+def _dry_wet(BEC_SUBZONE: str) -> str:
+    """
+    Function to check if BEC subzone is dry or wet
+    :return: "dry", "wet", "undifferentiated" or "Invalid Subzone"
+    """
+    # Lookup first letter of subzone and return if dry or wet
+    return {'d': 'dry',
+            'x': 'dry',
+            'm': 'wet',
+            'w': 'wet',
+            'v': 'wet',
+            'u': 'undifferentiated'}.get(BEC_SUBZONE[0], 'Invalid Subzone')
+
+
+def _stocking(VRI_LIVE_STEMS_PER_HA: float, VRI_DEAD_STEMS_PER_HA: float) -> float:
+    """
+    Function to get the number of live and dead stems in the stand (i.e., stocking)
+    :return: the number of stems per hectare
+    """
+    liveStems = 0 if VRI_LIVE_STEMS_PER_HA is None else VRI_LIVE_STEMS_PER_HA
+    deadStems = 0 if VRI_DEAD_STEMS_PER_HA is None else VRI_DEAD_STEMS_PER_HA
+    return liveStems + deadStems
+
+
+def _species(stand) -> list:
+    """
+    Function to get the species composition of a stand.
+    :param stand: an object with the SPECIES_CD_# and SPECIES_PCT_# attributes
+    :return: a list of (species code, species percentage) tuples, in species order
+    """
+    return [(stand.SPECIES_CD_1, stand.SPECIES_PCT_1), (stand.SPECIES_CD_2, stand.SPECIES_PCT_2),
+            (stand.SPECIES_CD_3, stand.SPECIES_PCT_3), (stand.SPECIES_CD_4, stand.SPECIES_PCT_4),
+            (stand.SPECIES_CD_5, stand.SPECIES_PCT_5), (stand.SPECIES_CD_6, stand.SPECIES_PCT_6)]
+
+
+def _max_prcnt(sppPrcntList: list) -> float:
+    """
+    Function to get the maximum of a list of species percentages, skipping missing values.
+    :return: the maximum percentage, 0 if the list is empty, or NaN if all percentages are missing
+    """
+    prcnts = [prcnt for prcnt in sppPrcntList if (prcnt is not None) and (prcnt == prcnt)]
+    if prcnts:
+        return max(prcnts)
+    return nan if sppPrcntList else 0
+
+
+def _dom_conifer_match(species: list, checkList, coniferList: list) -> bool:
+    """
+    Function to check if the dominant conifers in a stand match species in a list.
+    :param species: the species composition of the stand (see _species)
+    :param checkList: species codes to check
+    :param coniferList: list of conifer species codes
+    :return: true or false
+    """
+    # GET THE POSITIONS OF THE CONIFER SPECIES AT SITE IN CHECKLIST, AND OF ALL OTHER CONIFERS AT SITE
+    cnfrList = [i for i, (spCd, _) in enumerate(species) if spCd in checkList]
+    altCnfrList = [i for i, (spCd, _) in enumerate(species) if (spCd not in checkList) and (spCd in coniferList)]
+
+    # GET MAXIMUM PERCENTAGES (0 IF NO SPECIES FOUND AT SITE)
+    cnfrPrcnt = _max_prcnt([species[i][1] for i in cnfrList])
+    altCnfrPrcnt = _max_prcnt([species[i][1] for i in altCnfrList])
+
+    # Compare species and return result (ties are won by the species listed first)
+    if cnfrPrcnt != 0 and cnfrPrcnt == altCnfrPrcnt:
+        return cnfrList[0] < altCnfrList[0]
+    return cnfrPrcnt > altCnfrPrcnt
+
+
+def _dom_conifers(stand, coniferList: list) -> dict:
+    """
+    Function to build the species composition index of a stand, used by the dominant conifer checks of the
+    decision tree.
+    :param stand: an object with the SPECIES_CD_# and SPECIES_PCT_# attributes
+    :param coniferList: list of conifer species codes
+    :return: a dictionary of {species group: whether the dominant conifers match the group} for each group
+        in _DOM_CONIFER_GROUPS
+    """
+    species = _species(stand)
+    # Only conifers take part in the checks, so stands without conifers match no group
+    if not any(spCd in coniferList for spCd, _ in species):
+        return dict.fromkeys(_DOM_CONIFER_GROUPS, False)
+    return {group: _dom_conifer_match(species, group, coniferList) for group in _DOM_CONIFER_GROUPS}
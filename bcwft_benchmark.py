@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Startup benchmark for the BC Wildfire Fuel Typing module.
+
+bcwft2018 imports with NumPy alone: pandas, pyarrow and Numba are only imported when a batch needs them. This
+benchmark times, in fresh interpreters, importing bcwft2018, fuel typing a first stand with the scalar classifier
+(getFuelType), and a first batch of stands with the NumPy batch engine (classify_frame on a dictionary of lists).
+It fails if the import takes longer than the budget, or if any of the optional packages was imported on the way.
+
+Usage:
+    python bcwft_benchmark.py [--budget SECONDS] [--runs RUNS]
+"""
+__author__ = ['Gregory A. Greene, map.n.trowel@gmail.com']
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+from typing import NamedTuple
+
+
+# Packages the scalar classifier and the NumPy batch engine must not import
+_LAZY_MODULES = ['pandas', 'pyarrow', 'numba']
+
+# Import budget, in seconds
+_IMPORT_BUDGET = 0.5
+
+# A C-3 stand
+_STAND = {'COAST_INTERIOR_CD': 'I', 'BCLCS_LEVEL_1': 'V', 'BCLCS_LEVEL_2': 'T', 'BCLCS_LEVEL_3': 'U',
+          'BCLCS_LEVEL_4': 'TC', 'BCLCS_LEVEL_5': 'DE', 'BEC_ZONE_CODE': 'SBS', 'BEC_SUBZONE': 'mk',
+          'EARLIEST_NONLOGGING_DIST_TYPE': None, 'EARLIEST_NONLOGGING_DIST_DATE': None, 'HARVEST_DATE': None,
+          'CROWN_CLOSURE': 55, 'PROJ_HEIGHT_1': 22.5, 'PROJ_AGE_1': 90, 'VRI_LIVE_STEMS_PER_HA': 1200,
+          'VRI_DEAD_STEMS_PER_HA': 0, 'STAND_PERCENTAGE_DEAD': 0, 'INVENTORY_STANDARD_CD': 'V',
+          'NON_PRODUCTIVE_CD': None, 'LAND_COVER_CLASS_CD_1': 'TC', 'SPECIES_CD_1': 'PL', 'SPECIES_PCT_1': 80.0,
+          'SPECIES_CD_2': 'SX', 'SPECIES_PCT_2': 20.0, 'SPECIES_CD_3': None, 'SPECIES_PCT_3': 0.0,
+          'SPECIES_CD_4': None, 'SPECIES_PCT_4': 0.0, 'SPECIES_CD_5': None, 'SPECIES_PCT_5': 0.0,
+          'SPECIES_CD_6': None, 'SPECIES_PCT_6': 0.0}
+
+# Script run in a fresh interpreter, printing its timings as JSON
+_PROBE = '''
+import sys
+import json
+import time
+start = time.perf_counter()
+import bcwft2018
+imported = time.perf_counter()
+stand = json.loads(sys.argv[1])
+fuelTyping = bcwft2018.FuelTyping()
+fuelTyping.getFuelType('growing', **stand, reference_date=2020)
+scalar = time.perf_counter()
+fuelTyping.classify_frame({fld: [value] * 1000 for fld, value in stand.items()}, 'growing', reference_date=2020)
+batch = time.perf_counter()
+print(json.dumps({'import_seconds': imported - start, 'scalar_seconds': scalar - imported,
+                  'batch_seconds': batch - scalar, 'modules': [m for m in sys.argv[2:] if m in sys.modules]}))
+'''
+
+
+class StartupInfo(NamedTuple):
+    import_seconds: float
+    scalar_seconds: float
+    batch_seconds: float
+    modules: list
+
+
+def measure_startup(runs: int = 5) -> StartupInfo:
+    """
+    Function to time the startup of bcwft2018 in fresh interpreters.
+    :param runs: number of interpreters to time (the fastest run of each step is kept, as the others are slowed down
+        by the rest of the system)
+    :return: a StartupInfo of the import time, the time to fuel type the first stand with the scalar classifier and
+        the first batch with the batch engine, and the optional packages imported by any run
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    results = []
+    for _ in range(runs):
+        probe = subprocess.run([sys.executable, '-c', _PROBE, json.dumps(_STAND)] + _LAZY_MODULES, cwd=here,
+                               capture_output=True, text=True, check=True)
+        results.append(json.loads(probe.stdout))
+    return StartupInfo(import_seconds=min(result['import_seconds'] for result in results),
+                       scalar_seconds=min(result['scalar_seconds'] for result in results),
+                       batch_seconds=min(result['batch_seconds'] for result in results),
+                       modules=sorted({module for result in results for module in result['modules']}))
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description='Time the startup of the bcwft2018 module.')
+    parser.add_argument('--budget', type=float, default=_IMPORT_BUDGET,
+                        help=f'most seconds importing bcwft2018 may take (default: {_IMPORT_BUDGET})')
+    parser.add_argument('--runs', type=int, default=5, help='number of fresh interpreters to time (default: 5)')
+    args = parser.parse_args(argv)
+
+    info = measure_startup(args.runs)
+    print(f'import bcwft2018: {info.import_seconds * 1000:.1f} ms (budget {args.budget * 1000:.0f} ms)')
+    print(f'first stand (getFuelType): {info.scalar_seconds * 1000:.1f} ms')
+    print(f'first batch of 1000 stands (classify_frame): {info.batch_seconds * 1000:.1f} ms')
+    failed = False
+    if info.modules:
+        print(f'{", ".join(info.modules)} imported, but the scalar classifier and the batch engine should not need '
+              f'{"it" if len(info.modules) == 1 else "them"}')
+        failed = True
+    if info.import_seconds > args.budget:
+        print('The import is over budget.')
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,919 @@
+# -*- coding: utf-8 -*-
+"""
+Code generator for the BC Wildfire Fuel Typing decision tree.
+
+Compiles the declarative rule specification (bcwft_rules.DECISION_TREE) into bcwft_tree.py, which contains
+    1: decision_tree, the scalar decision tree of FuelTyping.decisionTree,
+    2: mask_decision_tree, the boolean mask evaluator of FuelTyping.classify_frame, and
+    3: NODES, the flat node table walked by FuelTyping.classify_frame(evaluator="flat").
+All are generated from the same tests, with these optimizations:
+    - season-only splits are merged into Seasonal leaves. The trees return the leaf reached by a stand (the rule ID
+      of the dormant season), and the rule IDs and fuel types of both seasons are looked up from it (GROWING_RULES
+      and FUEL_TYPES), so one evaluation gives the results of both seasons,
+    - runs of tests on SPECIES_CD_1 alone are dispatched through a cached lookup of the first matching test,
+    - tests shared between branches are evaluated once per batch by the mask evaluator, and
+    - the flat node table shares the nodes of identical subtrees.
+
+Usage:
+    python bcwft_codegen.py           regenerate bcwft_tree.py
+    python bcwft_codegen.py --check   exit with status 1 if bcwft_tree.py is out of date
+"""
+__author__ = ['Gregory A. Greene, map.n.trowel@gmail.com']
+
+import os
+import ast
+import sys
+from collections import Counter
+from typing import NamedTuple
+
+from bcwft_rules import DECISION_TREE, RULE_TABLE, Leaf, Seasonal, When, Otherwise
+
+
+# How the stand variables of the rule tests are stored in a StandBatch
+_CODES = ['COAST_INTERIOR_CD', 'BCLCS_LEVEL_1', 'BCLCS_LEVEL_2', 'BCLCS_LEVEL_3', 'BCLCS_LEVEL_4', 'BCLCS_LEVEL_5',
+          'BEC_ZONE_CODE', 'BEC_SUBZONE', 'EARLIEST_NONLOGGING_DIST_TYPE', 'INVENTORY_STANDARD_CD',
+          'LAND_COVER_CLASS_CD_1', 'SPECIES_CD_1', 'SPECIES_CD_2', 'SPECIES_CD_3', 'SPECIES_CD_4', 'SPECIES_CD_5',
+          'SPECIES_CD_6']  # Dictionary-encoded, with null masks
+_NUMBERS = ['CROWN_CLOSURE', 'PROJ_HEIGHT_1', 'PROJ_AGE_1', 'VRI_LIVE_STEMS_PER_HA', 'VRI_DEAD_STEMS_PER_HA',
+            'STAND_PERCENTAGE_DEAD', 'NON_PRODUCTIVE_CD', 'SPECIES_PCT_1', 'SPECIES_PCT_2', 'SPECIES_PCT_3',
+            'SPECIES_PCT_4', 'SPECIES_PCT_5', 'SPECIES_PCT_6', 'pct_cnfr', 'stocking']  # Floats, NaN if missing
+_LAGS = ['harv_lag', 'dist_lag']  # Floats, NaN for missing dates, with the None dates flagged in StandBatch.none
+_LAG_DATES = {'harv_lag': 'HARVEST_DATE', 'dist_lag': 'EARLIEST_NONLOGGING_DIST_DATE'}  # Date each lag is measured from
+_FLAGS = ['is_vegetated', 'is_forested', 'is_logged', 'is_burned']  # Booleans
+_LISTS = ['coniferList', 'dryBECzones']  # FuelTyping lists
+
+# Mask expressions of the tests on derived variables that are precomputed as StandBatch membership bits, or that
+# are not stored in a StandBatch
+_MEMBERSHIP = {('SPECIES_CD_1', 'coniferList'): 's.member(_CONIFER_BITS[0])',
+               ('BEC_ZONE_CODE', 'dryBECzones'): 's.member(_DRY_ZONE)',
+               ('dry_wet', 'dry'): 's.member(_DRY_SUBZONE)',
+               ('dry_wet', 'wet'): 's.member(_WET_SUBZONE)'}
+_IS_NONE = {'is_vegetated': "~s.isin('BCLCS_LEVEL_1', ['V', 'N'])"}
+
+# Flags implying that a variable is not None
+_IMPLIES = {'is_logged': 'harv_lag'}
+
+# Minimum number of consecutive SPECIES_CD_1 tests dispatched through a lookup
+_MIN_DISPATCH = 3
+
+# The StandBatch membership bits used by the mask evaluator (the bits of bcwft2018.StandBatch.membership)
+_MEMBERSHIP_BITS = '''\
+_CONIFER_BITS = (1 << 0, 1 << 1, 1 << 2, 1 << 3, 1 << 4, 1 << 5)
+_DRY_SUBZONE = 1 << 6
+_WET_SUBZONE = 1 << 7
+_DRY_ZONE = 1 << 8'''
+
+_HEADER = '''\
+# -*- coding: utf-8 -*-
+"""
+BC Wildfire Fuel Typing decision tree, generated from bcwft_rules.DECISION_TREE by bcwft_codegen.py.
+Do not edit this file: edit the rule specification and run "python bcwft_codegen.py" instead.
+"""
+__author__ = ['Gregory A. Greene, map.n.trowel@gmail.com']
+
+import numpy as np
+'''
+
+TARGET = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bcwft_tree.py')
+
+
+class _Mask(NamedTuple):
+    """
+    Boolean mask expression of a test
+    """
+    value: str
+    compound: bool = False
+    fails: tuple = ()  # (guards, variable) pairs: decisionTree raises where all guards are true and the variable is null
+    true_nonnull: frozenset = frozenset()  # variables that are not null where the test is true
+    false_nonnull: frozenset = frozenset()  # variables that are not null where the test is false
+    const: bool = None
+
+
+def _parse(expression: str) -> ast.expr:
+    """
+    Function to parse a test or modifier expression of the rule specification.
+    """
+    node = ast.parse(expression, mode='eval').body
+    for n in ast.walk(node):
+        if isinstance(n, ast.Name) and n.id not in _CODES + _NUMBERS + _LAGS + _FLAGS + _LISTS + ['dry_wet', 'dominant',
+                                                                                              'str']:
+            raise ValueError(f'Unknown variable "{n.id}" in rule test: {expression}')
+    return node
+
+
+def _species_groups(branches: list, groups: list = None) -> list:
+    """
+    Function to list the species groups of the dominant() tests, in order of first use.
+    """
+    groups = [] if groups is None else groups
+    for branch in branches:
+        if isinstance(branch, When):
+            for n in ast.walk(_parse(branch.test)):
+                if isinstance(n, ast.Call) and isinstance(n.func, ast.Name) and n.func.id == 'dominant':
+                    group = tuple(ast.literal_eval(a) for a in n.args)
+                    if group not in groups:
+                        groups.append(group)
+        if isinstance(branch.then, list):
+            _species_groups(branch.then, groups)
+    return groups
+
+
+def _leaves(branches: list) -> list:
+    """
+    Function to list the leaves of the decision tree.
+    """
+    leaves = []
+    for branch in branches:
+        if isinstance(branch.then, list):
+            leaves += _leaves(branch.then)
+        elif isinstance(branch.then, Seasonal):
+            leaves += [branch.then.dormant, branch.then.growing]
+        else:
+            leaves.append(branch.then)
+    return leaves
+
+
+def _seasonal_pairs(branches: list) -> list:
+    """
+    Function to list the Seasonal pairs of leaves of the decision tree.
+    """
+    pairs = []
+    for branch in branches:
+        if isinstance(branch.then, list):
+            pairs += _seasonal_pairs(branch.then)
+        elif isinstance(branch.then, Seasonal):
+            pairs.append(branch.then)
+    return pairs
+
+
+def _pack(items: list, width: int) -> list:
+    """
+    Function to pack comma-separated items into lines of at most width characters.
+    """
+    lines, line = [], ''
+    for item in items:
+        if line and len(line) + len(item) + 2 > width:
+            lines.append(line.rstrip())
+            line = ''
+        line += f'{item}, '
+    return lines + [line.rstrip()] if line else lines
+
+
+def check_rules(branches: list = DECISION_TREE) -> None:
+    """
+    Function to check the structure of the rule specification.
+    :param branches: the rule specification
+    :return: None
+    """
+    def check(branches):
+        if not branches:
+            raise ValueError('Empty list of branches in the rule specification.')
+        for k, branch in enumerate(branches):
+            if not isinstance(branch, (When, Otherwise)):
+                raise TypeError(f'Invalid branch in the rule specification: {branch!r}')
+            if isinstance(branch, Otherwise) and k != len(branches) - 1:
+                raise ValueError('Otherwise must be the last branch of a list.')
+            if isinstance(branch, When):
+                _parse(branch.test)
+            if isinstance(branch.then, list):
+                check(branch.then)
+            elif isinstance(branch.then, Seasonal):
+                if branch.then.dormant.modifier != branch.then.growing.modifier:
+                    raise ValueError(f'The leaves of a Seasonal pair must share the modifier: {branch.then!r}')
+            elif not isinstance(branch.then, Leaf):
+                raise TypeError(f'Invalid branch target in the rule specification: {branch.then!r}')
+
+    check(branches)
+    rules = [leaf.rule for leaf in _leaves(branches)]
+    if sorted(rules) != list(range(1, len(rules) + 1)):
+        raise ValueError('The rule IDs of the leaves must be numbered from 1 without gaps or duplicates.')
+    if set(rules) != set(RULE_TABLE):
+        raise ValueError('The rule IDs of the leaves must match bcwft_rules.RULE_TABLE.')
+    return
+
+
+################################################
+#### SCALAR DECISION TREE
+class _ScalarNames(ast.NodeTransformer):
+    """
+    Rewrites the variables of a rule expression as StandRecord (s) and FuelTyping (ft) attributes
+    """
+    def __init__(self, argument: str = None):
+        self.argument = argument
+
+    def visit_Name(self, node):
+        if node.id == self.argument:
+            # Variable passed as the argument (v) of a dispatch test
+            return ast.Name('v', ast.Load())
+        if node.id in _LISTS:
+            return ast.Attribute(ast.Name('ft', ast.Load()), node.id, ast.Load())
+        if node.id in ('str', 'dominant'):
+            return node
+        return ast.Attribute(ast.Name('s', ast.Load()), node.id, ast.Load())
+
+    def visit_Call(self, node):
+        if isinstance(node.func, ast.Name) and node.func.id == 'dominant':
+            group = ast.Tuple([ast.Constant(ast.literal_eval(a)) for a in node.args], ast.Load())
+            domConifers = ast.Attribute(ast.Name('s', ast.Load()), 'dom_conifers', ast.Load())
+            return ast.Subscript(domConifers, group, ast.Load())
+        return self.generic_visit(node)
+
+
+def _scalar(expression: str, argument: str = None) -> str:
+    return ast.unparse(_ScalarNames(argument).visit(_parse(expression)))
+
+
+def _leaf_comment(then) -> str:
+    if isinstance(then, Seasonal):
+        return f'  # {then.dormant.fuel_type}, growing season: {then.growing.rule} {then.growing.fuel_type}'
+    return f'  # {then.fuel_type}'
+
+
+def _dispatch_run(branches: list) -> int:
+    """
+    Function to get the number of leading branches testing SPECIES_CD_1 alone.
+    """
+    n = 0
+    for branch in branches:
+        if not isinstance(branch, When):
+            break
+        names = {x.id for x in ast.walk(_parse(branch.test)) if isinstance(x, ast.Name)} - {'str'}
+        if names != {'SPECIES_CD_1'}:
+            break
+        n += 1
+    return n if n >= _MIN_DISPATCH else 0
+
+
+class _ScalarWriter:
+    """
+    Writes the scalar decision tree
+    """
+    def __init__(self):
+        self.lines = []
+        self.dispatch = []
+
+    def branches(self, branches: list, ind: int) -> None:
+        pad = '    ' * ind
+        run = _dispatch_run(branches)
+        if run:
+            table = len(self.dispatch)
+            self.dispatch.append([_scalar(b.test, 'SPECIES_CD_1') for b in branches[:run]])
+            self.lines.append(f'{pad}branch = _dispatch({table}, s.SPECIES_CD_1)')
+        for k, branch in enumerate(branches):
+            if branch.label:
+                self.lines.append(f'{pad}#### {branch.label}')
+            if isinstance(branch, Otherwise):
+                self.lines.append(f'{pad}else:')
+            else:
+                keyword = 'if' if k == 0 else 'elif'
+                test = f'branch == {k}' if k < run else _scalar(branch.test)
+                self.lines.append(f'{pad}{keyword} {test}:')
+            self.target(branch.then, ind + 1)
+
+    def target(self, then, ind: int) -> None:
+        pad = '    ' * ind
+        if isinstance(then, list):
+            self.branches(then, ind)
+        else:
+            leaf = then.dormant if isinstance(then, Seasonal) else then
+            modifier = leaf.modifier if not isinstance(leaf.modifier, str) else _scalar(leaf.modifier)
+            self.lines.append(f'{pad}return {leaf.rule}, {modifier}{_leaf_comment(then)}')
+
+
+################################################
+#### MASK EVALUATOR
+class _MaskWriter:
+    """
+    Writes the boolean mask evaluator. Array expressions are collected as atoms, so those used by several tests can
+    be evaluated once per batch.
+    """
+    def __init__(self):
+        self.lines = []
+        self.atoms = []
+        self.uses = Counter()
+
+    def atom(self, expression: str) -> str:
+        if expression not in self.atoms:
+            self.atoms.append(expression)
+        k = self.atoms.index(expression)
+        self.uses[k] += 1
+        return f'\0{k}\0'
+
+    def null(self, name: str) -> str:
+        if name in _LAGS:
+            # The lag of a None date is None, and the lag of a NaT date is NaN, which fails every comparison
+            return f's.none[{_LAG_DATES[name]!r}]'
+        return f's.null[{name!r}]'
+
+    #### Tests
+    def mask(self, node: ast.expr, known: frozenset) -> _Mask:
+        if isinstance(node, ast.BoolOp):
+            result = self.mask(node.values[0], known)
+            for value in node.values[1:]:
+                result = self.combine(result, value, isinstance(node.op, ast.And), known)
+            return result
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            m = self.mask(node.operand, known)
+            if m.const is not None:
+                return _Mask('', const=not m.const)
+            value = f'~({m.value})' if m.compound else f'~{m.value}'
+            return _Mask(value, False, m.fails, m.false_nonnull, m.true_nonnull)
+        if isinstance(node, ast.Name) and node.id in _FLAGS:
+            implied = frozenset([_IMPLIES[node.id]]) if node.id in _IMPLIES else frozenset()
+            return _Mask(f's.{node.id}', true_nonnull=implied)
+        if isinstance(node, ast.Compare):
+            if len(node.ops) != 1:
+                raise ValueError(f'Chained comparisons are not supported: {ast.unparse(node)}')
+            return self.compare(node.left, node.ops[0], node.comparators[0], known)
+        if isinstance(node, ast.Call):
+            return self.call(node, known)
+        raise ValueError(f'Unsupported rule test: {ast.unparse(node)}')
+
+    def combine(self, a: _Mask, node: ast.expr, isAnd: bool, known: frozenset) -> _Mask:
+        # Short-circuit evaluation: the second test is only evaluated where the first is true (and) or false (or)
+        if a.const is not None and a.const != isAnd:
+            return a
+        b = self.mask(node, known | (a.true_nonnull if isAnd else a.false_nonnull))
+        if a.const is not None:
+            return b
+        if b.const is not None:
+            if b.const == isAnd:
+                return a
+            return _Mask('', const=b.const)
+
+        reached = a.value if isAnd else (f'~({a.value})' if a.compound else f'~{a.value}')
+        fails = a.fails
+        for guards, name in b.fails:
+            if name in (a.true_nonnull if isAnd else a.false_nonnull):
+                continue
+            if not isAnd and name in a.true_nonnull:
+                # Null stands never meet the first test
+                fails += ((guards, name),)
+            else:
+                fails += (((reached,) + guards, name),)
+
+        op = ' & ' if isAnd else ' | '
+        value = op.join(f'({m.value})' if m.compound else m.value for m in (a, b))
+        if isAnd:
+            trueNonnull = a.true_nonnull | b.true_nonnull
+            falseNonnull = a.false_nonnull & (a.true_nonnull | b.false_nonnull)
+        else:
+            trueNonnull = a.true_nonnull & (a.false_nonnull | b.true_nonnull)
+            falseNonnull = a.false_nonnull | b.false_nonnull
+        return _Mask(value, True, fails, trueNonnull, falseNonnull)
+
+    def compare(self, left: ast.expr, op: ast.cmpop, right: ast.expr, known: frozenset) -> _Mask:
+        if not isinstance(left, ast.Name):
+            raise ValueError(f'Unsupported comparison: {ast.unparse(left)}')
+        name = left.id
+        nonnull = frozenset([name])
+
+        if isinstance(op, (ast.Is, ast.IsNot)):
+            if not (isinstance(right, ast.Constant) and right.value is None):
+                raise ValueError(f'Only "is None" comparisons are supported: {name}')
+            isNot = isinstance(op, ast.IsNot)
+            if name in _CODES or name in _LAGS:
+                value = self.null(name)
+            elif name in _IS_NONE:
+                value = self.atom(_IS_NONE[name])
+            elif name in _NUMBERS:
+                # Missing numbers are NaN, never None
+                return _Mask('', const=isNot)
+            else:
+                raise ValueError(f'Unsupported None test: {name}')
+            if isNot:
+                return _Mask(f'~{value}', true_nonnull=nonnull)
+            return _Mask(value, false_nonnull=nonnull)
+
+        if isinstance(op, (ast.In, ast.NotIn)):
+            if isinstance(right, ast.Name):
+                if (name, right.id) not in _MEMBERSHIP:
+                    raise ValueError(f'Unsupported list test: {name} in {right.id}')
+                value = self.atom(_MEMBERSHIP[(name, right.id)])
+                if isinstance(op, ast.NotIn):
+                    return _Mask(f'~{value}', false_nonnull=nonnull)
+                return _Mask(value, true_nonnull=nonnull)
+            values = ast.literal_eval(right)
+            withNone = None in values
+            values = [v for v in values if v is not None]
+            if name in _CODES:
+                value = self.code_test(name, values)
+            elif name in _NUMBERS:
+                value = self.atom(f'np.isin(s.{name}, {values!r})')
+            else:
+                raise ValueError(f'Unsupported list test: {name}')
+            if withNone:
+                value, trueNonnull = f'{value} | {self.null(name)}', frozenset()
+                compound = True
+            else:
+                trueNonnull, compound = nonnull, False
+            if isinstance(op, ast.NotIn):
+                return _Mask(f'~({value})' if compound else f'~{value}', false_nonnull=trueNonnull)
+            return _Mask(value, compound, true_nonnull=trueNonnull)
+
+        value = ast.literal_eval(right)
+        if name == 'dry_wet' and isinstance(op, (ast.Eq, ast.NotEq)):
+            if (name, value) not in _MEMBERSHIP:
+                raise ValueError(f'Unsupported dry_wet test: {value!r}')
+            mask = self.atom(_MEMBERSHIP[(name, value)])
+            return _Mask(mask) if isinstance(op, ast.Eq) else _Mask(f'~{mask}')
+        if name in _CODES and isinstance(op, (ast.Eq, ast.NotEq)):
+            mask = self.code_test(name, [value])
+            if isinstance(op, ast.Eq):
+                return _Mask(mask, true_nonnull=nonnull)
+            return _Mask(f'~{mask}', false_nonnull=nonnull)
+        symbol = {ast.Eq: '==', ast.NotEq: '!=', ast.Lt: '<', ast.LtE: '<=', ast.Gt: '>', ast.GtE: '>='}[type(op)]
+        if name in _NUMBERS:
+            return _Mask(self.atom(f'(s.{name} {symbol} {value!r})'))
+        if name in _LAGS:
+            # Ordering comparisons with None raise in decisionTree
+            fails = () if name in known or symbol in ('==', '!=') else (((), name),)
+            return _Mask(self.atom(f'(s.{name} {symbol} {value!r})'), False, fails, nonnull, nonnull)
+        raise ValueError(f'Unsupported comparison: {name} {symbol} {value!r}')
+
+    def code_test(self, name: str, values: list) -> str:
+        if '' in values:
+            raise ValueError(f'Empty codes cannot be tested: {name}')
+        if len(values) == 1:
+            return self.atom(f's.eq({name!r}, {values[0]!r})')
+        return self.atom(f's.isin({name!r}, {values!r})')
+
+    def call(self, node: ast.Call, known: frozenset) -> _Mask:
+        func = node.func
+        if isinstance(func, ast.Name) and func.id == 'dominant':
+            group = tuple(ast.literal_eval(a) for a in node.args)
+            return _Mask(f's.dom_conifers[{group!r}]')
+        if isinstance(func, ast.Attribute) and func.attr == 'startswith':
+            prefix = ast.literal_eval(node.args[0])
+            obj = func.value
+            if isinstance(obj, ast.Call) and isinstance(obj.func, ast.Name) and obj.func.id == 'str':
+                # str(None) is "None"
+                name = obj.args[0].id
+                value = self.atom(f's.startswith({name!r}, {prefix!r})')
+                if 'None'.startswith(prefix):
+                    return _Mask(f'{value} | {self.null(name)}', True)
+                return _Mask(value, true_nonnull=frozenset([name]))
+            if isinstance(obj, ast.Name) and obj.id in _CODES:
+                # None has no startswith method
+                name = obj.id
+                fails = () if name in known else (((), name),)
+                nonnull = frozenset([name])
+                return _Mask(self.atom(f's.startswith({name!r}, {prefix!r})'), False, fails, nonnull, nonnull)
+        raise ValueError(f'Unsupported rule test: {ast.unparse(node)}')
+
+    #### Tree
+    def branches(self, branches: list, depth: int, ind: int, known: frozenset) -> None:
+        pad = '    ' * ind
+        source = f'm{depth}'
+        for branch in branches:
+            if branch.label:
+                self.lines.append(f'{pad}#### {branch.label}')
+            if isinstance(branch, Otherwise):
+                self.target(branch.then, depth + 1, ind, known, source)
+                return
+            m = self.mask(_parse(branch.test), known)
+            if m.const is False:
+                continue
+            if m.const is True:
+                self.target(branch.then, depth + 1, ind, known, source)
+                return
+            fails = [' & '.join(guards + (self.null(name),)) for guards, name in m.fails if name not in known]
+            failArg = f", {' | '.join(fails)}" if fails else ''
+            self.lines.append(f'{pad}m{depth + 1}, r{depth} = split({source}, {m.value}{failArg})  # {branch.test}')
+            self.target(branch.then, depth + 1, ind, known | m.true_nonnull, f'm{depth + 1}', assigned=True)
+            source = f'r{depth}'
+            known = known | m.false_nonnull | frozenset(name for guards, name in m.fails if not guards)
+
+    def target(self, then, depth: int, ind: int, known: frozenset, source: str, assigned: bool = False) -> None:
+        pad = '    ' * ind
+        if isinstance(then, list):
+            if not assigned:
+                self.lines.append(f'{pad}m{depth} = {source}')
+            self.lines.append(f'{pad}if m{depth}.any():')
+            self.branches(then, depth, ind + 1, known)
+        else:
+            leaf = then.dormant if isinstance(then, Seasonal) else then
+            self.lines.append(f'{pad}put({source}, {leaf.rule}{self.modifier(leaf.modifier)}){_leaf_comment(then)}')
+
+    def modifier(self, modifier) -> str:
+        if modifier is None:
+            return ''
+        if isinstance(modifier, str):
+            return ', ' + ast.unparse(_ScalarNames().visit(_parse(modifier)))
+        return f', {modifier!r}'
+
+    def resolve(self, lines: list) -> list:
+        """
+        Function to replace the atoms by their expressions, or by the shared predicates if used more than once.
+        """
+        shared = {k: n for n, k in enumerate(k for k in range(len(self.atoms)) if self.uses[k] > 1)}
+        resolved = []
+        for line in lines:
+            parts = line.split('\0')
+            for i in range(1, len(parts), 2):
+                k = int(parts[i])
+                parts[i] = f'p[{shared[k]}]' if k in shared else self.atoms[k]
+            resolved.append(''.join(parts))
+        return resolved, [self.atoms[k] for k in shared]
+
+
+################################################
+#### FLAT NODE TABLE
+# Operations of the flat node table. Nodes send null inputs (NaN) to their null child, and the other inputs to their
+# yes or no child depending on the operation. Leaves hold the rule ID reached (0: no leaf reached, -1: decisionTree
+# raises an exception).
+_OPS = ['OP_LEAF', 'OP_NOTNULL', 'OP_IN', 'OP_EQ', 'OP_NE', 'OP_LT', 'OP_LE', 'OP_GT', 'OP_GE']
+_FLAT_OPS = {ast.Eq: 'OP_EQ', ast.NotEq: 'OP_NE', ast.Lt: 'OP_LT', ast.LtE: 'OP_LE', ast.Gt: 'OP_GT',
+             ast.GtE: 'OP_GE'}
+_FLAT_SYMBOLS = {'OP_EQ': '==', 'OP_NE': '!=', 'OP_LT': '<', 'OP_LE': '<=', 'OP_GT': '>', 'OP_GE': '>='}
+_FAIL = -1
+
+
+class _FlatWriter:
+    """
+    Compiles the decision tree into a flat node table. Tests are split into single comparisons of one input column
+    (feature) of the batch, and code comparisons are looked up in boolean tables of the codes meeting them (code sets).
+    """
+    def __init__(self):
+        self.nodes = []
+        self.index = {}
+        self.features = []
+        self.code_sets = []
+        self.modifiers = {}
+
+    def feature(self, expression: str, comment: str) -> int:
+        if (expression, comment) not in self.features:
+            self.features.append((expression, comment))
+        return self.features.index((expression, comment))
+
+    def code_feature(self, name: str) -> int:
+        return self.feature(f"np.where(s.null[{name!r}], np.nan, s.{name})", name)
+
+    def none_feature(self, name: str) -> int:
+        return self.feature(f's.none[{_LAG_DATES[name]!r}]', f'{name} is None')
+
+    def code_set(self, name: str, expression: str) -> int:
+        if (name, expression) not in self.code_sets:
+            self.code_sets.append((name, expression))
+        return self.code_sets.index((name, expression))
+
+    def node(self, op: str, feature: int, value, yes: int, no: int, null: int, comment: str) -> int:
+        if op != 'OP_LEAF' and yes == no == null:
+            return yes
+        key = (op, feature, value, yes, no, null)
+        if key not in self.index:
+            self.index[key] = len(self.nodes)
+            self.nodes.append(key + (comment,))
+        return self.index[key]
+
+    def leaf(self, rule: int, comment: str) -> int:
+        return self.node('OP_LEAF', -1, rule, -1, -1, -1, comment)
+
+    #### Tests
+    def test(self, node: ast.expr, yes: int, no: int) -> int:
+        """
+        Function to compile a test into nodes.
+        :return: the index of the first node of the test
+        """
+        if isinstance(node, ast.BoolOp):
+            first = yes if isinstance(node.op, ast.And) else no
+            for value in reversed(node.values):
+                if isinstance(node.op, ast.And):
+                    first = self.test(value, first, no)
+                else:
+                    first = self.test(value, yes, first)
+            return first
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return self.test(node.operand, no, yes)
+        if isinstance(node, ast.Name) and node.id in _FLAGS:
+            return self.node('OP_NE', self.feature(f's.{node.id}', node.id), 0, yes, no, no, node.id)
+        if isinstance(node, ast.Compare):
+            if len(node.ops) != 1:
+                raise ValueError(f'Chained comparisons are not supported: {ast.unparse(node)}')
+            return self.compare(node.left, node.ops[0], node.comparators[0], yes, no)
+        if isinstance(node, ast.Call):
+            return self.call(node, yes, no)
+        raise ValueError(f'Unsupported rule test: {ast.unparse(node)}')
+
+    def compare(self, left: ast.expr, op: ast.cmpop, right: ast.expr, yes: int, no: int) -> int:
+        if not isinstance(left, ast.Name):
+            raise ValueError(f'Unsupported comparison: {ast.unparse(left)}')
+        name = left.id
+
+        if isinstance(op, (ast.Is, ast.IsNot)):
+            if not (isinstance(right, ast.Constant) and right.value is None):
+                raise ValueError(f'Only "is None" comparisons are supported: {name}')
+            if isinstance(op, ast.IsNot):
+                yes, no = no, yes
+            if name in _CODES:
+                return self.node('OP_NOTNULL', self.code_feature(name), 0, no, no, yes, f'{name} is None')
+            if name in _LAGS:
+                return self.node('OP_NE', self.none_feature(name), 0, yes, no, no, f'{name} is None')
+            if name in _IS_NONE:
+                # is_vegetated is None where BCLCS_LEVEL_1 is neither "V" nor "N"
+                codes = self.code_set('BCLCS_LEVEL_1', "np.isin(c, ['V', 'N'])")
+                return self.node('OP_IN', self.code_feature('BCLCS_LEVEL_1'), codes, no, yes, yes,
+                                 "BCLCS_LEVEL_1 in ['V', 'N']")
+            if name in _NUMBERS:
+                # Missing numbers are NaN, never None
+                return no
+            raise ValueError(f'Unsupported None test: {name}')
+
+        if isinstance(op, (ast.In, ast.NotIn)):
+            if isinstance(op, ast.NotIn):
+                yes, no = no, yes
+            if isinstance(right, ast.Name):
+                if (name, right.id) not in _MEMBERSHIP:
+                    raise ValueError(f'Unsupported list test: {name} in {right.id}')
+                return self.node('OP_NE', self.feature(_MEMBERSHIP[(name, right.id)], f'{name} in {right.id}'), 0,
+                                 yes, no, no, f'{name} in {right.id}')
+            values = ast.literal_eval(right)
+            null = yes if None in values else no
+            values = [v for v in values if v is not None]
+            if name in _CODES:
+                if '' in values:
+                    raise ValueError(f'Empty codes cannot be tested: {name}')
+                codes = self.code_set(name, f'np.isin(c, {values!r})')
+                return self.node('OP_IN', self.code_feature(name), codes, yes, no, null, f'{name} in {values!r}')
+            if name in _NUMBERS:
+                # NaN is not in the list
+                first = no
+                for value in reversed(values):
+                    first = self.node('OP_EQ', self.feature(f's.{name}', name), float(value), yes, first, first,
+                                      f'{name} == {value!r}')
+                return first
+            raise ValueError(f'Unsupported list test: {name}')
+
+        value = ast.literal_eval(right)
+        if name == 'dry_wet' and isinstance(op, (ast.Eq, ast.NotEq)):
+            if (name, value) not in _MEMBERSHIP:
+                raise ValueError(f'Unsupported dry_wet test: {value!r}')
+            if isinstance(op, ast.NotEq):
+                yes, no = no, yes
+            return self.node('OP_NE', self.feature(_MEMBERSHIP[(name, value)], f'dry_wet == {value!r}'), 0,
+                             yes, no, no, f'dry_wet == {value!r}')
+        if name in _CODES and isinstance(op, (ast.Eq, ast.NotEq)):
+            if value == '':
+                raise ValueError(f'Empty codes cannot be tested: {name}')
+            if isinstance(op, ast.NotEq):
+                yes, no = no, yes
+            codes = self.code_set(name, f'c == {value!r}')
+            return self.node('OP_IN', self.code_feature(name), codes, yes, no, no, f'{name} == {value!r}')
+        flatOp = _FLAT_OPS[type(op)]
+        # NaN is only unequal to numbers. Ordering comparisons with None (but not NaN) lags raise in decisionTree.
+        null = yes if flatOp == 'OP_NE' else no
+        if name in _LAGS and flatOp not in ('OP_EQ', 'OP_NE'):
+            null = self.node('OP_NE', self.none_feature(name), 0, self.leaf(_FAIL, 'FAIL'), null, null,
+                             f'{name} is None')
+        if name in _NUMBERS or name in _LAGS:
+            return self.node(flatOp, self.feature(f's.{name}', name), float(value), yes, no, null,
+                             f'{name} {_FLAT_SYMBOLS[flatOp]} {value!r}')
+        raise ValueError(f'Unsupported comparison: {name} {_FLAT_SYMBOLS[flatOp]} {value!r}')
+
+    def call(self, node: ast.Call, yes: int, no: int) -> int:
+        func = node.func
+        if isinstance(func, ast.Name) and func.id == 'dominant':
+            group = tuple(ast.literal_eval(a) for a in node.args)
+            feature = self.feature(f's.dom_conifers[{group!r}]', f'dominant{group!r}')
+            return self.node('OP_NE', feature, 0, yes, no, no, f'dominant{group!r}')
+        if isinstance(func, ast.Attribute) and func.attr == 'startswith':
+            prefix = ast.literal_eval(node.args[0])
+            obj = func.value
+            prefixes = (prefix,) if isinstance(prefix, str) else tuple(prefix)
+            match = ' | '.join(f'np.char.startswith(c, {p!r})' for p in prefixes)
+            if isinstance(obj, ast.Call) and isinstance(obj.func, ast.Name) and obj.func.id == 'str':
+                # str(None) is "None"
+                name = obj.args[0].id
+                null = yes if 'None'.startswith(prefix) else no
+            elif isinstance(obj, ast.Name) and obj.id in _CODES:
+                # None has no startswith method
+                name = obj.id
+                null = self.leaf(_FAIL, 'FAIL')
+            else:
+                raise ValueError(f'Unsupported rule test: {ast.unparse(node)}')
+            codes = self.code_set(name, match)
+            return self.node('OP_IN', self.code_feature(name), codes, yes, no, null,
+                             f'{name}.startswith({prefix!r})')
+        raise ValueError(f'Unsupported rule test: {ast.unparse(node)}')
+
+    #### Tree
+    def branches(self, branches: list) -> int:
+        first = self.leaf(0, 'no leaf reached')
+        for branch in reversed(branches):
+            then = self.target(branch.then)
+            first = then if isinstance(branch, Otherwise) else self.test(_parse(branch.test), then, first)
+        return first
+
+    def target(self, then) -> int:
+        if isinstance(then, list):
+            return self.branches(then)
+        leaf = then.dormant if isinstance(then, Seasonal) else then
+        self.modifiers[leaf.rule] = self.modifier(leaf.modifier)
+        return self.leaf(leaf.rule, f'rule {leaf.rule}:{_leaf_comment(then)[3:]}')
+
+    def modifier(self, modifier) -> tuple:
+        """
+        Function to get the (feature, value) of a modifier: the modifier is the feature times the value, or the value
+        if the feature is -1.
+        """
+        if modifier is None:
+            return -1, None
+        if not isinstance(modifier, str):
+            return -1, float(modifier)
+        node = _parse(modifier)
+        if isinstance(node, ast.Name) and node.id in _NUMBERS:
+            return self.feature(f's.{node.id}', node.id), 1.0
+        if (isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mult) and isinstance(node.left, ast.Name)
+                and node.left.id in _NUMBERS and isinstance(node.right, ast.Constant)):
+            return self.feature(f's.{node.left.id}', node.left.id), float(node.right.value)
+        raise ValueError(f'Unsupported fuel type modifier: {modifier}')
+
+    def table(self, root: int) -> list:
+        """
+        Function to number the nodes from the root, so that every node comes before its children.
+        :return: the node table lines
+        """
+        order = {k: len(self.nodes) - 1 - k for k in range(len(self.nodes))}
+        if order[root] != 0:
+            raise ValueError('The root of the flat node table must be its last compiled node.')
+        lines = []
+        for op, feature, value, yes, no, null, comment in reversed(self.nodes):
+            if op == 'OP_LEAF':
+                lines.append(f'    ({op}, -1, {value}, -1, -1, -1),  # {comment}')
+            else:
+                lines.append(f'    ({op}, {feature}, {value!r}, {order[yes]}, {order[no]}, {order[null]}),  '
+                             f'# {comment}')
+        return lines
+
+
+################################################
+#### MODULE
+def generate(branches: list = DECISION_TREE) -> str:
+    """
+    Function to generate the source code of bcwft_tree.py from the rule specification.
+    :param branches: the rule specification
+    :return: the source code
+    """
+    check_rules(branches)
+
+    scalar = _ScalarWriter()
+    scalar.branches(branches, 1)
+    masks = _MaskWriter()
+    masks.branches(branches, 0, 1, frozenset())
+    maskLines, shared = masks.resolve(masks.lines)
+    flat = _FlatWriter()
+    flatLines = flat.table(flat.branches(branches))
+
+    out = [_HEADER, '']
+    leaves = sorted(_leaves(branches))
+    out.append('# Fuel type of each rule ID (0: no leaf reached)')
+    out.append('FUEL_TYPES = [')
+    out.append('    None,  # 0')
+    out += [f'    {leaf.fuel_type!r},  # {leaf.rule}' for leaf in leaves]
+    out += [']', '']
+    out.append('# Growing season rule IDs of the Seasonal leaves, which are returned as their dormant season rule IDs')
+    out.append('_GROWING_SEASON = {')
+    pairs = [f'{pair.dormant.rule}: {pair.growing.rule}' for pair in _seasonal_pairs(branches)]
+    out += ['    ' + line for line in _pack(pairs, 116)]
+    out += ['}', 'GROWING_RULES = [_GROWING_SEASON.get(rule, rule) for rule in range(len(FUEL_TYPES))]', '', '']
+    out.append('# Species groups of the dominant() tests, in order of first use (see FuelTyping.checkDomConifers)')
+    out.append('DOM_CONIFER_GROUPS = [')
+    out += [f'    {group!r},' for group in _species_groups(branches)]
+    out += [']', '', '# StandBatch membership bits', _MEMBERSHIP_BITS, '', '']
+
+    out.append('# Tests of the SPECIES_CD_1 dispatch tables, and the cached index of the first test met by each code')
+    out.append('_DISPATCH = [')
+    for tests in scalar.dispatch:
+        out.append('    (')
+        out += [f'        lambda v: {test},' for test in tests]
+        out.append('    ),')
+    out += [']', '_DISPATCH_CACHE = [{} for _ in _DISPATCH]', '_DISPATCH_CACHE_SIZE = 4096', '', '']
+
+    out.append('''\
+def _dispatch(table: int, value) -> int:
+    """
+    Function to find the first test of a SPECIES_CD_1 dispatch table met by a value.
+    Results are cached for up to _DISPATCH_CACHE_SIZE codes per table. Exceptions raised by the tests are not cached.
+    :return: the index of the test, or -1 if none are met
+    """
+    cache = _DISPATCH_CACHE[table]
+    if isinstance(value, (str, type(None))) and value in cache:
+        return cache[value]
+    for branch, test in enumerate(_DISPATCH[table]):
+        if test(value):
+            break
+    else:
+        branch = -1
+    if isinstance(value, (str, type(None))) and len(cache) < _DISPATCH_CACHE_SIZE:
+        cache[value] = branch
+    return branch
+
+
+def decision_tree(s, ft) -> tuple:
+    """
+    The fuel typing decision tree.
+    :param s: the stand record, with the derived bcwft variables
+    :param ft: the FuelTyping instance
+    :return: a tuple of (leaf, fuel type modifier), or None if no leaf was reached. The leaf is the rule ID of the
+        dormant season (see GROWING_RULES and FUEL_TYPES).
+    """
+''')
+    out += scalar.lines
+    out += ['', '']
+
+    out.append('# Predicates shared between branches of mask_decision_tree, evaluated once per batch')
+    out.append('_SHARED = [')
+    out += [f'    lambda s, ft: {atom},  # {n}' for n, atom in enumerate(shared)]
+    out += [']', '', '']
+    out.append('''\
+class _Shared(dict):
+    """
+    Lazily evaluated shared predicates of a batch of stands
+    """
+    def __init__(self, s, ft):
+        super().__init__()
+        self.s = s
+        self.ft = ft
+
+    def __missing__(self, k):
+        self[k] = _SHARED[k](self.s, self.ft)
+        return self[k]
+
+
+def mask_decision_tree(s, tree, m0, ft) -> None:
+    """
+    The fuel typing decision tree evaluated as boolean masks over a batch of stands.
+    :param s: the StandBatch
+    :param tree: the _MaskTree collecting the leaves (dormant season rule IDs) reached by the stands
+    :param m0: the stands to classify
+    :param ft: the FuelTyping instance
+    :return: None
+    """
+    split, put = tree.split, tree.put
+    p = _Shared(s, ft)
+''')
+    out += maskLines
+    out += ['', '']
+
+    out.append('# Operations of the flat node table')
+    out.append(f"{', '.join(_OPS)} = range({len(_OPS)})")
+    out += ['', '']
+    out.append('# Flat node table of the decision tree, with the root first and every node before its children.')
+    out.append('# Nodes send stands to their yes, no or null child (the null child if the feature is NaN), and')
+    out.append('# leaves hold the rule ID reached by a stand (0: no leaf reached, '
+               f'{_FAIL}: decisionTree raises an exception).')
+    out.append('NODES = [')
+    out.append('    # (operation, feature, value or code set, yes, no, null)')
+    out += flatLines
+    out += [']', '']
+    out.append('# Fuel type modifiers of the rule IDs, as (feature, value): the value times the feature, or the value')
+    out.append('# if the feature is -1')
+    out.append('MODIFIERS = {')
+    modifiers = [f'{rule}: ({feature}, {value!r})' for rule, (feature, value) in sorted(flat.modifiers.items())
+                 if value is not None]
+    out += ['    ' + line for line in _pack(modifiers, 116)]
+    out += ['}', '', '']
+
+    codeFields = list(dict.fromkeys(name for name, expression in flat.code_sets))
+    out.append(f'''\
+def flat_inputs(s) -> tuple:
+    """
+    Function to get the inputs of the flat node table for a batch of stands.
+    :param s: the StandBatch
+    :return: a tuple of (features, code sets), where features is a float array of the features of each stand
+        (NaN if null), and code sets is a boolean array of the codes (StandBatch categories) in each code set
+    """
+    features = np.empty((len(s), {len(flat.features)}), dtype='float64', order='F')''')
+    for k, (expression, comment) in enumerate(flat.features):
+        named = expression in (f's.{comment}', f"np.where(s.null[{comment!r}], np.nan, s.{comment})")
+        comment = '' if named or 'dom_conifers' in expression else f'  # {comment}'
+        out.append(f'    features[:, {k}] = {expression}{comment}')
+    out.append('')
+    out.append('    width = max(len(s.categories[name]) for name in [')
+    out += ['        ' + line for line in _pack([repr(name) for name in codeFields], 112)]
+    out.append('    ])')
+    out.append(f'    codeSets = np.zeros(({len(flat.code_sets)}, width), dtype=bool)')
+    for name in codeFields:
+        out.append(f'    c = s.categories[{name!r}]')
+        out += [f'    codeSets[{k}, :len(c)] = {expression}' for k, (field, expression) in enumerate(flat.code_sets)
+                if field == name]
+    out.append('    return features, codeSets')
+    return '\n'.join(out).replace('\n\n\n\n', '\n\n\n') + '\n'
+
+
+def main(argv: list) -> int:
+    source = generate()
+    if '--check' in argv:
+        with open(TARGET, encoding='utf-8') as f:
+            if f.read() != source:
+                print(f'{TARGET} is out of date. Run "python bcwft_codegen.py" to regenerate it.')
+                return 1
+        return 0
+    with open(TARGET, 'w', encoding='utf-8') as f:
+        f.write(source)
+    print(f'Generated {TARGET}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,962 @@
+# -*- coding: utf-8 -*-
+"""
+Headless pipeline fuel typing the VRI feature classes of a file geodatabase (or any dataset GDAL can read).
+
+run_fuel_typing reads the attributes of the feature class in chunks of consecutive FIDs and fuel types the chunks on
+a pool of worker processes, which only return the fuel typing results of their features. The chunks are read as
+Arrow tables with pyogrio, without their geometries, or with fiona if pyogrio (or pyarrow) is not installed. Each
+chunk is selected with an attribute filter on its FID range rather than by its position, so reading a chunk costs
+the same anywhere in the feature class where the driver resolves the filter from the FIDs (most drivers read past
+every feature before a position). Drivers that do not index FIDs scan the whole feature class for every filtered
+chunk instead, so before the run check_fid_filter reads chunks at the start, middle and end of the feature class both
+ways, checks that the filter reads exactly the features of each chunk, and falls back to reading the chunks by
+position if the filter costs more (the measured costs are reported by --check-fid-filter). By default, the
+command line picks the worker count from the CPUs and memory available to the process (within the limits of its
+cgroup) and the cost of chunks sampled across the feature class, and cuts chunks of equal estimated cost that shrink
+towards the end of the run, so the workers finish together. The results are then joined to the features by FID and
+written with their fuel typing output fields, so the geometries never cross process boundaries. It reports progress
+through an optional callback as the chunks finish, and returns the statistics of the run. The BC Wildfire Fuel
+Typing Tool runs the same pipeline from its "Model Fuel Types" button, and this module can be run without a display
+(it never imports PySimpleGUI).
+
+Usage:
+    python bcwft_pipeline.py GDB LAYER [--season SEASON] [--workers {WORKERS,auto}] [--chunk-size {CHUNK_SIZE,auto}]
+                                       [--output OUTPUT] [--unclassified-only] [--reference-year YEAR]
+                                       [--projection-years YEARS] [--engine {pyogrio,fiona}] [--json]
+    python bcwft_pipeline.py GDB LAYER --check-fid-filter [--engine {pyogrio,fiona}] [--json]
+"""
+__author__ = ['Gregory A. Greene, map.n.trowel@gmail.com']
+
+import os
+import sys
+import json
+import math
+import time
+import queue
+import argparse
+import warnings
+import importlib.util
+import multiprocessing as mp
+from datetime import datetime
+from multiprocessing import current_process
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+
+import bcwft2018
+import bcwft_rollover
+from bcwft_sql import output_fields
+
+
+# Engines read_features can read the VRI dataset with, in order of preference
+READ_ENGINES = ['pyogrio', 'fiona']
+
+# OGR special field of the feature IDs in attribute filters (also matches the "fid" column of GeoPackages)
+_FID_FIELD = 'FID'
+
+# Auto mode (see plan_chunks): the smallest chunk, the largest share of the time of a chunk its overhead (opening the
+# dataset, filtering the FID range, setting up the batch) may take, and the chunks to aim for per worker
+_MIN_CHUNK_SIZE = 500
+_MAX_OVERHEAD_SHARE = 0.05
+_CHUNKS_PER_WORKER = 4
+
+# Auto mode: memory of an idle worker process, copies of the attributes of a chunk held while fuel typing it, and the
+# share of the available memory the workers may use (in MB)
+_WORKER_MEGABYTES = 200
+_CHUNK_MEMORY_FACTOR = 6
+_MEMORY_SHARE = 0.75
+
+# Shares of the feature class at which check_fid_filter reads a chunk with the FID filter and by position, and how
+# many times slower than the reads by position the FID filter may be before the chunks are read by position (the
+# reads by position get slower towards the end of the feature class, and the timings of small chunks are noisy)
+_FID_CHECK_POSITIONS = [0.0, 0.5, 1.0]
+_FID_FILTER_TOLERANCE = 1.5
+
+# Auto mode: number and size of the chunks sampled across the feature class to estimate the cost of its features
+_COST_SAMPLES = 8
+_COST_SAMPLE_SIZE = 250
+
+
+class ReadInfo(NamedTuple):
+    """
+    Read throughput of a chunk of features
+    """
+    engine: str
+    features: int
+    megabytes: float  # in-memory size of the attributes read (measured the same way for both engines)
+    seconds: float
+    features_per_second: float
+    megabytes_per_second: float
+
+
+class FidFilterCheck(NamedTuple):
+    """
+    Exactness and cost of reading the chunks of a feature class with the FID filter of read_features, rather than by
+    position (see check_fid_filter)
+    """
+    chunks: int
+    features: int  # in each chunk checked
+    filter_exact: bool  # the FID filter read exactly the features of every chunk checked
+    position_exact: bool  # the reads by position did too (the features are stored in FID order)
+    filter_seconds: float  # reading the chunks checked with the FID filter
+    position_seconds: float  # reading the chunks checked by position
+    use_filter: bool  # read the chunks of a run with the FID filter (or by position)
+
+
+class ChunkPlan(NamedTuple):
+    """
+    Worker count and chunk sizes of a run_fuel_typing run (see plan_chunks)
+    """
+    workers: int
+    chunk_size: int  # features in a chunk of average cost, before the chunks shrink towards the end of the run
+    min_chunk_size: int
+    cpus: int
+    memory_megabytes: float  # memory available to the workers (nan if unknown)
+    seconds_per_feature: float  # average, over the sampled chunks (nan if not sampled)
+    overhead_seconds: float  # per chunk (nan if not sampled)
+    megabytes_per_feature: float  # attributes read (nan if not sampled)
+
+
+class RunStats(NamedTuple):
+    """
+    Statistics of a run_fuel_typing run
+    """
+    features: int
+    chunks: int
+    workers: int
+    chunk_size: int
+    error_features: int  # features the fuel typing algorithm could not process ("FuelTyping-Error")
+    process_seconds: float  # reading and fuel typing the chunks
+    read_engine: str
+    fid_filter: bool  # chunks read with the FID filter (or by position, see check_fid_filter)
+    read_seconds: float  # reading the chunks, summed over the workers
+    read_features_per_second: float
+    read_megabytes_per_second: float
+    write_seconds: float  # joining the results to the geometries, and writing the output dataset
+    seconds: float
+    features_per_second: float
+    output: str  # path of the output dataset
+
+
+def output_values(season: str, results: tuple) -> list:
+    """
+    Function to align the classify_frame results of a season with the output_fields of that season
+    :param season: season for fuel typing assignments. Options: "growing", "dormant", "both"
+    :param results: the tuple returned by FuelTyping.classify_frame for the season
+    :return: a list of value arrays, one per output field
+    """
+    if season == 'both':
+        # The fuel type modifier does not depend on the season, so it is only written once
+        (growing_ref, growing_ft, modifier), (dormant_ref, dormant_ft, _) = results
+        return [growing_ref, growing_ft, dormant_ref, dormant_ft, modifier]
+    return list(results)
+
+
+def projection_values(season: str, projection) -> dict:
+    """
+    Function to get the projected fuel type fields of the years after the reference year of a projection
+    :param season: season for fuel typing assignments. Options: "growing", "dormant", "both"
+    :param projection: the Projection (or the tuple of growing and dormant Projections if the season is "both")
+        returned by FuelTyping.project_frame
+    :return: a dictionary of {field name: fuel type array}, with fields named FuelType_YEAR (FuelType_growing_YEAR
+        and FuelType_dormant_YEAR if the season is "both")
+    """
+    if season == 'both':
+        projections = {'FuelType_growing': projection[0], 'FuelType_dormant': projection[1]}
+    else:
+        projections = {'FuelType': projection}
+    values = {}
+    for prefix, seasonProjection in projections.items():
+        fuelTypes = seasonProjection.fuel_types()
+        for year, yearFuelTypes in zip(seasonProjection.years[1:], fuelTypes[1:]):
+            values[f'{prefix}_{year}'] = yearFuelTypes
+    return values
+
+
+def read_engine(engine: str = None) -> str:
+    """
+    Function to get the engine to read the VRI dataset with
+    :param engine: "pyogrio" (Arrow batch reads, needs pyogrio and pyarrow) or "fiona" (feature by feature reads).
+        By default, pyogrio if it is installed, and fiona otherwise.
+    :return: the name of the engine
+    """
+    if engine is None:
+        if importlib.util.find_spec('pyogrio') is None or importlib.util.find_spec('pyarrow') is None:
+            return 'fiona'  # The features are read feature by feature instead
+        return 'pyogrio'
+    if engine not in READ_ENGINES:
+        raise ValueError(f'The "engine" parameter must be one of {READ_ENGINES}.')
+    return engine
+
+
+def layer_info(gdb_path: str, feature_class: str, engine: str = None) -> tuple:
+    """
+    Function to get the number of features, the field names and the CRS of a feature class
+    :param gdb_path: path to the gdb containing the VRI dataset
+    :param feature_class: name of the VRI feature class
+    :param engine: the engine to read the feature class with (see read_engine)
+    :return: a tuple of (number of features, list of field names, CRS)
+    """
+    if read_engine(engine) == 'pyogrio':
+        import pyogrio
+        info = pyogrio.read_info(gdb_path, layer=feature_class, force_feature_count=True)
+        return info['features'], list(info['fields']), info['crs']
+    import fiona
+    with fiona.open(fp=gdb_path, layer=feature_class) as src:
+        return len(src), list(src.schema['properties'].keys()), src.crs
+
+
+def read_fids(gdb_path: str, feature_class: str, engine: str = None) -> np.ndarray:
+    """
+    Function to read the FIDs of the features of a feature class, without their fields or geometries
+    :param gdb_path: path to the gdb containing the VRI dataset
+    :param feature_class: name of the VRI feature class
+    :param engine: the engine to read the feature class with (see read_engine)
+    :return: a sorted int64 array of FIDs
+    """
+    if read_engine(engine) == 'pyogrio':
+        import pyogrio
+        meta, table = pyogrio.read_arrow(gdb_path, layer=feature_class, columns=[], read_geometry=False,
+                                         return_fids=True)
+        fids = table[meta['fid_column']].to_numpy()
+    else:
+        import fiona
+        with fiona.open(fp=gdb_path, layer=feature_class) as src:
+            fids = np.fromiter(src.keys(), dtype='int64')
+    return np.sort(fids.astype('int64'))
+
+
+def fid_chunks(fids: np.ndarray, chunk_size: int) -> list:
+    """
+    Function to split the FIDs of a feature class into ranges of chunk_size features each (the last may be smaller).
+    The ranges follow the FIDs read, so gaps left by deleted features do not make chunks smaller.
+    :param fids: the sorted FIDs of the features (see read_fids)
+    :param chunk_size: number of features in each range
+    :return: a list of slices of FIDs, from the first FID of each range to one past its last FID
+    """
+    return [slice(int(fids[i]), int(fids[min(i + chunk_size, len(fids)) - 1]) + 1)
+            for i in range(0, len(fids), chunk_size)]
+
+
+def read_features(gdb_path: str, feature_class: str, columns: list, rows: slice = None,
+                  geometry: bool = True, engine: str = None, fids: slice = None) -> pd.DataFrame:
+    """
+    Function to read features of a feature class, indexed by FID
+    :param gdb_path: path to the gdb containing the VRI dataset
+    :param feature_class: name of the VRI feature class
+    :param columns: the fields to read (the geometry is read separately)
+    :param rows: A slice of the positions of the features to read (default: every feature). Most drivers read past
+        every feature before the start of the slice, so use fids to read chunks of large feature classes.
+    :param geometry: If True, read the geometries into a GeoDataFrame. If False, only read the attributes.
+    :param engine: the engine to read the features with (see read_engine)
+    :param fids: A slice of the FIDs of the features to read (see fid_chunks), selected with an attribute filter,
+        which the drivers resolve without reading the features before it (overrides rows)
+    :return: a GeoDataFrame, or a pandas DataFrame if the geometries are not read
+    """
+    where = None if fids is None else f'{_FID_FIELD} >= {fids.start} AND {_FID_FIELD} < {fids.stop}'
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        if read_engine(engine) == 'pyogrio':
+            import pyogrio
+            if where is not None:
+                selection = {'where': where}
+            elif rows is not None:
+                selection = {'skip_features': rows.start, 'max_features': max(rows.stop - rows.start, 0)}
+            else:
+                selection = {}
+            if geometry:
+                features = pyogrio.read_dataframe(gdb_path, layer=feature_class, columns=columns, fid_as_index=True,
+                                                  use_arrow=True, **selection)
+            else:
+                # Read the attributes as an Arrow table, so no Python objects are built for the numeric columns
+                meta, table = pyogrio.read_arrow(gdb_path, layer=feature_class, columns=columns, read_geometry=False,
+                                                 return_fids=True, **selection)
+                features = table.to_pandas().set_index(meta['fid_column'])
+        else:
+            import fiona
+            with fiona.open(fp=gdb_path, layer=feature_class, include_fields=columns,
+                            ignore_geometry=not geometry) as src:
+                if where is not None:
+                    records = list(src.filter(where=where))
+                elif rows is not None:
+                    records = [record for _, record in src.items(rows.start, rows.stop)]
+                else:
+                    records = list(src)
+                crs = src.crs
+            if geometry:
+                features = gpd.GeoDataFrame.from_features(records, crs=crs, columns=columns)
+            else:
+                features = pd.DataFrame([record['properties'] for record in records], columns=columns)
+            features.index = pd.Index([int(record['id']) for record in records], dtype='int64')
+    features.index.name = 'FID'
+
+    # Ensure all values in date columns are datetime objects
+    for fld in ['EARLIEST_NONLOGGING_DIST_DATE', 'HARVEST_DATE']:
+        if fld in features:
+            features[fld] = pd.to_datetime(features[fld], errors='coerce')
+    return features
+
+
+def check_fid_filter(gdb_path: str, feature_class: str, fids: np.ndarray, columns: list, engine: str = None,
+                     chunk_size: int = _COST_SAMPLE_SIZE) -> FidFilterCheck:
+    """
+    Function to check that the FID filter of read_features reads exactly the features of a chunk, and that it costs
+    no more than reading the chunk by position. Chunks are read both ways at the start, middle and end of the feature
+    class: a driver that does not index FIDs scans the whole feature class for every filtered chunk, while reading by
+    position only reads past the features before the chunk. The chunks of a run are read by position if the FID filter
+    is much slower, and the features are stored in FID order.
+    :param gdb_path: path to the gdb containing the VRI dataset
+    :param feature_class: name of the VRI feature class
+    :param fids: the sorted FIDs of the features (see read_fids)
+    :param columns: the fields to read
+    :param engine: the engine to read the feature class with (see read_engine)
+    :param chunk_size: number of features in each chunk checked
+    :return: a FidFilterCheck tuple
+    """
+    n = len(fids)
+    size = min(chunk_size, n)
+    if not size:
+        return FidFilterCheck(chunks=0, features=0, filter_exact=True, position_exact=True, filter_seconds=0.0,
+                              position_seconds=0.0, use_filter=True)
+
+    # Warm up the imports and the dataset, so the first chunk read is not charged for them
+    read_features(gdb_path, feature_class, columns, rows=slice(0, 1), geometry=False, engine=engine)
+
+    starts = sorted({int(round(share * (n - size))) for share in _FID_CHECK_POSITIONS})
+    filter_exact = position_exact = True
+    filter_seconds = position_seconds = 0.0
+    for start in starts:
+        rows = slice(start, start + size)
+        expected = fids[rows]
+        t = time.perf_counter()
+        filtered = read_features(gdb_path, feature_class, columns, geometry=False, engine=engine,
+                                 fids=slice(int(expected[0]), int(expected[-1]) + 1))
+        filter_seconds += time.perf_counter() - t
+        t = time.perf_counter()
+        positioned = read_features(gdb_path, feature_class, columns, rows=rows, geometry=False, engine=engine)
+        position_seconds += time.perf_counter() - t
+        filter_exact = filter_exact and np.array_equal(np.sort(filtered.index.to_numpy()), expected)
+        position_exact = position_exact and np.array_equal(positioned.index.to_numpy(), expected)
+
+    if not filter_exact and not position_exact:
+        raise ValueError(f'The FID filter of {feature_class} does not read exactly the features of a chunk, and its '
+                         f'features are not stored in FID order to be read by position.')
+    use_filter = filter_exact and (not position_exact or filter_seconds <= _FID_FILTER_TOLERANCE * position_seconds)
+    return FidFilterCheck(chunks=len(starts), features=size, filter_exact=filter_exact, position_exact=position_exact,
+                          filter_seconds=filter_seconds, position_seconds=position_seconds, use_filter=use_filter)
+
+
+def read_and_process_features(process_all: bool,
+                              feature_slice: slice,
+                              season: str,
+                              fields_to_extract: list,
+                              gdb_path: str,
+                              feature_class: str,
+                              reference_date: datetime = None,
+                              projection_years: int = 0,
+                              engine: str = None,
+                              rows: slice = None,
+                              return_read_info: bool = False):
+    """
+    Function to read the attributes of a slice of the feature class, filter the fields, and run the fuel typing
+    algorithm. The geometries are not read, so only the fuel typing results are sent back to the parent process,
+    which joins them to the geometries by FID (see join_results).
+    :param process_all: If True, process all features. If false, only process features without "FuelType" values
+    :param feature_slice: A slice of the FIDs of the features to process in the VRI dataset (see fid_chunks)
+    :param season: season for fuel typing assignments. Options: "growing", "dormant", "both" (both seasons are
+        written to the FuelType_growing and FuelType_dormant fields in a single pass)
+    :param fields_to_extract: the fields in the VRI dataset that are needed for BCWFT fuel typing
+    :param gdb_path: path to the gdb containing the VRI dataset
+    :param feature_class: name of the VRI feature class
+    :param reference_date: the date harvest and disturbance lags are measured to (default: today)
+    :param projection_years: number of years after the reference date to project the fuel types of every feature
+        to, as the stands age and their lags grow (see projection_values for the fields written)
+    :param engine: the engine to read the slice with (see read_engine, default: pyogrio if it is installed)
+    :param rows: A slice of the positions of the features of the slice, to read them by position instead of with
+        the FID filter (see check_fid_filter)
+    :param return_read_info: If True, also return the read throughput of the slice
+    :return: a pandas DataFrame of the fuel typing output fields (and the BCWFT_nextYear and projection fields) of
+        the features of the slice, indexed by FID (and its ReadInfo if return_read_info is True)
+    """
+    process_id = current_process().name
+    print(f'\t[{process_id}] Processing chunk: {feature_slice}')
+
+    # Get the attributes of the current VRI feature slice
+    engine = read_engine(engine)
+    read_start = time.perf_counter()
+    slice_df = read_features(gdb_path, feature_class, fields_to_extract, rows=rows, geometry=False, engine=engine,
+                             fids=feature_slice if rows is None else None)
+    read_seconds = time.perf_counter() - read_start
+    megabytes = slice_df.memory_usage(index=False, deep=True).sum() / 1e6
+    read_info = ReadInfo(engine=engine, features=len(slice_df), megabytes=megabytes, seconds=read_seconds,
+                         features_per_second=len(slice_df) / read_seconds if read_seconds else np.nan,
+                         megabytes_per_second=megabytes / read_seconds if read_seconds else np.nan)
+    print(f'\t[{process_id}] Read {read_info.features} features ({read_info.megabytes:.1f} MB) with {engine} in '
+          f'{read_seconds:.2f} seconds ({read_info.features_per_second:.0f} features/s, '
+          f'{read_info.megabytes_per_second:.1f} MB/s)')
+
+    # Reorder the columns
+    slice_df = slice_df[fields_to_extract]
+
+    # Instantiate the bcwft2018 FuelTyping class
+    bcwft = bcwft2018.FuelTyping()
+
+    # Run fuel typing
+    fields = output_fields(season)
+    fuel_type_fields = [field for field in fields if field.startswith('FuelType')]
+    # Encode the fuel typing inputs of the slice
+    stands = bcwft.stand_batch(slice_df, reference_date)
+    if process_all:
+        # Get the fuel types for every feature
+        results = bcwft.classify_frame(stands, season)
+        for field, values in zip(fields, output_values(season, results)):
+            slice_df[field] = values
+    else:
+        # Get the fuel types for the features that contain no data values
+        partial = slice_df[fuel_type_fields].isna().any(axis=1)
+        if partial.any():
+            results = bcwft.classify_frame(bcwft.stand_batch(slice_df[partial], reference_date), season)
+            for field, values in zip(fields, output_values(season, results)):
+                slice_df[field] = slice_df[field].astype(object)
+                slice_df.loc[partial, field] = values
+
+    # Index the year the harvest or disturbance lags of each feature next cross a threshold of the decision tree, so
+    # later years only need to re-fuel-type the features whose year has arrived (see bcwft_rollover.py)
+    slice_df[bcwft_rollover.INDEX_FIELD] = bcwft_rollover.next_crossing_years(stands)
+
+    # Project the fuel types of every feature, reusing the encoded inputs
+    if projection_years > 0:
+        projection = bcwft.project_frame(stands, season, projection_years)
+        for field, values in projection_values(season, projection).items():
+            slice_df[field] = values
+
+    # Report features with invalid inputs, and features the fuel typing algorithm could not process
+    problems = bcwft.validate_batch(slice_df)
+    invalid_count = int(np.count_nonzero(problems))
+    if invalid_count:
+        invalid_fields = ', '.join(bcwft.describe_problems(np.bitwise_or.reduce(problems)))
+        print(f'\t[{process_id}] {invalid_count} features in chunk {feature_slice} have invalid values in: '
+              f'{invalid_fields}')
+    error_count = int((slice_df[fuel_type_fields[0]] == 'FuelTyping-Error').sum())
+    if error_count:
+        print(f'\t[{process_id}] {error_count} features in chunk {feature_slice} could not be fuel typed')
+
+    # Only return the results
+    results = slice_df.drop(columns=bcwft.fldList[3:])
+    if return_read_info:
+        return results, read_info
+    return results
+
+
+def has_output_fields(gdb_path: str, feature_class: str, season: str, engine: str = None) -> bool:
+    """
+    Function to check if a VRI feature class has any of the fuel typing output fields of a season, which are needed
+    to only process the features without fuel types
+    :param gdb_path: path to the gdb containing the VRI dataset
+    :param feature_class: name of the VRI feature class
+    :param season: season for fuel typing assignments. Options: "growing", "dormant", "both"
+    :param engine: the engine to read the feature class with (see read_engine)
+    :return: True or False
+    """
+    _, columns, _ = layer_info(gdb_path, feature_class, engine)
+    return any(column in columns for column in output_fields(season))
+
+
+def _process_chunk(args: tuple) -> tuple:
+    """
+    Function to run read_and_process_features on the arguments of a chunk (for Pool.imap).
+    :return: a tuple of (the results of the chunk, its ReadInfo)
+    """
+    return read_and_process_features(*args, return_read_info=True)
+
+
+def join_results(results: pd.DataFrame, gdb_path: str, feature_class: str, fields: list,
+                 engine: str = None) -> gpd.GeoDataFrame:
+    """
+    Function to join the fuel typing results of the features to their attributes and geometries, by FID
+    :param results: the results of read_and_process_features, indexed by FID
+    :param gdb_path: path to the gdb containing the VRI dataset
+    :param feature_class: name of the VRI feature class
+    :param fields: the fields of the feature class to write with the results
+    :param engine: the engine to read the features with (see read_engine)
+    :return: a GeoDataFrame of the fields, the geometries and the results of the features
+    """
+    features = read_features(gdb_path, feature_class, [fld for fld in fields if fld not in results], engine=engine)
+    return features.join(results)
+
+
+def _write_output(gdf: gpd.GeoDataFrame, gdb_path: str, feature_class: str, output: str = None) -> str:
+    """
+    Function to write the fuel typed features.
+    :param output: path of the output GeoPackage (*.gpkg) or file geodatabase (*.gdb), written to the
+        FEATURE_CLASS_FuelTypes layer. By default, the FEATURE_CLASS_FuelTypes feature class of the input file
+        geodatabase, or the FEATURE_CLASS_FuelTypes.gpkg GeoPackage next to it if it cannot be written.
+    :return: the path written
+    """
+    if output is None:
+        output = os.path.join(gdb_path, feature_class + '_FuelTypes')
+        try:
+            gdf.to_file(output, driver='FileGDB')
+        except Exception:
+            output = os.path.join(os.path.dirname(gdb_path), feature_class + '_FuelTypes.gpkg')
+            gdf.to_file(output, driver='GPKG')
+        return output
+    driver = 'FileGDB' if output.rstrip('/\\').lower().endswith('.gdb') else 'GPKG'
+    gdf.to_file(output, layer=feature_class + '_FuelTypes', driver=driver)
+    return output
+
+
+def _read_cgroup(path: str) -> str:
+    """
+    Function to read a cgroup control file.
+    :return: its stripped contents, or None if it does not exist
+    """
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def available_cpus() -> int:
+    """
+    Function to get the number of CPUs this process can run on, limited by the CPU quota of its cgroup (e.g., the
+    CPU limit of a container or a batch job), which os.cpu_count and mp.cpu_count ignore
+    :return: the number of CPUs (at least 1)
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on Windows or macOS
+        cpus = os.cpu_count() or 1
+
+    # cgroup v2 ("QUOTA PERIOD", or "max PERIOD" without a quota), then cgroup v1 (a quota of -1 without a quota)
+    cpu_max = _read_cgroup('/sys/fs/cgroup/cpu.max')
+    if cpu_max is not None:
+        quota, period = cpu_max.split()[:2]
+    else:
+        quota = _read_cgroup('/sys/fs/cgroup/cpu/cpu.cfs_quota_us')
+        period = _read_cgroup('/sys/fs/cgroup/cpu/cpu.cfs_period_us')
+    if quota not in [None, 'max', '-1'] and period:
+        cpus = min(cpus, int(quota) // int(period))
+    return max(cpus, 1)
+
+
+def available_memory() -> float:
+    """
+    Function to get the memory available to this process: the available memory of the system, limited by the memory
+    limit of its cgroup, less the memory the cgroup already uses
+    :return: the available memory in MB, or nan if it is unknown (e.g., on Windows)
+    """
+    available = []
+    meminfo = _read_cgroup('/proc/meminfo')
+    if meminfo is not None:
+        for line in meminfo.splitlines():
+            if line.startswith('MemAvailable:'):
+                available.append(int(line.split()[1]) / 1024)
+
+    # cgroup v2 ("max" without a limit), then cgroup v1 (a huge number without a limit)
+    limit = _read_cgroup('/sys/fs/cgroup/memory.max')
+    usage = _read_cgroup('/sys/fs/cgroup/memory.current')
+    if limit is None:
+        limit = _read_cgroup('/sys/fs/cgroup/memory/memory.limit_in_bytes')
+        usage = _read_cgroup('/sys/fs/cgroup/memory/memory.usage_in_bytes')
+    if limit is not None and limit != 'max' and int(limit) < 2 ** 60:
+        available.append((int(limit) - int(usage or 0)) / 2 ** 20)
+    return max(min(available), 0) if available else np.nan
+
+
+def plan_chunks(total_features: int,
+                seconds_per_feature: float = np.nan,
+                overhead_seconds: float = np.nan,
+                megabytes_per_feature: float = np.nan,
+                workers: int = None,
+                chunk_size: int = None,
+                cpus: int = None,
+                memory_megabytes: float = None) -> ChunkPlan:
+    """
+    Function to pick the worker count and the chunk sizes of a run. The smallest chunk keeps the overhead of a chunk
+    under _MAX_OVERHEAD_SHARE of its time, the planned chunk gives each worker _CHUNKS_PER_WORKER chunks, and both
+    are limited by the memory the workers may use. There are no more workers than CPUs, or than smallest chunks.
+    :param total_features: number of features to fuel type
+    :param seconds_per_feature: average seconds to read and fuel type a feature (nan if unknown)
+    :param overhead_seconds: seconds a chunk takes regardless of its size (nan if unknown)
+    :param megabytes_per_feature: in-memory size of the attributes of a feature (nan if unknown)
+    :param workers: number of worker processes (default: picked)
+    :param chunk_size: number of features in a chunk (default: picked)
+    :param cpus: number of CPUs (default: available_cpus())
+    :param memory_megabytes: memory available to the workers (default: available_memory())
+    :return: a ChunkPlan
+    """
+    cpus = available_cpus() if cpus is None else cpus
+    memory_megabytes = available_memory() if memory_megabytes is None else memory_megabytes
+    chunk_megabytes = _CHUNK_MEMORY_FACTOR * megabytes_per_feature
+
+    min_chunk_size = _MIN_CHUNK_SIZE
+    if seconds_per_feature > 0 and overhead_seconds > 0:
+        min_chunk_size = max(min_chunk_size, math.ceil(overhead_seconds / (_MAX_OVERHEAD_SHARE * seconds_per_feature)))
+    min_chunk_size = min(min_chunk_size, max(total_features, 1))
+    if chunk_size is not None:
+        min_chunk_size = min(min_chunk_size, chunk_size)
+
+    if workers is None:
+        workers = min(cpus, math.ceil(total_features / min_chunk_size))
+        if memory_megabytes > 0 and chunk_megabytes > 0:
+            memory_workers = _MEMORY_SHARE * memory_megabytes // (_WORKER_MEGABYTES + min_chunk_size * chunk_megabytes)
+            workers = min(workers, int(memory_workers))
+        workers = max(workers, 1)
+
+    if chunk_size is None:
+        chunk_size = math.ceil(total_features / (workers * _CHUNKS_PER_WORKER))
+        if memory_megabytes > 0 and chunk_megabytes > 0:
+            memory_chunk_size = (_MEMORY_SHARE * memory_megabytes / workers - _WORKER_MEGABYTES) / chunk_megabytes
+            chunk_size = min(chunk_size, int(memory_chunk_size))
+        chunk_size = max(min(chunk_size, total_features), min_chunk_size)
+    return ChunkPlan(workers=workers, chunk_size=chunk_size, min_chunk_size=min_chunk_size, cpus=cpus,
+                     memory_megabytes=memory_megabytes, seconds_per_feature=seconds_per_feature,
+                     overhead_seconds=overhead_seconds, megabytes_per_feature=megabytes_per_feature)
+
+
+class _GuidedSchedule:
+    """
+    FID ranges of the chunks of a run, cut as the chunks are dispatched. Each chunk takes its share of the estimated
+    cost left in the run (guided self-scheduling), between plan.min_chunk_size and plan.chunk_size features of average
+    cost, so the chunks are smaller where the features cost more, and shrink towards the end of the run, so no long
+    chunk is left running on its own while the other workers are idle.
+    """
+
+    def __init__(self, fids: np.ndarray, plan: ChunkPlan, segments: list = None, cost_positions: np.ndarray = None,
+                 costs: np.ndarray = None):
+        """
+        :param fids: the sorted FIDs of the features (see read_fids)
+        :param plan: the ChunkPlan of the run
+        :param segments: (start, stop) positions of the features to process (default: every feature)
+        :param cost_positions: positions at which the cumulative estimated cost of the features is known (default:
+            the first and the last position, i.e., every feature costs the same)
+        :param costs: the cumulative estimated cost of the features before each of the cost_positions
+        """
+        self.fids = fids
+        self.plan = plan
+        if segments is None:
+            segments = [(0, len(fids))]
+        self.segments = [(a, b) for a, b in segments if b > a]  # An empty layer leaves no chunks
+        if cost_positions is None:
+            cost_positions, costs = np.asarray([0, len(fids)]), np.asarray([0.0, float(len(fids))])
+        self.cost_positions = cost_positions
+        self.costs = costs
+        self.feature_cost = costs[-1] / max(cost_positions[-1], 1)
+
+    def _cost(self, position: float) -> float:
+        """
+        Function to get the cumulative estimated cost of the features before a position.
+        :return: the cost
+        """
+        return float(np.interp(position, self.cost_positions, self.costs))
+
+    def remaining_cost(self) -> float:
+        """
+        Function to get the estimated cost of the features not dispatched yet.
+        :return: the cost
+        """
+        return sum(self._cost(stop) - self._cost(start) for start, stop in self.segments)
+
+    def next_chunk(self) -> slice:
+        """
+        Function to cut the next chunk from the features not dispatched yet.
+        :return: a slice of FIDs (see fid_chunks), or None if every feature was dispatched
+        """
+        if not self.segments:
+            return None
+        start, stop = self.segments[0]
+        cost = min(max(self.remaining_cost() / (2 * self.plan.workers), self.plan.min_chunk_size * self.feature_cost),
+                   self.plan.chunk_size * self.feature_cost)
+        end = int(round(np.interp(self._cost(start) + cost, self.costs, self.cost_positions)))
+        end = min(max(end, start + self.plan.min_chunk_size), stop)
+        if stop - end < self.plan.min_chunk_size:  # Do not leave a sliver of the segment for a chunk of its own
+            end = stop
+        if end < stop:
+            self.segments[0] = (end, stop)
+        else:
+            self.segments.pop(0)
+        return slice(int(self.fids[start]), int(self.fids[end - 1]) + 1)
+
+
+def _sample_costs(fids: np.ndarray, chunk_args) -> tuple:
+    """
+    Function to process small chunks spread across a feature class in this process, timing them to estimate the cost
+    of its features for the auto mode (forested stands cost more to fuel type than non-vegetated ones, and the stands
+    of a feature class are usually grouped by area). The first chunk is a single feature, which warms up the imports,
+    and so is the last, which times the overhead of a chunk.
+    :param fids: the sorted FIDs of the features (see read_fids)
+    :param chunk_args: function of a slice of FIDs returning the arguments of read_and_process_features for it
+    :return: a tuple of (list of the (results, ReadInfo) of the sampled chunks, list of the (start, stop) positions
+        of the features not sampled, positions of the boundaries of the sampled areas, cumulative estimated cost of the
+        features before each boundary, average seconds per feature, overhead seconds, megabytes per feature)
+    """
+    n = len(fids)
+    bounds = np.round(np.linspace(0, n, _COST_SAMPLES + 1)).astype('int64')
+    starts = (bounds[:-1] + bounds[1:]) // 2 - _COST_SAMPLE_SIZE // 2
+    samples = [(0, 1)] + [(int(a), int(a) + _COST_SAMPLE_SIZE) for a in starts] + [(n - 1, n)]
+
+    sampled = []
+    seconds = []
+    for start, stop in samples:
+        t = time.perf_counter()
+        sampled.append(_process_chunk(chunk_args(slice(int(fids[start]), int(fids[stop - 1]) + 1))))
+        seconds.append(time.perf_counter() - t)
+
+    # Seconds per feature of each sampled area, without the overhead of its chunk
+    overhead = seconds[-1]
+    area_seconds = np.asarray([max(t - overhead, t / 2) / _COST_SAMPLE_SIZE for t in seconds[1:-1]])
+    costs = np.concatenate([[0.0], np.cumsum(area_seconds * np.diff(bounds))])
+    megabytes = sum(read_info.megabytes for _, read_info in sampled[1:-1]) / (_COST_SAMPLES * _COST_SAMPLE_SIZE)
+
+    segments = []
+    position = 0
+    for start, stop in samples:
+        segments.append((position, start))
+        position = stop
+    return sampled, segments, bounds, costs, costs[-1] / n, overhead, megabytes
+
+
+def run_fuel_typing(gdb_path: str,
+                    feature_class: str,
+                    season: str,
+                    workers: int = 1,
+                    chunk_size: int = 5000,
+                    output: str = None,
+                    process_all: bool = True,
+                    reference_date: datetime = None,
+                    projection_years: int = 0,
+                    progress=None,
+                    engine: str = None) -> RunStats:
+    """
+    Function to fuel type the features of a VRI feature class, and write them with their fuel typing output fields
+    :param gdb_path: path to the gdb containing the VRI dataset
+    :param feature_class: name of the VRI feature class
+    :param season: season for fuel typing assignments. Options: "growing", "dormant", "both"
+    :param workers: number of worker processes fuel typing the chunks (1 fuel types them in this process). If None,
+        picked from the CPUs and memory available and the estimated cost of the features (see plan_chunks).
+    :param chunk_size: number of features read and fuel typed at a time. If None, the chunks are cut as they are
+        dispatched, from their share of the estimated cost of the features left (see _GuidedSchedule).
+    :param output: path of the output dataset (see _write_output, default: next to the input dataset)
+    :param process_all: If True, process all features. If false, only process features without "FuelType" values
+        (the output_fields of the season must be in the dataset)
+    :param reference_date: the date harvest and disturbance lags are measured to (default: today, fixed once for
+        every chunk)
+    :param projection_years: number of years after the reference date to project the fuel types of every feature
+        to (see read_and_process_features)
+    :param progress: optional function of (features processed, total features) called as each chunk finishes
+    :param engine: the engine to read the dataset with (see read_engine, default: pyogrio if it is installed)
+    :return: a RunStats tuple
+    """
+    if season not in ['growing', 'dormant', 'both']:
+        raise ValueError('The "season" parameter must be either "growing", "dormant" or "both".')
+    if (workers is not None and workers < 1) or (chunk_size is not None and chunk_size < 1):
+        raise ValueError('The "workers" and "chunk_size" parameters must be positive integers, or None.')
+    engine = read_engine(engine)
+    start = time.perf_counter()
+
+    # Get the FIDs and fields of the VRI dataset
+    _, columns, crs = layer_info(gdb_path, feature_class, engine)
+    fids = read_fids(gdb_path, feature_class, engine)
+    total_features = len(fids)
+
+    fields_to_extract = bcwft2018.FuelTyping().fldList[3:]
+    if not process_all:
+        if not any(column in columns for column in output_fields(season)):
+            raise KeyError(f'None of the fuel typing output fields {output_fields(season)} are in the dataset.')
+        fields_to_extract = output_fields(season) + fields_to_extract
+
+    # Fix the reference date for the lag calculations so every chunk uses the same year
+    if reference_date is None:
+        reference_date = datetime.now()
+
+    # Read the chunks with the FID filter, unless the driver resolves it slower than reading the chunks by position
+    fid_check = check_fid_filter(gdb_path, feature_class, fids, fields_to_extract, engine)
+    if not fid_check.use_filter:
+        print(f'Reading the chunks by position: the FID filter took {fid_check.filter_seconds:.2f} seconds to read '
+              f'{fid_check.chunks} chunks of {fid_check.features} features, and reading them by position '
+              f'{fid_check.position_seconds:.2f} seconds')
+
+    def chunk_args(feature_slice):
+        rows = None
+        if not fid_check.use_filter:
+            rows = slice(int(np.searchsorted(fids, feature_slice.start)),
+                         int(np.searchsorted(fids, feature_slice.stop)))
+        return (process_all, feature_slice, season, fields_to_extract, gdb_path, feature_class, reference_date,
+                projection_years, engine, rows)
+
+    # Collect the results of the chunks, reporting progress as they finish. The workers only read and return
+    # attributes, so no geometries are sent between processes.
+    chunk_results = []
+    read_infos = []
+    processed = 0
+
+    def finish(chunk, read_info):
+        nonlocal processed
+        chunk_results.append(chunk)
+        read_infos.append(read_info)
+        processed += len(chunk)
+        if progress is not None:
+            progress(processed, total_features)
+
+    if workers is not None and chunk_size is not None:
+        # Set up the FID ranges of the chunks, so each worker reads its chunk directly instead of reading past the
+        # features before it
+        args = [chunk_args(feature_slice) for feature_slice in fid_chunks(fids, chunk_size)]
+        if workers == 1:
+            for result in map(_process_chunk, args):
+                finish(*result)
+        else:
+            with mp.Pool(workers) as pool:
+                for result in pool.imap(_process_chunk, args):
+                    finish(*result)
+    else:
+        # Estimate the cost of the features from chunks sampled across the feature class (keeping their results),
+        # unless there are too few features for the estimate to matter
+        if total_features >= 4 * _COST_SAMPLES * _COST_SAMPLE_SIZE:
+            sampled, segments, cost_positions, costs, seconds_per_feature, overhead, megabytes = \
+                _sample_costs(fids, chunk_args)
+            for result in sampled:
+                finish(*result)
+        else:
+            segments = cost_positions = costs = None
+            seconds_per_feature = overhead = megabytes = np.nan
+        plan = plan_chunks(total_features, seconds_per_feature, overhead, megabytes, workers, chunk_size)
+        workers, chunk_size = plan.workers, plan.chunk_size
+        print(f'Fuel typing with {plan.workers} workers ({plan.cpus} CPUs available), in chunks of '
+              f'{plan.min_chunk_size} to {plan.chunk_size} features')
+
+        # Cut the chunks as they are dispatched, keeping one queued for each worker, so the last chunks are small
+        # enough to finish together
+        schedule = _GuidedSchedule(fids, plan, segments, cost_positions, costs)
+        if workers == 1:
+            feature_slice = schedule.next_chunk()
+            while feature_slice is not None:
+                finish(*_process_chunk(chunk_args(feature_slice)))
+                feature_slice = schedule.next_chunk()
+        else:
+            done = queue.Queue()
+            pending = 0
+            with mp.Pool(workers) as pool:
+                while True:
+                    while pending < 2 * workers:
+                        feature_slice = schedule.next_chunk()
+                        if feature_slice is None:
+                            break
+                        pool.apply_async(_process_chunk, (chunk_args(feature_slice),), callback=done.put,
+                                         error_callback=done.put)
+                        pending += 1
+                    if not pending:
+                        break
+                    result = done.get()
+                    pending -= 1
+                    if isinstance(result, BaseException):
+                        raise result
+                    finish(*result)
+    processed_time = time.perf_counter()
+    results = pd.concat(chunk_results) if chunk_results else pd.DataFrame(index=pd.RangeIndex(0, name='FID'))
+
+    # Attach the results to the source geometries by FID
+    merged_gdf = join_results(results, gdb_path, feature_class, fields_to_extract, engine)
+    merged_gdf.crs = crs
+    output = _write_output(merged_gdf, gdb_path, feature_class, output)
+    end = time.perf_counter()
+
+    fuel_type_field = [field for field in output_fields(season) if field.startswith('FuelType')][0]
+    error_features = int((results[fuel_type_field] == 'FuelTyping-Error').sum()) if len(results) else 0
+    read_seconds = sum(info.seconds for info in read_infos)
+    read_features_count = sum(info.features for info in read_infos)
+    read_megabytes = sum(info.megabytes for info in read_infos)
+    return RunStats(features=len(merged_gdf), chunks=len(chunk_results), workers=workers, chunk_size=chunk_size,
+                    error_features=error_features, process_seconds=processed_time - start, read_engine=engine,
+                    fid_filter=fid_check.use_filter, read_seconds=read_seconds,
+                    read_features_per_second=read_features_count / read_seconds if read_seconds else np.nan,
+                    read_megabytes_per_second=read_megabytes / read_seconds if read_seconds else np.nan,
+                    write_seconds=end - processed_time, seconds=end - start,
+                    features_per_second=len(merged_gdf) / (end - start) if end > start else np.nan, output=output)
+
+
+def _auto_int(value: str) -> int:
+    """
+    Function to parse a positive integer command line option that can be left to the auto mode.
+    :return: the integer, or None for "auto"
+    """
+    if value == 'auto':
+        return None
+    if not value.isdigit() or int(value) < 1:
+        raise argparse.ArgumentTypeError(f'{value} is not a positive integer or "auto"')
+    return int(value)
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description='Fuel type the features of a VRI feature class.')
+    parser.add_argument('gdb', help='path to the gdb containing the VRI dataset')
+    parser.add_argument('layer', help='name of the VRI feature class')
+    parser.add_argument('--season', default='growing', choices=['growing', 'dormant', 'both'])
+    parser.add_argument('--workers', type=_auto_int, default='auto',
+                        help='number of worker processes, or "auto" to pick it from the CPUs and memory available and '
+                             'the cost of the features (default: auto)')
+    parser.add_argument('--chunk-size', type=_auto_int, default='auto',
+                        help='number of features read and fuel typed at a time, or "auto" to cut chunks from their '
+                             'share of the cost of the features left (default: auto)')
+    parser.add_argument('--output', default=None,
+                        help='output GeoPackage (*.gpkg) or file geodatabase (*.gdb) (default: LAYER_FuelTypes in the '
+                             'input gdb, or LAYER_FuelTypes.gpkg next to it)')
+    parser.add_argument('--unclassified-only', action='store_true',
+                        help='only fuel type the features without fuel types')
+    parser.add_argument('--reference-year', type=int, default=None,
+                        help='year harvest and disturbance lags are measured to (default: the current year)')
+    parser.add_argument('--projection-years', type=int, default=0,
+                        help='number of future years to project the fuel types to (default: 0)')
+    parser.add_argument('--engine', default=None, choices=READ_ENGINES,
+                        help='engine to read the dataset with (default: pyogrio if it is installed, or fiona)')
+    parser.add_argument('--json', action='store_true', help='print the run statistics as JSON')
+    parser.add_argument('--check-fid-filter', action='store_true',
+                        help='only check that the FID filter reads exactly the features of a chunk, and compare its '
+                             'cost with reading the chunk by position')
+    args = parser.parse_args(argv)
+
+    if args.check_fid_filter:
+        fids = read_fids(args.gdb, args.layer, args.engine)
+        try:
+            check = check_fid_filter(args.gdb, args.layer, fids, bcwft2018.FuelTyping().fldList[3:], args.engine)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 1
+        if args.json:
+            print(json.dumps(check._asdict()))
+        else:
+            print(f'Read {check.chunks} chunks of {check.features} features with the FID filter in '
+                  f'{check.filter_seconds:.3f} seconds (exact: {check.filter_exact}), and by position in '
+                  f'{check.position_seconds:.3f} seconds (exact: {check.position_exact}).')
+            print(f'The chunks are read {"with the FID filter" if check.use_filter else "by position"}.')
+        return 0 if check.filter_exact else 1
+
+    reference_date = None if args.reference_year is None else datetime(args.reference_year, 1, 1)
+
+    def report(processed, total):
+        print(f'{processed} of {total} features fuel typed ({round(100 * processed / total, 1)}%)', file=sys.stderr)
+
+    try:
+        stats = run_fuel_typing(args.gdb, args.layer, args.season, args.workers, args.chunk_size, args.output,
+                                not args.unclassified_only, reference_date, args.projection_years,
+                                None if args.json else report, args.engine)
+    except KeyError as e:
+        print(f'{e.args[0]} Fuel type the whole dataset instead.', file=sys.stderr)
+        return 1
+    if args.json:
+        print(json.dumps(stats._asdict()))
+    else:
+        print(f'Fuel typed {stats.features} features in {stats.chunks} chunks with {stats.workers} workers in '
+              f'{round(stats.seconds, 1)} seconds ({round(stats.features_per_second)} features per second).')
+        print(f'Read the chunks with {stats.read_engine} in {stats.read_seconds:.1f} worker seconds '
+              f'({stats.read_features_per_second:.0f} features/s, {stats.read_megabytes_per_second:.1f} MB/s).')
+        print(f'{stats.error_features} features could not be fuel typed. Written to: {stats.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Year rollover for fuel typed VRI tables.
+
+Harvest and disturbance lags are measured to the current year, so every year some stands cross a lag threshold of
+the decision tree (e.g., harv_lag <= 6, dist_lag <= 10) and may change fuel type, while the fuel types of all other
+stands stay the same. next_crossing_years indexes, for each stand, the next year in which its lags cross a threshold
+tested by the flat node table (bcwft_tree.NODES). The fuel typing tool writes it to the BCWFT_nextYear field, and
+build_index adds it to tables fuel typed without it. rollover then re-fuel-types only the stands whose crossing year
+has arrived, and writes their output fields and their next crossing year, instead of re-running the whole table.
+
+Usage:
+    python bcwft_rollover.py DATABASE TABLE [--season SEASON] [--dialect {sqlite,duckdb}] [--year YEAR] [--key KEY]
+                                            [--build]
+"""
+__author__ = ['Gregory A. Greene, map.n.trowel@gmail.com']
+
+import sys
+import argparse
+from datetime import datetime as dt
+
+import numpy as np
+
+import bcwft2018
+import bcwft_tree
+from bcwft_codegen import _LAGS, _LAG_DATES
+from bcwft_sql import output_fields, _quote, _stand_columns
+from bcwft_table import _flat_writer, _met
+
+
+# Field of the next crossing year of each stand (0 if its lags cross no more thresholds)
+INDEX_FIELD = 'BCWFT_nextYear'
+
+# Lags at which a test of the flat node table changes (see lag_crossings)
+_LAG_CROSSINGS = None
+
+
+def lag_crossings() -> dict:
+    """
+    Function to get the lags at which a test of the flat node table changes, i.e., the lags L for which some test of
+    the lag is met at L but not at L - 1, or the reverse. Lags are whole years, so a stand can only change fuel
+    type in a year its harvest or disturbance lag reaches one of these.
+    :return: a dictionary of {lag: sorted int array of lags}
+    """
+    global _LAG_CROSSINGS
+    if _LAG_CROSSINGS is None:
+        flat = _flat_writer()
+        features = {flat.features.index((f's.{lag}', lag)): lag for lag in _LAGS}
+        if any(feature in features for feature, value in bcwft_tree.MODIFIERS.values()):
+            raise ValueError('The fuel type modifiers depend on a lag, so they change every year.')
+
+        thresholds = {lag: [] for lag in _LAGS}
+        for op, feature, value, yes, no, null in bcwft_tree.NODES:
+            if feature in features and op != bcwft_tree.OP_NOTNULL:
+                thresholds[features[feature]].append((op, value))
+
+        crossings = {}
+        for lag, tests in thresholds.items():
+            stop = int(max([value for op, value in tests], default=0)) + 2
+            crossings[lag] = np.asarray([x for x in range(1, stop)
+                                         if any(_met(op, x - 1, value) != _met(op, x, value) for op, value in tests)],
+                                        dtype='int32')
+        _LAG_CROSSINGS = crossings
+    return _LAG_CROSSINGS
+
+
+def next_crossing_years(stands: 'bcwft2018.StandBatch') -> np.ndarray:
+    """
+    Function to get the next year after the reference year of a batch in which the harvest or disturbance lag of
+    each stand crosses a threshold of the decision tree. The fuel type of a stand stays the same until then.
+    :param stands: a StandBatch (see FuelTyping.stand_batch)
+    :return: an int32 array of years (0 if the lags of the stand cross no more thresholds, e.g., it has no dates)
+    """
+    nextYears = np.zeros(len(stands), dtype='int32')
+    for lag, crossings in lag_crossings().items():
+        fld = _LAG_DATES[lag]
+        years = getattr(stands, fld).astype('int32')
+        lags = np.maximum(stands.reference_year - years, 0)
+
+        # The first crossing above the current lag is reached that many years after the date year
+        k = np.searchsorted(crossings, lags, side='right')
+        crosses = ~stands.null[fld] & (k < len(crossings))
+        lagYears = np.where(crosses, years + crossings[np.minimum(k, len(crossings) - 1)], 0)
+        nextYears = np.where((nextYears == 0) | ((lagYears > 0) & (lagYears < nextYears)), lagYears, nextYears)
+    return nextYears
+
+
+def _read_stands(connection, table: str, key: str, where: str = '') -> tuple:
+    """
+    Function to read the keys and fldList[3:] columns of the stands of a table (see bcwft_sql._stand_columns).
+    :return: a tuple of (list of keys, dictionary of object arrays)
+    """
+    fields = bcwft2018.FuelTyping().fldList[3:]
+    rows = connection.execute(f"SELECT {key}, {', '.join(fields)} FROM {_quote(table)}{where}").fetchall()
+    return [row[0] for row in rows], _stand_columns([row[1:] for row in rows], fields)
+
+
+def _add_index_field(connection, table: str) -> None:
+    """
+    Function to add the INDEX_FIELD column to a table, if it does not have it.
+    :return: None
+    """
+    columns = [column[0] for column in connection.execute(f'SELECT * FROM {_quote(table)} LIMIT 0').description]
+    if INDEX_FIELD not in columns:
+        connection.execute(f'ALTER TABLE {_quote(table)} ADD COLUMN {INDEX_FIELD} INTEGER')
+    return
+
+
+def build_index(connection, table: str, reference_date=None, key: str = 'rowid') -> int:
+    """
+    Function to write the next crossing year of every stand of a table to its INDEX_FIELD column (added if missing).
+    :param connection: a DB-API connection to the database (e.g., sqlite3 or duckdb)
+    :param table: name of the table containing the fldList[3:] columns
+    :param reference_date: the date (or year) the table was fuel typed to (default: today)
+    :param key: the column identifying the stands of the table (e.g., "rowid", or "fid" for a GeoPackage)
+    :return: the number of stands indexed
+    """
+    ft = bcwft2018.FuelTyping()
+    keys, data = _read_stands(connection, table, key)
+    nextYears = next_crossing_years(ft.stand_batch(data, reference_date))
+
+    _add_index_field(connection, table)
+    connection.executemany(f'UPDATE {_quote(table)} SET {INDEX_FIELD} = ? WHERE {key} = ?',
+                           [(int(year), k) for year, k in zip(nextYears, keys)])
+    connection.commit()
+    return len(keys)
+
+
+def rollover(connection, table: str, season: str, reference_date=None, key: str = 'rowid') -> int:
+    """
+    Function to re-fuel-type the stands of a table whose next crossing year has arrived, writing their
+    output_fields(season) columns (which must exist) and their next crossing year.
+    :param connection: a DB-API connection to the database (e.g., sqlite3 or duckdb)
+    :param table: name of the table containing the fldList[3:] and INDEX_FIELD columns
+    :param season: season for fuel typing assignments. Options: "growing", "dormant", "both"
+    :param reference_date: the date (or year) to fuel type the stands to (default: today)
+    :param key: the column identifying the stands of the table (e.g., "rowid", or "fid" for a GeoPackage)
+    :return: the number of stands re-fuel-typed
+    """
+    ft = bcwft2018.FuelTyping()
+    referenceYear = bcwft2018._reference_year(reference_date)
+    keys, data = _read_stands(connection, table, key,
+                              f' WHERE {INDEX_FIELD} > 0 AND {INDEX_FIELD} <= {referenceYear}')
+    if not keys:
+        return 0
+
+    stands = ft.stand_batch(data, referenceYear)
+    results = ft.classify_frame(stands, season)
+    if season == 'both':
+        (growingRef, growingFT, modifier), (dormantRef, dormantFT, _) = results
+        columns = [growingRef, growingFT, dormantRef, dormantFT, modifier]
+    else:
+        columns = list(results)
+    columns.append([int(year) for year in next_crossing_years(stands)])
+
+    assignments = ', '.join(f'{fld} = ?' for fld in output_fields(season) + [INDEX_FIELD])
+    connection.executemany(f'UPDATE {_quote(table)} SET {assignments} WHERE {key} = ?',
+                           [tuple(column[i] for column in columns) + (k,) for i, k in enumerate(keys)])
+    connection.commit()
+    return len(keys)
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description='Re-fuel-type the stands of a fuel typed VRI table whose harvest or '
+                                                 'disturbance lags crossed a threshold since it was fuel typed.')
+    parser.add_argument('database', help='path to the database (e.g., a GeoPackage)')
+    parser.add_argument('table', help='name of the fuel typed table')
+    parser.add_argument('--season', default='growing', choices=['growing', 'dormant', 'both'])
+    parser.add_argument('--dialect', default='sqlite', choices=['sqlite', 'duckdb'])
+    parser.add_argument('--year', type=int, default=None,
+                        help='year to fuel type the stands to (default: the current year)')
+    parser.add_argument('--key', default='rowid', help='column identifying the stands (default: rowid)')
+    parser.add_argument('--build', action='store_true',
+                        help=f'index the {INDEX_FIELD} of every stand instead, to the year the table was fuel typed')
+    args = parser.parse_args(argv)
+
+    if args.dialect == 'duckdb':
+        import duckdb
+        connection = duckdb.connect(args.database)
+    else:
+        import sqlite3
+        connection = sqlite3.connect(args.database)
+    year = dt.now().year if args.year is None else args.year
+    try:
+        if args.build:
+            print(f'Indexed the next crossing year of {build_index(connection, args.table, year, args.key)} stands.')
+        else:
+            print(f'Re-fuel-typed {rollover(connection, args.table, args.season, year, args.key)} stands to {year}.')
+    finally:
+        connection.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
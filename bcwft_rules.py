@@ -0,0 +1,1311 @@
+# -*- coding: utf-8 -*-
+"""
+Rules of the BC Wildfire Fuel Typing decision tree.
+
+DECISION_TREE is the declarative specification of the decision tree. It is a list of branches, tried in order:
+    When(test, then, label): taken by stands meeting the test, and
+    Otherwise(then, label): taken by the remaining stands.
+A branch leads to a list of branches, a Leaf (rule ID, fuel type and fuel type modifier), or a Seasonal pair of
+leaves chosen by the season. Stands meeting none of the branches of a list reach no leaf. Tests and modifiers are
+Python expressions of the StandRecord fields (including the derived bcwft variables), the FuelTyping coniferList
+and dryBECzones lists, and dominant(*species), which is true when the dominant conifer of the stand is one of the
+species (see FuelTyping.checkDomConifers). Labels name the sections of the tree.
+
+bcwft_codegen.py compiles DECISION_TREE into bcwft_tree.py, which holds the scalar decision tree and the boolean
+mask evaluator used by bcwft2018.FuelTyping.
+
+Each leaf has a fixed rule ID, reported as the "BCWFT_rowRef" value of a feature.
+RULE_TABLE maps each rule ID to a tuple containing
+    1: the decisionTree line number previously reported as the row reference (bcwft2018 before rule IDs), and
+    2: a description of the branch conditions leading to the leaf.
+"""
+__author__ = ['Gregory A. Greene, map.n.trowel@gmail.com']
+
+from typing import NamedTuple
+
+
+class Leaf(NamedTuple):
+    """
+    Leaf of the decision tree
+    """
+    rule: int
+    fuel_type: str
+    modifier: object = None  # A number, or an expression of the stand variables
+
+
+class Seasonal(NamedTuple):
+    """
+    Pair of leaves of the dormant and growing seasons
+    """
+    dormant: Leaf
+    growing: Leaf
+
+
+class When(NamedTuple):
+    """
+    Branch of the decision tree taken by stands meeting a test
+    """
+    test: str
+    then: object  # A list of branches, a Leaf or a Seasonal pair of leaves
+    label: str = None
+
+
+class Otherwise(NamedTuple):
+    """
+    Branch of the decision tree taken by the stands meeting none of the preceding tests
+    """
+    then: object  # A list of branches, a Leaf or a Seasonal pair of leaves
+    label: str = None
+
+
+DECISION_TREE = [
+    When('not is_vegetated or is_vegetated is None', label='NON-VEGETATED SITE', then=[
+        When('is_logged', label='SITE LOGGED', then=[
+            When('harv_lag <= 6', label='SITE HARVESTED WITHIN LAST 6 YEARS', then=[
+                When("COAST_INTERIOR_CD == 'C'", Leaf(1, 'S-3')),
+                Otherwise(Leaf(2, 'S-1')),
+            ]),
+            When('harv_lag <= 24', label='SITE HARVESTED WITHIN LAST 7-24 YEARS', then=[
+                When("BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']", Seasonal(Leaf(3, 'D-1'), Leaf(4, 'D-2'))),
+                Otherwise(Seasonal(Leaf(5, 'O-1a'), Leaf(6, 'O-1b'))),
+            ]),
+            Otherwise(label='SITE HARVESTED LONGER THAN 24 YEARS AGO', then=[
+                When("BEC_ZONE_CODE in ['CMA', 'IMA']", Leaf(7, 'N')),
+                When("BEC_ZONE_CODE in ['BAFA', 'MH']", Seasonal(Leaf(8, 'D-1'), Leaf(9, 'D-2'))),
+                When("BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH'] and dry_wet == 'wet'", Leaf(10, 'C-5')),
+                When("BEC_ZONE_CODE in ['BWBS']", Leaf(11, 'C-2')),
+                When("BEC_ZONE_CODE == 'SWB'", Seasonal(Leaf(12, 'M-1', 50), Leaf(13, 'M-2', 50))),
+                When("BEC_ZONE_CODE == 'SBS' or (BEC_ZONE_CODE == 'IDF' and dry_wet == 'wet') "
+                     "or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'dry')", Leaf(14, 'C-3')),
+                When("BEC_ZONE_CODE in ['SBPS', 'MS', 'ESSF'] or (BEC_ZONE_CODE in ['IDF', 'CDF'] "
+                     "and dry_wet == 'dry')", Leaf(15, 'C-7')),
+                When("BEC_ZONE_CODE in ['PP', 'BG']", Seasonal(Leaf(16, 'O-1a'), Leaf(17, 'O-1b'))),
+                When("BEC_ZONE_CODE == 'CWH' and dry_wet == 'dry'", Seasonal(Leaf(18, 'M-1', 40), Leaf(19, 'M-2', 40))),
+            ]),
+        ]),
+        Otherwise(label='SITE UNLOGGED', then=[
+            When('is_burned and dist_lag is not None and (dist_lag < 11)', label='SITE RECENTLY BURNED', then=[
+                When('dist_lag <= 3', Leaf(20, 'N')),
+                When('dist_lag <= 6', Seasonal(Leaf(21, 'D-1'), Leaf(22, 'D-2'))),
+                When('dist_lag <= 10', Seasonal(Leaf(23, 'O-1a'), Leaf(24, 'O-1b'))),
+            ]),
+            Otherwise(label='SITE NOT RECENTLY BURNED', then=[
+                When("BCLCS_LEVEL_2 in ['L', None]", [
+                    When('SPECIES_CD_1 is not None', [
+                        When("BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']", Seasonal(Leaf(25, 'D-1'), Leaf(26, 'D-2'))),
+                        Otherwise(Seasonal(Leaf(27, 'O-1a'), Leaf(28, 'O-1b'))),
+                    ]),
+                    Otherwise(Leaf(29, 'N')),
+                ]),
+                Otherwise(Leaf(30, 'N')),
+            ]),
+        ]),
+    ]),
+    When('is_vegetated', label='SITE VEGETATED', then=[
+        When('is_forested', label='SITE FORESTED', then=[
+            When('is_burned and dist_lag is not None and (dist_lag <= 10)', label='SITE RECENTLY BURNED', then=[
+                When('pct_cnfr is not None and pct_cnfr >= 60', [
+                    When('CROWN_CLOSURE is not None and CROWN_CLOSURE > 40', [
+                        When('dist_lag <= 3', Leaf(31, 'N')),
+                        When('dist_lag <= 6', Seasonal(Leaf(32, 'D-1'), Leaf(33, 'D-2'))),
+                        Otherwise(Leaf(34, 'C-5')),
+                    ]),
+                    Otherwise([
+                        When('dist_lag <= 1', Leaf(35, 'N')),
+                        When('dist_lag <= 6', Seasonal(Leaf(36, 'D-1'), Leaf(37, 'D-2'))),
+                        Otherwise(Seasonal(Leaf(38, 'O-1a'), Leaf(39, 'O-1b'))),
+                    ]),
+                ]),
+                Otherwise([
+                    When('dist_lag <= 1', Leaf(40, 'N')),
+                    Otherwise(Seasonal(Leaf(41, 'D-1'), Leaf(42, 'D-2'))),
+                ]),
+            ]),
+            Otherwise(label='SITE NOT RECENTLY BURNED', then=[
+                When('SPECIES_CD_1 is None or SPECIES_PCT_1 is None or SPECIES_PCT_1 == 0',
+                     Leaf(43, 'VegForestNoBurn_Species-ERROR')),
+                When('SPECIES_PCT_1 >= 80', label='PURE/SINGLE SPECIES STANDS', then=[
+                    When('SPECIES_CD_1 in coniferList', [
+                        When("SPECIES_CD_1 in ['PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P']",
+                             label='PURE LODGEPOLE PINE STANDS', then=[
+                            When('harv_lag is not None and harv_lag <= 7', Leaf(44, 'S-1')),
+                            Otherwise([
+                                When("BCLCS_LEVEL_5 == 'SP'", label='SPARSE STANDS', then=[
+                                    When("BEC_ZONE_CODE in ['CWH', 'CDF', 'MH'] or (BEC_ZONE_CODE in ['ICH'] "
+                                         "and dry_wet == 'wet')", Seasonal(Leaf(45, 'D-1'), Leaf(46, 'D-2'))),
+                                    Otherwise(Leaf(47, 'C-7')),
+                                ]),
+                                Otherwise(label='DENSE OR OPEN STANDS', then=[
+                                    When('PROJ_HEIGHT_1 < 4', Seasonal(Leaf(48, 'O-1a'), Leaf(49, 'O-1b'))),
+                                    When('PROJ_HEIGHT_1 <= 12', [
+                                        When('stocking > 8000', Leaf(50, 'C-4')),
+                                        Otherwise(Leaf(51, 'C-3')),
+                                    ]),
+                                    When('PROJ_HEIGHT_1 > 12', [
+                                        When('CROWN_CLOSURE < 40', [
+                                            When("BEC_ZONE_CODE in ['BG', 'PP', 'IDF', 'MS']", Leaf(52, 'C-7')),
+                                            When("BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']", Leaf(53, 'C-5')),
+                                            Otherwise(Leaf(54, 'C-3')),
+                                        ]),
+                                        Otherwise([
+                                            When("EARLIEST_NONLOGGING_DIST_TYPE == 'IBM'",
+                                                 label='MOUNTAIN PINE BEETLE STANDS', then=[
+                                                When('dist_lag <= 5', [
+                                                    When('STAND_PERCENTAGE_DEAD is not None '
+                                                         'and STAND_PERCENTAGE_DEAD > 50', Leaf(55, 'M-3', 65)),
+                                                    When('STAND_PERCENTAGE_DEAD is not None '
+                                                         'and STAND_PERCENTAGE_DEAD >= 25', Leaf(56, 'C-2')),
+                                                    Otherwise(Leaf(57, 'C-3')),
+                                                ]),
+                                                Otherwise([
+                                                    When('STAND_PERCENTAGE_DEAD is not None '
+                                                         'and STAND_PERCENTAGE_DEAD > 50', Leaf(58, 'C-2')),
+                                                    When('STAND_PERCENTAGE_DEAD is not None '
+                                                         'and STAND_PERCENTAGE_DEAD >= 25', Leaf(59, 'C-3')),
+                                                    Otherwise(Leaf(60, 'C-3')),
+                                                ]),
+                                            ]),
+                                            Otherwise(Leaf(61, 'C-3'), label='NON MOUNTAIN PINE BEETLE STANDS'),
+                                        ]),
+                                    ]),
+                                ]),
+                            ]),
+                        ]),
+                        When("SPECIES_CD_1 == 'PY'", label='PURE PONDEROSA PINE STANDS', then=[
+                            When("BCLCS_LEVEL_5 in ['DE', 'OP']", label='DENSE OR OPEN STANDS', then=[
+                                When('harv_lag is not None and harv_lag <= 10', Leaf(62, 'S-1')),
+                                Otherwise([
+                                    When('PROJ_HEIGHT_1 < 4', Seasonal(Leaf(63, 'O-1a'), Leaf(64, 'O-1b'))),
+                                    When('PROJ_HEIGHT_1 <= 12', [
+                                        When('stocking > 8000', Leaf(65, 'C-4')),
+                                        When('stocking >= 3000', Leaf(66, 'C-3')),
+                                        Otherwise(Leaf(67, 'C-7')),
+                                    ]),
+                                    When('PROJ_HEIGHT_1 <= 17', [
+                                        When("BCLCS_LEVEL_5 == 'DE'", Leaf(68, 'C-3')),
+                                        When("BCLCS_LEVEL_5 == 'OP'", Leaf(69, 'C-7')),
+                                    ]),
+                                    Otherwise(Leaf(70, 'C-7')),
+                                ]),
+                            ]),
+                            When("BCLCS_LEVEL_5 == 'SP'", label='SPARSE STANDS', then=[
+                                When('STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD >= 40',
+                                     Seasonal(Leaf(71, 'O-1a'), Leaf(72, 'O-1b'))),
+                                Otherwise([
+                                    When('harv_lag is not None and harv_lag <= 10', Leaf(73, 'S-1')),
+                                    Otherwise(Leaf(74, 'C-7')),
+                                ]),
+                            ]),
+                        ]),
+                        When("SPECIES_CD_1 in ['PA', 'PF', 'PW']", label='PURE OTHER PINE STANDS', then=[
+                            When("BCLCS_LEVEL_5 == 'DE'", Leaf(75, 'C-3')),
+                            When("BCLCS_LEVEL_5 in ['SP', 'OP']", [
+                                When('stocking >= 900', Leaf(76, 'C-3')),
+                                When('stocking >= 600', Leaf(77, 'C-7')),
+                                Otherwise(Leaf(78, 'C-5')),
+                            ]),
+                        ]),
+                        When("SPECIES_CD_1 in ['FD', 'FDC', 'FDI', 'F']", label='PURE DOUGLAS-FIR STANDS', then=[
+                            When('harv_lag is not None and harv_lag <= 6', label='SITE HARVESTED WITHIN LAST 6 YEARS',
+                                 then=[
+                                When("BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' "
+                                     "and dry_wet == 'wet')", Leaf(79, 'S-3')),
+                                Otherwise(Leaf(80, 'S-1')),
+                            ]),
+                            Otherwise(label='SITE HARVESTED LONGER THAN 6 YEARS AGO', then=[
+                                When('PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 < 4', [
+                                    When("BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' "
+                                         "and dry_wet == 'wet')", Seasonal(Leaf(81, 'D-1'), Leaf(82, 'D-2'))),
+                                    Otherwise(Seasonal(Leaf(83, 'O-1a'), Leaf(84, 'O-1b'))),
+                                ]),
+                                When('PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 >= 4', [
+                                    When('CROWN_CLOSURE is not None and CROWN_CLOSURE > 55', [
+                                        When('PROJ_HEIGHT_1 <= 12', [
+                                            When("BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' "
+                                                 "and dry_wet == 'wet')", Leaf(85, 'C-3')),
+                                            Otherwise([
+                                                When('STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD > 34',
+                                                     Leaf(86, 'C-4')),
+                                                Otherwise(Leaf(87, 'C-3')),
+                                            ]),
+                                        ]),
+                                        When('PROJ_HEIGHT_1 > 12', [
+                                            When("BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' "
+                                                 "and dry_wet == 'wet')", Leaf(88, 'C-5')),
+                                            Otherwise(Leaf(89, 'C-7')),
+                                        ]),
+                                    ]),
+                                    When('CROWN_CLOSURE is None or CROWN_CLOSURE >= 26', [
+                                        When("BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' "
+                                             "and dry_wet == 'wet')", Leaf(90, 'C-5')),
+                                        Otherwise(Leaf(91, 'C-7')),
+                                    ]),
+                                    Otherwise([
+                                        When("BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' "
+                                             "and dry_wet == 'wet')", Seasonal(Leaf(92, 'D-1'), Leaf(93, 'D-2'))),
+                                        Otherwise(Seasonal(Leaf(94, 'O-1a'), Leaf(95, 'O-1b'))),
+                                    ]),
+                                ]),
+                                Otherwise(Leaf(96, 'VegForestNoBurnPureFd_ProjHeight-ERROR')),
+                            ]),
+                        ]),
+                        When("SPECIES_CD_1 == 'SE'", label='PURE ENGELMANN SPRUCE STANDS', then=[
+                            When('harv_lag is not None and harv_lag <= 10', Leaf(97, 'S-2')),
+                            Otherwise([
+                                When("BCLCS_LEVEL_5 == 'SP'", Seasonal(Leaf(98, 'D-1'), Leaf(99, 'D-2'))),
+                                When("BCLCS_LEVEL_5 == 'DE'", Leaf(100, 'C-2')),
+                                When("BCLCS_LEVEL_5 == 'OP'", Leaf(101, 'C-3')),
+                            ]),
+                        ]),
+                        When("SPECIES_CD_1 == 'SS'", label='PURE SITKA SPRUCE STANDS', then=[
+                            When('harv_lag is not None and harv_lag <= 6', Leaf(102, 'S-3')),
+                            Otherwise([
+                                When("BCLCS_LEVEL_5 == 'SP'", Seasonal(Leaf(103, 'D-1'), Leaf(104, 'D-2'))),
+                                When("BCLCS_LEVEL_5 in ['DE', 'OP']", Leaf(105, 'C-5')),
+                            ]),
+                        ]),
+                        When("SPECIES_CD_1 in ['SB', 'SW']", label='PURE BLACK OR WHITE SPRUCE STANDS', then=[
+                            When('harv_lag is not None and harv_lag <= 10', Leaf(106, 'S-2')),
+                            Otherwise([
+                                When("BCLCS_LEVEL_5 in ['DE', 'OP']", Leaf(107, 'C-2')),
+                                When("BCLCS_LEVEL_5 == 'SP'", [
+                                    When("BEC_ZONE_CODE in ['BWBS', 'SWB']", Leaf(108, 'C-1')),
+                                    Otherwise(Seasonal(Leaf(109, 'M-1', 30), Leaf(110, 'M-2', 30))),
+                                ]),
+                            ]),
+                        ]),
+                        When("SPECIES_CD_1.startswith('S')", label='PURE SPRUCE (UNKNOWN OR HYBRID) STANDS', then=[
+                            When('harv_lag is not None and harv_lag <= 7', Leaf(111, 'S-2')),
+                            Otherwise([
+                                When("BEC_ZONE_CODE in ['BWBS', 'SWB']", [
+                                    When("BCLCS_LEVEL_5 in ['DE', 'OP']", Leaf(112, 'C-2')),
+                                    Otherwise(Leaf(113, 'C-1')),
+                                ]),
+                                Otherwise([
+                                    When("BCLCS_LEVEL_5 == 'SP'", Leaf(114, 'C-7')),
+                                    Otherwise([
+                                        When("BEC_ZONE_CODE in ['CWH', 'CDF']", Leaf(115, 'C-5')),
+                                        Otherwise([
+                                            When('PROJ_HEIGHT_1 < 4', Seasonal(Leaf(116, 'O-1a'), Leaf(117, 'O-1b'))),
+                                            When('PROJ_HEIGHT_1 >= 4', [
+                                                When("BCLCS_LEVEL_5 == 'OP'", Leaf(118, 'C-3')),
+                                                When("BCLCS_LEVEL_5 == 'DE'", Leaf(119, 'C-2')),
+                                                Otherwise(Leaf(120, 'VegForestPureOtherSpruceInterior_NoBCLCSLv5-ERROR')),
+                                            ]),
+                                            Otherwise(Leaf(121, 'VegForestPureOtherSpruceInterior_ProjHeight-ERROR')),
+                                        ]),
+                                    ]),
+                                ]),
+                            ]),
+                        ]),
+                        When("SPECIES_CD_1 in ['C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM']",
+                             label='PURE REDCEDAR, YELLOW CEDAR OR HEMLOCK STANDS', then=[
+                            When('harv_lag is not None and harv_lag <= 6', Leaf(122, 'S-3')),
+                            Otherwise([
+                                When("BCLCS_LEVEL_5 == 'DE'", [
+                                    When('PROJ_HEIGHT_1 < 4', Seasonal(Leaf(123, 'D-1'), Leaf(124, 'D-2'))),
+                                    When('PROJ_HEIGHT_1 <= 15', Leaf(125, 'C-3')),
+                                    When('PROJ_HEIGHT_1 > 15', [
+                                        When('PROJ_AGE_1 < 60', Leaf(126, 'C-3')),
+                                        When('PROJ_AGE_1 <= 99', Seasonal(Leaf(127, 'M-1', 30), Leaf(128, 'M-2', 30))),
+                                        Otherwise(Leaf(129, 'C-5')),
+                                    ]),
+                                ]),
+                                When("BCLCS_LEVEL_5 == 'OP'", Leaf(130, 'C-5')),
+                                When("BCLCS_LEVEL_5 == 'SP'", Seasonal(Leaf(131, 'D-1'), Leaf(132, 'D-2'))),
+                            ]),
+                        ]),
+                        When("SPECIES_CD_1.startswith('B')", label='PURE TRUE FIR STANDS', then=[
+                            When("SPECIES_CD_1 == 'BG'", Leaf(133, 'C-7')),
+                            When("SPECIES_CD_1 == 'BA'", Seasonal(Leaf(134, 'M-1', 30), Leaf(135, 'M-2', 30))),
+                            Otherwise([
+                                When("BCLCS_LEVEL_5 == 'SP'", Leaf(136, 'C-7')),
+                                Otherwise(Leaf(137, 'C-5')),
+                            ]),
+                        ]),
+                        When("SPECIES_CD_1 in ['T', 'TW']", Leaf(138, 'C-5'), label='PURE YEW STANDS'),
+                        When("SPECIES_CD_1 in ['J', 'JR']", Seasonal(Leaf(139, 'O-1a'), Leaf(140, 'O-1b')),
+                             label='PURE JUNIPER STANDS'),
+                        Otherwise(Leaf(141, 'VegForestedPureSpeciesStand_Species-ERROR')),
+                    ]),
+                    Otherwise(Seasonal(Leaf(142, 'D-1'), Leaf(143, 'D-2')), label='DECIDUOUS/BROADLEAF OR LARCH STAND'),
+                ]),
+                When('SPECIES_PCT_1 < 80', label='MIXED-SPECIES STANDS', then=[
+                    When('pct_cnfr <= 20', Seasonal(Leaf(144, 'D-1'), Leaf(145, 'D-2')),
+                         label='MIXED-SPECIES DECIDUOUS STANDS'),
+                    When('pct_cnfr > 20', label='MIXED-SPECIES CONIFER OR MIXEDWOOD STANDS', then=[
+                        When('pct_cnfr <= 40', label='21-40% CONIFER = DECIDUOUS DOMINATED MIXEDWOOD STANDS', then=[
+                            When('harv_lag is not None and harv_lag <= 6', Leaf(146, 'S-2')),
+                            Otherwise([
+                                When("dominant('SB', 'SW', 'SE', 'SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX')",
+                                     Seasonal(Leaf(147, 'M-1', 'pct_cnfr'), Leaf(148, 'M-2', 'pct_cnfr')),
+                                     label='DOMINANT CONIFER = BLACK, WHITE, ENGELMANN, OR HYBRID SPRUCE'),
+                                When("dominant('S')", label='DOMINANT CONIFER = UNKNOWN SPRUCE', then=[
+                                    When("COAST_INTERIOR_CD == 'C'",
+                                         Seasonal(Leaf(149, 'M-1', 'pct_cnfr * 0.5'), Leaf(150, 'M-2', 'pct_cnfr * 0.5'))),
+                                    Otherwise(Seasonal(Leaf(151, 'M-1', 'pct_cnfr'), Leaf(152, 'M-2', 'pct_cnfr'))),
+                                ]),
+                                Otherwise(label='DOMINANT CONIFER = ANY OTHER CONIFER', then=[
+                                    When("BCLCS_LEVEL_5 == 'SP'",
+                                         Seasonal(Leaf(153, 'M-1', 'pct_cnfr * 0.5'), Leaf(154, 'M-2', 'pct_cnfr * 0.5'))),
+                                    Otherwise(Seasonal(Leaf(155, 'M-1', 'pct_cnfr * 0.7'), Leaf(156, 'M-2', 'pct_cnfr * 0.7'))),
+                                ]),
+                            ]),
+                        ]),
+                        When('pct_cnfr <= 65', label='41-65% CONIFER = CONIFER_DOMINATED MIXEDWOOD STANDS', then=[
+                            When('harv_lag is not None and harv_lag <= 6', Leaf(157, 'S-1')),
+                            Otherwise([
+                                When("dominant('PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P')",
+                                     label='DOMINANT CONIFER = LODGEPOLE PINE', then=[
+                                    When("BCLCS_LEVEL_5 == 'SP'",
+                                         Seasonal(Leaf(158, 'M-1', 'pct_cnfr * 0.6'), Leaf(159, 'M-2', 'pct_cnfr * 0.6'))),
+                                    When("BCLCS_LEVEL_5 == 'OP'",
+                                         Seasonal(Leaf(160, 'M-1', 'pct_cnfr * 0.7'), Leaf(161, 'M-2', 'pct_cnfr * 0.7'))),
+                                    When("BCLCS_LEVEL_5 == 'DE'",
+                                         Seasonal(Leaf(162, 'M-1', 'pct_cnfr * 0.8'), Leaf(163, 'M-2', 'pct_cnfr * 0.8'))),
+                                ]),
+                                When("dominant('PY')",
+                                     Seasonal(Leaf(164, 'M-1', 'pct_cnfr * 0.6'), Leaf(165, 'M-2', 'pct_cnfr * 0.6')),
+                                     label='DOMINANT CONIFER = PONDEROSA PINE'),
+                                When("dominant('PA', 'PF', 'PW')",
+                                     Seasonal(Leaf(166, 'M-1', 'pct_cnfr * 0.5'), Leaf(167, 'M-2', 'pct_cnfr * 0.5')),
+                                     label='DOMINANT CONIFER = OTHER PINE'),
+                                When("dominant('F', 'FD', 'FDC', 'FDI')", label='DOMINANT CONIFER = DOUGLAS-FIR', then=[
+                                    When("BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH']",
+                                         Seasonal(Leaf(168, 'M-1', 'pct_cnfr * 0.5'), Leaf(169, 'M-2', 'pct_cnfr * 0.5'))),
+                                    Otherwise(Seasonal(Leaf(170, 'M-1', 'pct_cnfr * 0.6'), Leaf(171, 'M-2', 'pct_cnfr * 0.6'))),
+                                ]),
+                                When("dominant('SE')", label='DOMINANT CONIFER = ENGELMANN SPRUCE', then=[
+                                    When("BCLCS_LEVEL_5 == 'SP'",
+                                         Seasonal(Leaf(172, 'M-1', 'pct_cnfr * 0.6'), Leaf(173, 'M-2', 'pct_cnfr * 0.6'))),
+                                    When("BCLCS_LEVEL_5 in ['OP', 'DE']",
+                                         Seasonal(Leaf(174, 'M-1', 'pct_cnfr * 0.9'), Leaf(175, 'M-2', 'pct_cnfr * 0.9'))),
+                                ]),
+                                When("dominant('SS')",
+                                     Seasonal(Leaf(176, 'M-1', 'pct_cnfr * 0.4'), Leaf(177, 'M-2', 'pct_cnfr * 0.4')),
+                                     label='DOMINANT CONIFER = SITKA SPRUCE'),
+                                When("dominant('SB', 'SW')",
+                                     Seasonal(Leaf(178, 'M-1', 'pct_cnfr'), Leaf(179, 'M-2', 'pct_cnfr')),
+                                     label='DOMINANT CONIFER = BLACK OR WHITE SPRUCE'),
+                                When("dominant('SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX', 'S')",
+                                     label='DOMINANT CONIFER = UNKNOWN OR HYBRID SPRUCE', then=[
+                                    When("BEC_ZONE_CODE in ['BWBS', 'SWB']", [
+                                        When("BCLCS_LEVEL_5 in ['DE', 'OP']",
+                                             Seasonal(Leaf(180, 'M-1', 'pct_cnfr'), Leaf(181, 'M-2', 'pct_cnfr'))),
+                                        When("BCLCS_LEVEL_5 in ['SP']",
+                                             Seasonal(Leaf(182, 'M-1', 'pct_cnfr * 0.6'), Leaf(183, 'M-2', 'pct_cnfr * 0.6'))),
+                                    ]),
+                                    Otherwise([
+                                        When("BCLCS_LEVEL_5 in ['SP']",
+                                             Seasonal(Leaf(184, 'M-1', 'pct_cnfr * 0.6'), Leaf(185, 'M-2', 'pct_cnfr * 0.6'))),
+                                        When("BCLCS_LEVEL_5 in ['DE', 'OP']", [
+                                            When("COAST_INTERIOR_CD == 'I'",
+                                                 Seasonal(Leaf(186, 'M-1', 'pct_cnfr * 0.8'), Leaf(187, 'M-2', 'pct_cnfr * 0.8'))),
+                                            When("COAST_INTERIOR_CD == 'C'",
+                                                 Seasonal(Leaf(188, 'M-1', 'pct_cnfr * 0.5'), Leaf(189, 'M-2', 'pct_cnfr * 0.5'))),
+                                        ]),
+                                        Otherwise(Leaf(190, 'VegForestMixedSpeciesCnfrLT65_BCLCSLv5-ERROR')),
+                                    ]),
+                                ]),
+                                When("dominant('C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM')",
+                                     Seasonal(Leaf(191, 'M-1', 'pct_cnfr * 0.4'), Leaf(192, 'M-2', 'pct_cnfr * 0.4')),
+                                     label='DOMINANT CONIFER = REDCEDAR, YELLOW CEDAR OR HEMLOCK'),
+                                When("dominant('B', 'BA', 'BG', 'BL')",
+                                     Seasonal(Leaf(193, 'M-1', 'pct_cnfr * 0.6'), Leaf(194, 'M-2', 'pct_cnfr * 0.6')),
+                                     label='DOMINANT CONIFER = FIR'),
+                                When("dominant('T', 'TW')", Leaf(195, 'C-5'), label='DOMINANT CONIFER = YEW'),
+                                When("dominant('J', 'JR')", Seasonal(Leaf(196, 'O-1a'), Leaf(197, 'O-1b')),
+                                     label='DOMINANT CONIFER = JUNIPER'),
+                            ]),
+                        ]),
+                        When('pct_cnfr <= 80', label='66-80% CONIFER = CONIFER_DOMINATED MIXEDWOOD STANDS', then=[
+                            When('harv_lag is not None and harv_lag <= 6', Leaf(198, 'S-1')),
+                            Otherwise([
+                                When("dominant('PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P')",
+                                     label='DOMINANT CONIFER = LODGEPOLE PINE', then=[
+                                    When("BCLCS_LEVEL_5 in ['SP']",
+                                         Seasonal(Leaf(199, 'M-1', 'pct_cnfr * 0.5'), Leaf(200, 'M-2', 'pct_cnfr * 0.5'))),
+                                    When("BCLCS_LEVEL_5 in ['OP']",
+                                         Seasonal(Leaf(201, 'M-1', 'pct_cnfr * 0.7'), Leaf(202, 'M-2', 'pct_cnfr * 0.7'))),
+                                    When("BCLCS_LEVEL_5 in ['DE']",
+                                         Seasonal(Leaf(203, 'M-1', 'pct_cnfr * 0.8'), Leaf(204, 'M-2', 'pct_cnfr * 0.8'))),
+                                ]),
+                                When("dominant('PY')", Leaf(205, 'C-7'), label='DOMINANT CONIFER = PONDEROSA PINE'),
+                                When("dominant('PA', 'PF', 'PW')", Leaf(206, 'C-5'),
+                                     label='DOMINANT CONIFER = OTHER PINE'),
+                                When("dominant('F', 'FD', 'FDC', 'FDI')", label='DOMINANT CONIFER = DOUGLAS-FIR', then=[
+                                    When("BEC_ZONE_CODE in ['CWH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' "
+                                         "and dry_wet == 'wet')", Leaf(207, 'C-5')),
+                                    Otherwise([
+                                        When("BCLCS_LEVEL_5 in ['DE']",
+                                             Seasonal(Leaf(208, 'M-1', 'pct_cnfr * 0.7'), Leaf(209, 'M-2', 'pct_cnfr * 0.7'))),
+                                        Otherwise(Leaf(210, 'C-7')),
+                                    ]),
+                                ]),
+                                When("dominant('SE')", label='DOMINANT CONIFER = ENGELMANN SPRUCE', then=[
+                                    When("BCLCS_LEVEL_5 in ['SP']",
+                                         Seasonal(Leaf(211, 'M-1', 'pct_cnfr * 0.6'), Leaf(212, 'M-2', 'pct_cnfr * 0.6'))),
+                                    When("BCLCS_LEVEL_5 in ['OP', 'DE']",
+                                         Seasonal(Leaf(213, 'M-1', 'pct_cnfr * 0.7'), Leaf(214, 'M-2', 'pct_cnfr * 0.7'))),
+                                ]),
+                                When("dominant('SS')", Leaf(215, 'C-5'), label='DOMINANT CONIFER = SITKA SPRUCE'),
+                                When("dominant('SB', 'SW')",
+                                     Seasonal(Leaf(216, 'M-1', 'pct_cnfr'), Leaf(217, 'M-2', 'pct_cnfr')),
+                                     label='DOMINANT CONIFER = BLACK OR WHITE SPRUCE'),
+                                When("dominant('SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX', 'S')",
+                                     label='DOMINANT CONIFER = UNKNOWN OR HYBRID SPRUCE', then=[
+                                    When("BEC_ZONE_CODE in ['BWBS', 'SWB']", [
+                                        When("BCLCS_LEVEL_5 in ['DE', 'OP']",
+                                             Seasonal(Leaf(218, 'M-1', 'pct_cnfr'), Leaf(219, 'M-2', 'pct_cnfr'))),
+                                        When("BCLCS_LEVEL_5 in ['SP']",
+                                             Seasonal(Leaf(220, 'M-1', 'pct_cnfr * 0.6'), Leaf(221, 'M-2', 'pct_cnfr * 0.6'))),
+                                    ]),
+                                    Otherwise([
+                                        When("BCLCS_LEVEL_5 in ['SP']",
+                                             Seasonal(Leaf(222, 'M-1', 'pct_cnfr * 0.6'), Leaf(223, 'M-2', 'pct_cnfr * 0.6'))),
+                                        Otherwise([
+                                            When("COAST_INTERIOR_CD == 'I'",
+                                                 Seasonal(Leaf(224, 'M-1', 'pct_cnfr * 0.8'), Leaf(225, 'M-2', 'pct_cnfr * 0.8'))),
+                                            Otherwise(Leaf(226, 'C-5')),
+                                        ]),
+                                    ]),
+                                ]),
+                                When("dominant('C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM')", Leaf(227, 'C-5'),
+                                     label='DOMINANT CONIFER = REDCEDAR, YELLOW CEDAR OR HEMLOCK'),
+                                When("dominant('B', 'BA', 'BG', 'BL')", Leaf(228, 'C-7'),
+                                     label='DOMINANT CONIFER = FIR'),
+                                When("dominant('T', 'TW')", Leaf(229, 'C-5'), label='DOMINANT CONIFER = YEW'),
+                                When("dominant('J', 'JR')", Leaf(230, 'C-7'), label='DOMINANT CONIFER = JUNIPER'),
+                            ]),
+                        ]),
+                        When('pct_cnfr <= 100', label='81-100% CONIFER = PURE CONIFER, MIXED-SPECIES STANDS', then=[
+                            When("SPECIES_CD_1 in ['P', 'PL', 'PLI', 'PLC', 'PJ', 'PXJ']",
+                                 label='DOMINANT CONIFER = LODGEPONE PINE', then=[
+                                When('harv_lag is not None and harv_lag <= 7', Leaf(231, 'S-1')),
+                                Otherwise([
+                                    When("BCLCS_LEVEL_5 in ['SP']", [
+                                        When("BEC_ZONE_CODE in ['CWH', 'CDF', 'MH'] or (BEC_ZONE_CODE == 'ICH' "
+                                             "and dry_wet == 'wet')", Seasonal(Leaf(232, 'D-1'), Leaf(233, 'D-2'))),
+                                        Otherwise(Leaf(234, 'C-7')),
+                                    ]),
+                                    Otherwise([
+                                        When('PROJ_HEIGHT_1 < 4', Seasonal(Leaf(235, 'O-1a'), Leaf(236, 'O-1b'))),
+                                        When('PROJ_HEIGHT_1 >= 4', [
+                                            When("SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B')", [
+                                                When('PROJ_HEIGHT_1 <= 12', [
+                                                    When('stocking > 8000', Leaf(237, 'C-4')),
+                                                    Otherwise(Leaf(238, 'C-3')),
+                                                ]),
+                                                Otherwise([
+                                                    When('CROWN_CLOSURE < 40', [
+                                                        When("BEC_ZONE_CODE in ['BG', 'PP', 'IDF', 'MS']",
+                                                             Leaf(239, 'C-7')),
+                                                        When("BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']", Leaf(240, 'C-5')),
+                                                        Otherwise(Leaf(241, 'C-3')),
+                                                    ]),
+                                                    Otherwise([
+                                                        When("EARLIEST_NONLOGGING_DIST_TYPE == 'IBM'", [
+                                                            When('dist_lag <= 5', [
+                                                                When("BCLCS_LEVEL_5 in ['DE']", [
+                                                                    When('STAND_PERCENTAGE_DEAD is not None '
+                                                                         'and STAND_PERCENTAGE_DEAD > 50',
+                                                                         Leaf(242, 'M-3', 65)),
+                                                                    When('STAND_PERCENTAGE_DEAD is not None '
+                                                                         'and STAND_PERCENTAGE_DEAD >= 25',
+                                                                         Leaf(243, 'C-2')),
+                                                                    Otherwise(Leaf(244, 'C-2')),
+                                                                ]),
+                                                                Otherwise([
+                                                                    When('STAND_PERCENTAGE_DEAD is not None '
+                                                                         'and STAND_PERCENTAGE_DEAD > 50',
+                                                                         Leaf(245, 'M-3', 65)),
+                                                                    When('STAND_PERCENTAGE_DEAD is not None '
+                                                                         'and STAND_PERCENTAGE_DEAD >= 25',
+                                                                         Leaf(246, 'C-2')),
+                                                                    Otherwise(Leaf(247, 'C-3')),
+                                                                ]),
+                                                            ]),
+                                                            Otherwise([
+                                                                When("BCLCS_LEVEL_5 in ['DE']", [
+                                                                    When('STAND_PERCENTAGE_DEAD is not None '
+                                                                         'and STAND_PERCENTAGE_DEAD > 50',
+                                                                         Leaf(248, 'C-2')),
+                                                                    When('STAND_PERCENTAGE_DEAD is not None '
+                                                                         'and STAND_PERCENTAGE_DEAD >= 25',
+                                                                         Leaf(249, 'C-2')),
+                                                                    Otherwise(Leaf(250, 'C-3')),
+                                                                ]),
+                                                                Otherwise([
+                                                                    When('STAND_PERCENTAGE_DEAD is not None '
+                                                                         'and STAND_PERCENTAGE_DEAD > 50',
+                                                                         Leaf(251, 'C-2')),
+                                                                    When('STAND_PERCENTAGE_DEAD is not None '
+                                                                         'and STAND_PERCENTAGE_DEAD >= 25',
+                                                                         Leaf(252, 'C-3')),
+                                                                    Otherwise(Leaf(253, 'C-3')),
+                                                                ]),
+                                                            ]),
+                                                        ]),
+                                                        Otherwise(Leaf(254, 'C-3')),
+                                                    ]),
+                                                ]),
+                                            ]),
+                                            Otherwise([
+                                                When('CROWN_CLOSURE < 40', [
+                                                    When("BEC_ZONE_CODE in ['IDF', 'PP', 'BG', 'SBPS', 'MS']",
+                                                         Leaf(255, 'C-7')),
+                                                    When("BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH']", Leaf(256, 'C-5')),
+                                                    Otherwise(Leaf(257, 'C-3')),
+                                                ]),
+                                                Otherwise(Leaf(258, 'C-3')),
+                                            ]),
+                                        ]),
+                                    ]),
+                                ]),
+                            ]),
+                            When("SPECIES_CD_1 in ['PY']", label='DOMINANT CONIFER = PONDEROSA PINE', then=[
+                                When('harv_lag is not None and harv_lag <= 7', Leaf(259, 'S-1')),
+                                Otherwise([
+                                    When('PROJ_HEIGHT_1 < 4', Seasonal(Leaf(260, 'O-1a'), Leaf(261, 'O-1b'))),
+                                    Otherwise([
+                                        When("BCLCS_LEVEL_5 in ['DE']", Leaf(262, 'C-3')),
+                                        Otherwise(Leaf(263, 'C-7')),
+                                    ]),
+                                ]),
+                            ]),
+                            When("SPECIES_CD_1 in ['PA', 'PF', 'PW']", label='DOMINANT CONIFER = OTHER PINE', then=[
+                                When("BCLCS_LEVEL_5 in ['DE']", Leaf(264, 'C-3')),
+                                Otherwise([
+                                    When('stocking >= 900', Leaf(265, 'C-3')),
+                                    When('stocking >= 600', Leaf(266, 'C-7')),
+                                    Otherwise(Leaf(267, 'C-5')),
+                                ]),
+                            ]),
+                            When("SPECIES_CD_1.startswith('F')", label='DOMINANT CONIFER = DOUGLAS-FIR', then=[
+                                When('harv_lag is not None and harv_lag <= 6', [
+                                    When("BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' "
+                                         "and dry_wet == 'wet')", Leaf(268, 'S-3')),
+                                    Otherwise(Leaf(269, 'S-1')),
+                                ]),
+                                Otherwise([
+                                    When('PROJ_HEIGHT_1 < 4', [
+                                        When("BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' "
+                                             "and dry_wet == 'wet')", Seasonal(Leaf(270, 'D-1'), Leaf(271, 'D-2'))),
+                                        Otherwise(Seasonal(Leaf(272, 'O-1a'), Leaf(273, 'O-1b'))),
+                                    ]),
+                                    Otherwise([
+                                        When('CROWN_CLOSURE > 55', [
+                                            When('PROJ_HEIGHT_1 <= 12', [
+                                                When("BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] "
+                                                     "or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')",
+                                                     Leaf(274, 'C-5')),
+                                                Otherwise([
+                                                    When('STAND_PERCENTAGE_DEAD is not None '
+                                                         'and STAND_PERCENTAGE_DEAD > 34', Leaf(275, 'C-4')),
+                                                    Otherwise([
+                                                        When("SPECIES_CD_2 == 'PY'", Leaf(276, 'C-7')),
+                                                        Otherwise(Leaf(277, 'C-3')),
+                                                    ]),
+                                                ]),
+                                            ]),
+                                            When('PROJ_HEIGHT_1 > 12', [
+                                                When("BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] "
+                                                     "or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')",
+                                                     Leaf(278, 'C-5')),
+                                                Otherwise(Leaf(279, 'C-7')),
+                                            ]),
+                                        ]),
+                                        When('CROWN_CLOSURE >= 26 or CROWN_CLOSURE is None', [
+                                            When("BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' "
+                                                 "and dry_wet == 'wet')", Leaf(280, 'C-5')),
+                                            Otherwise(Leaf(281, 'C-7')),
+                                        ]),
+                                        Otherwise([
+                                            When("BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' "
+                                                 "and dry_wet == 'wet')", Seasonal(Leaf(282, 'D-1'), Leaf(283, 'D-2'))),
+                                            Otherwise(Seasonal(Leaf(284, 'O-1a'), Leaf(285, 'O-1b'))),
+                                        ]),
+                                    ]),
+                                ]),
+                            ]),
+                            When("SPECIES_CD_1.startswith('S')", label='DOMINANT CONIFER = SPRUCE', then=[
+                                When('harv_lag is not None and harv_lag <= 6', [
+                                    When("BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' "
+                                         "and dry_wet == 'wet')", Leaf(286, 'S-3')),
+                                    Otherwise(Leaf(287, 'S-2')),
+                                ]),
+                                Otherwise([
+                                    When("SPECIES_CD_1 == 'SE'", [
+                                        When("BCLCS_LEVEL_5 in ['SP']", Leaf(288, 'C-7')),
+                                        Otherwise([
+                                            When("SPECIES_CD_2 in ['BL', 'B', 'PL', 'P', 'PLI']", [
+                                                When("BCLCS_LEVEL_5 in ['DE']", Leaf(289, 'C-2')),
+                                                Otherwise(Leaf(290, 'C-3')),
+                                            ]),
+                                            When("SPECIES_CD_2 in ['HW', 'HM', 'CW', 'YC']", [
+                                                When("BCLCS_LEVEL_5 in ['DE']", Leaf(291, 'C-3')),
+                                                Otherwise(Leaf(292, 'C-5')),
+                                            ]),
+                                            Otherwise(Leaf(293, 'C-3')),
+                                        ]),
+                                    ]),
+                                    When("SPECIES_CD_1 in ['SS']", Leaf(294, 'C-5')),
+                                    When("SPECIES_CD_1 in ['SB']", [
+                                        When("BCLCS_LEVEL_5 in ['DE', 'OP']", Leaf(295, 'C-2')),
+                                        Otherwise([
+                                            When("BEC_ZONE_CODE in ['BWBS']", Leaf(296, 'C-1')),
+                                            Otherwise(Leaf(297, 'C-3')),
+                                        ]),
+                                    ]),
+                                    Otherwise([
+                                        When("BEC_ZONE_CODE in ['BWBS']", [
+                                            When("BCLCS_LEVEL_5 in ['DE']", Leaf(298, 'C-2')),
+                                            When("BCLCS_LEVEL_5 in ['OP']", Leaf(299, 'C-3')),
+                                            Otherwise(Leaf(300, 'C-1')),
+                                        ]),
+                                        Otherwise([
+                                            When("BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']", [
+                                                When("SPECIES_CD_2 in ['BL', 'B'] or SPECIES_CD_2.startswith('P')", [
+                                                    When("BCLCS_LEVEL_5 in ['SP']", Leaf(301, 'C-7')),
+                                                    Otherwise(Leaf(302, 'C-3')),
+                                                ]),
+                                                Otherwise(Leaf(303, 'C-5')),
+                                            ]),
+                                            Otherwise([
+                                                When("BCLCS_LEVEL_5 in ['SP']", Leaf(304, 'C-7')),
+                                                Otherwise([
+                                                    When("BCLCS_LEVEL_5 in ['DE']", Leaf(305, 'C-2')),
+                                                    Otherwise([
+                                                        When('STAND_PERCENTAGE_DEAD is not None '
+                                                             'and STAND_PERCENTAGE_DEAD > 34', Leaf(306, 'C-2')),
+                                                        Otherwise([
+                                                            When("SPECIES_CD_2 in ['PL', 'PLI', 'P']",
+                                                                 Leaf(307, 'C-2')),
+                                                            Otherwise(Leaf(308, 'C-3')),
+                                                        ]),
+                                                    ]),
+                                                ]),
+                                            ]),
+                                        ]),
+                                    ]),
+                                ]),
+                            ]),
+                            When("SPECIES_CD_1.startswith('C') or SPECIES_CD_1.startswith('Y') "
+                                 "or SPECIES_CD_1.startswith('H')",
+                                 label='DOMINANT CONIFER = REDCEDAR, YELLOW CEDAR OR HEMLOCK', then=[
+                                When('harv_lag is not None and harv_lag <= 6', Leaf(309, 'S-3')),
+                                Otherwise([
+                                    When("BCLCS_LEVEL_5 == 'DE'", [
+                                        When('PROJ_HEIGHT_1 < 4', Seasonal(Leaf(310, 'D-1'), Leaf(311, 'D-2'))),
+                                        When('PROJ_HEIGHT_1 <= 15', Leaf(312, 'C-3')),
+                                        Otherwise([
+                                            When('PROJ_AGE_1 < 60', Leaf(313, 'C-3')),
+                                            When('PROJ_AGE_1 <= 99',
+                                                 Seasonal(Leaf(314, 'M-1', 40), Leaf(315, 'M-2', 40))),
+                                            Otherwise(Leaf(316, 'C-5')),
+                                        ]),
+                                    ]),
+                                    When("BCLCS_LEVEL_5 in ['OP']", Leaf(317, 'C-5')),
+                                    Otherwise(Seasonal(Leaf(318, 'D-1'), Leaf(319, 'D-2'))),
+                                ]),
+                            ]),
+                            When("SPECIES_CD_1 in ['BG']", Leaf(320, 'C-7'), label='DOMINANT CONIFER = GRAND FIR'),
+                            When("SPECIES_CD_1 in ['BA']", label='DOMINANT CONIFER = AMABALIS FIR', then=[
+                                When("SPECIES_CD_2 in ['SE', 'SW', 'S']", Leaf(321, 'C-3')),
+                                Otherwise(Seasonal(Leaf(322, 'M-1', 40), Leaf(323, 'M-2', 40))),
+                            ]),
+                            When("SPECIES_CD_1 in ['B', 'BL']", label='DOMINANT CONIFER = OTHER FIR', then=[
+                                When("COAST_INTERIOR_CD == 'C'", Seasonal(Leaf(324, 'M-1', 40), Leaf(325, 'M-2', 40))),
+                                Otherwise([
+                                    When("BCLCS_LEVEL_5 in ['SP']", Leaf(326, 'C-7')),
+                                    When("BCLCS_LEVEL_5 in ['DE']", [
+                                        When("SPECIES_CD_2 in ['SE', 'SW', 'S']", Leaf(327, 'C-2')),
+                                        Otherwise(Leaf(328, 'C-3')),
+                                    ]),
+                                    Otherwise(Leaf(329, 'C-3')),
+                                ]),
+                            ]),
+                            When("SPECIES_CD_1 in ['T', 'TW']", Leaf(330, 'C-5'), label='DOMINANT CONIFER = YEW'),
+                            When("SPECIES_CD_1 in ['J', 'JR']", Leaf(331, 'C-7'), label='DOMINANT CONIFER = JUNIPER'),
+                        ]),
+                    ]),
+                ]),
+            ]),
+        ]),
+        Otherwise(label='NON-FORESTED SITE', then=[
+            When('is_burned and dist_lag is not None and (dist_lag < 11)', label='SITE RECENTLY BURNED', then=[
+                When('dist_lag <= 1', Leaf(332, 'N')),
+                When('dist_lag <= 3', Seasonal(Leaf(333, 'D-1'), Leaf(334, 'D-2'))),
+                Otherwise(Seasonal(Leaf(335, 'O-1a'), Leaf(336, 'O-1b'))),
+            ]),
+            Otherwise(label='SITE NOT RECENTLY BURNED', then=[
+                When('is_logged', label='SITE LOGGED', then=[
+                    When('SPECIES_CD_1 is not None', [
+                        When('harv_lag <= 7', [
+                            When("str(SPECIES_CD_1).startswith('P')", Leaf(337, 'S-1')),
+                            When("str(SPECIES_CD_1).startswith('S') or str(SPECIES_CD_1).startswith('B')",
+                                 Leaf(338, 'S-2')),
+                            When("SPECIES_CD_1 in ['CW', 'YC'] or str(SPECIES_CD_1).startswith('H')", Leaf(339, 'S-3')),
+                            When("str(SPECIES_CD_1).startswith('FD')", [
+                                When("BEC_ZONE_CODE in ['CWH', 'ICH']", Leaf(340, 'S-3')),
+                                Otherwise(Leaf(341, 'S-1')),
+                            ]),
+                            Otherwise(Leaf(342, 'S-1')),
+                        ]),
+                        When('harv_lag <= 24', [
+                            When("BEC_ZONE_CODE in ['CWH', 'MH'] or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')",
+                                 Seasonal(Leaf(343, 'D-1'), Leaf(344, 'D-2'))),
+                            Otherwise(Seasonal(Leaf(345, 'O-1a'), Leaf(346, 'O-1b'))),
+                        ]),
+                        Otherwise([
+                            When("BEC_ZONE_CODE in ['CMA', 'IMA']", Leaf(347, 'N')),
+                            When("BEC_ZONE_CODE == 'BAFA'", Seasonal(Leaf(348, 'D-1'), Leaf(349, 'D-2'))),
+                            When("BEC_ZONE_CODE == 'CWH'", [
+                                When("dry_wet == 'dry'", Seasonal(Leaf(350, 'M-1', 40), Leaf(351, 'M-2', 40))),
+                                Otherwise(Leaf(352, 'C-5')),
+                            ]),
+                            When("BEC_ZONE_CODE == 'BWBS'", Leaf(353, 'C-2')),
+                            When("BEC_ZONE_CODE == 'SWB'", Seasonal(Leaf(354, 'M-1', 50), Leaf(355, 'M-2', 50))),
+                            When("BEC_ZONE_CODE == 'SBS'", Leaf(356, 'C-3')),
+                            When("BEC_ZONE_CODE == 'SBPS'", Leaf(357, 'C-7')),
+                            When("BEC_ZONE_CODE == 'MS'", Leaf(358, 'C-3')),
+                            When("BEC_ZONE_CODE == 'IDF'", [
+                                When("dry_wet == 'dry'", Leaf(359, 'C-7')),
+                                Otherwise(Leaf(360, 'C-3')),
+                            ]),
+                            When("BEC_ZONE_CODE == 'PP'", Seasonal(Leaf(361, 'O-1a'), Leaf(362, 'O-1b'))),
+                            When("BEC_ZONE_CODE == 'BG'", Seasonal(Leaf(363, 'O-1a'), Leaf(364, 'O-1b'))),
+                            When("BEC_ZONE_CODE == 'MH'", Seasonal(Leaf(365, 'D-1'), Leaf(366, 'D-2'))),
+                            When("BEC_ZONE_CODE == 'ESSF'", Leaf(367, 'C-3')),
+                            When("BEC_ZONE_CODE == 'CDF'", [
+                                When("dry_wet == 'dry'", Leaf(368, 'C-7')),
+                                Otherwise(Leaf(369, 'C-5')),
+                            ]),
+                            When("BEC_ZONE_CODE == 'ICH'", [
+                                When("dry_wet == 'dry'", Leaf(370, 'C-3')),
+                                Otherwise(Leaf(371, 'C-5')),
+                            ]),
+                            Otherwise(Leaf(372, 'VegNonForestUnburnedLoggedGT24HasSpecies_BEC-ERROR')),
+                        ]),
+                    ]),
+                    Otherwise([
+                        When('harv_lag <= 5', Leaf(373, 'S-1')),
+                        When('harv_lag <= 24', [
+                            When("BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']", Seasonal(Leaf(374, 'D-1'), Leaf(375, 'D-2'))),
+                            Otherwise(Seasonal(Leaf(376, 'O-1a'), Leaf(377, 'O-1b'))),
+                        ]),
+                        Otherwise([
+                            When("BEC_ZONE_CODE in ['CMA', 'IMA']", Leaf(378, 'N')),
+                            When("BEC_ZONE_CODE == 'BAFA'", Seasonal(Leaf(379, 'D-1'), Leaf(380, 'D-2'))),
+                            When("BEC_ZONE_CODE == 'CWH'", [
+                                When("dry_wet == 'dry'", Seasonal(Leaf(381, 'M-1', 40), Leaf(382, 'M-2', 40))),
+                                Otherwise(Leaf(383, 'C-5')),
+                            ]),
+                            When("BEC_ZONE_CODE == 'BWBS'", Leaf(384, 'C-2')),
+                            When("BEC_ZONE_CODE == 'SWB'", Seasonal(Leaf(385, 'M-1', 25), Leaf(386, 'M-2', 25))),
+                            When("BEC_ZONE_CODE == 'SBS'", Leaf(387, 'C-3')),
+                            When("BEC_ZONE_CODE == 'SBPS'", Leaf(388, 'C-7')),
+                            When("BEC_ZONE_CODE == 'MS'", Leaf(389, 'C-7')),
+                            When("BEC_ZONE_CODE == 'IDF'", [
+                                When("dry_wet == 'dry'", Leaf(390, 'C-7')),
+                                Otherwise(Seasonal(Leaf(391, 'M-1', 50), Leaf(392, 'M-2', 50))),
+                            ]),
+                            When("BEC_ZONE_CODE == 'PP'", Seasonal(Leaf(393, 'O-1a'), Leaf(394, 'O-1b'))),
+                            When("BEC_ZONE_CODE == 'BG'", Seasonal(Leaf(395, 'O-1a'), Leaf(396, 'O-1b'))),
+                            When("BEC_ZONE_CODE == 'MH'", Seasonal(Leaf(397, 'D-1'), Leaf(398, 'D-2'))),
+                            When("BEC_ZONE_CODE == 'ESSF'", Leaf(399, 'C-7')),
+                            When("BEC_ZONE_CODE == 'CDF'", [
+                                When("dry_wet == 'dry'", Leaf(400, 'C-7')),
+                                Otherwise(Leaf(401, 'C-5')),
+                            ]),
+                            When("BEC_ZONE_CODE == 'ICH'", [
+                                When("dry_wet == 'dry'", Seasonal(Leaf(402, 'M-1', 40), Leaf(403, 'M-2', 40))),
+                                Otherwise(Leaf(404, 'C-5')),
+                            ]),
+                            Otherwise(Leaf(405, 'VegNonForestUnburnedLoggedGT24NoSpecies_BEC-ERROR')),
+                        ]),
+                    ]),
+                ]),
+                Otherwise(label='SITE NOT LOGGED', then=[
+                    When('SPECIES_CD_1 is not None', [
+                        When("BEC_ZONE_CODE in ['CMA', 'IMA']", Leaf(406, 'N')),
+                        When("BEC_ZONE_CODE in ['CWH', 'MH', 'ICH', 'BAFA']",
+                             Seasonal(Leaf(407, 'D-1'), Leaf(408, 'D-2'))),
+                        Otherwise(Seasonal(Leaf(409, 'O-1a'), Leaf(410, 'O-1b'))),
+                    ]),
+                    Otherwise([
+                        When("INVENTORY_STANDARD_CD == 'F'", [
+                            When('NON_PRODUCTIVE_CD in [11, 12, 13]', [
+                                When("BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']",
+                                     Seasonal(Leaf(411, 'D-1'), Leaf(412, 'D-2'))),
+                                Otherwise(Seasonal(Leaf(413, 'O-1a'), Leaf(414, 'O-1b'))),
+                            ]),
+                            When('NON_PRODUCTIVE_CD == 35', Leaf(415, 'W')),
+                            When('NON_PRODUCTIVE_CD == 42', Leaf(416, 'N')),
+                            When('NON_PRODUCTIVE_CD in [60, 62, 63]', Seasonal(Leaf(417, 'O-1a'), Leaf(418, 'O-1b'))),
+                            When('NON_PRODUCTIVE_CD is None', [
+                                When("BEC_ZONE_CODE in ['CMA', 'IMA']", Leaf(419, 'N')),
+                                When("BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']",
+                                     Seasonal(Leaf(420, 'D-1'), Leaf(421, 'D-2'))),
+                                Otherwise(Seasonal(Leaf(422, 'O-1a'), Leaf(423, 'O-1b'))),
+                            ]),
+                            Otherwise(Leaf(424, 'N')),
+                        ]),
+                        Otherwise([
+                            When("LAND_COVER_CLASS_CD_1 in ['LA', 'RE', 'RI', 'OC']", Leaf(425, 'W')),
+                            When("LAND_COVER_CLASS_CD_1 == 'HG'", Seasonal(Leaf(426, 'O-1a'), Leaf(427, 'O-1b'))),
+                            When("LAND_COVER_CLASS_CD_1 in ['BY', 'BM', 'BL']",
+                                 Seasonal(Leaf(428, 'D-1'), Leaf(429, 'D-2'))),
+                            When("LAND_COVER_CLASS_CD_1 in ['SL', 'ST', 'HE', 'HF', None]", [
+                                When("BEC_ZONE_CODE in ['CMA', 'IMA']", Leaf(430, 'N')),
+                                When("BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']",
+                                     Seasonal(Leaf(431, 'D-1'), Leaf(432, 'D-2'))),
+                                Otherwise(Seasonal(Leaf(433, 'O-1a'), Leaf(434, 'O-1b'))),
+                            ]),
+                            Otherwise(Leaf(435, 'N')),
+                        ]),
+                    ]),
+                ]),
+            ]),
+        ]),
+    ]),
+]
+
+
+RULE_TABLE = {
+    1: (409, "Non-vegetated site > Site logged > Site harvested within last 6 years > COAST_INTERIOR_CD == 'C'"),
+    2: (411, "Non-vegetated site > Site logged > Site harvested within last 6 years > COAST_INTERIOR_CD != 'C'"),
+    3: (416, "Non-vegetated site > Site logged > Site harvested within last 7-24 years > BEC_ZONE_CODE in ['CWH', 'MH', 'ICH'] > dormant season"),
+    4: (418, "Non-vegetated site > Site logged > Site harvested within last 7-24 years > BEC_ZONE_CODE in ['CWH', 'MH', 'ICH'] > growing season"),
+    5: (421, "Non-vegetated site > Site logged > Site harvested within last 7-24 years > BEC_ZONE_CODE not in ['CWH', 'MH', 'ICH'] > dormant season"),
+    6: (423, "Non-vegetated site > Site logged > Site harvested within last 7-24 years > BEC_ZONE_CODE not in ['CWH', 'MH', 'ICH'] > growing season"),
+    7: (427, "Non-vegetated site > Site logged > Site harvested longer than 24 years ago > BEC_ZONE_CODE in ['CMA', 'IMA']"),
+    8: (430, "Non-vegetated site > Site logged > Site harvested longer than 24 years ago > BEC_ZONE_CODE in ['BAFA', 'MH'] > dormant season"),
+    9: (432, "Non-vegetated site > Site logged > Site harvested longer than 24 years ago > BEC_ZONE_CODE in ['BAFA', 'MH'] > growing season"),
+    10: (434, "Non-vegetated site > Site logged > Site harvested longer than 24 years ago > BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH'] and dry_wet == 'wet'"),
+    11: (436, "Non-vegetated site > Site logged > Site harvested longer than 24 years ago > BEC_ZONE_CODE in ['BWBS']"),
+    12: (439, "Non-vegetated site > Site logged > Site harvested longer than 24 years ago > BEC_ZONE_CODE == 'SWB' > dormant season"),
+    13: (441, "Non-vegetated site > Site logged > Site harvested longer than 24 years ago > BEC_ZONE_CODE == 'SWB' > growing season"),
+    14: (444, "Non-vegetated site > Site logged > Site harvested longer than 24 years ago > (BEC_ZONE_CODE == 'SBS') or (BEC_ZONE_CODE == 'IDF' and dry_wet == 'wet') or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'dry')"),
+    15: (447, "Non-vegetated site > Site logged > Site harvested longer than 24 years ago > BEC_ZONE_CODE in ['SBPS', 'MS', 'ESSF'] or (BEC_ZONE_CODE in ['IDF', 'CDF'] and dry_wet == 'dry')"),
+    16: (450, "Non-vegetated site > Site logged > Site harvested longer than 24 years ago > BEC_ZONE_CODE in ['PP', 'BG'] > dormant season"),
+    17: (452, "Non-vegetated site > Site logged > Site harvested longer than 24 years ago > BEC_ZONE_CODE in ['PP', 'BG'] > growing season"),
+    18: (455, "Non-vegetated site > Site logged > Site harvested longer than 24 years ago > BEC_ZONE_CODE == 'CWH' and dry_wet == 'dry' > dormant season"),
+    19: (457, "Non-vegetated site > Site logged > Site harvested longer than 24 years ago > BEC_ZONE_CODE == 'CWH' and dry_wet == 'dry' > growing season"),
+    20: (463, 'Non-vegetated site > Site unlogged > Site recently burned > dist_lag <= 3'),
+    21: (466, 'Non-vegetated site > Site unlogged > Site recently burned > dist_lag <= 6 > dormant season'),
+    22: (468, 'Non-vegetated site > Site unlogged > Site recently burned > dist_lag <= 6 > growing season'),
+    23: (471, 'Non-vegetated site > Site unlogged > Site recently burned > dist_lag <= 10 > dormant season'),
+    24: (473, 'Non-vegetated site > Site unlogged > Site recently burned > dist_lag <= 10 > growing season'),
+    25: (480, "Non-vegetated site > Site unlogged > Site not recently burned > BCLCS_LEVEL_2 in ['L', None] > SPECIES_CD_1 is not None > BEC_ZONE_CODE in ['CWH', 'MH', 'ICH'] > dormant season"),
+    26: (482, "Non-vegetated site > Site unlogged > Site not recently burned > BCLCS_LEVEL_2 in ['L', None] > SPECIES_CD_1 is not None > BEC_ZONE_CODE in ['CWH', 'MH', 'ICH'] > growing season"),
+    27: (485, "Non-vegetated site > Site unlogged > Site not recently burned > BCLCS_LEVEL_2 in ['L', None] > SPECIES_CD_1 is not None > BEC_ZONE_CODE not in ['CWH', 'MH', 'ICH'] > dormant season"),
+    28: (487, "Non-vegetated site > Site unlogged > Site not recently burned > BCLCS_LEVEL_2 in ['L', None] > SPECIES_CD_1 is not None > BEC_ZONE_CODE not in ['CWH', 'MH', 'ICH'] > growing season"),
+    29: (489, "Non-vegetated site > Site unlogged > Site not recently burned > BCLCS_LEVEL_2 in ['L', None] > SPECIES_CD_1 is None"),
+    30: (491, "Non-vegetated site > Site unlogged > Site not recently burned > BCLCS_LEVEL_2 not in ['L', None]"),
+    31: (502, 'Site vegetated > Site forested > Site recently burned > (pct_cnfr is not None) and (pct_cnfr >= 60) > (CROWN_CLOSURE is not None) and (CROWN_CLOSURE > 40) > dist_lag <= 3'),
+    32: (505, 'Site vegetated > Site forested > Site recently burned > (pct_cnfr is not None) and (pct_cnfr >= 60) > (CROWN_CLOSURE is not None) and (CROWN_CLOSURE > 40) > dist_lag <= 6 > dormant season'),
+    33: (507, 'Site vegetated > Site forested > Site recently burned > (pct_cnfr is not None) and (pct_cnfr >= 60) > (CROWN_CLOSURE is not None) and (CROWN_CLOSURE > 40) > dist_lag <= 6 > growing season'),
+    34: (509, 'Site vegetated > Site forested > Site recently burned > (pct_cnfr is not None) and (pct_cnfr >= 60) > (CROWN_CLOSURE is not None) and (CROWN_CLOSURE > 40) > dist_lag > 6'),
+    35: (512, 'Site vegetated > Site forested > Site recently burned > (pct_cnfr is not None) and (pct_cnfr >= 60) > not ((CROWN_CLOSURE is not None) and (CROWN_CLOSURE > 40)) > dist_lag <= 1'),
+    36: (515, 'Site vegetated > Site forested > Site recently burned > (pct_cnfr is not None) and (pct_cnfr >= 60) > not ((CROWN_CLOSURE is not None) and (CROWN_CLOSURE > 40)) > dist_lag <= 6 > dormant season'),
+    37: (517, 'Site vegetated > Site forested > Site recently burned > (pct_cnfr is not None) and (pct_cnfr >= 60) > not ((CROWN_CLOSURE is not None) and (CROWN_CLOSURE > 40)) > dist_lag <= 6 > growing season'),
+    38: (520, 'Site vegetated > Site forested > Site recently burned > (pct_cnfr is not None) and (pct_cnfr >= 60) > not ((CROWN_CLOSURE is not None) and (CROWN_CLOSURE > 40)) > dist_lag > 6 > dormant season'),
+    39: (522, 'Site vegetated > Site forested > Site recently burned > (pct_cnfr is not None) and (pct_cnfr >= 60) > not ((CROWN_CLOSURE is not None) and (CROWN_CLOSURE > 40)) > dist_lag > 6 > growing season'),
+    40: (525, 'Site vegetated > Site forested > Site recently burned > not ((pct_cnfr is not None) and (pct_cnfr >= 60)) > dist_lag <= 1'),
+    41: (528, 'Site vegetated > Site forested > Site recently burned > not ((pct_cnfr is not None) and (pct_cnfr >= 60)) > dist_lag > 1 > dormant season'),
+    42: (530, 'Site vegetated > Site forested > Site recently burned > not ((pct_cnfr is not None) and (pct_cnfr >= 60)) > dist_lag > 1 > growing season'),
+    43: (534, 'Site vegetated > Site forested > Site not recently burned > (SPECIES_CD_1 is None) or (SPECIES_PCT_1 is None) or (SPECIES_PCT_1 == 0)'),
+    44: (543, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > harv_lag is not None and harv_lag <= 7'),
+    45: (549, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > not (harv_lag is not None and harv_lag <= 7) > Sparse stands > (BEC_ZONE_CODE in ['CWH', 'CDF', 'MH']) or (BEC_ZONE_CODE in ['ICH'] and dry_wet == 'wet') > dormant season"),
+    46: (551, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > not (harv_lag is not None and harv_lag <= 7) > Sparse stands > (BEC_ZONE_CODE in ['CWH', 'CDF', 'MH']) or (BEC_ZONE_CODE in ['ICH'] and dry_wet == 'wet') > growing season"),
+    47: (553, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > not (harv_lag is not None and harv_lag <= 7) > Sparse stands > not ((BEC_ZONE_CODE in ['CWH', 'CDF', 'MH']) or (BEC_ZONE_CODE in ['ICH'] and dry_wet == 'wet'))"),
+    48: (557, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > not (harv_lag is not None and harv_lag <= 7) > Dense or open stands > PROJ_HEIGHT_1 < 4 > dormant season'),
+    49: (559, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > not (harv_lag is not None and harv_lag <= 7) > Dense or open stands > PROJ_HEIGHT_1 < 4 > growing season'),
+    50: (562, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > not (harv_lag is not None and harv_lag <= 7) > Dense or open stands > PROJ_HEIGHT_1 <= 12 > stocking > 8000'),
+    51: (564, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > not (harv_lag is not None and harv_lag <= 7) > Dense or open stands > PROJ_HEIGHT_1 <= 12 > stocking <= 8000'),
+    52: (568, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > not (harv_lag is not None and harv_lag <= 7) > Dense or open stands > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE < 40 > BEC_ZONE_CODE in ['BG', 'PP', 'IDF', 'MS']"),
+    53: (571, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > not (harv_lag is not None and harv_lag <= 7) > Dense or open stands > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE < 40 > BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']"),
+    54: (574, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > not (harv_lag is not None and harv_lag <= 7) > Dense or open stands > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE < 40 > BEC_ZONE_CODE not in ['CWH', 'MH', 'ICH']"),
+    55: (580, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > not (harv_lag is not None and harv_lag <= 7) > Dense or open stands > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > Mountain pine beetle stands > dist_lag <= 5 > STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD > 50'),
+    56: (583, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > not (harv_lag is not None and harv_lag <= 7) > Dense or open stands > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > Mountain pine beetle stands > dist_lag <= 5 > STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD >= 25'),
+    57: (586, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > not (harv_lag is not None and harv_lag <= 7) > Dense or open stands > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > Mountain pine beetle stands > dist_lag <= 5 > not (STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD >= 25)'),
+    58: (590, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > not (harv_lag is not None and harv_lag <= 7) > Dense or open stands > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > Mountain pine beetle stands > dist_lag > 5 > STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD > 50'),
+    59: (593, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > not (harv_lag is not None and harv_lag <= 7) > Dense or open stands > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > Mountain pine beetle stands > dist_lag > 5 > STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD >= 25'),
+    60: (596, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > not (harv_lag is not None and harv_lag <= 7) > Dense or open stands > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > Mountain pine beetle stands > dist_lag > 5 > not (STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD >= 25)'),
+    61: (599, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure lodgepole pine stands > not (harv_lag is not None and harv_lag <= 7) > Dense or open stands > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > Non mountain pine beetle stands'),
+    62: (605, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure ponderosa pine stands > Dense or open stands > harv_lag is not None and harv_lag <= 10'),
+    63: (609, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure ponderosa pine stands > Dense or open stands > not (harv_lag is not None and harv_lag <= 10) > PROJ_HEIGHT_1 < 4 > dormant season'),
+    64: (611, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure ponderosa pine stands > Dense or open stands > not (harv_lag is not None and harv_lag <= 10) > PROJ_HEIGHT_1 < 4 > growing season'),
+    65: (614, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure ponderosa pine stands > Dense or open stands > not (harv_lag is not None and harv_lag <= 10) > PROJ_HEIGHT_1 <= 12 > stocking > 8000'),
+    66: (616, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure ponderosa pine stands > Dense or open stands > not (harv_lag is not None and harv_lag <= 10) > PROJ_HEIGHT_1 <= 12 > stocking >= 3000'),
+    67: (618, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure ponderosa pine stands > Dense or open stands > not (harv_lag is not None and harv_lag <= 10) > PROJ_HEIGHT_1 <= 12 > stocking < 3000'),
+    68: (621, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure ponderosa pine stands > Dense or open stands > not (harv_lag is not None and harv_lag <= 10) > PROJ_HEIGHT_1 <= 17 > BCLCS_LEVEL_5 == 'DE'"),
+    69: (623, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure ponderosa pine stands > Dense or open stands > not (harv_lag is not None and harv_lag <= 10) > PROJ_HEIGHT_1 <= 17 > BCLCS_LEVEL_5 == 'OP'"),
+    70: (625, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure ponderosa pine stands > Dense or open stands > not (harv_lag is not None and harv_lag <= 10) > PROJ_HEIGHT_1 > 17'),
+    71: (629, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure ponderosa pine stands > Sparse stands > STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD >= 40 > dormant season'),
+    72: (631, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure ponderosa pine stands > Sparse stands > STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD >= 40 > growing season'),
+    73: (634, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure ponderosa pine stands > Sparse stands > not (STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD >= 40) > harv_lag is not None and harv_lag <= 10'),
+    74: (636, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure ponderosa pine stands > Sparse stands > not (STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD >= 40) > not (harv_lag is not None and harv_lag <= 10)'),
+    75: (640, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure other pine stands > BCLCS_LEVEL_5 == 'DE'"),
+    76: (643, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure other pine stands > BCLCS_LEVEL_5 in ['SP', 'OP'] > stocking >= 900"),
+    77: (645, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure other pine stands > BCLCS_LEVEL_5 in ['SP', 'OP'] > stocking >= 600"),
+    78: (647, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure other pine stands > BCLCS_LEVEL_5 in ['SP', 'OP'] > stocking < 600"),
+    79: (654, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested within last 6 years > (BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')"),
+    80: (656, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested within last 6 years > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet'))"),
+    81: (663, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested longer than 6 years ago > PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 < 4 > (BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet') > dormant season"),
+    82: (665, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested longer than 6 years ago > PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 < 4 > (BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet') > growing season"),
+    83: (668, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested longer than 6 years ago > PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 < 4 > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > dormant season"),
+    84: (670, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested longer than 6 years ago > PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 < 4 > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > growing season"),
+    85: (676, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested longer than 6 years ago > PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 >= 4 > CROWN_CLOSURE is not None and CROWN_CLOSURE > 55 > PROJ_HEIGHT_1 <= 12 > (BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')"),
+    86: (681, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested longer than 6 years ago > PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 >= 4 > CROWN_CLOSURE is not None and CROWN_CLOSURE > 55 > PROJ_HEIGHT_1 <= 12 > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > ((STAND_PERCENTAGE_DEAD is not None) and (STAND_PERCENTAGE_DEAD > 34))"),
+    87: (684, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested longer than 6 years ago > PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 >= 4 > CROWN_CLOSURE is not None and CROWN_CLOSURE > 55 > PROJ_HEIGHT_1 <= 12 > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > not (((STAND_PERCENTAGE_DEAD is not None) and (STAND_PERCENTAGE_DEAD > 34)))"),
+    88: (689, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested longer than 6 years ago > PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 >= 4 > CROWN_CLOSURE is not None and CROWN_CLOSURE > 55 > PROJ_HEIGHT_1 > 12 > (BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')"),
+    89: (692, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested longer than 6 years ago > PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 >= 4 > CROWN_CLOSURE is not None and CROWN_CLOSURE > 55 > PROJ_HEIGHT_1 > 12 > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet'))"),
+    90: (697, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested longer than 6 years ago > PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 >= 4 > CROWN_CLOSURE is None or CROWN_CLOSURE >= 26 > (BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')"),
+    91: (699, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested longer than 6 years ago > PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 >= 4 > CROWN_CLOSURE is None or CROWN_CLOSURE >= 26 > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet'))"),
+    92: (704, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested longer than 6 years ago > PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 >= 4 > not (CROWN_CLOSURE is None or CROWN_CLOSURE >= 26) > (BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet') > dormant season"),
+    93: (707, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested longer than 6 years ago > PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 >= 4 > not (CROWN_CLOSURE is None or CROWN_CLOSURE >= 26) > (BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet') > growing season"),
+    94: (711, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested longer than 6 years ago > PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 >= 4 > not (CROWN_CLOSURE is None or CROWN_CLOSURE >= 26) > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > dormant season"),
+    95: (714, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested longer than 6 years ago > PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 >= 4 > not (CROWN_CLOSURE is None or CROWN_CLOSURE >= 26) > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > growing season"),
+    96: (717, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure douglas-fir stands > Site harvested longer than 6 years ago > not (PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 >= 4)'),
+    97: (722, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure engelmann spruce stands > harv_lag is not None and harv_lag <= 10'),
+    98: (726, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure engelmann spruce stands > not (harv_lag is not None and harv_lag <= 10) > BCLCS_LEVEL_5 == 'SP' > dormant season"),
+    99: (728, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure engelmann spruce stands > not (harv_lag is not None and harv_lag <= 10) > BCLCS_LEVEL_5 == 'SP' > growing season"),
+    100: (730, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure engelmann spruce stands > not (harv_lag is not None and harv_lag <= 10) > BCLCS_LEVEL_5 == 'DE'"),
+    101: (732, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure engelmann spruce stands > not (harv_lag is not None and harv_lag <= 10) > BCLCS_LEVEL_5 == 'OP'"),
+    102: (736, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure sitka spruce stands > harv_lag is not None and harv_lag <= 6'),
+    103: (740, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure sitka spruce stands > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'SP' > dormant season"),
+    104: (742, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure sitka spruce stands > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'SP' > growing season"),
+    105: (744, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure sitka spruce stands > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 in ['DE', 'OP']"),
+    106: (748, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure black or white spruce stands > harv_lag is not None and harv_lag <= 10'),
+    107: (751, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure black or white spruce stands > not (harv_lag is not None and harv_lag <= 10) > BCLCS_LEVEL_5 in ['DE', 'OP']"),
+    108: (754, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure black or white spruce stands > not (harv_lag is not None and harv_lag <= 10) > BCLCS_LEVEL_5 == 'SP' > BEC_ZONE_CODE in ['BWBS', 'SWB']"),
+    109: (757, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure black or white spruce stands > not (harv_lag is not None and harv_lag <= 10) > BCLCS_LEVEL_5 == 'SP' > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > dormant season"),
+    110: (759, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure black or white spruce stands > not (harv_lag is not None and harv_lag <= 10) > BCLCS_LEVEL_5 == 'SP' > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > growing season"),
+    111: (764, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure spruce (unknown or hybrid) stands > harv_lag is not None and harv_lag <= 7'),
+    112: (768, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure spruce (unknown or hybrid) stands > not (harv_lag is not None and harv_lag <= 7) > BEC_ZONE_CODE in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 in ['DE', 'OP']"),
+    113: (770, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure spruce (unknown or hybrid) stands > not (harv_lag is not None and harv_lag <= 7) > BEC_ZONE_CODE in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 not in ['DE', 'OP']"),
+    114: (773, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure spruce (unknown or hybrid) stands > not (harv_lag is not None and harv_lag <= 7) > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 == 'SP'"),
+    115: (776, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure spruce (unknown or hybrid) stands > not (harv_lag is not None and harv_lag <= 7) > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 != 'SP' > BEC_ZONE_CODE in ['CWH', 'CDF']"),
+    116: (780, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure spruce (unknown or hybrid) stands > not (harv_lag is not None and harv_lag <= 7) > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 != 'SP' > BEC_ZONE_CODE not in ['CWH', 'CDF'] > PROJ_HEIGHT_1 < 4 > dormant season"),
+    117: (783, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure spruce (unknown or hybrid) stands > not (harv_lag is not None and harv_lag <= 7) > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 != 'SP' > BEC_ZONE_CODE not in ['CWH', 'CDF'] > PROJ_HEIGHT_1 < 4 > growing season"),
+    118: (787, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure spruce (unknown or hybrid) stands > not (harv_lag is not None and harv_lag <= 7) > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 != 'SP' > BEC_ZONE_CODE not in ['CWH', 'CDF'] > PROJ_HEIGHT_1 >= 4 > BCLCS_LEVEL_5 == 'OP'"),
+    119: (790, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure spruce (unknown or hybrid) stands > not (harv_lag is not None and harv_lag <= 7) > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 != 'SP' > BEC_ZONE_CODE not in ['CWH', 'CDF'] > PROJ_HEIGHT_1 >= 4 > BCLCS_LEVEL_5 == 'DE'"),
+    120: (793, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure spruce (unknown or hybrid) stands > not (harv_lag is not None and harv_lag <= 7) > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 != 'SP' > BEC_ZONE_CODE not in ['CWH', 'CDF'] > PROJ_HEIGHT_1 >= 4 > BCLCS_LEVEL_5 != 'DE'"),
+    121: (797, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure spruce (unknown or hybrid) stands > not (harv_lag is not None and harv_lag <= 7) > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 != 'SP' > BEC_ZONE_CODE not in ['CWH', 'CDF'] > PROJ_HEIGHT_1 < 4"),
+    122: (803, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure redcedar, yellow cedar or hemlock stands > harv_lag is not None and harv_lag <= 6'),
+    123: (808, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure redcedar, yellow cedar or hemlock stands > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'DE' > PROJ_HEIGHT_1 < 4 > dormant season"),
+    124: (810, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure redcedar, yellow cedar or hemlock stands > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'DE' > PROJ_HEIGHT_1 < 4 > growing season"),
+    125: (812, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure redcedar, yellow cedar or hemlock stands > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'DE' > PROJ_HEIGHT_1 <= 15"),
+    126: (815, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure redcedar, yellow cedar or hemlock stands > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'DE' > PROJ_HEIGHT_1 > 15 > PROJ_AGE_1 < 60"),
+    127: (818, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure redcedar, yellow cedar or hemlock stands > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'DE' > PROJ_HEIGHT_1 > 15 > PROJ_AGE_1 <= 99 > dormant season"),
+    128: (821, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure redcedar, yellow cedar or hemlock stands > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'DE' > PROJ_HEIGHT_1 > 15 > PROJ_AGE_1 <= 99 > growing season"),
+    129: (824, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure redcedar, yellow cedar or hemlock stands > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'DE' > PROJ_HEIGHT_1 > 15 > PROJ_AGE_1 > 99"),
+    130: (826, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure redcedar, yellow cedar or hemlock stands > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'OP'"),
+    131: (829, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure redcedar, yellow cedar or hemlock stands > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'SP' > dormant season"),
+    132: (831, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure redcedar, yellow cedar or hemlock stands > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'SP' > growing season"),
+    133: (835, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure true fir stands > SPECIES_CD_1 == 'BG'"),
+    134: (838, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure true fir stands > SPECIES_CD_1 == 'BA' > dormant season"),
+    135: (840, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure true fir stands > SPECIES_CD_1 == 'BA' > growing season"),
+    136: (843, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure true fir stands > SPECIES_CD_1 != 'BA' > BCLCS_LEVEL_5 == 'SP'"),
+    137: (845, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure true fir stands > SPECIES_CD_1 != 'BA' > BCLCS_LEVEL_5 != 'SP'"),
+    138: (848, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure yew stands'),
+    139: (852, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure juniper stands > dormant season'),
+    140: (854, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > Pure juniper stands > growing season'),
+    141: (856, "Site vegetated > Site forested > Site not recently burned > Pure/single species stands > SPECIES_CD_1 in coniferList > SPECIES_CD_1 not in ['J', 'JR']"),
+    142: (861, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > Deciduous/broadleaf or larch stand > dormant season'),
+    143: (863, 'Site vegetated > Site forested > Site not recently burned > Pure/single species stands > Deciduous/broadleaf or larch stand > growing season'),
+    144: (869, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species deciduous stands > dormant season'),
+    145: (871, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species deciduous stands > growing season'),
+    146: (877, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 21-40% conifer = deciduous dominated mixedwood stands > harv_lag is not None and harv_lag <= 6'),
+    147: (883, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 21-40% conifer = deciduous dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = black, white, engelmann, or hybrid spruce > dormant season'),
+    148: (886, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 21-40% conifer = deciduous dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = black, white, engelmann, or hybrid spruce > growing season'),
+    149: (892, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 21-40% conifer = deciduous dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown spruce > COAST_INTERIOR_CD == 'C' > dormant season"),
+    150: (895, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 21-40% conifer = deciduous dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown spruce > COAST_INTERIOR_CD == 'C' > growing season"),
+    151: (899, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 21-40% conifer = deciduous dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown spruce > COAST_INTERIOR_CD != 'C' > dormant season"),
+    152: (902, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 21-40% conifer = deciduous dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown spruce > COAST_INTERIOR_CD != 'C' > growing season"),
+    153: (908, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 21-40% conifer = deciduous dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = any other conifer > BCLCS_LEVEL_5 == 'SP' > dormant season"),
+    154: (911, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 21-40% conifer = deciduous dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = any other conifer > BCLCS_LEVEL_5 == 'SP' > growing season"),
+    155: (915, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 21-40% conifer = deciduous dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = any other conifer > BCLCS_LEVEL_5 != 'SP' > dormant season"),
+    156: (918, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 21-40% conifer = deciduous dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = any other conifer > BCLCS_LEVEL_5 != 'SP' > growing season"),
+    157: (923, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > harv_lag is not None and harv_lag <= 6'),
+    158: (929, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = lodgepole pine > BCLCS_LEVEL_5 == 'SP' > dormant season"),
+    159: (932, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = lodgepole pine > BCLCS_LEVEL_5 == 'SP' > growing season"),
+    160: (936, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = lodgepole pine > BCLCS_LEVEL_5 == 'OP' > dormant season"),
+    161: (939, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = lodgepole pine > BCLCS_LEVEL_5 == 'OP' > growing season"),
+    162: (943, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = lodgepole pine > BCLCS_LEVEL_5 == 'DE' > dormant season"),
+    163: (946, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = lodgepole pine > BCLCS_LEVEL_5 == 'DE' > growing season"),
+    164: (951, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = ponderosa pine > dormant season'),
+    165: (954, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = ponderosa pine > growing season'),
+    166: (959, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = other pine > dormant season'),
+    167: (962, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = other pine > growing season'),
+    168: (968, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = douglas-fir > BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH'] > dormant season"),
+    169: (971, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = douglas-fir > BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH'] > growing season"),
+    170: (975, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = douglas-fir > BEC_ZONE_CODE not in ['CWH', 'CDF', 'ICH'] > dormant season"),
+    171: (978, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = douglas-fir > BEC_ZONE_CODE not in ['CWH', 'CDF', 'ICH'] > growing season"),
+    172: (984, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = engelmann spruce > BCLCS_LEVEL_5 == 'SP' > dormant season"),
+    173: (987, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = engelmann spruce > BCLCS_LEVEL_5 == 'SP' > growing season"),
+    174: (991, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = engelmann spruce > BCLCS_LEVEL_5 in ['OP', 'DE'] > dormant season"),
+    175: (994, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = engelmann spruce > BCLCS_LEVEL_5 in ['OP', 'DE'] > growing season"),
+    176: (999, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = sitka spruce > dormant season'),
+    177: (1002, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = sitka spruce > growing season'),
+    178: (1007, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = black or white spruce > dormant season'),
+    179: (1010, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = black or white spruce > growing season'),
+    180: (1017, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 in ['DE', 'OP'] > dormant season"),
+    181: (1020, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 in ['DE', 'OP'] > growing season"),
+    182: (1024, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 in ['SP'] > dormant season"),
+    183: (1027, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 in ['SP'] > growing season"),
+    184: (1032, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 in ['SP'] > dormant season"),
+    185: (1035, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 in ['SP'] > growing season"),
+    186: (1040, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 in ['DE', 'OP'] > COAST_INTERIOR_CD == 'I' > dormant season"),
+    187: (1043, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 in ['DE', 'OP'] > COAST_INTERIOR_CD == 'I' > growing season"),
+    188: (1047, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 in ['DE', 'OP'] > COAST_INTERIOR_CD == 'C' > dormant season"),
+    189: (1050, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 in ['DE', 'OP'] > COAST_INTERIOR_CD == 'C' > growing season"),
+    190: (1053, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 not in ['DE', 'OP']"),
+    191: (1059, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = redcedar, yellow cedar or hemlock > dormant season'),
+    192: (1062, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = redcedar, yellow cedar or hemlock > growing season'),
+    193: (1067, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = fir > dormant season'),
+    194: (1070, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = fir > growing season'),
+    195: (1074, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = yew'),
+    196: (1078, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = juniper > dormant season'),
+    197: (1080, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 41-65% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = juniper > growing season'),
+    198: (1084, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > harv_lag is not None and harv_lag <= 6'),
+    199: (1090, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = lodgepole pine > BCLCS_LEVEL_5 in ['SP'] > dormant season"),
+    200: (1093, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = lodgepole pine > BCLCS_LEVEL_5 in ['SP'] > growing season"),
+    201: (1097, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = lodgepole pine > BCLCS_LEVEL_5 in ['OP'] > dormant season"),
+    202: (1100, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = lodgepole pine > BCLCS_LEVEL_5 in ['OP'] > growing season"),
+    203: (1104, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = lodgepole pine > BCLCS_LEVEL_5 in ['DE'] > dormant season"),
+    204: (1107, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = lodgepole pine > BCLCS_LEVEL_5 in ['DE'] > growing season"),
+    205: (1111, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = ponderosa pine'),
+    206: (1114, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = other pine'),
+    207: (1119, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = douglas-fir > (BEC_ZONE_CODE in ['CWH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')"),
+    208: (1123, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = douglas-fir > not ((BEC_ZONE_CODE in ['CWH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > BCLCS_LEVEL_5 in ['DE'] > dormant season"),
+    209: (1126, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = douglas-fir > not ((BEC_ZONE_CODE in ['CWH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > BCLCS_LEVEL_5 in ['DE'] > growing season"),
+    210: (1129, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = douglas-fir > not ((BEC_ZONE_CODE in ['CWH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > BCLCS_LEVEL_5 not in ['DE']"),
+    211: (1134, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = engelmann spruce > BCLCS_LEVEL_5 in ['SP'] > dormant season"),
+    212: (1137, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = engelmann spruce > BCLCS_LEVEL_5 in ['SP'] > growing season"),
+    213: (1141, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = engelmann spruce > BCLCS_LEVEL_5 in ['OP', 'DE'] > dormant season"),
+    214: (1144, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = engelmann spruce > BCLCS_LEVEL_5 in ['OP', 'DE'] > growing season"),
+    215: (1148, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = sitka spruce'),
+    216: (1152, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = black or white spruce > dormant season'),
+    217: (1155, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = black or white spruce > growing season'),
+    218: (1162, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 in ['DE', 'OP'] > dormant season"),
+    219: (1165, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 in ['DE', 'OP'] > growing season"),
+    220: (1169, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 in ['SP'] > dormant season"),
+    221: (1172, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 in ['SP'] > growing season"),
+    222: (1177, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 in ['SP'] > dormant season"),
+    223: (1180, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 in ['SP'] > growing season"),
+    224: (1185, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 not in ['SP'] > COAST_INTERIOR_CD == 'I' > dormant season"),
+    225: (1188, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 not in ['SP'] > COAST_INTERIOR_CD == 'I' > growing season"),
+    226: (1191, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = unknown or hybrid spruce > BEC_ZONE_CODE not in ['BWBS', 'SWB'] > BCLCS_LEVEL_5 not in ['SP'] > COAST_INTERIOR_CD != 'I'"),
+    227: (1195, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = redcedar, yellow cedar or hemlock'),
+    228: (1198, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = fir'),
+    229: (1201, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = yew'),
+    230: (1204, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 66-80% conifer = conifer_dominated mixedwood stands > not (harv_lag is not None and harv_lag <= 6) > Dominant conifer = juniper'),
+    231: (1210, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > harv_lag is not None and harv_lag <= 7'),
+    232: (1216, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 in ['SP'] > (BEC_ZONE_CODE in ['CWH', 'CDF', 'MH']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet') > dormant season"),
+    233: (1219, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 in ['SP'] > (BEC_ZONE_CODE in ['CWH', 'CDF', 'MH']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet') > growing season"),
+    234: (1222, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 in ['SP'] > not ((BEC_ZONE_CODE in ['CWH', 'CDF', 'MH']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet'))"),
+    235: (1226, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 < 4 > dormant season"),
+    236: (1229, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 < 4 > growing season"),
+    237: (1236, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 <= 12 > stocking > 8000"),
+    238: (1239, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 <= 12 > stocking <= 8000"),
+    239: (1244, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE < 40 > BEC_ZONE_CODE in ['BG', 'PP', 'IDF', 'MS']"),
+    240: (1247, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE < 40 > BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']"),
+    241: (1250, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE < 40 > BEC_ZONE_CODE not in ['CWH', 'MH', 'ICH']"),
+    242: (1258, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > EARLIEST_NONLOGGING_DIST_TYPE == 'IBM' > dist_lag <= 5 > BCLCS_LEVEL_5 in ['DE'] > ((STAND_PERCENTAGE_DEAD is not None) and (STAND_PERCENTAGE_DEAD > 50))"),
+    243: (1262, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > EARLIEST_NONLOGGING_DIST_TYPE == 'IBM' > dist_lag <= 5 > BCLCS_LEVEL_5 in ['DE'] > ((STAND_PERCENTAGE_DEAD is not None) and (STAND_PERCENTAGE_DEAD >= 25))"),
+    244: (1265, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > EARLIEST_NONLOGGING_DIST_TYPE == 'IBM' > dist_lag <= 5 > BCLCS_LEVEL_5 in ['DE'] > not (((STAND_PERCENTAGE_DEAD is not None) and (STAND_PERCENTAGE_DEAD >= 25)))"),
+    245: (1270, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > EARLIEST_NONLOGGING_DIST_TYPE == 'IBM' > dist_lag <= 5 > BCLCS_LEVEL_5 not in ['DE'] > ((STAND_PERCENTAGE_DEAD is not None) and (STAND_PERCENTAGE_DEAD > 50))"),
+    246: (1274, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > EARLIEST_NONLOGGING_DIST_TYPE == 'IBM' > dist_lag <= 5 > BCLCS_LEVEL_5 not in ['DE'] > ((STAND_PERCENTAGE_DEAD is not None) and (STAND_PERCENTAGE_DEAD >= 25))"),
+    247: (1277, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > EARLIEST_NONLOGGING_DIST_TYPE == 'IBM' > dist_lag <= 5 > BCLCS_LEVEL_5 not in ['DE'] > not (((STAND_PERCENTAGE_DEAD is not None) and (STAND_PERCENTAGE_DEAD >= 25)))"),
+    248: (1283, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > EARLIEST_NONLOGGING_DIST_TYPE == 'IBM' > dist_lag > 5 > BCLCS_LEVEL_5 in ['DE'] > ((STAND_PERCENTAGE_DEAD is not None) and (STAND_PERCENTAGE_DEAD > 50))"),
+    249: (1287, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > EARLIEST_NONLOGGING_DIST_TYPE == 'IBM' > dist_lag > 5 > BCLCS_LEVEL_5 in ['DE'] > ((STAND_PERCENTAGE_DEAD is not None) and (STAND_PERCENTAGE_DEAD >= 25))"),
+    250: (1290, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > EARLIEST_NONLOGGING_DIST_TYPE == 'IBM' > dist_lag > 5 > BCLCS_LEVEL_5 in ['DE'] > not (((STAND_PERCENTAGE_DEAD is not None) and (STAND_PERCENTAGE_DEAD >= 25)))"),
+    251: (1295, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > EARLIEST_NONLOGGING_DIST_TYPE == 'IBM' > dist_lag > 5 > BCLCS_LEVEL_5 not in ['DE'] > ((STAND_PERCENTAGE_DEAD is not None) and (STAND_PERCENTAGE_DEAD > 50))"),
+    252: (1299, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > EARLIEST_NONLOGGING_DIST_TYPE == 'IBM' > dist_lag > 5 > BCLCS_LEVEL_5 not in ['DE'] > ((STAND_PERCENTAGE_DEAD is not None) and (STAND_PERCENTAGE_DEAD >= 25))"),
+    253: (1302, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > EARLIEST_NONLOGGING_DIST_TYPE == 'IBM' > dist_lag > 5 > BCLCS_LEVEL_5 not in ['DE'] > not (((STAND_PERCENTAGE_DEAD is not None) and (STAND_PERCENTAGE_DEAD >= 25)))"),
+    254: (1305, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B') > PROJ_HEIGHT_1 > 12 > CROWN_CLOSURE >= 40 > EARLIEST_NONLOGGING_DIST_TYPE != 'IBM'"),
+    255: (1310, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > not (SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B')) > CROWN_CLOSURE < 40 > BEC_ZONE_CODE in ['IDF', 'PP', 'BG', 'SBPS', 'MS']"),
+    256: (1313, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > not (SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B')) > CROWN_CLOSURE < 40 > BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH']"),
+    257: (1316, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > not (SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B')) > CROWN_CLOSURE < 40 > BEC_ZONE_CODE not in ['CWH', 'CDF', 'ICH']"),
+    258: (1319, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = lodgepone pine > not (harv_lag is not None and harv_lag <= 7) > BCLCS_LEVEL_5 not in ['SP'] > PROJ_HEIGHT_1 >= 4 > not (SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B')) > CROWN_CLOSURE >= 40"),
+    259: (1324, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = ponderosa pine > (harv_lag is not None) and (harv_lag <= 7)'),
+    260: (1328, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = ponderosa pine > not ((harv_lag is not None) and (harv_lag <= 7)) > PROJ_HEIGHT_1 < 4 > dormant season'),
+    261: (1330, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = ponderosa pine > not ((harv_lag is not None) and (harv_lag <= 7)) > PROJ_HEIGHT_1 < 4 > growing season'),
+    262: (1333, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = ponderosa pine > not ((harv_lag is not None) and (harv_lag <= 7)) > PROJ_HEIGHT_1 >= 4 > BCLCS_LEVEL_5 in ['DE']"),
+    263: (1335, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = ponderosa pine > not ((harv_lag is not None) and (harv_lag <= 7)) > PROJ_HEIGHT_1 >= 4 > BCLCS_LEVEL_5 not in ['DE']"),
+    264: (1339, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = other pine > BCLCS_LEVEL_5 in ['DE']"),
+    265: (1342, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = other pine > BCLCS_LEVEL_5 not in ['DE'] > stocking >= 900"),
+    266: (1344, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = other pine > BCLCS_LEVEL_5 not in ['DE'] > stocking >= 600"),
+    267: (1346, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = other pine > BCLCS_LEVEL_5 not in ['DE'] > stocking < 600"),
+    268: (1352, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > harv_lag is not None and harv_lag <= 6 > (BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')"),
+    269: (1354, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > harv_lag is not None and harv_lag <= 6 > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet'))"),
+    270: (1360, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > not (harv_lag is not None and harv_lag <= 6) > PROJ_HEIGHT_1 < 4 > (BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet') > dormant season"),
+    271: (1363, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > not (harv_lag is not None and harv_lag <= 6) > PROJ_HEIGHT_1 < 4 > (BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet') > growing season"),
+    272: (1367, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > not (harv_lag is not None and harv_lag <= 6) > PROJ_HEIGHT_1 < 4 > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > dormant season"),
+    273: (1370, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > not (harv_lag is not None and harv_lag <= 6) > PROJ_HEIGHT_1 < 4 > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > growing season"),
+    274: (1377, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > not (harv_lag is not None and harv_lag <= 6) > PROJ_HEIGHT_1 >= 4 > CROWN_CLOSURE > 55 > PROJ_HEIGHT_1 <= 12 > (BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')"),
+    275: (1382, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > not (harv_lag is not None and harv_lag <= 6) > PROJ_HEIGHT_1 >= 4 > CROWN_CLOSURE > 55 > PROJ_HEIGHT_1 <= 12 > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > ((STAND_PERCENTAGE_DEAD is not None) and (STAND_PERCENTAGE_DEAD > 34))"),
+    276: (1386, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > not (harv_lag is not None and harv_lag <= 6) > PROJ_HEIGHT_1 >= 4 > CROWN_CLOSURE > 55 > PROJ_HEIGHT_1 <= 12 > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > not (((STAND_PERCENTAGE_DEAD is not None) and (STAND_PERCENTAGE_DEAD > 34))) > SPECIES_CD_2 == 'PY'"),
+    277: (1389, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > not (harv_lag is not None and harv_lag <= 6) > PROJ_HEIGHT_1 >= 4 > CROWN_CLOSURE > 55 > PROJ_HEIGHT_1 <= 12 > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > not (((STAND_PERCENTAGE_DEAD is not None) and (STAND_PERCENTAGE_DEAD > 34))) > SPECIES_CD_2 != 'PY'"),
+    278: (1394, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > not (harv_lag is not None and harv_lag <= 6) > PROJ_HEIGHT_1 >= 4 > CROWN_CLOSURE > 55 > PROJ_HEIGHT_1 > 12 > (BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')"),
+    279: (1397, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > not (harv_lag is not None and harv_lag <= 6) > PROJ_HEIGHT_1 >= 4 > CROWN_CLOSURE > 55 > PROJ_HEIGHT_1 > 12 > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet'))"),
+    280: (1402, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > not (harv_lag is not None and harv_lag <= 6) > PROJ_HEIGHT_1 >= 4 > CROWN_CLOSURE >= 26 or CROWN_CLOSURE is None > (BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')"),
+    281: (1405, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > not (harv_lag is not None and harv_lag <= 6) > PROJ_HEIGHT_1 >= 4 > CROWN_CLOSURE >= 26 or CROWN_CLOSURE is None > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet'))"),
+    282: (1411, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > not (harv_lag is not None and harv_lag <= 6) > PROJ_HEIGHT_1 >= 4 > not (CROWN_CLOSURE >= 26 or CROWN_CLOSURE is None) > (BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet') > dormant season"),
+    283: (1414, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > not (harv_lag is not None and harv_lag <= 6) > PROJ_HEIGHT_1 >= 4 > not (CROWN_CLOSURE >= 26 or CROWN_CLOSURE is None) > (BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet') > growing season"),
+    284: (1418, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > not (harv_lag is not None and harv_lag <= 6) > PROJ_HEIGHT_1 >= 4 > not (CROWN_CLOSURE >= 26 or CROWN_CLOSURE is None) > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > dormant season"),
+    285: (1421, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = douglas-fir > not (harv_lag is not None and harv_lag <= 6) > PROJ_HEIGHT_1 >= 4 > not (CROWN_CLOSURE >= 26 or CROWN_CLOSURE is None) > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > growing season"),
+    286: (1428, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > harv_lag is not None and harv_lag <= 6 > (BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')"),
+    287: (1430, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > harv_lag is not None and harv_lag <= 6 > not ((BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet'))"),
+    288: (1434, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 == 'SE' > BCLCS_LEVEL_5 in ['SP']"),
+    289: (1438, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 == 'SE' > BCLCS_LEVEL_5 not in ['SP'] > SPECIES_CD_2 in ['BL', 'B', 'PL', 'P', 'PLI'] > BCLCS_LEVEL_5 in ['DE']"),
+    290: (1441, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 == 'SE' > BCLCS_LEVEL_5 not in ['SP'] > SPECIES_CD_2 in ['BL', 'B', 'PL', 'P', 'PLI'] > BCLCS_LEVEL_5 not in ['DE']"),
+    291: (1445, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 == 'SE' > BCLCS_LEVEL_5 not in ['SP'] > SPECIES_CD_2 in ['HW', 'HM', 'CW', 'YC'] > BCLCS_LEVEL_5 in ['DE']"),
+    292: (1448, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 == 'SE' > BCLCS_LEVEL_5 not in ['SP'] > SPECIES_CD_2 in ['HW', 'HM', 'CW', 'YC'] > BCLCS_LEVEL_5 not in ['DE']"),
+    293: (1451, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 == 'SE' > BCLCS_LEVEL_5 not in ['SP'] > SPECIES_CD_2 not in ['HW', 'HM', 'CW', 'YC']"),
+    294: (1454, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 in ['SS']"),
+    295: (1457, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 in ['SB'] > BCLCS_LEVEL_5 in ['DE', 'OP']"),
+    296: (1460, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 in ['SB'] > BCLCS_LEVEL_5 not in ['DE', 'OP'] > BEC_ZONE_CODE in ['BWBS']"),
+    297: (1463, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 in ['SB'] > BCLCS_LEVEL_5 not in ['DE', 'OP'] > BEC_ZONE_CODE not in ['BWBS']"),
+    298: (1468, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 not in ['SB'] > BEC_ZONE_CODE in ['BWBS'] > BCLCS_LEVEL_5 in ['DE']"),
+    299: (1471, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 not in ['SB'] > BEC_ZONE_CODE in ['BWBS'] > BCLCS_LEVEL_5 in ['OP']"),
+    300: (1474, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 not in ['SB'] > BEC_ZONE_CODE in ['BWBS'] > BCLCS_LEVEL_5 not in ['OP']"),
+    301: (1482, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 not in ['SB'] > BEC_ZONE_CODE not in ['BWBS'] > BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] > (SPECIES_CD_2 in ['BL', 'B']) or SPECIES_CD_2.startswith('P') > BCLCS_LEVEL_5 in ['SP']"),
+    302: (1485, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 not in ['SB'] > BEC_ZONE_CODE not in ['BWBS'] > BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] > (SPECIES_CD_2 in ['BL', 'B']) or SPECIES_CD_2.startswith('P') > BCLCS_LEVEL_5 not in ['SP']"),
+    303: (1488, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 not in ['SB'] > BEC_ZONE_CODE not in ['BWBS'] > BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] > not ((SPECIES_CD_2 in ['BL', 'B']) or SPECIES_CD_2.startswith('P'))"),
+    304: (1492, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 not in ['SB'] > BEC_ZONE_CODE not in ['BWBS'] > BEC_ZONE_CODE not in ['CWH', 'MH', 'CDF'] > BCLCS_LEVEL_5 in ['SP']"),
+    305: (1496, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 not in ['SB'] > BEC_ZONE_CODE not in ['BWBS'] > BEC_ZONE_CODE not in ['CWH', 'MH', 'CDF'] > BCLCS_LEVEL_5 not in ['SP'] > BCLCS_LEVEL_5 in ['DE']"),
+    306: (1500, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 not in ['SB'] > BEC_ZONE_CODE not in ['BWBS'] > BEC_ZONE_CODE not in ['CWH', 'MH', 'CDF'] > BCLCS_LEVEL_5 not in ['SP'] > BCLCS_LEVEL_5 not in ['DE'] > STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD > 34"),
+    307: (1504, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 not in ['SB'] > BEC_ZONE_CODE not in ['BWBS'] > BEC_ZONE_CODE not in ['CWH', 'MH', 'CDF'] > BCLCS_LEVEL_5 not in ['SP'] > BCLCS_LEVEL_5 not in ['DE'] > not (STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD > 34) > SPECIES_CD_2 in ['PL', 'PLI', 'P']"),
+    308: (1507, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = spruce > not (harv_lag is not None and harv_lag <= 6) > SPECIES_CD_1 not in ['SB'] > BEC_ZONE_CODE not in ['BWBS'] > BEC_ZONE_CODE not in ['CWH', 'MH', 'CDF'] > BCLCS_LEVEL_5 not in ['SP'] > BCLCS_LEVEL_5 not in ['DE'] > not (STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD > 34) > SPECIES_CD_2 not in ['PL', 'PLI', 'P']"),
+    309: (1513, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = redcedar, yellow cedar or hemlock > harv_lag is not None and harv_lag <= 6'),
+    310: (1518, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = redcedar, yellow cedar or hemlock > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'DE' > PROJ_HEIGHT_1 < 4 > dormant season"),
+    311: (1521, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = redcedar, yellow cedar or hemlock > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'DE' > PROJ_HEIGHT_1 < 4 > growing season"),
+    312: (1524, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = redcedar, yellow cedar or hemlock > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'DE' > PROJ_HEIGHT_1 <= 15"),
+    313: (1527, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = redcedar, yellow cedar or hemlock > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'DE' > PROJ_HEIGHT_1 > 15 > PROJ_AGE_1 < 60"),
+    314: (1531, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = redcedar, yellow cedar or hemlock > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'DE' > PROJ_HEIGHT_1 > 15 > PROJ_AGE_1 <= 99 > dormant season"),
+    315: (1534, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = redcedar, yellow cedar or hemlock > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'DE' > PROJ_HEIGHT_1 > 15 > PROJ_AGE_1 <= 99 > growing season"),
+    316: (1537, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = redcedar, yellow cedar or hemlock > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 == 'DE' > PROJ_HEIGHT_1 > 15 > PROJ_AGE_1 > 99"),
+    317: (1540, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = redcedar, yellow cedar or hemlock > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 in ['OP']"),
+    318: (1543, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = redcedar, yellow cedar or hemlock > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 not in ['OP'] > dormant season"),
+    319: (1545, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = redcedar, yellow cedar or hemlock > not (harv_lag is not None and harv_lag <= 6) > BCLCS_LEVEL_5 not in ['OP'] > growing season"),
+    320: (1548, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = grand fir'),
+    321: (1552, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = amabalis fir > SPECIES_CD_2 in ['SE', 'SW', 'S']"),
+    322: (1555, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = amabalis fir > SPECIES_CD_2 not in ['SE', 'SW', 'S'] > dormant season"),
+    323: (1557, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = amabalis fir > SPECIES_CD_2 not in ['SE', 'SW', 'S'] > growing season"),
+    324: (1562, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = other fir > COAST_INTERIOR_CD == 'C' > dormant season"),
+    325: (1564, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = other fir > COAST_INTERIOR_CD == 'C' > growing season"),
+    326: (1567, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = other fir > COAST_INTERIOR_CD != 'C' > BCLCS_LEVEL_5 in ['SP']"),
+    327: (1570, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = other fir > COAST_INTERIOR_CD != 'C' > BCLCS_LEVEL_5 in ['DE'] > SPECIES_CD_2 in ['SE', 'SW', 'S']"),
+    328: (1572, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = other fir > COAST_INTERIOR_CD != 'C' > BCLCS_LEVEL_5 in ['DE'] > SPECIES_CD_2 not in ['SE', 'SW', 'S']"),
+    329: (1574, "Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = other fir > COAST_INTERIOR_CD != 'C' > BCLCS_LEVEL_5 not in ['DE']"),
+    330: (1577, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = yew'),
+    331: (1580, 'Site vegetated > Site forested > Site not recently burned > SPECIES_PCT_1 < 80 > Mixed-species conifer or mixedwood stands > 81-100% conifer = pure conifer, mixed-species stands > Dominant conifer = juniper'),
+    332: (1587, 'Site vegetated > Non-forested site > Site recently burned > dist_lag <= 1'),
+    333: (1590, 'Site vegetated > Non-forested site > Site recently burned > dist_lag <= 3 > dormant season'),
+    334: (1592, 'Site vegetated > Non-forested site > Site recently burned > dist_lag <= 3 > growing season'),
+    335: (1595, 'Site vegetated > Non-forested site > Site recently burned > dist_lag > 3 > dormant season'),
+    336: (1597, 'Site vegetated > Non-forested site > Site recently burned > dist_lag > 3 > growing season'),
+    337: (1605, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag <= 7 > str(SPECIES_CD_1).startswith('P')"),
+    338: (1607, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag <= 7 > str(SPECIES_CD_1).startswith('S') or str(SPECIES_CD_1).startswith('B')"),
+    339: (1609, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag <= 7 > (SPECIES_CD_1 in ['CW', 'YC']) or str(SPECIES_CD_1).startswith('H')"),
+    340: (1612, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag <= 7 > str(SPECIES_CD_1).startswith('FD') > BEC_ZONE_CODE in ['CWH', 'ICH']"),
+    341: (1614, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag <= 7 > str(SPECIES_CD_1).startswith('FD') > BEC_ZONE_CODE not in ['CWH', 'ICH']"),
+    342: (1616, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag <= 7 > not (str(SPECIES_CD_1).startswith('FD'))"),
+    343: (1621, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag <= 24 > (BEC_ZONE_CODE in ['CWH', 'MH']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet') > dormant season"),
+    344: (1623, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag <= 24 > (BEC_ZONE_CODE in ['CWH', 'MH']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet') > growing season"),
+    345: (1626, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag <= 24 > not ((BEC_ZONE_CODE in ['CWH', 'MH']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > dormant season"),
+    346: (1628, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag <= 24 > not ((BEC_ZONE_CODE in ['CWH', 'MH']) or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')) > growing season"),
+    347: (1631, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE in ['CMA', 'IMA']"),
+    348: (1634, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'BAFA' > dormant season"),
+    349: (1636, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'BAFA' > growing season"),
+    350: (1640, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'CWH' > dry_wet == 'dry' > dormant season"),
+    351: (1642, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'CWH' > dry_wet == 'dry' > growing season"),
+    352: (1644, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'CWH' > dry_wet != 'dry'"),
+    353: (1646, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'BWBS'"),
+    354: (1649, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'SWB' > dormant season"),
+    355: (1651, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'SWB' > growing season"),
+    356: (1653, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'SBS'"),
+    357: (1655, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'SBPS'"),
+    358: (1657, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'MS'"),
+    359: (1660, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'IDF' > dry_wet == 'dry'"),
+    360: (1662, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'IDF' > dry_wet != 'dry'"),
+    361: (1665, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'PP' > dormant season"),
+    362: (1667, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'PP' > growing season"),
+    363: (1670, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'BG' > dormant season"),
+    364: (1672, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'BG' > growing season"),
+    365: (1675, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'MH' > dormant season"),
+    366: (1677, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'MH' > growing season"),
+    367: (1679, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'ESSF'"),
+    368: (1682, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'CDF' > dry_wet == 'dry'"),
+    369: (1684, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'CDF' > dry_wet != 'dry'"),
+    370: (1687, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'ICH' > dry_wet == 'dry'"),
+    371: (1689, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE == 'ICH' > dry_wet != 'dry'"),
+    372: (1691, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is not None > harv_lag > 24 > BEC_ZONE_CODE != 'ICH'"),
+    373: (1696, 'Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag <= 5'),
+    374: (1700, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag <= 24 > BEC_ZONE_CODE in ['CWH', 'MH', 'ICH'] > dormant season"),
+    375: (1702, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag <= 24 > BEC_ZONE_CODE in ['CWH', 'MH', 'ICH'] > growing season"),
+    376: (1705, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag <= 24 > BEC_ZONE_CODE not in ['CWH', 'MH', 'ICH'] > dormant season"),
+    377: (1707, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag <= 24 > BEC_ZONE_CODE not in ['CWH', 'MH', 'ICH'] > growing season"),
+    378: (1710, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE in ['CMA', 'IMA']"),
+    379: (1713, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'BAFA' > dormant season"),
+    380: (1715, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'BAFA' > growing season"),
+    381: (1719, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'CWH' > dry_wet == 'dry' > dormant season"),
+    382: (1721, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'CWH' > dry_wet == 'dry' > growing season"),
+    383: (1723, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'CWH' > dry_wet != 'dry'"),
+    384: (1725, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'BWBS'"),
+    385: (1728, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'SWB' > dormant season"),
+    386: (1730, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'SWB' > growing season"),
+    387: (1732, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'SBS'"),
+    388: (1734, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'SBPS'"),
+    389: (1736, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'MS'"),
+    390: (1739, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'IDF' > dry_wet == 'dry'"),
+    391: (1742, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'IDF' > dry_wet != 'dry' > dormant season"),
+    392: (1744, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'IDF' > dry_wet != 'dry' > growing season"),
+    393: (1747, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'PP' > dormant season"),
+    394: (1749, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'PP' > growing season"),
+    395: (1752, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'BG' > dormant season"),
+    396: (1754, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'BG' > growing season"),
+    397: (1757, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'MH' > dormant season"),
+    398: (1759, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'MH' > growing season"),
+    399: (1761, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'ESSF'"),
+    400: (1764, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'CDF' > dry_wet == 'dry'"),
+    401: (1766, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'CDF' > dry_wet != 'dry'"),
+    402: (1770, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'ICH' > dry_wet == 'dry' > dormant season"),
+    403: (1772, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'ICH' > dry_wet == 'dry' > growing season"),
+    404: (1774, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE == 'ICH' > dry_wet != 'dry'"),
+    405: (1776, "Site vegetated > Non-forested site > Site not recently burned > Site logged > SPECIES_CD_1 is None > harv_lag > 24 > BEC_ZONE_CODE != 'ICH'"),
+    406: (1783, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is not None > BEC_ZONE_CODE in ['CMA', 'IMA']"),
+    407: (1786, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is not None > BEC_ZONE_CODE in ['CWH', 'MH', 'ICH', 'BAFA'] > dormant season"),
+    408: (1788, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is not None > BEC_ZONE_CODE in ['CWH', 'MH', 'ICH', 'BAFA'] > growing season"),
+    409: (1791, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is not None > BEC_ZONE_CODE not in ['CWH', 'MH', 'ICH', 'BAFA'] > dormant season"),
+    410: (1793, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is not None > BEC_ZONE_CODE not in ['CWH', 'MH', 'ICH', 'BAFA'] > growing season"),
+    411: (1799, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD == 'F' > NON_PRODUCTIVE_CD in [11, 12, 13] > BEC_ZONE_CODE in ['CWH', 'MH', 'ICH'] > dormant season"),
+    412: (1801, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD == 'F' > NON_PRODUCTIVE_CD in [11, 12, 13] > BEC_ZONE_CODE in ['CWH', 'MH', 'ICH'] > growing season"),
+    413: (1804, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD == 'F' > NON_PRODUCTIVE_CD in [11, 12, 13] > BEC_ZONE_CODE not in ['CWH', 'MH', 'ICH'] > dormant season"),
+    414: (1806, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD == 'F' > NON_PRODUCTIVE_CD in [11, 12, 13] > BEC_ZONE_CODE not in ['CWH', 'MH', 'ICH'] > growing season"),
+    415: (1808, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD == 'F' > NON_PRODUCTIVE_CD == 35"),
+    416: (1810, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD == 'F' > NON_PRODUCTIVE_CD == 42"),
+    417: (1813, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD == 'F' > NON_PRODUCTIVE_CD in [60, 62, 63] > dormant season"),
+    418: (1815, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD == 'F' > NON_PRODUCTIVE_CD in [60, 62, 63] > growing season"),
+    419: (1818, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD == 'F' > NON_PRODUCTIVE_CD is None > BEC_ZONE_CODE in ['CMA', 'IMA']"),
+    420: (1821, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD == 'F' > NON_PRODUCTIVE_CD is None > BEC_ZONE_CODE in ['CWH', 'MH', 'ICH'] > dormant season"),
+    421: (1823, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD == 'F' > NON_PRODUCTIVE_CD is None > BEC_ZONE_CODE in ['CWH', 'MH', 'ICH'] > growing season"),
+    422: (1826, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD == 'F' > NON_PRODUCTIVE_CD is None > BEC_ZONE_CODE not in ['CWH', 'MH', 'ICH'] > dormant season"),
+    423: (1828, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD == 'F' > NON_PRODUCTIVE_CD is None > BEC_ZONE_CODE not in ['CWH', 'MH', 'ICH'] > growing season"),
+    424: (1830, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD == 'F' > not (NON_PRODUCTIVE_CD is None)"),
+    425: (1833, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD != 'F' > LAND_COVER_CLASS_CD_1 in ['LA', 'RE', 'RI', 'OC']"),
+    426: (1836, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD != 'F' > LAND_COVER_CLASS_CD_1 == 'HG' > dormant season"),
+    427: (1838, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD != 'F' > LAND_COVER_CLASS_CD_1 == 'HG' > growing season"),
+    428: (1841, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD != 'F' > LAND_COVER_CLASS_CD_1 in ['BY', 'BM', 'BL'] > dormant season"),
+    429: (1843, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD != 'F' > LAND_COVER_CLASS_CD_1 in ['BY', 'BM', 'BL'] > growing season"),
+    430: (1846, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD != 'F' > LAND_COVER_CLASS_CD_1 in ['SL', 'ST', 'HE', 'HF', None] > BEC_ZONE_CODE in ['CMA', 'IMA']"),
+    431: (1849, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD != 'F' > LAND_COVER_CLASS_CD_1 in ['SL', 'ST', 'HE', 'HF', None] > BEC_ZONE_CODE in ['CWH', 'MH', 'ICH'] > dormant season"),
+    432: (1851, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD != 'F' > LAND_COVER_CLASS_CD_1 in ['SL', 'ST', 'HE', 'HF', None] > BEC_ZONE_CODE in ['CWH', 'MH', 'ICH'] > growing season"),
+    433: (1854, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD != 'F' > LAND_COVER_CLASS_CD_1 in ['SL', 'ST', 'HE', 'HF', None] > BEC_ZONE_CODE not in ['CWH', 'MH', 'ICH'] > dormant season"),
+    434: (1856, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD != 'F' > LAND_COVER_CLASS_CD_1 in ['SL', 'ST', 'HE', 'HF', None] > BEC_ZONE_CODE not in ['CWH', 'MH', 'ICH'] > growing season"),
+    435: (1858, "Site vegetated > Non-forested site > Site not recently burned > Site not logged > SPECIES_CD_1 is None > INVENTORY_STANDARD_CD != 'F' > LAND_COVER_CLASS_CD_1 not in ['SL', 'ST', 'HE', 'HF', None]"),
+}
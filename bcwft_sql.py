@@ -0,0 +1,584 @@
+# -*- coding: utf-8 -*-
+"""
+SQL generator for the BC Wildfire Fuel Typing decision tree.
+
+Compiles the declarative rule specification (bcwft_rules.DECISION_TREE) into a SQL query for SQLite (including
+GeoPackages) and DuckDB, so VRI tables can be fuel typed inside the database. The query derives the bcwft
+variables (lags, conifer percentage, dry/wet subzones and the dominant conifer checks) in common table expressions,
+then evaluates the decision tree as CASE expressions giving the same leaves as FuelTyping.decisionTree. The results
+can be selected, saved as a view, or written to the table with an UPDATE statement. Requires SQLite 3.35 or later.
+
+Usage:
+    python bcwft_sql.py TABLE [--season SEASON] [--dialect {sqlite,duckdb}] [--reference-year YEAR] [--key KEY]
+                              [--view VIEW | --update] [--verify DATABASE]
+"""
+__author__ = ['Gregory A. Greene, map.n.trowel@gmail.com']
+
+import ast
+import sys
+import argparse
+from typing import NamedTuple
+
+import numpy as np
+
+import bcwft2018
+from bcwft_codegen import check_rules, _parse, _leaves, _seasonal_pairs, _species_groups, _CODES, _NUMBERS, _LAGS, \
+    _FLAGS, _IMPLIES
+from bcwft_rules import DECISION_TREE, Seasonal, Otherwise
+
+
+class _Dialect(NamedTuple):
+    """
+    SQL expressions that differ between database engines
+    """
+    code: str  # Code fields are compared as text
+    number: str  # Numbers are compared as floats, with invalid numbers as NULL
+    year: str  # Year of a date (NULL for missing or invalid dates)
+    current_year: str
+    greatest: str  # Largest of several values, none of them NULL
+    real: str  # Floating point type
+
+
+_DIALECTS = {
+    'sqlite': _Dialect(code='CAST({} AS TEXT)',
+                       number='CAST({} AS REAL)',
+                       year="CAST(strftime('%Y', substr({}, 1, 10)) AS INTEGER)",
+                       current_year="CAST(strftime('%Y', 'now') AS INTEGER)",
+                       greatest='max',
+                       real='REAL'),
+    'duckdb': _Dialect(code='CAST({} AS VARCHAR)',
+                       number='TRY_CAST({} AS DOUBLE)',
+                       year='year(TRY_CAST(substr(CAST({} AS VARCHAR), 1, 10) AS DATE))',
+                       current_year='year(current_date)',
+                       greatest='greatest',
+                       real='DOUBLE'),
+}
+
+# Columns of the derived variables that are precomputed as StandBatch membership bits
+_MEMBERSHIP = {('SPECIES_CD_1', 'coniferList'): 'cnfr_1',
+               ('BEC_ZONE_CODE', 'dryBECzones'): 'is_dry_zone',
+               ('dry_wet', 'dry'): 'is_dry',
+               ('dry_wet', 'wet'): 'is_wet'}
+
+# Number of nested branch lists evaluated in one stage of the query. Deeper lists are evaluated in the next stage,
+# as the default SQLite parser stack cannot hold the whole decision tree in one CASE expression.
+_STAGE_DEPTH = 4
+_BLOCK = 10000  # Leaf values of the stands continuing to a branch list of the next stage (_BLOCK + block number)
+
+# Percentage below any species percentage, standing in for NULL in the dominant conifer checks
+_NO_PRCNT = '-1.0e308'
+
+
+def _literal(value) -> str:
+    """
+    Function to write a value, or a list of values, as a SQL literal.
+    """
+    if isinstance(value, (list, tuple)):
+        return '(' + ', '.join(_literal(v) for v in value) + ')'
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    if isinstance(value, bool) or value is None:
+        raise ValueError(f'Unsupported SQL literal: {value!r}')
+    return repr(value)
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class _Test(NamedTuple):
+    """
+    SQL expression of a test. The expression is never NULL: NULL inputs get the result of the Python test.
+    """
+    value: str
+    compound: bool = False
+    fails: tuple = ()  # (guards, variable) pairs: decisionTree raises where all guards are true and the variable is null
+    true_nonnull: frozenset = frozenset()  # variables that are not null where the test is true
+    false_nonnull: frozenset = frozenset()  # variables that are not null where the test is false
+    const: bool = None
+
+
+def _not(t: _Test) -> str:
+    return f'NOT ({t.value})' if t.compound else f'NOT {t.value}'
+
+
+class _CaseWriter:
+    """
+    Writes the decision tree as a CASE expression over the columns of the derived bcwft variables
+    """
+    def __init__(self):
+        self.groups = _species_groups(DECISION_TREE)
+        self.blocks = []  # (stage, CASE expression lines) of the branch lists evaluated in later stages
+
+    #### Tests
+    def test(self, node: ast.expr, known: frozenset) -> _Test:
+        if isinstance(node, ast.BoolOp):
+            result = self.test(node.values[0], known)
+            for value in node.values[1:]:
+                result = self.combine(result, value, isinstance(node.op, ast.And), known)
+            return result
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            t = self.test(node.operand, known)
+            if t.const is not None:
+                return _Test('', const=not t.const)
+            return _Test(_not(t), False, t.fails, t.false_nonnull, t.true_nonnull)
+        if isinstance(node, ast.Name) and node.id in _FLAGS:
+            implied = frozenset([_IMPLIES[node.id]]) if node.id in _IMPLIES else frozenset()
+            return _Test(node.id, true_nonnull=implied)
+        if isinstance(node, ast.Compare):
+            if len(node.ops) != 1:
+                raise ValueError(f'Chained comparisons are not supported: {ast.unparse(node)}')
+            return self.compare(node.left, node.ops[0], node.comparators[0], known)
+        if isinstance(node, ast.Call):
+            return self.call(node, known)
+        raise ValueError(f'Unsupported rule test: {ast.unparse(node)}')
+
+    def combine(self, a: _Test, node: ast.expr, isAnd: bool, known: frozenset) -> _Test:
+        # Short-circuit evaluation: the second test is only evaluated where the first is true (and) or false (or)
+        if a.const is not None and a.const != isAnd:
+            return a
+        b = self.test(node, known | (a.true_nonnull if isAnd else a.false_nonnull))
+        if a.const is not None:
+            return b
+        if b.const is not None:
+            if b.const == isAnd:
+                return a
+            return _Test('', const=b.const)
+
+        reached = (f'({a.value})' if a.compound else a.value) if isAnd else _not(a)
+        fails = a.fails + tuple(((reached,) + guards, name) for guards, name in b.fails
+                                if name not in (a.true_nonnull if isAnd else a.false_nonnull))
+
+        op = ' AND ' if isAnd else ' OR '
+        value = op.join(f'({t.value})' if t.compound else t.value for t in (a, b))
+        if isAnd:
+            trueNonnull = a.true_nonnull | b.true_nonnull
+            falseNonnull = a.false_nonnull & (a.true_nonnull | b.false_nonnull)
+        else:
+            trueNonnull = a.true_nonnull & (a.false_nonnull | b.true_nonnull)
+            falseNonnull = a.false_nonnull | b.false_nonnull
+        return _Test(value, True, fails, trueNonnull, falseNonnull)
+
+    def compare(self, left: ast.expr, op: ast.cmpop, right: ast.expr, known: frozenset) -> _Test:
+        if not isinstance(left, ast.Name):
+            raise ValueError(f'Unsupported comparison: {ast.unparse(left)}')
+        name = left.id
+        nonnull = frozenset([name])
+
+        if isinstance(op, (ast.Is, ast.IsNot)):
+            if not (isinstance(right, ast.Constant) and right.value is None):
+                raise ValueError(f'Only "is None" comparisons are supported: {name}')
+            isNot = isinstance(op, ast.IsNot)
+            if name in _LAGS:
+                # A NULL date is missing from the dataset, which pandas reads as NaT: its lag is NaN, never None
+                return _Test('', const=isNot)
+            if name in _CODES:
+                if isNot:
+                    return _Test(f'{name} IS NOT NULL', true_nonnull=nonnull)
+                return _Test(f'{name} IS NULL', false_nonnull=nonnull)
+            if name == 'is_vegetated':
+                # is_vegetated is None where BCLCS_LEVEL_1 is neither "V" nor "N"
+                isVegetatedOrNot = "COALESCE(BCLCS_LEVEL_1 IN ('V', 'N'), FALSE)"
+                return _Test(isVegetatedOrNot if isNot else f'NOT {isVegetatedOrNot}')
+            if name in _NUMBERS:
+                # Missing numbers are NaN, never None
+                return _Test('', const=isNot)
+            raise ValueError(f'Unsupported None test: {name}')
+
+        if isinstance(op, (ast.In, ast.NotIn)):
+            if isinstance(right, ast.Name):
+                if (name, right.id) not in _MEMBERSHIP:
+                    raise ValueError(f'Unsupported list test: {name} in {right.id}')
+                t = _Test(_MEMBERSHIP[(name, right.id)], true_nonnull=nonnull)
+            else:
+                values = ast.literal_eval(right)
+                withNone = None in values
+                values = [v for v in values if v is not None]
+                if name in _CODES:
+                    if '' in values:
+                        raise ValueError(f'Empty codes cannot be tested: {name}')
+                    t = _Test(f'COALESCE({name} IN {_literal(values)}, {str(withNone).upper()})',
+                              true_nonnull=frozenset() if withNone else nonnull)
+                elif name in _NUMBERS:
+                    # NaN is not in the list
+                    t = _Test(f'COALESCE({name} IN {_literal(values)}, FALSE)')
+                else:
+                    raise ValueError(f'Unsupported list test: {name}')
+            if isinstance(op, ast.NotIn):
+                return _Test(_not(t), false_nonnull=t.true_nonnull)
+            return t
+
+        value = ast.literal_eval(right)
+        if name == 'dry_wet' and isinstance(op, (ast.Eq, ast.NotEq)):
+            if (name, value) not in _MEMBERSHIP:
+                raise ValueError(f'Unsupported dry_wet test: {value!r}')
+            column = _MEMBERSHIP[(name, value)]
+            return _Test(column) if isinstance(op, ast.Eq) else _Test(f'NOT {column}')
+        if name in _CODES and isinstance(op, (ast.Eq, ast.NotEq)):
+            if value == '':
+                raise ValueError(f'Empty codes cannot be tested: {name}')
+            t = _Test(f'COALESCE({name} = {_literal(value)}, FALSE)')
+            if isinstance(op, ast.Eq):
+                return t._replace(true_nonnull=nonnull)
+            return _Test(_not(t), false_nonnull=nonnull)
+        symbol = {ast.Eq: '=', ast.NotEq: '<>', ast.Lt: '<', ast.LtE: '<=', ast.Gt: '>', ast.GtE: '>='}[type(op)]
+        # NaN is only unequal to numbers
+        condition = f"COALESCE({name} {symbol} {_literal(value)}, {'TRUE' if symbol == '<>' else 'FALSE'})"
+        if name in _NUMBERS or name in _LAGS:
+            # The lags of NULL dates are NaN, so comparing them never raises
+            return _Test(condition)
+        raise ValueError(f'Unsupported comparison: {name} {symbol} {value!r}')
+
+    def call(self, node: ast.Call, known: frozenset) -> _Test:
+        func = node.func
+        if isinstance(func, ast.Name) and func.id == 'dominant':
+            group = tuple(ast.literal_eval(a) for a in node.args)
+            return _Test(f'dom_{self.groups.index(group)}')
+        if isinstance(func, ast.Attribute) and func.attr == 'startswith':
+            prefix = ast.literal_eval(node.args[0])
+            obj = func.value
+            if not isinstance(prefix, str):
+                raise ValueError(f'Unsupported rule test: {ast.unparse(node)}')
+            if isinstance(obj, ast.Call) and isinstance(obj.func, ast.Name) and obj.func.id == 'str':
+                # str(None) is "None"
+                name = obj.args[0].id
+                withNone = 'None'.startswith(prefix)
+                return _Test(f'COALESCE(substr({name}, 1, {len(prefix)}) = {_literal(prefix)}, '
+                             f'{str(withNone).upper()})', true_nonnull=frozenset() if withNone else frozenset([name]))
+            if isinstance(obj, ast.Name) and obj.id in _CODES:
+                # None has no startswith method
+                name = obj.id
+                fails = () if name in known else (((), name),)
+                nonnull = frozenset([name])
+                return _Test(f'COALESCE(substr({name}, 1, {len(prefix)}) = {_literal(prefix)}, FALSE)', False, fails,
+                             nonnull, nonnull)
+        raise ValueError(f'Unsupported rule test: {ast.unparse(node)}')
+
+    #### Tree
+    def branches(self, branches: list, ind: int, known: frozenset, stage: int = 0, depth: int = 0) -> list:
+        pad = '    ' * ind
+        lines = [f'{pad}CASE']
+        for branch in branches:
+            if branch.label:
+                lines.append(f'{pad}    -- {branch.label}')
+            if isinstance(branch, Otherwise):
+                return lines + self.target(branch.then, 'ELSE', ind + 1, known, stage, depth) + [f'{pad}END']
+            t = self.test(_parse(branch.test), known)
+            if t.const is False:
+                continue
+            if t.const is True:
+                return lines + self.target(branch.then, 'ELSE', ind + 1, known, stage, depth) + [f'{pad}END']
+            fails = [' AND '.join(guards + (f'{name} IS NULL',)) for guards, name in t.fails if name not in known]
+            if fails:
+                lines.append(f"{pad}    WHEN {' OR '.join(fails)} THEN -1")
+            lines += self.target(branch.then, f'WHEN {t.value} THEN', ind + 1, known | t.true_nonnull, stage, depth)
+            known = known | t.false_nonnull | frozenset(name for guards, name in t.fails if not guards)
+        return lines + [f'{pad}    ELSE 0', f'{pad}END']
+
+    def target(self, then, keyword: str, ind: int, known: frozenset, stage: int, depth: int) -> list:
+        pad = '    ' * ind
+        if isinstance(then, list):
+            if depth + 1 < _STAGE_DEPTH:
+                return [f'{pad}{keyword}'] + self.branches(then, ind + 1, known, stage, depth + 1)
+            # Number the block before the blocks nested in it
+            block = len(self.blocks)
+            self.blocks.append(None)
+            self.blocks[block] = (stage + 1, self.branches(then, 4, known, stage + 1))
+            return [f'{pad}{keyword} {_BLOCK + block}  -- continued in stage {stage + 1}']
+        leaf = then.dormant if isinstance(then, Seasonal) else then
+        comment = then.dormant.fuel_type if isinstance(then, Seasonal) else then.fuel_type
+        return [f'{pad}{keyword} {leaf.rule}  -- {comment}']
+
+
+def _derived_columns(dialect: _Dialect, referenceYear: str, groups: list) -> list:
+    """
+    Function to get the common table expressions deriving the bcwft variables from the bcwft_inputs table.
+    :return: a list of (name, select list) pairs
+    """
+    ft = bcwft2018.FuelTyping()
+    species = range(1, 7)
+    variables = [
+        "COALESCE(BCLCS_LEVEL_1 = 'V', FALSE) AS is_vegetated",
+        "COALESCE(BCLCS_LEVEL_2 = 'T', FALSE) AS is_forested",
+        'TRUE AS is_logged',  # Only None harvest dates are unlogged, and a NULL date is read as NaT
+        "COALESCE(EARLIEST_NONLOGGING_DIST_TYPE IN ('B', 'BE', 'BG', 'BW', 'BR', 'NB'), FALSE) AS is_burned",
+        f'CASE WHEN {referenceYear} - harvest_year > 0 THEN {referenceYear} - harvest_year '
+        f'WHEN harvest_year IS NOT NULL THEN 0 END AS harv_lag',
+        f'CASE WHEN {referenceYear} - dist_year > 0 THEN {referenceYear} - dist_year '
+        f'WHEN dist_year IS NOT NULL THEN 0 END AS dist_lag',
+        "COALESCE(substr(BEC_SUBZONE, 1, 1) IN ('d', 'x'), FALSE) AS is_dry",
+        "COALESCE(substr(BEC_SUBZONE, 1, 1) IN ('m', 'w', 'v'), FALSE) AS is_wet",
+        f'COALESCE(BEC_ZONE_CODE IN {_literal(ft.dryBECzones)}, FALSE) AS is_dry_zone',
+        'VRI_LIVE_STEMS_PER_HA + VRI_DEAD_STEMS_PER_HA AS stocking',
+    ]
+    variables += [f'COALESCE(SPECIES_CD_{i} IN {_literal(ft.coniferList)}, FALSE) AS cnfr_{i}' for i in species]
+    variables += [f'COALESCE(SPECIES_CD_{i} IN {_literal(list(group))}, FALSE) AS in_{k}_{i}'
+                  for k, group in enumerate(groups) for i in species]
+
+    # Maximum percentage of the species in a list, skipping NULL. NULL if none have a percentage, 0 if none match.
+    def maxPrcnt(inList):
+        prcnts = ', '.join(f'CASE WHEN {inList(i)} AND SPECIES_PCT_{i} IS NOT NULL THEN SPECIES_PCT_{i} '
+                           f'ELSE {_NO_PRCNT} END' for i in species)
+        anyIn = ' OR '.join(inList(i) for i in species)
+        return f'CASE WHEN {dialect.greatest}({prcnts}) > {_NO_PRCNT} THEN {dialect.greatest}({prcnts}) ' \
+               f'WHEN {anyIn} THEN NULL ELSE 0 END'
+
+    # Position of the first species in a list (the first species if none match)
+    def first(inList):
+        return 'CASE ' + ' '.join(f'WHEN {inList(i)} THEN {i}' for i in species) + ' ELSE 1 END'
+
+    prcnts = ['(' + ' + '.join(f'CASE WHEN cnfr_{i} THEN SPECIES_PCT_{i} ELSE 0 END' for i in species)
+              + ') AS pct_sum']
+    for k in range(len(groups)):
+        inCheck = (lambda i, k=k: f'in_{k}_{i}')
+        inAlt = (lambda i, k=k: f'(NOT in_{k}_{i} AND cnfr_{i})')
+        prcnts += [f'{maxPrcnt(inCheck)} AS cnfr_prcnt_{k}', f'{maxPrcnt(inAlt)} AS alt_prcnt_{k}',
+                   f'{first(inCheck)} AS cnfr_first_{k}', f'{first(inAlt)} AS alt_first_{k}']
+
+    # Ties are won by the species listed first
+    dominance = ['CASE WHEN pct_sum > 100 THEN 100 ELSE pct_sum END AS pct_cnfr']
+    dominance += [f'CASE WHEN cnfr_prcnt_{k} <> 0 AND cnfr_prcnt_{k} = alt_prcnt_{k} '
+                  f'THEN cnfr_first_{k} < alt_first_{k} ELSE COALESCE(cnfr_prcnt_{k} > alt_prcnt_{k}, FALSE) END '
+                  f'AS dom_{k}' for k in range(len(groups))]
+    return [('bcwft_variables', variables), ('bcwft_prcnts', prcnts), ('bcwft_derived', dominance)]
+
+
+def _season_outputs(season: str) -> list:
+    """
+    Function to get the output columns of a season, from the leaf reached by each stand (bcwft_leaf).
+    :return: a list of (name, expression) pairs
+    """
+    if season == 'growing':
+        pairs = sorted((pair.dormant.rule, pair.growing.rule) for pair in _seasonal_pairs(DECISION_TREE))
+        rule = '(CASE bcwft_leaf ' + ' '.join(f'WHEN {dormant} THEN {growing}' for dormant, growing in pairs) + \
+               ' ELSE bcwft_leaf END)'
+    else:
+        rule = 'bcwft_leaf'
+
+    rulesByFuelType = {}
+    for leaf in sorted(_leaves(DECISION_TREE)):
+        rulesByFuelType.setdefault(leaf.fuel_type, []).append(leaf.rule)
+    fuelTypes = '\n'.join(f'            WHEN {rule} IN {_literal(rules)} THEN {_literal(fuelType)}'
+                          for fuelType, rules in rulesByFuelType.items())
+    fuelType = f"""CASE
+            WHEN bcwft_leaf = -1 THEN 'FuelTyping-Error'
+            WHEN bcwft_leaf = 0 THEN 'NoneTypeReturn-ERROR'
+{fuelTypes}
+        END"""
+    return [('BCWFT_rowRef', f'CASE WHEN bcwft_leaf > 0 THEN {rule} END'), ('FuelType', fuelType)]
+
+
+def _modifier_output(dialect: _Dialect) -> str:
+    """
+    Function to get the fuel type modifier of the leaf reached by each stand (bcwft_leaf).
+    """
+    rulesByModifier = {}
+    for leaf in sorted(_leaves(DECISION_TREE)):
+        if leaf.modifier is not None:
+            modifier = leaf.modifier if isinstance(leaf.modifier, str) else \
+                f'CAST({_literal(leaf.modifier)} AS {dialect.real})'
+            rulesByModifier.setdefault(modifier, []).append(leaf.rule)
+    modifiers = '\n'.join(f'            WHEN bcwft_leaf IN {_literal(rules)} THEN {modifier}'
+                          for modifier, rules in rulesByModifier.items())
+    return f'CASE\n{modifiers}\n        END'
+
+
+def output_fields(season: str) -> list:
+    """
+    Function to get the fuel typing output fields written for a season
+    :param season: season for fuel typing assignments. Options: "growing", "dormant", "both"
+    :return: a list of the output field names, in the order they are written to the dataset
+    """
+    if season == 'both':
+        return ['BCWFT_rowRef_growing', 'FuelType_growing', 'BCWFT_rowRef_dormant', 'FuelType_dormant', 'FT_Modifier']
+    return ['BCWFT_rowRef', 'FuelType', 'FT_Modifier']
+
+
+def select_sql(table: str, season: str, dialect: str = 'sqlite', reference_date=None, key: str = 'rowid') -> str:
+    """
+    Function to generate a SQL query fuel typing the stands of a table with the BC Wildfire Fuel Typing algorithm.
+    The query gives the same results as FuelTyping.classify_frame, with NULL dates read as NaT (see _stand_columns).
+    :param table: name of the table containing the fldList[3:] columns
+    :param season: season for fuel typing assignments. Options: "growing", "dormant", "both"
+    :param dialect: SQL dialect. Options: "sqlite" (including GeoPackages), "duckdb"
+    :param reference_date: the date (or year) harvest and disturbance lags are measured to (default: the current
+        date when the query runs)
+    :param key: the column identifying the stands of the table (e.g., "rowid", or "fid" for a GeoPackage)
+    :return: the SQL query, selecting the key and output_fields(season) columns
+    """
+    if season not in ['growing', 'dormant', 'both']:
+        raise ValueError('The "season" parameter must be either "growing", "dormant" or "both".')
+    if dialect not in _DIALECTS:
+        raise ValueError(f'The "dialect" parameter must be one of: {list(_DIALECTS)}')
+    check_rules(DECISION_TREE)
+    sql = _DIALECTS[dialect]
+    referenceYear = sql.current_year if reference_date is None else str(bcwft2018._reference_year(reference_date))
+
+    ft = bcwft2018.FuelTyping()
+    inputs = [f'{key} AS bcwft_key']
+    for fld in ft.fldList[3:]:
+        if fld in _CODES:
+            inputs.append(f'{sql.code.format(fld)} AS {fld}')
+        elif fld in _NUMBERS:
+            inputs.append(f'{sql.number.format(fld)} AS {fld}')
+    inputs += [f'{sql.year.format("HARVEST_DATE")} AS harvest_year',
+               f'{sql.year.format("EARLIEST_NONLOGGING_DIST_DATE")} AS dist_year']
+
+    writer = _CaseWriter()
+    ctes = ['bcwft_inputs AS MATERIALIZED (\n    SELECT\n        ' + ',\n        '.join(inputs) +
+            f'\n    FROM {_quote(table)}\n)']
+    source = 'bcwft_inputs'
+    for name, columns in _derived_columns(sql, referenceYear, writer.groups):
+        ctes.append(f'{name} AS MATERIALIZED (\n    SELECT\n        *,\n        ' + ',\n        '.join(columns) +
+                    f'\n    FROM {source}\n)')
+        source = name
+
+    # Stands getFuelType would reject before reaching the decision tree
+    failed = "BEC_ZONE_CODE IS NULL OR BEC_SUBZONE IS NULL OR BEC_SUBZONE = ''"
+    tree = writer.branches(DECISION_TREE, 2, frozenset())
+    tree.insert(1, f'            WHEN {failed} THEN -1')
+    ctes.append('bcwft_stage_0 AS MATERIALIZED (\n    SELECT\n        *,\n' + '\n'.join(tree) + ' AS bcwft_leaf_0' +
+                f'\n    FROM {source}\n)')
+
+    # The stands reaching the deeper branch lists continue in the next stages
+    stages = max([stage for stage, lines in writer.blocks], default=0)
+    for stage in range(1, stages + 1):
+        tree = [f'        CASE bcwft_leaf_{stage - 1}']
+        for block, (blockStage, lines) in enumerate(writer.blocks):
+            if blockStage == stage:
+                tree += [f'            WHEN {_BLOCK + block} THEN'] + lines
+        tree.append(f'            ELSE bcwft_leaf_{stage - 1}')
+        tree.append(f'        END AS bcwft_leaf_{stage}')
+        ctes.append(f'bcwft_stage_{stage} AS MATERIALIZED (\n    SELECT\n        *,\n' + '\n'.join(tree) +
+                    f'\n    FROM bcwft_stage_{stage - 1}\n)')
+    ctes.append(f'bcwft_leaves AS MATERIALIZED (\n    SELECT\n        bcwft_key,\n        pct_cnfr,\n'
+                f'        bcwft_leaf_{stages} AS bcwft_leaf\n    FROM bcwft_stage_{stages}\n)')
+
+    if season == 'both':
+        growing, dormant = _season_outputs('growing'), _season_outputs('dormant')
+        outputs = [(f'{name}_growing', expression) for name, expression in growing] + \
+                  [(f'{name}_dormant', expression) for name, expression in dormant]
+    else:
+        outputs = _season_outputs(season)
+    outputs.append(('FT_Modifier', _modifier_output(sql)))
+
+    columns = [f'bcwft_key AS {key}'] + [f'{expression} AS {name}' for name, expression in outputs]
+    return 'WITH ' + ',\n'.join(ctes) + '\nSELECT\n    ' + ',\n    '.join(columns) + '\nFROM bcwft_leaves'
+
+
+def view_sql(view: str, table: str, season: str, dialect: str = 'sqlite', reference_date=None,
+             key: str = 'rowid') -> str:
+    """
+    Function to generate a SQL statement creating a view of the fuel types of the stands of a table.
+    :param view: name of the view
+    :return: the SQL statement (see select_sql for the other parameters)
+    """
+    return f'CREATE VIEW {_quote(view)} AS\n' + select_sql(table, season, dialect, reference_date, key)
+
+
+def update_sql(table: str, season: str, dialect: str = 'sqlite', reference_date=None, key: str = 'rowid') -> str:
+    """
+    Function to generate a SQL statement writing the fuel types of the stands of a table to its output_fields(season)
+    columns, which must exist.
+    :return: the SQL statement (see select_sql for the parameters)
+    """
+    assignments = ',\n    '.join(f'{fld} = bcwft.{fld}' for fld in output_fields(season))
+    return f'UPDATE {_quote(table)}\nSET\n    {assignments}\n' \
+           f'FROM (\n{select_sql(table, season, dialect, reference_date, key)}\n) AS bcwft\n' \
+           f'WHERE {_quote(table)}.{key} = bcwft.{key}'
+
+
+def verify(connection, table: str, season: str, dialect: str = 'sqlite', reference_date=None,
+           key: str = 'rowid') -> list:
+    """
+    Function to check the SQL query against FuelTyping.classify_frame on the stands of a table.
+    :param connection: a DB-API connection to the database (e.g., sqlite3 or duckdb)
+    :return: a list of the keys of the stands with different results (see select_sql for the other parameters)
+    """
+    ft = bcwft2018.FuelTyping()
+    fields = ft.fldList[3:]
+    cursor = connection.execute(f"SELECT {key}, {', '.join(fields)} FROM {_quote(table)} ORDER BY {key}")
+    rows = cursor.fetchall()
+    keys = [row[0] for row in rows]
+    data = _stand_columns([row[1:] for row in rows], fields)
+
+    results = ft.classify_frame(data, season, reference_date)
+    if season == 'both':
+        (growingRef, growingFT, modifier), (dormantRef, dormantFT, _) = results
+        expected = [growingRef, growingFT, dormantRef, dormantFT, modifier]
+    else:
+        expected = list(results)
+
+    cursor = connection.execute(f'SELECT * FROM ({select_sql(table, season, dialect, reference_date, key)}) '
+                                f'AS bcwft ORDER BY {key}')
+    mismatches = []
+    for i, row in enumerate(cursor.fetchall()):
+        for value, column in zip(row[1:], expected):
+            python = column[i]
+            if python is None or value is None:
+                same = python is None and value is None
+            elif isinstance(python, str):
+                same = python == value
+            else:
+                same = abs(float(python) - float(value)) <= 1e-9
+            if not same:
+                mismatches.append(keys[i])
+                break
+    return mismatches
+
+
+def _stand_columns(rows: list, fields: list) -> dict:
+    """
+    Function to get the stands read from a table as columns for FuelTyping.classify_frame. NULL dates are read as
+    NaT, as pandas reads the missing dates of a dataset, so they are logged with NaN lags, as in the SQL query.
+    :param rows: the values of the fields of each stand
+    :param fields: the fldList[3:] fields of the rows
+    :return: a dictionary of object arrays
+    """
+    data = {fld: np.asarray([row[k] for row in rows], dtype=object) for k, fld in enumerate(fields)}
+    for fld in bcwft2018._DATE_FIELDS:
+        data[fld][np.equal(data[fld], None)] = np.datetime64('NaT')
+    return data
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description='Generate SQL fuel typing the stands of a VRI table.')
+    parser.add_argument('table', help='name of the table containing the fuel typing input fields')
+    parser.add_argument('--season', default='growing', choices=['growing', 'dormant', 'both'])
+    parser.add_argument('--dialect', default='sqlite', choices=list(_DIALECTS))
+    parser.add_argument('--reference-year', type=int, default=None,
+                        help='year harvest and disturbance lags are measured to (default: the current year)')
+    parser.add_argument('--key', default='rowid', help='column identifying the stands (default: rowid)')
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--view', help='create a view with this name instead of selecting the fuel types')
+    output.add_argument('--update', action='store_true', help='update the fuel type columns of the table')
+    parser.add_argument('--verify', metavar='DATABASE',
+                        help='check the query against the Python engine on the table of this database instead')
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        if args.dialect == 'duckdb':
+            import duckdb
+            connection = duckdb.connect(args.verify, read_only=True)
+        else:
+            import sqlite3
+            connection = sqlite3.connect(args.verify)
+        mismatches = verify(connection, args.table, args.season, args.dialect, args.reference_year, args.key)
+        connection.close()
+        if mismatches:
+            print(f'{len(mismatches)} stands have different results in SQL, e.g., {args.key} {mismatches[:10]}')
+            return 1
+        print('The SQL results match the Python engine.')
+        return 0
+
+    if args.view:
+        print(view_sql(args.view, args.table, args.season, args.dialect, args.reference_year, args.key) + ';')
+    elif args.update:
+        print(update_sql(args.table, args.season, args.dialect, args.reference_year, args.key) + ';')
+    else:
+        print(select_sql(args.table, args.season, args.dialect, args.reference_year, args.key) + ';')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,501 @@
+# -*- coding: utf-8 -*-
+"""
+Lookup table compiler for the BC Wildfire Fuel Typing decision tree.
+
+The decision tree only compares its numeric features (heights, ages, crown closure, stocking, the lags, pct_cnfr,
+...) to a finite set of constants, and only tests its code features against finite code sets. So each feature of the
+flat node table (bcwft_tree.NODES) can be binned into intervals, or classes of codes, that take the same branch at
+every node, and the tree can be compiled into a lookup table over the bins:
+    - features are read one at a time, in the order the tree first uses them (breadth first), which keeps the table
+      small,
+    - each layer of the table is a dense array of the next state for every (state, bin) of a feature. Only the
+      states reachable from the root are materialized: a state is a distinct subtree left after binning the earlier
+      features, and
+    - the states of the last layer hold the rule IDs of the leaves.
+Classifying a batch is then binning its features, and one indexing step per feature (LookupTable.classify).
+
+verify proves the table gives the same rule IDs as the flat node table: the bins are checked at the boundaries of
+every threshold of every node, and every region of the bins the tree leads to a leaf is walked through the table.
+
+Usage:
+    python bcwft_table.py            compile the lookup table and print its size
+    python bcwft_table.py --verify   compile the lookup table and verify it against the flat node table
+"""
+__author__ = ['Gregory A. Greene, map.n.trowel@gmail.com']
+
+import ast
+import sys
+import threading
+from collections import deque
+
+import numpy as np
+
+import bcwft_tree
+from bcwft_codegen import _FlatWriter, _OPS
+from bcwft_rules import DECISION_TREE
+
+
+# Branches of a node, as returned by the bins of its feature
+_YES, _NO, _NULL = range(3)
+# Suffix of the representative codes that match no literal code of a code set (see _CodeBins)
+_OTHER = '\uffff'
+
+
+def _met(op: int, x: float, value: float) -> bool:
+    """
+    Function to check if a number meets the test of a node of the flat node table.
+    :return: True if the number meets the test
+    """
+    if op == bcwft_tree.OP_EQ:
+        return x == value
+    elif op == bcwft_tree.OP_NE:
+        return x != value
+    elif op == bcwft_tree.OP_LT:
+        return x < value
+    elif op == bcwft_tree.OP_LE:
+        return x <= value
+    elif op == bcwft_tree.OP_GT:
+        return x > value
+    elif op == bcwft_tree.OP_GE:
+        return x >= value
+    elif op == bcwft_tree.OP_NOTNULL:
+        return True
+    raise ValueError(f'Unsupported operation of a number feature: {_OPS[op]}')
+
+
+class _NumberBins:
+    """
+    Bins of a number feature: the intervals between the thresholds of the nodes testing the feature and the
+    thresholds themselves, merged when they take the same branch at every node, and a last bin for NaN.
+    """
+    def __init__(self, feature: int, nodes: list):
+        self.feature = feature
+        tests = [(op, value) for op, f, value, yes, no, null in nodes if f == feature and op != bcwft_tree.OP_LEAF]
+        self.thresholds = np.unique([float(value) for op, value in tests if op != bcwft_tree.OP_NOTNULL])
+
+        # Raw bin 2 * i is the interval below threshold i (or above the last threshold), raw bin 2 * i + 1 is the
+        # threshold i
+        t = self.thresholds
+        below = np.concatenate([[t[0] - 1] if len(t) else [0.0], (t[:-1] + t[1:]) / 2, [t[-1] + 1] if len(t) else []])
+        raw = np.empty(2 * len(t) + 1)
+        raw[0::2] = below
+        raw[1::2] = t
+
+        signatures = {}
+        self.merge = np.empty(len(raw), dtype='int16')
+        for r, x in enumerate(raw):
+            signature = tuple(_met(op, x, float(value)) for op, value in tests)
+            self.merge[r] = signatures.setdefault(signature, len(signatures))
+        self.values = [raw[list(self.merge).index(b)] for b in range(len(signatures))]
+        self.null = len(self.values)
+        self.n = self.null + 1
+        self.lookup = np.append(self.merge, self.null).astype('int16')  # Raw bins, with NaN last
+
+    def branch(self, op: int, value: float, b: int) -> int:
+        """
+        Function to get the branch a node sends the stands of a bin to.
+        :return: _YES, _NO or _NULL
+        """
+        if b == self.null:
+            return _NULL
+        return _YES if _met(op, self.values[b], float(value)) else _NO
+
+    def digitize(self, column: np.ndarray, codeSets: np.ndarray) -> np.ndarray:
+        """
+        Function to get the bins of a column of the features.
+        :return: an int16 array
+        """
+        # The number of thresholds below a number plus the number of thresholds up to it is its raw bin. The
+        # thresholds are few, so comparing to each is faster than a binary search.
+        raw = np.isnan(column).astype('uint8') * np.uint8(len(self.merge))
+        for t in self.thresholds:
+            raw += column > t
+            raw += column >= t
+        return self.lookup[raw]
+
+    def boundaries(self) -> np.ndarray:
+        """
+        Function to get the values where the branches of the nodes can change: every threshold, the next floats
+        below and above it, and the representative value of every bin.
+        :return: a float array
+        """
+        t = self.thresholds
+        return np.unique(np.concatenate([t, np.nextafter(t, -np.inf), np.nextafter(t, np.inf), self.values,
+                                         [-1.0e308, 1.0e308]]))
+
+
+class _CodeBins:
+    """
+    Bins of a code feature: the classes of codes that are in the same code sets of the nodes testing the feature,
+    and a last bin for null codes. The classes are found from representative codes: every literal of the code set
+    expressions, and every literal followed by _OTHER. A code that is not a literal is in the same code sets as its
+    longest matching prefix followed by _OTHER (or _OTHER alone if no prefix matches).
+    """
+    def __init__(self, feature: int, name: str, nodes: list, expressions: dict):
+        self.feature = feature
+        self.name = name
+        self.sets = sorted({int(value) for op, f, value, yes, no, null in nodes
+                            if f == feature and op == bcwft_tree.OP_IN})
+        if any(op not in [bcwft_tree.OP_LEAF, bcwft_tree.OP_IN, bcwft_tree.OP_NOTNULL]
+               for op, f, value, yes, no, null in nodes if f == feature):
+            raise ValueError(f'Unsupported operation of a code feature: {name}')
+
+        literals = {node.value for k in self.sets for node in ast.walk(ast.parse(expressions[k]))
+                    if isinstance(node, ast.Constant) and isinstance(node.value, str)}
+        self.codes = np.asarray(sorted(literals | {code + _OTHER for code in literals} | {_OTHER, ''}))
+        self.expressions = [expressions[k] for k in self.sets]
+        signatures = self.signatures(self.members(self.codes))
+
+        # Bins are numbered in order of the first representative code of each class
+        self.classes = {}
+        for signature in signatures:
+            self.classes.setdefault(int(signature), len(self.classes))
+        self.values = [[bool((signature >> i) & 1) for i in range(len(self.sets))] for signature in self.classes]
+        self.null = len(self.values)
+        self.n = self.null + 1
+
+    def members(self, c: np.ndarray) -> np.ndarray:
+        """
+        Function to evaluate the code sets of the feature on an array of codes.
+        :return: a boolean array of (code sets, codes)
+        """
+        members = np.zeros((len(self.sets), len(c)), dtype=bool)
+        for i, expression in enumerate(self.expressions):
+            members[i] = eval(expression, {'np': np, 'c': c})
+        return members
+
+    def signatures(self, members: np.ndarray) -> np.ndarray:
+        """
+        Function to encode the code sets each code is in as bits.
+        :return: an int64 array
+        """
+        weights = np.left_shift(1, np.arange(len(self.sets), dtype='int64'))
+        return (members.astype('int64') * weights[:, None]).sum(axis=0)
+
+    def branch(self, op: int, value: int, b: int) -> int:
+        """
+        Function to get the branch a node sends the stands of a bin to.
+        :return: _YES, _NO or _NULL
+        """
+        if b == self.null:
+            return _NULL
+        elif op == bcwft_tree.OP_NOTNULL:
+            return _YES
+        return _YES if self.values[b][self.sets.index(int(value))] else _NO
+
+    def digitize(self, column: np.ndarray, codeSets: np.ndarray) -> np.ndarray:
+        """
+        Function to get the bins of a column of the features, from the code sets of the batch categories.
+        :return: an int16 array
+        """
+        unique, inverse = np.unique(self.signatures(codeSets[self.sets]), return_inverse=True)
+        categoryBins = np.asarray([self.classes.get(int(signature), -1) for signature in unique], dtype='int16')
+        isNull = np.isnan(column)
+        bins = categoryBins[inverse][np.where(isNull, 0, column).astype('intp')]
+        if np.any(bins[~isNull] < 0):
+            raise ValueError(f'Codes of {self.name} are in a combination of code sets without a bin.')
+        bins[isNull] = self.null
+        return bins
+
+
+class LookupTable:
+    """
+    Decision tree compiled into layers of dense [state, bin] -> next state tables, one per feature
+    """
+    def __init__(self, bins: list, layers: list, rules: np.ndarray):
+        """
+        :param bins: the bins of the features, in the order they are read
+        :param layers: the next state of every (state, bin) of each feature, with the root as state 0
+        :param rules: the rule ID of each state of the last layer (0: no leaf reached, -1: decisionTree raises
+            an exception)
+        """
+        self.bins = bins
+        self.layers = layers
+        self.rules = rules
+
+    @property
+    def size(self) -> int:
+        """
+        Number of cells of the layers
+        """
+        return sum(layer.size for layer in self.layers)
+
+    def classify(self, features: np.ndarray, codeSets: np.ndarray) -> np.ndarray:
+        """
+        Function to get the rule ID of the leaf reached by each stand, by binning the features and indexing the
+        layers.
+        :param features: the features of each stand (see bcwft_tree.flat_inputs)
+        :param codeSets: the codes in each code set (see bcwft_tree.flat_inputs)
+        :return: an int16 array of rule IDs (0: no leaf reached, -1: decisionTree raises an exception)
+        """
+        state = np.zeros(len(features), dtype='intp')
+        for bins, layer in zip(self.bins, self.layers):
+            state = layer.ravel()[state * bins.n + bins.digitize(features[:, bins.feature], codeSets)]
+        return self.rules[state]
+
+
+class _Compiler:
+    """
+    Builds the layers of a LookupTable. The subtrees left after binning some of the features are hash-consed, so
+    identical subtrees are one state.
+    """
+    def __init__(self, nodes: list, bins: dict):
+        self.nodes = nodes
+        self.bins = bins
+        self.subtrees = {}
+        self.keys = []
+        self.restricted = {}
+
+    def subtree(self, key: tuple) -> int:
+        if key[0] is not None and key[1] == key[2] == key[3]:
+            return key[1]
+        if key not in self.subtrees:
+            self.subtrees[key] = len(self.keys)
+            self.keys.append(key)
+        return self.subtrees[key]
+
+    def tree(self) -> int:
+        """
+        Function to get the subtree of the whole flat node table.
+        :return: the subtree
+        """
+        subtrees = {}
+        for k in reversed(range(len(self.nodes))):  # Every node comes before its children
+            op, feature, value, yes, no, null = self.nodes[k]
+            if op == bcwft_tree.OP_LEAF:
+                subtrees[k] = self.subtree((None, int(value), None, None))
+            else:
+                subtrees[k] = self.subtree((k, subtrees[yes], subtrees[no], subtrees[null]))
+        return subtrees[0]
+
+    def restrict(self, subtree: int, feature: int, b: int) -> int:
+        """
+        Function to get the subtree left for the stands in bin b of a feature.
+        :return: the subtree
+        """
+        key = (subtree, feature, b)
+        if key not in self.restricted:
+            k, yes, no, null = self.keys[subtree]
+            if k is None:
+                result = subtree
+            elif self.nodes[k][1] == feature:
+                op, feature, value = self.nodes[k][:3]
+                result = self.restrict((yes, no, null)[self.bins[feature].branch(op, value, b)], feature, b)
+            else:
+                result = self.subtree((k, self.restrict(yes, feature, b), self.restrict(no, feature, b),
+                                       self.restrict(null, feature, b)))
+            self.restricted[key] = result
+        return self.restricted[key]
+
+    def layers(self, order: list) -> tuple:
+        """
+        Function to build the layers of the table, reading the features in order.
+        :return: a tuple of (layers, rule ID of each state of the last layer)
+        """
+        states = [self.tree()]
+        layers = []
+        for feature in order:
+            nextStates = {}
+            layer = np.empty((len(states), self.bins[feature].n), dtype='int32')
+            for i, subtree in enumerate(states):
+                for b in range(self.bins[feature].n):
+                    layer[i, b] = nextStates.setdefault(self.restrict(subtree, feature, b), len(nextStates))
+            layers.append(layer)
+            states = list(nextStates)
+
+        if any(self.keys[subtree][0] is not None for subtree in states):
+            raise ValueError('The lookup table does not read every feature of the flat node table.')
+        dtype = 'int16' if max(len(states), max((len(layer) for layer in layers), default=0)) < 2 ** 15 else 'int32'
+        return [layer.astype(dtype) for layer in layers], np.asarray([self.keys[s][1] for s in states], dtype='int16')
+
+
+def _flat_writer() -> _FlatWriter:
+    """
+    Function to compile the rule specification into a flat node table, checking it matches bcwft_tree.NODES.
+    :return: the _FlatWriter, for the features and code sets of the nodes
+    """
+    flat = _FlatWriter()
+    root = flat.branches(DECISION_TREE)
+    order = {k: len(flat.nodes) - 1 - k for k in range(len(flat.nodes))}
+    nodes = [(_OPS.index(op), feature, value, order.get(yes, -1), order.get(no, -1), order.get(null, -1))
+             for op, feature, value, yes, no, null, comment in reversed(flat.nodes)]
+    if order[root] != 0 or nodes != [tuple(node) for node in bcwft_tree.NODES]:
+        raise ValueError('bcwft_tree.py is out of date. Run "python bcwft_codegen.py" to regenerate it.')
+    return flat
+
+
+def _feature_order(nodes: list) -> list:
+    """
+    Function to get the features tested by the flat node table, in order of first use, breadth first from the root.
+    :return: a list of features
+    """
+    order = {}
+    queue = deque([0])
+    seen = {0}
+    while queue:
+        op, feature, value, yes, no, null = nodes[queue.popleft()]
+        if op == bcwft_tree.OP_LEAF:
+            continue
+        order.setdefault(feature, len(order))
+        for child in (yes, no, null):
+            if child not in seen:
+                seen.add(child)
+                queue.append(child)
+    return list(order)
+
+
+def compile_table() -> LookupTable:
+    """
+    Function to compile the flat node table (bcwft_tree.NODES) into a lookup table.
+    :return: a LookupTable object
+    """
+    flat = _flat_writer()
+    nodes = [tuple(node) for node in bcwft_tree.NODES]
+    expressions = dict(enumerate(expression for name, expression in flat.code_sets))
+    codeFeatures = {flat.code_feature(name): name for name, expression in flat.code_sets}
+
+    order = _feature_order(nodes)
+    bins = {f: _CodeBins(f, codeFeatures[f], nodes, expressions) if f in codeFeatures else _NumberBins(f, nodes)
+            for f in order}
+    layers, rules = _Compiler(nodes, bins).layers(order)
+    return LookupTable([bins[f] for f in order], layers, rules)
+
+
+_TABLE = None
+_TABLE_LOCK = threading.Lock()
+
+
+def lookup_table() -> LookupTable:
+    """
+    Function to get the lookup table, compiling it on first use.
+    :return: a LookupTable object
+    """
+    global _TABLE
+    with _TABLE_LOCK:
+        if _TABLE is None:
+            _TABLE = compile_table()
+    return _TABLE
+
+
+#### VERIFICATION
+def _walk(nodes: list, x: np.ndarray, codeSets: np.ndarray) -> int:
+    """
+    Function to walk a stand down the flat node table.
+    :return: the rule ID of the leaf reached
+    """
+    k = 0
+    while nodes[k][0] != bcwft_tree.OP_LEAF:
+        op, feature, value, yes, no, null = nodes[k]
+        v = x[feature]
+        if np.isnan(v):
+            k = null
+        elif op == bcwft_tree.OP_IN:
+            k = yes if codeSets[int(value), int(v)] else no
+        else:
+            k = yes if _met(op, v, value) else no
+    return int(nodes[k][2])
+
+
+def verify(table: LookupTable) -> list:
+    """
+    Function to prove the lookup table gives the same rule IDs as the flat node table for every input, in three
+    steps:
+        1: every number that can change a branch (each threshold and the floats either side of it) and every
+           representative code takes the same branch as its bin at every node,
+        2: every region of the bins that leads down a path of the flat node table (the bins allowed at each node of
+           the path) is walked through all the matching states of the table, which must all hold the rule ID of the
+           path's leaf, and
+        3: a stand inside every region is classified by binning its features, and by walking the flat node table.
+    :param table: the LookupTable
+    :return: a list of the problems found (empty if the table is equivalent to the flat node table)
+    """
+    nodes = [tuple(node) for node in bcwft_tree.NODES]
+    bins = {b.feature: b for b in table.bins}
+    problems = []
+
+    # The code sets of the representative codes of each code feature, which are the categories of the feature
+    codeBins = [b for b in table.bins if isinstance(b, _CodeBins)]
+    codeSets = np.zeros((1 + max([max(b.sets, default=0) for b in codeBins], default=0),
+                         max([len(b.codes) for b in codeBins], default=1)), dtype=bool)
+    for b in codeBins:
+        codeSets[b.sets, :len(b.codes)] = b.members(b.codes)
+
+    # 1: The bins take the same branches as their values, at the boundaries of every threshold
+    for b in table.bins:
+        if isinstance(b, _NumberBins):
+            x = b.boundaries()
+        else:
+            x = np.arange(len(b.codes), dtype='float64')
+        binned = b.digitize(x, codeSets)
+        for k, (op, f, value, yes, no, null) in enumerate(nodes):
+            if f != b.feature or op == bcwft_tree.OP_LEAF:
+                continue
+            for v, bin_ in zip(x, binned):
+                if isinstance(b, _NumberBins):
+                    met = _met(op, v, value)
+                else:
+                    met = op == bcwft_tree.OP_NOTNULL or codeSets[int(value), int(v)]
+                if (_YES if met else _NO) != b.branch(op, value, bin_):
+                    problems.append(f'Node {k}: {float(v)!r} takes another branch than its bin {int(bin_)}')
+
+    # 2: Every path of the flat node table, as the bins each feature can be in, reaches only states of its leaf
+    regions = []
+    stack = [(0, {f: (1 << b.n) - 1 for f, b in bins.items()})]
+    while stack:
+        k, allowed = stack.pop()
+        op, feature, value, yes, no, null = nodes[k]
+        if op == bcwft_tree.OP_LEAF:
+            regions.append((allowed, int(value)))
+            continue
+        # The bins going to each child (nodes can have the same child on several branches)
+        children = {}
+        for bin_ in range(bins[feature].n):
+            child = (yes, no, null)[bins[feature].branch(op, value, bin_)]
+            children[child] = children.get(child, 0) | 1 << bin_
+        for child, mask in children.items():
+            if allowed[feature] & mask:
+                stack.append((child, {**allowed, feature: allowed[feature] & mask}))
+
+    for allowed, rule in regions:
+        states = np.zeros(1, dtype='intp')
+        for b, layer in zip(table.bins, table.layers):
+            states = np.unique(layer[np.ix_(states, [i for i in range(b.n) if (allowed[b.feature] >> i) & 1])])
+        if np.any(table.rules[states] != rule):
+            problems.append(f'A region of rule {rule} reaches the rules {sorted(set(table.rules[states].tolist()))}')
+
+    # 3: A stand in every region (in the first bin allowed for each feature) gets the same rule ID from both
+    categories = {b.feature: list(b.digitize(np.arange(len(b.codes), dtype='float64'), codeSets)) for b in codeBins}
+    features = np.zeros((len(regions), 1 + max(f for op, f, value, yes, no, null in nodes)))
+    for r, (allowed, rule) in enumerate(regions):
+        for b in table.bins:
+            bin_ = (allowed[b.feature] & -allowed[b.feature]).bit_length() - 1
+            if bin_ == b.null:
+                features[r, b.feature] = np.nan
+            elif isinstance(b, _CodeBins):
+                features[r, b.feature] = categories[b.feature].index(bin_)
+            else:
+                features[r, b.feature] = b.values[bin_]
+    rules = table.classify(features, codeSets)
+    for r, (allowed, rule) in enumerate(regions):
+        walked = _walk(nodes, features[r], codeSets)
+        if not rule == walked == rules[r]:
+            problems.append(f'A stand of rule {rule} walks to rule {walked} and is looked up as rule {int(rules[r])}')
+
+    return problems
+
+
+def main(argv: list) -> int:
+    table = lookup_table()
+    print(f'Compiled a lookup table of {len(table.layers)} layers and {table.size} cells '
+          f'({max(len(layer) for layer in table.layers)} states at most).')
+    if '--verify' in argv:
+        problems = verify(table)
+        if problems:
+            print(f'{len(problems)} problems found, e.g., {problems[:10]}')
+            return 1
+        print('The lookup table matches the flat node table.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,3571 @@
+# -*- coding: utf-8 -*-
+"""
+BC Wildfire Fuel Typing decision tree, generated from bcwft_rules.DECISION_TREE by bcwft_codegen.py.
+Do not edit this file: edit the rule specification and run "python bcwft_codegen.py" instead.
+"""
+__author__ = ['Gregory A. Greene, map.n.trowel@gmail.com']
+
+import numpy as np
+
+
+# Fuel type of each rule ID (0: no leaf reached)
+FUEL_TYPES = [
+    None,  # 0
+    'S-3',  # 1
+    'S-1',  # 2
+    'D-1',  # 3
+    'D-2',  # 4
+    'O-1a',  # 5
+    'O-1b',  # 6
+    'N',  # 7
+    'D-1',  # 8
+    'D-2',  # 9
+    'C-5',  # 10
+    'C-2',  # 11
+    'M-1',  # 12
+    'M-2',  # 13
+    'C-3',  # 14
+    'C-7',  # 15
+    'O-1a',  # 16
+    'O-1b',  # 17
+    'M-1',  # 18
+    'M-2',  # 19
+    'N',  # 20
+    'D-1',  # 21
+    'D-2',  # 22
+    'O-1a',  # 23
+    'O-1b',  # 24
+    'D-1',  # 25
+    'D-2',  # 26
+    'O-1a',  # 27
+    'O-1b',  # 28
+    'N',  # 29
+    'N',  # 30
+    'N',  # 31
+    'D-1',  # 32
+    'D-2',  # 33
+    'C-5',  # 34
+    'N',  # 35
+    'D-1',  # 36
+    'D-2',  # 37
+    'O-1a',  # 38
+    'O-1b',  # 39
+    'N',  # 40
+    'D-1',  # 41
+    'D-2',  # 42
+    'VegForestNoBurn_Species-ERROR',  # 43
+    'S-1',  # 44
+    'D-1',  # 45
+    'D-2',  # 46
+    'C-7',  # 47
+    'O-1a',  # 48
+    'O-1b',  # 49
+    'C-4',  # 50
+    'C-3',  # 51
+    'C-7',  # 52
+    'C-5',  # 53
+    'C-3',  # 54
+    'M-3',  # 55
+    'C-2',  # 56
+    'C-3',  # 57
+    'C-2',  # 58
+    'C-3',  # 59
+    'C-3',  # 60
+    'C-3',  # 61
+    'S-1',  # 62
+    'O-1a',  # 63
+    'O-1b',  # 64
+    'C-4',  # 65
+    'C-3',  # 66
+    'C-7',  # 67
+    'C-3',  # 68
+    'C-7',  # 69
+    'C-7',  # 70
+    'O-1a',  # 71
+    'O-1b',  # 72
+    'S-1',  # 73
+    'C-7',  # 74
+    'C-3',  # 75
+    'C-3',  # 76
+    'C-7',  # 77
+    'C-5',  # 78
+    'S-3',  # 79
+    'S-1',  # 80
+    'D-1',  # 81
+    'D-2',  # 82
+    'O-1a',  # 83
+    'O-1b',  # 84
+    'C-3',  # 85
+    'C-4',  # 86
+    'C-3',  # 87
+    'C-5',  # 88
+    'C-7',  # 89
+    'C-5',  # 90
+    'C-7',  # 91
+    'D-1',  # 92
+    'D-2',  # 93
+    'O-1a',  # 94
+    'O-1b',  # 95
+    'VegForestNoBurnPureFd_ProjHeight-ERROR',  # 96
+    'S-2',  # 97
+    'D-1',  # 98
+    'D-2',  # 99
+    'C-2',  # 100
+    'C-3',  # 101
+    'S-3',  # 102
+    'D-1',  # 103
+    'D-2',  # 104
+    'C-5',  # 105
+    'S-2',  # 106
+    'C-2',  # 107
+    'C-1',  # 108
+    'M-1',  # 109
+    'M-2',  # 110
+    'S-2',  # 111
+    'C-2',  # 112
+    'C-1',  # 113
+    'C-7',  # 114
+    'C-5',  # 115
+    'O-1a',  # 116
+    'O-1b',  # 117
+    'C-3',  # 118
+    'C-2',  # 119
+    'VegForestPureOtherSpruceInterior_NoBCLCSLv5-ERROR',  # 120
+    'VegForestPureOtherSpruceInterior_ProjHeight-ERROR',  # 121
+    'S-3',  # 122
+    'D-1',  # 123
+    'D-2',  # 124
+    'C-3',  # 125
+    'C-3',  # 126
+    'M-1',  # 127
+    'M-2',  # 128
+    'C-5',  # 129
+    'C-5',  # 130
+    'D-1',  # 131
+    'D-2',  # 132
+    'C-7',  # 133
+    'M-1',  # 134
+    'M-2',  # 135
+    'C-7',  # 136
+    'C-5',  # 137
+    'C-5',  # 138
+    'O-1a',  # 139
+    'O-1b',  # 140
+    'VegForestedPureSpeciesStand_Species-ERROR',  # 141
+    'D-1',  # 142
+    'D-2',  # 143
+    'D-1',  # 144
+    'D-2',  # 145
+    'S-2',  # 146
+    'M-1',  # 147
+    'M-2',  # 148
+    'M-1',  # 149
+    'M-2',  # 150
+    'M-1',  # 151
+    'M-2',  # 152
+    'M-1',  # 153
+    'M-2',  # 154
+    'M-1',  # 155
+    'M-2',  # 156
+    'S-1',  # 157
+    'M-1',  # 158
+    'M-2',  # 159
+    'M-1',  # 160
+    'M-2',  # 161
+    'M-1',  # 162
+    'M-2',  # 163
+    'M-1',  # 164
+    'M-2',  # 165
+    'M-1',  # 166
+    'M-2',  # 167
+    'M-1',  # 168
+    'M-2',  # 169
+    'M-1',  # 170
+    'M-2',  # 171
+    'M-1',  # 172
+    'M-2',  # 173
+    'M-1',  # 174
+    'M-2',  # 175
+    'M-1',  # 176
+    'M-2',  # 177
+    'M-1',  # 178
+    'M-2',  # 179
+    'M-1',  # 180
+    'M-2',  # 181
+    'M-1',  # 182
+    'M-2',  # 183
+    'M-1',  # 184
+    'M-2',  # 185
+    'M-1',  # 186
+    'M-2',  # 187
+    'M-1',  # 188
+    'M-2',  # 189
+    'VegForestMixedSpeciesCnfrLT65_BCLCSLv5-ERROR',  # 190
+    'M-1',  # 191
+    'M-2',  # 192
+    'M-1',  # 193
+    'M-2',  # 194
+    'C-5',  # 195
+    'O-1a',  # 196
+    'O-1b',  # 197
+    'S-1',  # 198
+    'M-1',  # 199
+    'M-2',  # 200
+    'M-1',  # 201
+    'M-2',  # 202
+    'M-1',  # 203
+    'M-2',  # 204
+    'C-7',  # 205
+    'C-5',  # 206
+    'C-5',  # 207
+    'M-1',  # 208
+    'M-2',  # 209
+    'C-7',  # 210
+    'M-1',  # 211
+    'M-2',  # 212
+    'M-1',  # 213
+    'M-2',  # 214
+    'C-5',  # 215
+    'M-1',  # 216
+    'M-2',  # 217
+    'M-1',  # 218
+    'M-2',  # 219
+    'M-1',  # 220
+    'M-2',  # 221
+    'M-1',  # 222
+    'M-2',  # 223
+    'M-1',  # 224
+    'M-2',  # 225
+    'C-5',  # 226
+    'C-5',  # 227
+    'C-7',  # 228
+    'C-5',  # 229
+    'C-7',  # 230
+    'S-1',  # 231
+    'D-1',  # 232
+    'D-2',  # 233
+    'C-7',  # 234
+    'O-1a',  # 235
+    'O-1b',  # 236
+    'C-4',  # 237
+    'C-3',  # 238
+    'C-7',  # 239
+    'C-5',  # 240
+    'C-3',  # 241
+    'M-3',  # 242
+    'C-2',  # 243
+    'C-2',  # 244
+    'M-3',  # 245
+    'C-2',  # 246
+    'C-3',  # 247
+    'C-2',  # 248
+    'C-2',  # 249
+    'C-3',  # 250
+    'C-2',  # 251
+    'C-3',  # 252
+    'C-3',  # 253
+    'C-3',  # 254
+    'C-7',  # 255
+    'C-5',  # 256
+    'C-3',  # 257
+    'C-3',  # 258
+    'S-1',  # 259
+    'O-1a',  # 260
+    'O-1b',  # 261
+    'C-3',  # 262
+    'C-7',  # 263
+    'C-3',  # 264
+    'C-3',  # 265
+    'C-7',  # 266
+    'C-5',  # 267
+    'S-3',  # 268
+    'S-1',  # 269
+    'D-1',  # 270
+    'D-2',  # 271
+    'O-1a',  # 272
+    'O-1b',  # 273
+    'C-5',  # 274
+    'C-4',  # 275
+    'C-7',  # 276
+    'C-3',  # 277
+    'C-5',  # 278
+    'C-7',  # 279
+    'C-5',  # 280
+    'C-7',  # 281
+    'D-1',  # 282
+    'D-2',  # 283
+    'O-1a',  # 284
+    'O-1b',  # 285
+    'S-3',  # 286
+    'S-2',  # 287
+    'C-7',  # 288
+    'C-2',  # 289
+    'C-3',  # 290
+    'C-3',  # 291
+    'C-5',  # 292
+    'C-3',  # 293
+    'C-5',  # 294
+    'C-2',  # 295
+    'C-1',  # 296
+    'C-3',  # 297
+    'C-2',  # 298
+    'C-3',  # 299
+    'C-1',  # 300
+    'C-7',  # 301
+    'C-3',  # 302
+    'C-5',  # 303
+    'C-7',  # 304
+    'C-2',  # 305
+    'C-2',  # 306
+    'C-2',  # 307
+    'C-3',  # 308
+    'S-3',  # 309
+    'D-1',  # 310
+    'D-2',  # 311
+    'C-3',  # 312
+    'C-3',  # 313
+    'M-1',  # 314
+    'M-2',  # 315
+    'C-5',  # 316
+    'C-5',  # 317
+    'D-1',  # 318
+    'D-2',  # 319
+    'C-7',  # 320
+    'C-3',  # 321
+    'M-1',  # 322
+    'M-2',  # 323
+    'M-1',  # 324
+    'M-2',  # 325
+    'C-7',  # 326
+    'C-2',  # 327
+    'C-3',  # 328
+    'C-3',  # 329
+    'C-5',  # 330
+    'C-7',  # 331
+    'N',  # 332
+    'D-1',  # 333
+    'D-2',  # 334
+    'O-1a',  # 335
+    'O-1b',  # 336
+    'S-1',  # 337
+    'S-2',  # 338
+    'S-3',  # 339
+    'S-3',  # 340
+    'S-1',  # 341
+    'S-1',  # 342
+    'D-1',  # 343
+    'D-2',  # 344
+    'O-1a',  # 345
+    'O-1b',  # 346
+    'N',  # 347
+    'D-1',  # 348
+    'D-2',  # 349
+    'M-1',  # 350
+    'M-2',  # 351
+    'C-5',  # 352
+    'C-2',  # 353
+    'M-1',  # 354
+    'M-2',  # 355
+    'C-3',  # 356
+    'C-7',  # 357
+    'C-3',  # 358
+    'C-7',  # 359
+    'C-3',  # 360
+    'O-1a',  # 361
+    'O-1b',  # 362
+    'O-1a',  # 363
+    'O-1b',  # 364
+    'D-1',  # 365
+    'D-2',  # 366
+    'C-3',  # 367
+    'C-7',  # 368
+    'C-5',  # 369
+    'C-3',  # 370
+    'C-5',  # 371
+    'VegNonForestUnburnedLoggedGT24HasSpecies_BEC-ERROR',  # 372
+    'S-1',  # 373
+    'D-1',  # 374
+    'D-2',  # 375
+    'O-1a',  # 376
+    'O-1b',  # 377
+    'N',  # 378
+    'D-1',  # 379
+    'D-2',  # 380
+    'M-1',  # 381
+    'M-2',  # 382
+    'C-5',  # 383
+    'C-2',  # 384
+    'M-1',  # 385
+    'M-2',  # 386
+    'C-3',  # 387
+    'C-7',  # 388
+    'C-7',  # 389
+    'C-7',  # 390
+    'M-1',  # 391
+    'M-2',  # 392
+    'O-1a',  # 393
+    'O-1b',  # 394
+    'O-1a',  # 395
+    'O-1b',  # 396
+    'D-1',  # 397
+    'D-2',  # 398
+    'C-7',  # 399
+    'C-7',  # 400
+    'C-5',  # 401
+    'M-1',  # 402
+    'M-2',  # 403
+    'C-5',  # 404
+    'VegNonForestUnburnedLoggedGT24NoSpecies_BEC-ERROR',  # 405
+    'N',  # 406
+    'D-1',  # 407
+    'D-2',  # 408
+    'O-1a',  # 409
+    'O-1b',  # 410
+    'D-1',  # 411
+    'D-2',  # 412
+    'O-1a',  # 413
+    'O-1b',  # 414
+    'W',  # 415
+    'N',  # 416
+    'O-1a',  # 417
+    'O-1b',  # 418
+    'N',  # 419
+    'D-1',  # 420
+    'D-2',  # 421
+    'O-1a',  # 422
+    'O-1b',  # 423
+    'N',  # 424
+    'W',  # 425
+    'O-1a',  # 426
+    'O-1b',  # 427
+    'D-1',  # 428
+    'D-2',  # 429
+    'N',  # 430
+    'D-1',  # 431
+    'D-2',  # 432
+    'O-1a',  # 433
+    'O-1b',  # 434
+    'N',  # 435
+]
+
+# Growing season rule IDs of the Seasonal leaves, which are returned as their dormant season rule IDs
+_GROWING_SEASON = {
+    3: 4, 5: 6, 8: 9, 12: 13, 16: 17, 18: 19, 21: 22, 23: 24, 25: 26, 27: 28, 32: 33, 36: 37, 38: 39, 41: 42, 45: 46,
+    48: 49, 63: 64, 71: 72, 81: 82, 83: 84, 92: 93, 94: 95, 98: 99, 103: 104, 109: 110, 116: 117, 123: 124, 127: 128,
+    131: 132, 134: 135, 139: 140, 142: 143, 144: 145, 147: 148, 149: 150, 151: 152, 153: 154, 155: 156, 158: 159,
+    160: 161, 162: 163, 164: 165, 166: 167, 168: 169, 170: 171, 172: 173, 174: 175, 176: 177, 178: 179, 180: 181,
+    182: 183, 184: 185, 186: 187, 188: 189, 191: 192, 193: 194, 196: 197, 199: 200, 201: 202, 203: 204, 208: 209,
+    211: 212, 213: 214, 216: 217, 218: 219, 220: 221, 222: 223, 224: 225, 232: 233, 235: 236, 260: 261, 270: 271,
+    272: 273, 282: 283, 284: 285, 310: 311, 314: 315, 318: 319, 322: 323, 324: 325, 333: 334, 335: 336, 343: 344,
+    345: 346, 348: 349, 350: 351, 354: 355, 361: 362, 363: 364, 365: 366, 374: 375, 376: 377, 379: 380, 381: 382,
+    385: 386, 391: 392, 393: 394, 395: 396, 397: 398, 402: 403, 407: 408, 409: 410, 411: 412, 413: 414, 417: 418,
+    420: 421, 422: 423, 426: 427, 428: 429, 431: 432, 433: 434,
+}
+GROWING_RULES = [_GROWING_SEASON.get(rule, rule) for rule in range(len(FUEL_TYPES))]
+
+
+# Species groups of the dominant() tests, in order of first use (see FuelTyping.checkDomConifers)
+DOM_CONIFER_GROUPS = [
+    ('SB', 'SW', 'SE', 'SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX'),
+    ('S',),
+    ('PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P'),
+    ('PY',),
+    ('PA', 'PF', 'PW'),
+    ('F', 'FD', 'FDC', 'FDI'),
+    ('SE',),
+    ('SS',),
+    ('SB', 'SW'),
+    ('SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX', 'S'),
+    ('C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM'),
+    ('B', 'BA', 'BG', 'BL'),
+    ('T', 'TW'),
+    ('J', 'JR'),
+]
+
+# StandBatch membership bits
+_CONIFER_BITS = (1 << 0, 1 << 1, 1 << 2, 1 << 3, 1 << 4, 1 << 5)
+_DRY_SUBZONE = 1 << 6
+_WET_SUBZONE = 1 << 7
+_DRY_ZONE = 1 << 8
+
+
+# Tests of the SPECIES_CD_1 dispatch tables, and the cached index of the first test met by each code
+_DISPATCH = [
+    (
+        lambda v: v in ['PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P'],
+        lambda v: v == 'PY',
+        lambda v: v in ['PA', 'PF', 'PW'],
+        lambda v: v in ['FD', 'FDC', 'FDI', 'F'],
+        lambda v: v == 'SE',
+        lambda v: v == 'SS',
+        lambda v: v in ['SB', 'SW'],
+        lambda v: v.startswith('S'),
+        lambda v: v in ['C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM'],
+        lambda v: v.startswith('B'),
+        lambda v: v in ['T', 'TW'],
+        lambda v: v in ['J', 'JR'],
+    ),
+    (
+        lambda v: v in ['P', 'PL', 'PLI', 'PLC', 'PJ', 'PXJ'],
+        lambda v: v in ['PY'],
+        lambda v: v in ['PA', 'PF', 'PW'],
+        lambda v: v.startswith('F'),
+        lambda v: v.startswith('S'),
+        lambda v: v.startswith('C') or v.startswith('Y') or v.startswith('H'),
+        lambda v: v in ['BG'],
+        lambda v: v in ['BA'],
+        lambda v: v in ['B', 'BL'],
+        lambda v: v in ['T', 'TW'],
+        lambda v: v in ['J', 'JR'],
+    ),
+    (
+        lambda v: v == 'SE',
+        lambda v: v in ['SS'],
+        lambda v: v in ['SB'],
+    ),
+    (
+        lambda v: str(v).startswith('P'),
+        lambda v: str(v).startswith('S') or str(v).startswith('B'),
+        lambda v: v in ['CW', 'YC'] or str(v).startswith('H'),
+        lambda v: str(v).startswith('FD'),
+    ),
+]
+_DISPATCH_CACHE = [{} for _ in _DISPATCH]
+_DISPATCH_CACHE_SIZE = 4096
+
+
+def _dispatch(table: int, value) -> int:
+    """
+    Function to find the first test of a SPECIES_CD_1 dispatch table met by a value.
+    Results are cached for up to _DISPATCH_CACHE_SIZE codes per table. Exceptions raised by the tests are not cached.
+    :return: the index of the test, or -1 if none are met
+    """
+    cache = _DISPATCH_CACHE[table]
+    if isinstance(value, (str, type(None))) and value in cache:
+        return cache[value]
+    for branch, test in enumerate(_DISPATCH[table]):
+        if test(value):
+            break
+    else:
+        branch = -1
+    if isinstance(value, (str, type(None))) and len(cache) < _DISPATCH_CACHE_SIZE:
+        cache[value] = branch
+    return branch
+
+
+def decision_tree(s, ft) -> tuple:
+    """
+    The fuel typing decision tree.
+    :param s: the stand record, with the derived bcwft variables
+    :param ft: the FuelTyping instance
+    :return: a tuple of (leaf, fuel type modifier), or None if no leaf was reached. The leaf is the rule ID of the
+        dormant season (see GROWING_RULES and FUEL_TYPES).
+    """
+
+    #### NON-VEGETATED SITE
+    if not s.is_vegetated or s.is_vegetated is None:
+        #### SITE LOGGED
+        if s.is_logged:
+            #### SITE HARVESTED WITHIN LAST 6 YEARS
+            if s.harv_lag <= 6:
+                if s.COAST_INTERIOR_CD == 'C':
+                    return 1, None  # S-3
+                else:
+                    return 2, None  # S-1
+            #### SITE HARVESTED WITHIN LAST 7-24 YEARS
+            elif s.harv_lag <= 24:
+                if s.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']:
+                    return 3, None  # D-1, growing season: 4 D-2
+                else:
+                    return 5, None  # O-1a, growing season: 6 O-1b
+            #### SITE HARVESTED LONGER THAN 24 YEARS AGO
+            else:
+                if s.BEC_ZONE_CODE in ['CMA', 'IMA']:
+                    return 7, None  # N
+                elif s.BEC_ZONE_CODE in ['BAFA', 'MH']:
+                    return 8, None  # D-1, growing season: 9 D-2
+                elif s.BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH'] and s.dry_wet == 'wet':
+                    return 10, None  # C-5
+                elif s.BEC_ZONE_CODE in ['BWBS']:
+                    return 11, None  # C-2
+                elif s.BEC_ZONE_CODE == 'SWB':
+                    return 12, 50  # M-1, growing season: 13 M-2
+                elif s.BEC_ZONE_CODE == 'SBS' or (s.BEC_ZONE_CODE == 'IDF' and s.dry_wet == 'wet') or (s.BEC_ZONE_CODE == 'ICH' and s.dry_wet == 'dry'):
+                    return 14, None  # C-3
+                elif s.BEC_ZONE_CODE in ['SBPS', 'MS', 'ESSF'] or (s.BEC_ZONE_CODE in ['IDF', 'CDF'] and s.dry_wet == 'dry'):
+                    return 15, None  # C-7
+                elif s.BEC_ZONE_CODE in ['PP', 'BG']:
+                    return 16, None  # O-1a, growing season: 17 O-1b
+                elif s.BEC_ZONE_CODE == 'CWH' and s.dry_wet == 'dry':
+                    return 18, 40  # M-1, growing season: 19 M-2
+        #### SITE UNLOGGED
+        else:
+            #### SITE RECENTLY BURNED
+            if s.is_burned and s.dist_lag is not None and (s.dist_lag < 11):
+                if s.dist_lag <= 3:
+                    return 20, None  # N
+                elif s.dist_lag <= 6:
+                    return 21, None  # D-1, growing season: 22 D-2
+                elif s.dist_lag <= 10:
+                    return 23, None  # O-1a, growing season: 24 O-1b
+            #### SITE NOT RECENTLY BURNED
+            else:
+                if s.BCLCS_LEVEL_2 in ['L', None]:
+                    if s.SPECIES_CD_1 is not None:
+                        if s.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']:
+                            return 25, None  # D-1, growing season: 26 D-2
+                        else:
+                            return 27, None  # O-1a, growing season: 28 O-1b
+                    else:
+                        return 29, None  # N
+                else:
+                    return 30, None  # N
+    #### SITE VEGETATED
+    elif s.is_vegetated:
+        #### SITE FORESTED
+        if s.is_forested:
+            #### SITE RECENTLY BURNED
+            if s.is_burned and s.dist_lag is not None and (s.dist_lag <= 10):
+                if s.pct_cnfr is not None and s.pct_cnfr >= 60:
+                    if s.CROWN_CLOSURE is not None and s.CROWN_CLOSURE > 40:
+                        if s.dist_lag <= 3:
+                            return 31, None  # N
+                        elif s.dist_lag <= 6:
+                            return 32, None  # D-1, growing season: 33 D-2
+                        else:
+                            return 34, None  # C-5
+                    else:
+                        if s.dist_lag <= 1:
+                            return 35, None  # N
+                        elif s.dist_lag <= 6:
+                            return 36, None  # D-1, growing season: 37 D-2
+                        else:
+                            return 38, None  # O-1a, growing season: 39 O-1b
+                else:
+                    if s.dist_lag <= 1:
+                        return 40, None  # N
+                    else:
+                        return 41, None  # D-1, growing season: 42 D-2
+            #### SITE NOT RECENTLY BURNED
+            else:
+                if s.SPECIES_CD_1 is None or s.SPECIES_PCT_1 is None or s.SPECIES_PCT_1 == 0:
+                    return 43, None  # VegForestNoBurn_Species-ERROR
+                #### PURE/SINGLE SPECIES STANDS
+                elif s.SPECIES_PCT_1 >= 80:
+                    if s.SPECIES_CD_1 in ft.coniferList:
+                        branch = _dispatch(0, s.SPECIES_CD_1)
+                        #### PURE LODGEPOLE PINE STANDS
+                        if branch == 0:
+                            if s.harv_lag is not None and s.harv_lag <= 7:
+                                return 44, None  # S-1
+                            else:
+                                #### SPARSE STANDS
+                                if s.BCLCS_LEVEL_5 == 'SP':
+                                    if s.BEC_ZONE_CODE in ['CWH', 'CDF', 'MH'] or (s.BEC_ZONE_CODE in ['ICH'] and s.dry_wet == 'wet'):
+                                        return 45, None  # D-1, growing season: 46 D-2
+                                    else:
+                                        return 47, None  # C-7
+                                #### DENSE OR OPEN STANDS
+                                else:
+                                    if s.PROJ_HEIGHT_1 < 4:
+                                        return 48, None  # O-1a, growing season: 49 O-1b
+                                    elif s.PROJ_HEIGHT_1 <= 12:
+                                        if s.stocking > 8000:
+                                            return 50, None  # C-4
+                                        else:
+                                            return 51, None  # C-3
+                                    elif s.PROJ_HEIGHT_1 > 12:
+                                        if s.CROWN_CLOSURE < 40:
+                                            if s.BEC_ZONE_CODE in ['BG', 'PP', 'IDF', 'MS']:
+                                                return 52, None  # C-7
+                                            elif s.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']:
+                                                return 53, None  # C-5
+                                            else:
+                                                return 54, None  # C-3
+                                        else:
+                                            #### MOUNTAIN PINE BEETLE STANDS
+                                            if s.EARLIEST_NONLOGGING_DIST_TYPE == 'IBM':
+                                                if s.dist_lag <= 5:
+                                                    if s.STAND_PERCENTAGE_DEAD is not None and s.STAND_PERCENTAGE_DEAD > 50:
+                                                        return 55, 65  # M-3
+                                                    elif s.STAND_PERCENTAGE_DEAD is not None and s.STAND_PERCENTAGE_DEAD >= 25:
+                                                        return 56, None  # C-2
+                                                    else:
+                                                        return 57, None  # C-3
+                                                else:
+                                                    if s.STAND_PERCENTAGE_DEAD is not None and s.STAND_PERCENTAGE_DEAD > 50:
+                                                        return 58, None  # C-2
+                                                    elif s.STAND_PERCENTAGE_DEAD is not None and s.STAND_PERCENTAGE_DEAD >= 25:
+                                                        return 59, None  # C-3
+                                                    else:
+                                                        return 60, None  # C-3
+                                            #### NON MOUNTAIN PINE BEETLE STANDS
+                                            else:
+                                                return 61, None  # C-3
+                        #### PURE PONDEROSA PINE STANDS
+                        elif branch == 1:
+                            #### DENSE OR OPEN STANDS
+                            if s.BCLCS_LEVEL_5 in ['DE', 'OP']:
+                                if s.harv_lag is not None and s.harv_lag <= 10:
+                                    return 62, None  # S-1
+                                else:
+                                    if s.PROJ_HEIGHT_1 < 4:
+                                        return 63, None  # O-1a, growing season: 64 O-1b
+                                    elif s.PROJ_HEIGHT_1 <= 12:
+                                        if s.stocking > 8000:
+                                            return 65, None  # C-4
+                                        elif s.stocking >= 3000:
+                                            return 66, None  # C-3
+                                        else:
+                                            return 67, None  # C-7
+                                    elif s.PROJ_HEIGHT_1 <= 17:
+                                        if s.BCLCS_LEVEL_5 == 'DE':
+                                            return 68, None  # C-3
+                                        elif s.BCLCS_LEVEL_5 == 'OP':
+                                            return 69, None  # C-7
+                                    else:
+                                        return 70, None  # C-7
+                            #### SPARSE STANDS
+                            elif s.BCLCS_LEVEL_5 == 'SP':
+                                if s.STAND_PERCENTAGE_DEAD is not None and s.STAND_PERCENTAGE_DEAD >= 40:
+                                    return 71, None  # O-1a, growing season: 72 O-1b
+                                else:
+                                    if s.harv_lag is not None and s.harv_lag <= 10:
+                                        return 73, None  # S-1
+                                    else:
+                                        return 74, None  # C-7
+                        #### PURE OTHER PINE STANDS
+                        elif branch == 2:
+                            if s.BCLCS_LEVEL_5 == 'DE':
+                                return 75, None  # C-3
+                            elif s.BCLCS_LEVEL_5 in ['SP', 'OP']:
+                                if s.stocking >= 900:
+                                    return 76, None  # C-3
+                                elif s.stocking >= 600:
+                                    return 77, None  # C-7
+                                else:
+                                    return 78, None  # C-5
+                        #### PURE DOUGLAS-FIR STANDS
+                        elif branch == 3:
+                            #### SITE HARVESTED WITHIN LAST 6 YEARS
+                            if s.harv_lag is not None and s.harv_lag <= 6:
+                                if s.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (s.BEC_ZONE_CODE == 'ICH' and s.dry_wet == 'wet'):
+                                    return 79, None  # S-3
+                                else:
+                                    return 80, None  # S-1
+                            #### SITE HARVESTED LONGER THAN 6 YEARS AGO
+                            else:
+                                if s.PROJ_HEIGHT_1 is not None and s.PROJ_HEIGHT_1 < 4:
+                                    if s.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (s.BEC_ZONE_CODE == 'ICH' and s.dry_wet == 'wet'):
+                                        return 81, None  # D-1, growing season: 82 D-2
+                                    else:
+                                        return 83, None  # O-1a, growing season: 84 O-1b
+                                elif s.PROJ_HEIGHT_1 is not None and s.PROJ_HEIGHT_1 >= 4:
+                                    if s.CROWN_CLOSURE is not None and s.CROWN_CLOSURE > 55:
+                                        if s.PROJ_HEIGHT_1 <= 12:
+                                            if s.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (s.BEC_ZONE_CODE == 'ICH' and s.dry_wet == 'wet'):
+                                                return 85, None  # C-3
+                                            else:
+                                                if s.STAND_PERCENTAGE_DEAD is not None and s.STAND_PERCENTAGE_DEAD > 34:
+                                                    return 86, None  # C-4
+                                                else:
+                                                    return 87, None  # C-3
+                                        elif s.PROJ_HEIGHT_1 > 12:
+                                            if s.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (s.BEC_ZONE_CODE == 'ICH' and s.dry_wet == 'wet'):
+                                                return 88, None  # C-5
+                                            else:
+                                                return 89, None  # C-7
+                                    elif s.CROWN_CLOSURE is None or s.CROWN_CLOSURE >= 26:
+                                        if s.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (s.BEC_ZONE_CODE == 'ICH' and s.dry_wet == 'wet'):
+                                            return 90, None  # C-5
+                                        else:
+                                            return 91, None  # C-7
+                                    else:
+                                        if s.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (s.BEC_ZONE_CODE == 'ICH' and s.dry_wet == 'wet'):
+                                            return 92, None  # D-1, growing season: 93 D-2
+                                        else:
+                                            return 94, None  # O-1a, growing season: 95 O-1b
+                                else:
+                                    return 96, None  # VegForestNoBurnPureFd_ProjHeight-ERROR
+                        #### PURE ENGELMANN SPRUCE STANDS
+                        elif branch == 4:
+                            if s.harv_lag is not None and s.harv_lag <= 10:
+                                return 97, None  # S-2
+                            else:
+                                if s.BCLCS_LEVEL_5 == 'SP':
+                                    return 98, None  # D-1, growing season: 99 D-2
+                                elif s.BCLCS_LEVEL_5 == 'DE':
+                                    return 100, None  # C-2
+                                elif s.BCLCS_LEVEL_5 == 'OP':
+                                    return 101, None  # C-3
+                        #### PURE SITKA SPRUCE STANDS
+                        elif branch == 5:
+                            if s.harv_lag is not None and s.harv_lag <= 6:
+                                return 102, None  # S-3
+                            else:
+                                if s.BCLCS_LEVEL_5 == 'SP':
+                                    return 103, None  # D-1, growing season: 104 D-2
+                                elif s.BCLCS_LEVEL_5 in ['DE', 'OP']:
+                                    return 105, None  # C-5
+                        #### PURE BLACK OR WHITE SPRUCE STANDS
+                        elif branch == 6:
+                            if s.harv_lag is not None and s.harv_lag <= 10:
+                                return 106, None  # S-2
+                            else:
+                                if s.BCLCS_LEVEL_5 in ['DE', 'OP']:
+                                    return 107, None  # C-2
+                                elif s.BCLCS_LEVEL_5 == 'SP':
+                                    if s.BEC_ZONE_CODE in ['BWBS', 'SWB']:
+                                        return 108, None  # C-1
+                                    else:
+                                        return 109, 30  # M-1, growing season: 110 M-2
+                        #### PURE SPRUCE (UNKNOWN OR HYBRID) STANDS
+                        elif branch == 7:
+                            if s.harv_lag is not None and s.harv_lag <= 7:
+                                return 111, None  # S-2
+                            else:
+                                if s.BEC_ZONE_CODE in ['BWBS', 'SWB']:
+                                    if s.BCLCS_LEVEL_5 in ['DE', 'OP']:
+                                        return 112, None  # C-2
+                                    else:
+                                        return 113, None  # C-1
+                                else:
+                                    if s.BCLCS_LEVEL_5 == 'SP':
+                                        return 114, None  # C-7
+                                    else:
+                                        if s.BEC_ZONE_CODE in ['CWH', 'CDF']:
+                                            return 115, None  # C-5
+                                        else:
+                                            if s.PROJ_HEIGHT_1 < 4:
+                                                return 116, None  # O-1a, growing season: 117 O-1b
+                                            elif s.PROJ_HEIGHT_1 >= 4:
+                                                if s.BCLCS_LEVEL_5 == 'OP':
+                                                    return 118, None  # C-3
+                                                elif s.BCLCS_LEVEL_5 == 'DE':
+                                                    return 119, None  # C-2
+                                                else:
+                                                    return 120, None  # VegForestPureOtherSpruceInterior_NoBCLCSLv5-ERROR
+                                            else:
+                                                return 121, None  # VegForestPureOtherSpruceInterior_ProjHeight-ERROR
+                        #### PURE REDCEDAR, YELLOW CEDAR OR HEMLOCK STANDS
+                        elif branch == 8:
+                            if s.harv_lag is not None and s.harv_lag <= 6:
+                                return 122, None  # S-3
+                            else:
+                                if s.BCLCS_LEVEL_5 == 'DE':
+                                    if s.PROJ_HEIGHT_1 < 4:
+                                        return 123, None  # D-1, growing season: 124 D-2
+                                    elif s.PROJ_HEIGHT_1 <= 15:
+                                        return 125, None  # C-3
+                                    elif s.PROJ_HEIGHT_1 > 15:
+                                        if s.PROJ_AGE_1 < 60:
+                                            return 126, None  # C-3
+                                        elif s.PROJ_AGE_1 <= 99:
+                                            return 127, 30  # M-1, growing season: 128 M-2
+                                        else:
+                                            return 129, None  # C-5
+                                elif s.BCLCS_LEVEL_5 == 'OP':
+                                    return 130, None  # C-5
+                                elif s.BCLCS_LEVEL_5 == 'SP':
+                                    return 131, None  # D-1, growing season: 132 D-2
+                        #### PURE TRUE FIR STANDS
+                        elif branch == 9:
+                            if s.SPECIES_CD_1 == 'BG':
+                                return 133, None  # C-7
+                            elif s.SPECIES_CD_1 == 'BA':
+                                return 134, 30  # M-1, growing season: 135 M-2
+                            else:
+                                if s.BCLCS_LEVEL_5 == 'SP':
+                                    return 136, None  # C-7
+                                else:
+                                    return 137, None  # C-5
+                        #### PURE YEW STANDS
+                        elif branch == 10:
+                            return 138, None  # C-5
+                        #### PURE JUNIPER STANDS
+                        elif branch == 11:
+                            return 139, None  # O-1a, growing season: 140 O-1b
+                        else:
+                            return 141, None  # VegForestedPureSpeciesStand_Species-ERROR
+                    #### DECIDUOUS/BROADLEAF OR LARCH STAND
+                    else:
+                        return 142, None  # D-1, growing season: 143 D-2
+                #### MIXED-SPECIES STANDS
+                elif s.SPECIES_PCT_1 < 80:
+                    #### MIXED-SPECIES DECIDUOUS STANDS
+                    if s.pct_cnfr <= 20:
+                        return 144, None  # D-1, growing season: 145 D-2
+                    #### MIXED-SPECIES CONIFER OR MIXEDWOOD STANDS
+                    elif s.pct_cnfr > 20:
+                        #### 21-40% CONIFER = DECIDUOUS DOMINATED MIXEDWOOD STANDS
+                        if s.pct_cnfr <= 40:
+                            if s.harv_lag is not None and s.harv_lag <= 6:
+                                return 146, None  # S-2
+                            else:
+                                #### DOMINANT CONIFER = BLACK, WHITE, ENGELMANN, OR HYBRID SPRUCE
+                                if s.dom_conifers['SB', 'SW', 'SE', 'SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX']:
+                                    return 147, s.pct_cnfr  # M-1, growing season: 148 M-2
+                                #### DOMINANT CONIFER = UNKNOWN SPRUCE
+                                elif s.dom_conifers['S',]:
+                                    if s.COAST_INTERIOR_CD == 'C':
+                                        return 149, s.pct_cnfr * 0.5  # M-1, growing season: 150 M-2
+                                    else:
+                                        return 151, s.pct_cnfr  # M-1, growing season: 152 M-2
+                                #### DOMINANT CONIFER = ANY OTHER CONIFER
+                                else:
+                                    if s.BCLCS_LEVEL_5 == 'SP':
+                                        return 153, s.pct_cnfr * 0.5  # M-1, growing season: 154 M-2
+                                    else:
+                                        return 155, s.pct_cnfr * 0.7  # M-1, growing season: 156 M-2
+                        #### 41-65% CONIFER = CONIFER_DOMINATED MIXEDWOOD STANDS
+                        elif s.pct_cnfr <= 65:
+                            if s.harv_lag is not None and s.harv_lag <= 6:
+                                return 157, None  # S-1
+                            else:
+                                #### DOMINANT CONIFER = LODGEPOLE PINE
+                                if s.dom_conifers['PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P']:
+                                    if s.BCLCS_LEVEL_5 == 'SP':
+                                        return 158, s.pct_cnfr * 0.6  # M-1, growing season: 159 M-2
+                                    elif s.BCLCS_LEVEL_5 == 'OP':
+                                        return 160, s.pct_cnfr * 0.7  # M-1, growing season: 161 M-2
+                                    elif s.BCLCS_LEVEL_5 == 'DE':
+                                        return 162, s.pct_cnfr * 0.8  # M-1, growing season: 163 M-2
+                                #### DOMINANT CONIFER = PONDEROSA PINE
+                                elif s.dom_conifers['PY',]:
+                                    return 164, s.pct_cnfr * 0.6  # M-1, growing season: 165 M-2
+                                #### DOMINANT CONIFER = OTHER PINE
+                                elif s.dom_conifers['PA', 'PF', 'PW']:
+                                    return 166, s.pct_cnfr * 0.5  # M-1, growing season: 167 M-2
+                                #### DOMINANT CONIFER = DOUGLAS-FIR
+                                elif s.dom_conifers['F', 'FD', 'FDC', 'FDI']:
+                                    if s.BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH']:
+                                        return 168, s.pct_cnfr * 0.5  # M-1, growing season: 169 M-2
+                                    else:
+                                        return 170, s.pct_cnfr * 0.6  # M-1, growing season: 171 M-2
+                                #### DOMINANT CONIFER = ENGELMANN SPRUCE
+                                elif s.dom_conifers['SE',]:
+                                    if s.BCLCS_LEVEL_5 == 'SP':
+                                        return 172, s.pct_cnfr * 0.6  # M-1, growing season: 173 M-2
+                                    elif s.BCLCS_LEVEL_5 in ['OP', 'DE']:
+                                        return 174, s.pct_cnfr * 0.9  # M-1, growing season: 175 M-2
+                                #### DOMINANT CONIFER = SITKA SPRUCE
+                                elif s.dom_conifers['SS',]:
+                                    return 176, s.pct_cnfr * 0.4  # M-1, growing season: 177 M-2
+                                #### DOMINANT CONIFER = BLACK OR WHITE SPRUCE
+                                elif s.dom_conifers['SB', 'SW']:
+                                    return 178, s.pct_cnfr  # M-1, growing season: 179 M-2
+                                #### DOMINANT CONIFER = UNKNOWN OR HYBRID SPRUCE
+                                elif s.dom_conifers['SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX', 'S']:
+                                    if s.BEC_ZONE_CODE in ['BWBS', 'SWB']:
+                                        if s.BCLCS_LEVEL_5 in ['DE', 'OP']:
+                                            return 180, s.pct_cnfr  # M-1, growing season: 181 M-2
+                                        elif s.BCLCS_LEVEL_5 in ['SP']:
+                                            return 182, s.pct_cnfr * 0.6  # M-1, growing season: 183 M-2
+                                    else:
+                                        if s.BCLCS_LEVEL_5 in ['SP']:
+                                            return 184, s.pct_cnfr * 0.6  # M-1, growing season: 185 M-2
+                                        elif s.BCLCS_LEVEL_5 in ['DE', 'OP']:
+                                            if s.COAST_INTERIOR_CD == 'I':
+                                                return 186, s.pct_cnfr * 0.8  # M-1, growing season: 187 M-2
+                                            elif s.COAST_INTERIOR_CD == 'C':
+                                                return 188, s.pct_cnfr * 0.5  # M-1, growing season: 189 M-2
+                                        else:
+                                            return 190, None  # VegForestMixedSpeciesCnfrLT65_BCLCSLv5-ERROR
+                                #### DOMINANT CONIFER = REDCEDAR, YELLOW CEDAR OR HEMLOCK
+                                elif s.dom_conifers['C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM']:
+                                    return 191, s.pct_cnfr * 0.4  # M-1, growing season: 192 M-2
+                                #### DOMINANT CONIFER = FIR
+                                elif s.dom_conifers['B', 'BA', 'BG', 'BL']:
+                                    return 193, s.pct_cnfr * 0.6  # M-1, growing season: 194 M-2
+                                #### DOMINANT CONIFER = YEW
+                                elif s.dom_conifers['T', 'TW']:
+                                    return 195, None  # C-5
+                                #### DOMINANT CONIFER = JUNIPER
+                                elif s.dom_conifers['J', 'JR']:
+                                    return 196, None  # O-1a, growing season: 197 O-1b
+                        #### 66-80% CONIFER = CONIFER_DOMINATED MIXEDWOOD STANDS
+                        elif s.pct_cnfr <= 80:
+                            if s.harv_lag is not None and s.harv_lag <= 6:
+                                return 198, None  # S-1
+                            else:
+                                #### DOMINANT CONIFER = LODGEPOLE PINE
+                                if s.dom_conifers['PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P']:
+                                    if s.BCLCS_LEVEL_5 in ['SP']:
+                                        return 199, s.pct_cnfr * 0.5  # M-1, growing season: 200 M-2
+                                    elif s.BCLCS_LEVEL_5 in ['OP']:
+                                        return 201, s.pct_cnfr * 0.7  # M-1, growing season: 202 M-2
+                                    elif s.BCLCS_LEVEL_5 in ['DE']:
+                                        return 203, s.pct_cnfr * 0.8  # M-1, growing season: 204 M-2
+                                #### DOMINANT CONIFER = PONDEROSA PINE
+                                elif s.dom_conifers['PY',]:
+                                    return 205, None  # C-7
+                                #### DOMINANT CONIFER = OTHER PINE
+                                elif s.dom_conifers['PA', 'PF', 'PW']:
+                                    return 206, None  # C-5
+                                #### DOMINANT CONIFER = DOUGLAS-FIR
+                                elif s.dom_conifers['F', 'FD', 'FDC', 'FDI']:
+                                    if s.BEC_ZONE_CODE in ['CWH', 'CDF'] or (s.BEC_ZONE_CODE == 'ICH' and s.dry_wet == 'wet'):
+                                        return 207, None  # C-5
+                                    else:
+                                        if s.BCLCS_LEVEL_5 in ['DE']:
+                                            return 208, s.pct_cnfr * 0.7  # M-1, growing season: 209 M-2
+                                        else:
+                                            return 210, None  # C-7
+                                #### DOMINANT CONIFER = ENGELMANN SPRUCE
+                                elif s.dom_conifers['SE',]:
+                                    if s.BCLCS_LEVEL_5 in ['SP']:
+                                        return 211, s.pct_cnfr * 0.6  # M-1, growing season: 212 M-2
+                                    elif s.BCLCS_LEVEL_5 in ['OP', 'DE']:
+                                        return 213, s.pct_cnfr * 0.7  # M-1, growing season: 214 M-2
+                                #### DOMINANT CONIFER = SITKA SPRUCE
+                                elif s.dom_conifers['SS',]:
+                                    return 215, None  # C-5
+                                #### DOMINANT CONIFER = BLACK OR WHITE SPRUCE
+                                elif s.dom_conifers['SB', 'SW']:
+                                    return 216, s.pct_cnfr  # M-1, growing season: 217 M-2
+                                #### DOMINANT CONIFER = UNKNOWN OR HYBRID SPRUCE
+                                elif s.dom_conifers['SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX', 'S']:
+                                    if s.BEC_ZONE_CODE in ['BWBS', 'SWB']:
+                                        if s.BCLCS_LEVEL_5 in ['DE', 'OP']:
+                                            return 218, s.pct_cnfr  # M-1, growing season: 219 M-2
+                                        elif s.BCLCS_LEVEL_5 in ['SP']:
+                                            return 220, s.pct_cnfr * 0.6  # M-1, growing season: 221 M-2
+                                    else:
+                                        if s.BCLCS_LEVEL_5 in ['SP']:
+                                            return 222, s.pct_cnfr * 0.6  # M-1, growing season: 223 M-2
+                                        else:
+                                            if s.COAST_INTERIOR_CD == 'I':
+                                                return 224, s.pct_cnfr * 0.8  # M-1, growing season: 225 M-2
+                                            else:
+                                                return 226, None  # C-5
+                                #### DOMINANT CONIFER = REDCEDAR, YELLOW CEDAR OR HEMLOCK
+                                elif s.dom_conifers['C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM']:
+                                    return 227, None  # C-5
+                                #### DOMINANT CONIFER = FIR
+                                elif s.dom_conifers['B', 'BA', 'BG', 'BL']:
+                                    return 228, None  # C-7
+                                #### DOMINANT CONIFER = YEW
+                                elif s.dom_conifers['T', 'TW']:
+                                    return 229, None  # C-5
+                                #### DOMINANT CONIFER = JUNIPER
+                                elif s.dom_conifers['J', 'JR']:
+                                    return 230, None  # C-7
+                        #### 81-100% CONIFER = PURE CONIFER, MIXED-SPECIES STANDS
+                        elif s.pct_cnfr <= 100:
+                            branch = _dispatch(1, s.SPECIES_CD_1)
+                            #### DOMINANT CONIFER = LODGEPONE PINE
+                            if branch == 0:
+                                if s.harv_lag is not None and s.harv_lag <= 7:
+                                    return 231, None  # S-1
+                                else:
+                                    if s.BCLCS_LEVEL_5 in ['SP']:
+                                        if s.BEC_ZONE_CODE in ['CWH', 'CDF', 'MH'] or (s.BEC_ZONE_CODE == 'ICH' and s.dry_wet == 'wet'):
+                                            return 232, None  # D-1, growing season: 233 D-2
+                                        else:
+                                            return 234, None  # C-7
+                                    else:
+                                        if s.PROJ_HEIGHT_1 < 4:
+                                            return 235, None  # O-1a, growing season: 236 O-1b
+                                        elif s.PROJ_HEIGHT_1 >= 4:
+                                            if s.SPECIES_CD_2.startswith('S') or s.SPECIES_CD_2.startswith('B'):
+                                                if s.PROJ_HEIGHT_1 <= 12:
+                                                    if s.stocking > 8000:
+                                                        return 237, None  # C-4
+                                                    else:
+                                                        return 238, None  # C-3
+                                                else:
+                                                    if s.CROWN_CLOSURE < 40:
+                                                        if s.BEC_ZONE_CODE in ['BG', 'PP', 'IDF', 'MS']:
+                                                            return 239, None  # C-7
+                                                        elif s.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']:
+                                                            return 240, None  # C-5
+                                                        else:
+                                                            return 241, None  # C-3
+                                                    else:
+                                                        if s.EARLIEST_NONLOGGING_DIST_TYPE == 'IBM':
+                                                            if s.dist_lag <= 5:
+                                                                if s.BCLCS_LEVEL_5 in ['DE']:
+                                                                    if s.STAND_PERCENTAGE_DEAD is not None and s.STAND_PERCENTAGE_DEAD > 50:
+                                                                        return 242, 65  # M-3
+                                                                    elif s.STAND_PERCENTAGE_DEAD is not None and s.STAND_PERCENTAGE_DEAD >= 25:
+                                                                        return 243, None  # C-2
+                                                                    else:
+                                                                        return 244, None  # C-2
+                                                                else:
+                                                                    if s.STAND_PERCENTAGE_DEAD is not None and s.STAND_PERCENTAGE_DEAD > 50:
+                                                                        return 245, 65  # M-3
+                                                                    elif s.STAND_PERCENTAGE_DEAD is not None and s.STAND_PERCENTAGE_DEAD >= 25:
+                                                                        return 246, None  # C-2
+                                                                    else:
+                                                                        return 247, None  # C-3
+                                                            else:
+                                                                if s.BCLCS_LEVEL_5 in ['DE']:
+                                                                    if s.STAND_PERCENTAGE_DEAD is not None and s.STAND_PERCENTAGE_DEAD > 50:
+                                                                        return 248, None  # C-2
+                                                                    elif s.STAND_PERCENTAGE_DEAD is not None and s.STAND_PERCENTAGE_DEAD >= 25:
+                                                                        return 249, None  # C-2
+                                                                    else:
+                                                                        return 250, None  # C-3
+                                                                else:
+                                                                    if s.STAND_PERCENTAGE_DEAD is not None and s.STAND_PERCENTAGE_DEAD > 50:
+                                                                        return 251, None  # C-2
+                                                                    elif s.STAND_PERCENTAGE_DEAD is not None and s.STAND_PERCENTAGE_DEAD >= 25:
+                                                                        return 252, None  # C-3
+                                                                    else:
+                                                                        return 253, None  # C-3
+                                                        else:
+                                                            return 254, None  # C-3
+                                            else:
+                                                if s.CROWN_CLOSURE < 40:
+                                                    if s.BEC_ZONE_CODE in ['IDF', 'PP', 'BG', 'SBPS', 'MS']:
+                                                        return 255, None  # C-7
+                                                    elif s.BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH']:
+                                                        return 256, None  # C-5
+                                                    else:
+                                                        return 257, None  # C-3
+                                                else:
+                                                    return 258, None  # C-3
+                            #### DOMINANT CONIFER = PONDEROSA PINE
+                            elif branch == 1:
+                                if s.harv_lag is not None and s.harv_lag <= 7:
+                                    return 259, None  # S-1
+                                else:
+                                    if s.PROJ_HEIGHT_1 < 4:
+                                        return 260, None  # O-1a, growing season: 261 O-1b
+                                    else:
+                                        if s.BCLCS_LEVEL_5 in ['DE']:
+                                            return 262, None  # C-3
+                                        else:
+                                            return 263, None  # C-7
+                            #### DOMINANT CONIFER = OTHER PINE
+                            elif branch == 2:
+                                if s.BCLCS_LEVEL_5 in ['DE']:
+                                    return 264, None  # C-3
+                                else:
+                                    if s.stocking >= 900:
+                                        return 265, None  # C-3
+                                    elif s.stocking >= 600:
+                                        return 266, None  # C-7
+                                    else:
+                                        return 267, None  # C-5
+                            #### DOMINANT CONIFER = DOUGLAS-FIR
+                            elif branch == 3:
+                                if s.harv_lag is not None and s.harv_lag <= 6:
+                                    if s.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (s.BEC_ZONE_CODE == 'ICH' and s.dry_wet == 'wet'):
+                                        return 268, None  # S-3
+                                    else:
+                                        return 269, None  # S-1
+                                else:
+                                    if s.PROJ_HEIGHT_1 < 4:
+                                        if s.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (s.BEC_ZONE_CODE == 'ICH' and s.dry_wet == 'wet'):
+                                            return 270, None  # D-1, growing season: 271 D-2
+                                        else:
+                                            return 272, None  # O-1a, growing season: 273 O-1b
+                                    else:
+                                        if s.CROWN_CLOSURE > 55:
+                                            if s.PROJ_HEIGHT_1 <= 12:
+                                                if s.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (s.BEC_ZONE_CODE == 'ICH' and s.dry_wet == 'wet'):
+                                                    return 274, None  # C-5
+                                                else:
+                                                    if s.STAND_PERCENTAGE_DEAD is not None and s.STAND_PERCENTAGE_DEAD > 34:
+                                                        return 275, None  # C-4
+                                                    else:
+                                                        if s.SPECIES_CD_2 == 'PY':
+                                                            return 276, None  # C-7
+                                                        else:
+                                                            return 277, None  # C-3
+                                            elif s.PROJ_HEIGHT_1 > 12:
+                                                if s.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (s.BEC_ZONE_CODE == 'ICH' and s.dry_wet == 'wet'):
+                                                    return 278, None  # C-5
+                                                else:
+                                                    return 279, None  # C-7
+                                        elif s.CROWN_CLOSURE >= 26 or s.CROWN_CLOSURE is None:
+                                            if s.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (s.BEC_ZONE_CODE == 'ICH' and s.dry_wet == 'wet'):
+                                                return 280, None  # C-5
+                                            else:
+                                                return 281, None  # C-7
+                                        else:
+                                            if s.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (s.BEC_ZONE_CODE == 'ICH' and s.dry_wet == 'wet'):
+                                                return 282, None  # D-1, growing season: 283 D-2
+                                            else:
+                                                return 284, None  # O-1a, growing season: 285 O-1b
+                            #### DOMINANT CONIFER = SPRUCE
+                            elif branch == 4:
+                                if s.harv_lag is not None and s.harv_lag <= 6:
+                                    if s.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (s.BEC_ZONE_CODE == 'ICH' and s.dry_wet == 'wet'):
+                                        return 286, None  # S-3
+                                    else:
+                                        return 287, None  # S-2
+                                else:
+                                    branch = _dispatch(2, s.SPECIES_CD_1)
+                                    if branch == 0:
+                                        if s.BCLCS_LEVEL_5 in ['SP']:
+                                            return 288, None  # C-7
+                                        else:
+                                            if s.SPECIES_CD_2 in ['BL', 'B', 'PL', 'P', 'PLI']:
+                                                if s.BCLCS_LEVEL_5 in ['DE']:
+                                                    return 289, None  # C-2
+                                                else:
+                                                    return 290, None  # C-3
+                                            elif s.SPECIES_CD_2 in ['HW', 'HM', 'CW', 'YC']:
+                                                if s.BCLCS_LEVEL_5 in ['DE']:
+                                                    return 291, None  # C-3
+                                                else:
+                                                    return 292, None  # C-5
+                                            else:
+                                                return 293, None  # C-3
+                                    elif branch == 1:
+                                        return 294, None  # C-5
+                                    elif branch == 2:
+                                        if s.BCLCS_LEVEL_5 in ['DE', 'OP']:
+                                            return 295, None  # C-2
+                                        else:
+                                            if s.BEC_ZONE_CODE in ['BWBS']:
+                                                return 296, None  # C-1
+                                            else:
+                                                return 297, None  # C-3
+                                    else:
+                                        if s.BEC_ZONE_CODE in ['BWBS']:
+                                            if s.BCLCS_LEVEL_5 in ['DE']:
+                                                return 298, None  # C-2
+                                            elif s.BCLCS_LEVEL_5 in ['OP']:
+                                                return 299, None  # C-3
+                                            else:
+                                                return 300, None  # C-1
+                                        else:
+                                            if s.BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']:
+                                                if s.SPECIES_CD_2 in ['BL', 'B'] or s.SPECIES_CD_2.startswith('P'):
+                                                    if s.BCLCS_LEVEL_5 in ['SP']:
+                                                        return 301, None  # C-7
+                                                    else:
+                                                        return 302, None  # C-3
+                                                else:
+                                                    return 303, None  # C-5
+                                            else:
+                                                if s.BCLCS_LEVEL_5 in ['SP']:
+                                                    return 304, None  # C-7
+                                                else:
+                                                    if s.BCLCS_LEVEL_5 in ['DE']:
+                                                        return 305, None  # C-2
+                                                    else:
+                                                        if s.STAND_PERCENTAGE_DEAD is not None and s.STAND_PERCENTAGE_DEAD > 34:
+                                                            return 306, None  # C-2
+                                                        else:
+                                                            if s.SPECIES_CD_2 in ['PL', 'PLI', 'P']:
+                                                                return 307, None  # C-2
+                                                            else:
+                                                                return 308, None  # C-3
+                            #### DOMINANT CONIFER = REDCEDAR, YELLOW CEDAR OR HEMLOCK
+                            elif branch == 5:
+                                if s.harv_lag is not None and s.harv_lag <= 6:
+                                    return 309, None  # S-3
+                                else:
+                                    if s.BCLCS_LEVEL_5 == 'DE':
+                                        if s.PROJ_HEIGHT_1 < 4:
+                                            return 310, None  # D-1, growing season: 311 D-2
+                                        elif s.PROJ_HEIGHT_1 <= 15:
+                                            return 312, None  # C-3
+                                        else:
+                                            if s.PROJ_AGE_1 < 60:
+                                                return 313, None  # C-3
+                                            elif s.PROJ_AGE_1 <= 99:
+                                                return 314, 40  # M-1, growing season: 315 M-2
+                                            else:
+                                                return 316, None  # C-5
+                                    elif s.BCLCS_LEVEL_5 in ['OP']:
+                                        return 317, None  # C-5
+                                    else:
+                                        return 318, None  # D-1, growing season: 319 D-2
+                            #### DOMINANT CONIFER = GRAND FIR
+                            elif branch == 6:
+                                return 320, None  # C-7
+                            #### DOMINANT CONIFER = AMABALIS FIR
+                            elif branch == 7:
+                                if s.SPECIES_CD_2 in ['SE', 'SW', 'S']:
+                                    return 321, None  # C-3
+                                else:
+                                    return 322, 40  # M-1, growing season: 323 M-2
+                            #### DOMINANT CONIFER = OTHER FIR
+                            elif branch == 8:
+                                if s.COAST_INTERIOR_CD == 'C':
+                                    return 324, 40  # M-1, growing season: 325 M-2
+                                else:
+                                    if s.BCLCS_LEVEL_5 in ['SP']:
+                                        return 326, None  # C-7
+                                    elif s.BCLCS_LEVEL_5 in ['DE']:
+                                        if s.SPECIES_CD_2 in ['SE', 'SW', 'S']:
+                                            return 327, None  # C-2
+                                        else:
+                                            return 328, None  # C-3
+                                    else:
+                                        return 329, None  # C-3
+                            #### DOMINANT CONIFER = YEW
+                            elif branch == 9:
+                                return 330, None  # C-5
+                            #### DOMINANT CONIFER = JUNIPER
+                            elif branch == 10:
+                                return 331, None  # C-7
+        #### NON-FORESTED SITE
+        else:
+            #### SITE RECENTLY BURNED
+            if s.is_burned and s.dist_lag is not None and (s.dist_lag < 11):
+                if s.dist_lag <= 1:
+                    return 332, None  # N
+                elif s.dist_lag <= 3:
+                    return 333, None  # D-1, growing season: 334 D-2
+                else:
+                    return 335, None  # O-1a, growing season: 336 O-1b
+            #### SITE NOT RECENTLY BURNED
+            else:
+                #### SITE LOGGED
+                if s.is_logged:
+                    if s.SPECIES_CD_1 is not None:
+                        if s.harv_lag <= 7:
+                            branch = _dispatch(3, s.SPECIES_CD_1)
+                            if branch == 0:
+                                return 337, None  # S-1
+                            elif branch == 1:
+                                return 338, None  # S-2
+                            elif branch == 2:
+                                return 339, None  # S-3
+                            elif branch == 3:
+                                if s.BEC_ZONE_CODE in ['CWH', 'ICH']:
+                                    return 340, None  # S-3
+                                else:
+                                    return 341, None  # S-1
+                            else:
+                                return 342, None  # S-1
+                        elif s.harv_lag <= 24:
+                            if s.BEC_ZONE_CODE in ['CWH', 'MH'] or (s.BEC_ZONE_CODE == 'ICH' and s.dry_wet == 'wet'):
+                                return 343, None  # D-1, growing season: 344 D-2
+                            else:
+                                return 345, None  # O-1a, growing season: 346 O-1b
+                        else:
+                            if s.BEC_ZONE_CODE in ['CMA', 'IMA']:
+                                return 347, None  # N
+                            elif s.BEC_ZONE_CODE == 'BAFA':
+                                return 348, None  # D-1, growing season: 349 D-2
+                            elif s.BEC_ZONE_CODE == 'CWH':
+                                if s.dry_wet == 'dry':
+                                    return 350, 40  # M-1, growing season: 351 M-2
+                                else:
+                                    return 352, None  # C-5
+                            elif s.BEC_ZONE_CODE == 'BWBS':
+                                return 353, None  # C-2
+                            elif s.BEC_ZONE_CODE == 'SWB':
+                                return 354, 50  # M-1, growing season: 355 M-2
+                            elif s.BEC_ZONE_CODE == 'SBS':
+                                return 356, None  # C-3
+                            elif s.BEC_ZONE_CODE == 'SBPS':
+                                return 357, None  # C-7
+                            elif s.BEC_ZONE_CODE == 'MS':
+                                return 358, None  # C-3
+                            elif s.BEC_ZONE_CODE == 'IDF':
+                                if s.dry_wet == 'dry':
+                                    return 359, None  # C-7
+                                else:
+                                    return 360, None  # C-3
+                            elif s.BEC_ZONE_CODE == 'PP':
+                                return 361, None  # O-1a, growing season: 362 O-1b
+                            elif s.BEC_ZONE_CODE == 'BG':
+                                return 363, None  # O-1a, growing season: 364 O-1b
+                            elif s.BEC_ZONE_CODE == 'MH':
+                                return 365, None  # D-1, growing season: 366 D-2
+                            elif s.BEC_ZONE_CODE == 'ESSF':
+                                return 367, None  # C-3
+                            elif s.BEC_ZONE_CODE == 'CDF':
+                                if s.dry_wet == 'dry':
+                                    return 368, None  # C-7
+                                else:
+                                    return 369, None  # C-5
+                            elif s.BEC_ZONE_CODE == 'ICH':
+                                if s.dry_wet == 'dry':
+                                    return 370, None  # C-3
+                                else:
+                                    return 371, None  # C-5
+                            else:
+                                return 372, None  # VegNonForestUnburnedLoggedGT24HasSpecies_BEC-ERROR
+                    else:
+                        if s.harv_lag <= 5:
+                            return 373, None  # S-1
+                        elif s.harv_lag <= 24:
+                            if s.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']:
+                                return 374, None  # D-1, growing season: 375 D-2
+                            else:
+                                return 376, None  # O-1a, growing season: 377 O-1b
+                        else:
+                            if s.BEC_ZONE_CODE in ['CMA', 'IMA']:
+                                return 378, None  # N
+                            elif s.BEC_ZONE_CODE == 'BAFA':
+                                return 379, None  # D-1, growing season: 380 D-2
+                            elif s.BEC_ZONE_CODE == 'CWH':
+                                if s.dry_wet == 'dry':
+                                    return 381, 40  # M-1, growing season: 382 M-2
+                                else:
+                                    return 383, None  # C-5
+                            elif s.BEC_ZONE_CODE == 'BWBS':
+                                return 384, None  # C-2
+                            elif s.BEC_ZONE_CODE == 'SWB':
+                                return 385, 25  # M-1, growing season: 386 M-2
+                            elif s.BEC_ZONE_CODE == 'SBS':
+                                return 387, None  # C-3
+                            elif s.BEC_ZONE_CODE == 'SBPS':
+                                return 388, None  # C-7
+                            elif s.BEC_ZONE_CODE == 'MS':
+                                return 389, None  # C-7
+                            elif s.BEC_ZONE_CODE == 'IDF':
+                                if s.dry_wet == 'dry':
+                                    return 390, None  # C-7
+                                else:
+                                    return 391, 50  # M-1, growing season: 392 M-2
+                            elif s.BEC_ZONE_CODE == 'PP':
+                                return 393, None  # O-1a, growing season: 394 O-1b
+                            elif s.BEC_ZONE_CODE == 'BG':
+                                return 395, None  # O-1a, growing season: 396 O-1b
+                            elif s.BEC_ZONE_CODE == 'MH':
+                                return 397, None  # D-1, growing season: 398 D-2
+                            elif s.BEC_ZONE_CODE == 'ESSF':
+                                return 399, None  # C-7
+                            elif s.BEC_ZONE_CODE == 'CDF':
+                                if s.dry_wet == 'dry':
+                                    return 400, None  # C-7
+                                else:
+                                    return 401, None  # C-5
+                            elif s.BEC_ZONE_CODE == 'ICH':
+                                if s.dry_wet == 'dry':
+                                    return 402, 40  # M-1, growing season: 403 M-2
+                                else:
+                                    return 404, None  # C-5
+                            else:
+                                return 405, None  # VegNonForestUnburnedLoggedGT24NoSpecies_BEC-ERROR
+                #### SITE NOT LOGGED
+                else:
+                    if s.SPECIES_CD_1 is not None:
+                        if s.BEC_ZONE_CODE in ['CMA', 'IMA']:
+                            return 406, None  # N
+                        elif s.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH', 'BAFA']:
+                            return 407, None  # D-1, growing season: 408 D-2
+                        else:
+                            return 409, None  # O-1a, growing season: 410 O-1b
+                    else:
+                        if s.INVENTORY_STANDARD_CD == 'F':
+                            if s.NON_PRODUCTIVE_CD in [11, 12, 13]:
+                                if s.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']:
+                                    return 411, None  # D-1, growing season: 412 D-2
+                                else:
+                                    return 413, None  # O-1a, growing season: 414 O-1b
+                            elif s.NON_PRODUCTIVE_CD == 35:
+                                return 415, None  # W
+                            elif s.NON_PRODUCTIVE_CD == 42:
+                                return 416, None  # N
+                            elif s.NON_PRODUCTIVE_CD in [60, 62, 63]:
+                                return 417, None  # O-1a, growing season: 418 O-1b
+                            elif s.NON_PRODUCTIVE_CD is None:
+                                if s.BEC_ZONE_CODE in ['CMA', 'IMA']:
+                                    return 419, None  # N
+                                elif s.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']:
+                                    return 420, None  # D-1, growing season: 421 D-2
+                                else:
+                                    return 422, None  # O-1a, growing season: 423 O-1b
+                            else:
+                                return 424, None  # N
+                        else:
+                            if s.LAND_COVER_CLASS_CD_1 in ['LA', 'RE', 'RI', 'OC']:
+                                return 425, None  # W
+                            elif s.LAND_COVER_CLASS_CD_1 == 'HG':
+                                return 426, None  # O-1a, growing season: 427 O-1b
+                            elif s.LAND_COVER_CLASS_CD_1 in ['BY', 'BM', 'BL']:
+                                return 428, None  # D-1, growing season: 429 D-2
+                            elif s.LAND_COVER_CLASS_CD_1 in ['SL', 'ST', 'HE', 'HF', None]:
+                                if s.BEC_ZONE_CODE in ['CMA', 'IMA']:
+                                    return 430, None  # N
+                                elif s.BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']:
+                                    return 431, None  # D-1, growing season: 432 D-2
+                                else:
+                                    return 433, None  # O-1a, growing season: 434 O-1b
+                            else:
+                                return 435, None  # N
+
+
+# Predicates shared between branches of mask_decision_tree, evaluated once per batch
+_SHARED = [
+    lambda s, ft: (s.harv_lag <= 6),  # 0
+    lambda s, ft: s.eq('COAST_INTERIOR_CD', 'C'),  # 1
+    lambda s, ft: (s.harv_lag <= 24),  # 2
+    lambda s, ft: s.isin('BEC_ZONE_CODE', ['CWH', 'MH', 'ICH']),  # 3
+    lambda s, ft: s.isin('BEC_ZONE_CODE', ['CMA', 'IMA']),  # 4
+    lambda s, ft: s.isin('BEC_ZONE_CODE', ['CWH', 'CDF', 'ICH']),  # 5
+    lambda s, ft: s.member(_WET_SUBZONE),  # 6
+    lambda s, ft: s.eq('BEC_ZONE_CODE', 'BWBS'),  # 7
+    lambda s, ft: s.eq('BEC_ZONE_CODE', 'SWB'),  # 8
+    lambda s, ft: s.eq('BEC_ZONE_CODE', 'SBS'),  # 9
+    lambda s, ft: s.eq('BEC_ZONE_CODE', 'IDF'),  # 10
+    lambda s, ft: s.eq('BEC_ZONE_CODE', 'ICH'),  # 11
+    lambda s, ft: s.member(_DRY_SUBZONE),  # 12
+    lambda s, ft: s.eq('BEC_ZONE_CODE', 'CWH'),  # 13
+    lambda s, ft: (s.dist_lag < 11),  # 14
+    lambda s, ft: (s.dist_lag <= 3),  # 15
+    lambda s, ft: (s.dist_lag <= 6),  # 16
+    lambda s, ft: (s.dist_lag <= 10),  # 17
+    lambda s, ft: (s.dist_lag <= 1),  # 18
+    lambda s, ft: (s.harv_lag <= 7),  # 19
+    lambda s, ft: s.eq('BCLCS_LEVEL_5', 'SP'),  # 20
+    lambda s, ft: s.isin('BEC_ZONE_CODE', ['CWH', 'CDF', 'MH']),  # 21
+    lambda s, ft: (s.PROJ_HEIGHT_1 < 4),  # 22
+    lambda s, ft: (s.PROJ_HEIGHT_1 <= 12),  # 23
+    lambda s, ft: (s.stocking > 8000),  # 24
+    lambda s, ft: (s.PROJ_HEIGHT_1 > 12),  # 25
+    lambda s, ft: (s.CROWN_CLOSURE < 40),  # 26
+    lambda s, ft: s.isin('BEC_ZONE_CODE', ['BG', 'PP', 'IDF', 'MS']),  # 27
+    lambda s, ft: s.eq('EARLIEST_NONLOGGING_DIST_TYPE', 'IBM'),  # 28
+    lambda s, ft: (s.dist_lag <= 5),  # 29
+    lambda s, ft: (s.STAND_PERCENTAGE_DEAD > 50),  # 30
+    lambda s, ft: (s.STAND_PERCENTAGE_DEAD >= 25),  # 31
+    lambda s, ft: s.eq('SPECIES_CD_1', 'PY'),  # 32
+    lambda s, ft: s.isin('BCLCS_LEVEL_5', ['DE', 'OP']),  # 33
+    lambda s, ft: (s.harv_lag <= 10),  # 34
+    lambda s, ft: s.eq('BCLCS_LEVEL_5', 'DE'),  # 35
+    lambda s, ft: s.eq('BCLCS_LEVEL_5', 'OP'),  # 36
+    lambda s, ft: s.isin('SPECIES_CD_1', ['PA', 'PF', 'PW']),  # 37
+    lambda s, ft: (s.stocking >= 900),  # 38
+    lambda s, ft: (s.stocking >= 600),  # 39
+    lambda s, ft: s.isin('BEC_ZONE_CODE', ['CWH', 'MH', 'CDF']),  # 40
+    lambda s, ft: (s.PROJ_HEIGHT_1 >= 4),  # 41
+    lambda s, ft: (s.CROWN_CLOSURE > 55),  # 42
+    lambda s, ft: (s.STAND_PERCENTAGE_DEAD > 34),  # 43
+    lambda s, ft: (s.CROWN_CLOSURE >= 26),  # 44
+    lambda s, ft: s.eq('SPECIES_CD_1', 'SE'),  # 45
+    lambda s, ft: s.eq('SPECIES_CD_1', 'SS'),  # 46
+    lambda s, ft: s.isin('BEC_ZONE_CODE', ['BWBS', 'SWB']),  # 47
+    lambda s, ft: s.startswith('SPECIES_CD_1', 'S'),  # 48
+    lambda s, ft: s.isin('BEC_ZONE_CODE', ['CWH', 'CDF']),  # 49
+    lambda s, ft: (s.PROJ_HEIGHT_1 <= 15),  # 50
+    lambda s, ft: (s.PROJ_AGE_1 < 60),  # 51
+    lambda s, ft: (s.PROJ_AGE_1 <= 99),  # 52
+    lambda s, ft: s.startswith('SPECIES_CD_1', 'B'),  # 53
+    lambda s, ft: s.eq('SPECIES_CD_1', 'BG'),  # 54
+    lambda s, ft: s.eq('SPECIES_CD_1', 'BA'),  # 55
+    lambda s, ft: s.isin('SPECIES_CD_1', ['T', 'TW']),  # 56
+    lambda s, ft: s.isin('SPECIES_CD_1', ['J', 'JR']),  # 57
+    lambda s, ft: s.isin('BCLCS_LEVEL_5', ['OP', 'DE']),  # 58
+    lambda s, ft: s.eq('COAST_INTERIOR_CD', 'I'),  # 59
+    lambda s, ft: s.startswith('SPECIES_CD_1', 'H'),  # 60
+    lambda s, ft: s.isin('SPECIES_CD_2', ['SE', 'SW', 'S']),  # 61
+    lambda s, ft: s.eq('BEC_ZONE_CODE', 'BAFA'),  # 62
+    lambda s, ft: s.eq('BEC_ZONE_CODE', 'SBPS'),  # 63
+    lambda s, ft: s.eq('BEC_ZONE_CODE', 'MS'),  # 64
+    lambda s, ft: s.eq('BEC_ZONE_CODE', 'PP'),  # 65
+    lambda s, ft: s.eq('BEC_ZONE_CODE', 'BG'),  # 66
+    lambda s, ft: s.eq('BEC_ZONE_CODE', 'MH'),  # 67
+    lambda s, ft: s.eq('BEC_ZONE_CODE', 'ESSF'),  # 68
+    lambda s, ft: s.eq('BEC_ZONE_CODE', 'CDF'),  # 69
+]
+
+
+class _Shared(dict):
+    """
+    Lazily evaluated shared predicates of a batch of stands
+    """
+    def __init__(self, s, ft):
+        super().__init__()
+        self.s = s
+        self.ft = ft
+
+    def __missing__(self, k):
+        self[k] = _SHARED[k](self.s, self.ft)
+        return self[k]
+
+
+def mask_decision_tree(s, tree, m0, ft) -> None:
+    """
+    The fuel typing decision tree evaluated as boolean masks over a batch of stands.
+    :param s: the StandBatch
+    :param tree: the _MaskTree collecting the leaves (dormant season rule IDs) reached by the stands
+    :param m0: the stands to classify
+    :param ft: the FuelTyping instance
+    :return: None
+    """
+    split, put = tree.split, tree.put
+    p = _Shared(s, ft)
+
+    #### NON-VEGETATED SITE
+    m1, r0 = split(m0, ~s.is_vegetated | ~s.isin('BCLCS_LEVEL_1', ['V', 'N']))  # not is_vegetated or is_vegetated is None
+    if m1.any():
+        #### SITE LOGGED
+        m2, r1 = split(m1, s.is_logged)  # is_logged
+        if m2.any():
+            #### SITE HARVESTED WITHIN LAST 6 YEARS
+            m3, r2 = split(m2, p[0])  # harv_lag <= 6
+            if m3.any():
+                m4, r3 = split(m3, p[1])  # COAST_INTERIOR_CD == 'C'
+                put(m4, 1)  # S-3
+                put(r3, 2)  # S-1
+            #### SITE HARVESTED WITHIN LAST 7-24 YEARS
+            m3, r2 = split(r2, p[2])  # harv_lag <= 24
+            if m3.any():
+                m4, r3 = split(m3, p[3])  # BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']
+                put(m4, 3)  # D-1, growing season: 4 D-2
+                put(r3, 5)  # O-1a, growing season: 6 O-1b
+            #### SITE HARVESTED LONGER THAN 24 YEARS AGO
+            m3 = r2
+            if m3.any():
+                m4, r3 = split(m3, p[4])  # BEC_ZONE_CODE in ['CMA', 'IMA']
+                put(m4, 7)  # N
+                m4, r3 = split(r3, s.isin('BEC_ZONE_CODE', ['BAFA', 'MH']))  # BEC_ZONE_CODE in ['BAFA', 'MH']
+                put(m4, 8)  # D-1, growing season: 9 D-2
+                m4, r3 = split(r3, p[5] & p[6])  # BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH'] and dry_wet == 'wet'
+                put(m4, 10)  # C-5
+                m4, r3 = split(r3, p[7])  # BEC_ZONE_CODE in ['BWBS']
+                put(m4, 11)  # C-2
+                m4, r3 = split(r3, p[8])  # BEC_ZONE_CODE == 'SWB'
+                put(m4, 12, 50)  # M-1, growing season: 13 M-2
+                m4, r3 = split(r3, (p[9] | (p[10] & p[6])) | (p[11] & p[12]))  # BEC_ZONE_CODE == 'SBS' or (BEC_ZONE_CODE == 'IDF' and dry_wet == 'wet') or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'dry')
+                put(m4, 14)  # C-3
+                m4, r3 = split(r3, s.isin('BEC_ZONE_CODE', ['SBPS', 'MS', 'ESSF']) | (s.isin('BEC_ZONE_CODE', ['IDF', 'CDF']) & p[12]))  # BEC_ZONE_CODE in ['SBPS', 'MS', 'ESSF'] or (BEC_ZONE_CODE in ['IDF', 'CDF'] and dry_wet == 'dry')
+                put(m4, 15)  # C-7
+                m4, r3 = split(r3, s.isin('BEC_ZONE_CODE', ['PP', 'BG']))  # BEC_ZONE_CODE in ['PP', 'BG']
+                put(m4, 16)  # O-1a, growing season: 17 O-1b
+                m4, r3 = split(r3, p[13] & p[12])  # BEC_ZONE_CODE == 'CWH' and dry_wet == 'dry'
+                put(m4, 18, 40)  # M-1, growing season: 19 M-2
+        #### SITE UNLOGGED
+        m2 = r1
+        if m2.any():
+            #### SITE RECENTLY BURNED
+            m3, r2 = split(m2, (s.is_burned & ~s.none['EARLIEST_NONLOGGING_DIST_DATE']) & p[14])  # is_burned and dist_lag is not None and (dist_lag < 11)
+            if m3.any():
+                m4, r3 = split(m3, p[15])  # dist_lag <= 3
+                put(m4, 20)  # N
+                m4, r3 = split(r3, p[16])  # dist_lag <= 6
+                put(m4, 21)  # D-1, growing season: 22 D-2
+                m4, r3 = split(r3, p[17])  # dist_lag <= 10
+                put(m4, 23)  # O-1a, growing season: 24 O-1b
+            #### SITE NOT RECENTLY BURNED
+            m3 = r2
+            if m3.any():
+                m4, r3 = split(m3, s.eq('BCLCS_LEVEL_2', 'L') | s.null['BCLCS_LEVEL_2'])  # BCLCS_LEVEL_2 in ['L', None]
+                if m4.any():
+                    m5, r4 = split(m4, ~s.null['SPECIES_CD_1'])  # SPECIES_CD_1 is not None
+                    if m5.any():
+                        m6, r5 = split(m5, p[3])  # BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']
+                        put(m6, 25)  # D-1, growing season: 26 D-2
+                        put(r5, 27)  # O-1a, growing season: 28 O-1b
+                    put(r4, 29)  # N
+                put(r3, 30)  # N
+    #### SITE VEGETATED
+    m1, r0 = split(r0, s.is_vegetated)  # is_vegetated
+    if m1.any():
+        #### SITE FORESTED
+        m2, r1 = split(m1, s.is_forested)  # is_forested
+        if m2.any():
+            #### SITE RECENTLY BURNED
+            m3, r2 = split(m2, (s.is_burned & ~s.none['EARLIEST_NONLOGGING_DIST_DATE']) & p[17])  # is_burned and dist_lag is not None and (dist_lag <= 10)
+            if m3.any():
+                m4, r3 = split(m3, (s.pct_cnfr >= 60))  # pct_cnfr is not None and pct_cnfr >= 60
+                if m4.any():
+                    m5, r4 = split(m4, (s.CROWN_CLOSURE > 40))  # CROWN_CLOSURE is not None and CROWN_CLOSURE > 40
+                    if m5.any():
+                        m6, r5 = split(m5, p[15])  # dist_lag <= 3
+                        put(m6, 31)  # N
+                        m6, r5 = split(r5, p[16])  # dist_lag <= 6
+                        put(m6, 32)  # D-1, growing season: 33 D-2
+                        put(r5, 34)  # C-5
+                    m5 = r4
+                    if m5.any():
+                        m6, r5 = split(m5, p[18])  # dist_lag <= 1
+                        put(m6, 35)  # N
+                        m6, r5 = split(r5, p[16])  # dist_lag <= 6
+                        put(m6, 36)  # D-1, growing season: 37 D-2
+                        put(r5, 38)  # O-1a, growing season: 39 O-1b
+                m4 = r3
+                if m4.any():
+                    m5, r4 = split(m4, p[18])  # dist_lag <= 1
+                    put(m5, 40)  # N
+                    put(r4, 41)  # D-1, growing season: 42 D-2
+            #### SITE NOT RECENTLY BURNED
+            m3 = r2
+            if m3.any():
+                m4, r3 = split(m3, s.null['SPECIES_CD_1'] | (s.SPECIES_PCT_1 == 0))  # SPECIES_CD_1 is None or SPECIES_PCT_1 is None or SPECIES_PCT_1 == 0
+                put(m4, 43)  # VegForestNoBurn_Species-ERROR
+                #### PURE/SINGLE SPECIES STANDS
+                m4, r3 = split(r3, (s.SPECIES_PCT_1 >= 80))  # SPECIES_PCT_1 >= 80
+                if m4.any():
+                    m5, r4 = split(m4, s.member(_CONIFER_BITS[0]))  # SPECIES_CD_1 in coniferList
+                    if m5.any():
+                        #### PURE LODGEPOLE PINE STANDS
+                        m6, r5 = split(m5, s.isin('SPECIES_CD_1', ['PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P']))  # SPECIES_CD_1 in ['PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P']
+                        if m6.any():
+                            m7, r6 = split(m6, ~s.none['HARVEST_DATE'] & p[19])  # harv_lag is not None and harv_lag <= 7
+                            put(m7, 44)  # S-1
+                            m7 = r6
+                            if m7.any():
+                                #### SPARSE STANDS
+                                m8, r7 = split(m7, p[20])  # BCLCS_LEVEL_5 == 'SP'
+                                if m8.any():
+                                    m9, r8 = split(m8, p[21] | (p[11] & p[6]))  # BEC_ZONE_CODE in ['CWH', 'CDF', 'MH'] or (BEC_ZONE_CODE in ['ICH'] and dry_wet == 'wet')
+                                    put(m9, 45)  # D-1, growing season: 46 D-2
+                                    put(r8, 47)  # C-7
+                                #### DENSE OR OPEN STANDS
+                                m8 = r7
+                                if m8.any():
+                                    m9, r8 = split(m8, p[22])  # PROJ_HEIGHT_1 < 4
+                                    put(m9, 48)  # O-1a, growing season: 49 O-1b
+                                    m9, r8 = split(r8, p[23])  # PROJ_HEIGHT_1 <= 12
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[24])  # stocking > 8000
+                                        put(m10, 50)  # C-4
+                                        put(r9, 51)  # C-3
+                                    m9, r8 = split(r8, p[25])  # PROJ_HEIGHT_1 > 12
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[26])  # CROWN_CLOSURE < 40
+                                        if m10.any():
+                                            m11, r10 = split(m10, p[27])  # BEC_ZONE_CODE in ['BG', 'PP', 'IDF', 'MS']
+                                            put(m11, 52)  # C-7
+                                            m11, r10 = split(r10, p[3])  # BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']
+                                            put(m11, 53)  # C-5
+                                            put(r10, 54)  # C-3
+                                        m10 = r9
+                                        if m10.any():
+                                            #### MOUNTAIN PINE BEETLE STANDS
+                                            m11, r10 = split(m10, p[28])  # EARLIEST_NONLOGGING_DIST_TYPE == 'IBM'
+                                            if m11.any():
+                                                m12, r11 = split(m11, p[29], s.none['EARLIEST_NONLOGGING_DIST_DATE'])  # dist_lag <= 5
+                                                if m12.any():
+                                                    m13, r12 = split(m12, p[30])  # STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD > 50
+                                                    put(m13, 55, 65)  # M-3
+                                                    m13, r12 = split(r12, p[31])  # STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD >= 25
+                                                    put(m13, 56)  # C-2
+                                                    put(r12, 57)  # C-3
+                                                m12 = r11
+                                                if m12.any():
+                                                    m13, r12 = split(m12, p[30])  # STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD > 50
+                                                    put(m13, 58)  # C-2
+                                                    m13, r12 = split(r12, p[31])  # STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD >= 25
+                                                    put(m13, 59)  # C-3
+                                                    put(r12, 60)  # C-3
+                                            #### NON MOUNTAIN PINE BEETLE STANDS
+                                            put(r10, 61)  # C-3
+                        #### PURE PONDEROSA PINE STANDS
+                        m6, r5 = split(r5, p[32])  # SPECIES_CD_1 == 'PY'
+                        if m6.any():
+                            #### DENSE OR OPEN STANDS
+                            m7, r6 = split(m6, p[33])  # BCLCS_LEVEL_5 in ['DE', 'OP']
+                            if m7.any():
+                                m8, r7 = split(m7, ~s.none['HARVEST_DATE'] & p[34])  # harv_lag is not None and harv_lag <= 10
+                                put(m8, 62)  # S-1
+                                m8 = r7
+                                if m8.any():
+                                    m9, r8 = split(m8, p[22])  # PROJ_HEIGHT_1 < 4
+                                    put(m9, 63)  # O-1a, growing season: 64 O-1b
+                                    m9, r8 = split(r8, p[23])  # PROJ_HEIGHT_1 <= 12
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[24])  # stocking > 8000
+                                        put(m10, 65)  # C-4
+                                        m10, r9 = split(r9, (s.stocking >= 3000))  # stocking >= 3000
+                                        put(m10, 66)  # C-3
+                                        put(r9, 67)  # C-7
+                                    m9, r8 = split(r8, (s.PROJ_HEIGHT_1 <= 17))  # PROJ_HEIGHT_1 <= 17
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[35])  # BCLCS_LEVEL_5 == 'DE'
+                                        put(m10, 68)  # C-3
+                                        m10, r9 = split(r9, p[36])  # BCLCS_LEVEL_5 == 'OP'
+                                        put(m10, 69)  # C-7
+                                    put(r8, 70)  # C-7
+                            #### SPARSE STANDS
+                            m7, r6 = split(r6, p[20])  # BCLCS_LEVEL_5 == 'SP'
+                            if m7.any():
+                                m8, r7 = split(m7, (s.STAND_PERCENTAGE_DEAD >= 40))  # STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD >= 40
+                                put(m8, 71)  # O-1a, growing season: 72 O-1b
+                                m8 = r7
+                                if m8.any():
+                                    m9, r8 = split(m8, ~s.none['HARVEST_DATE'] & p[34])  # harv_lag is not None and harv_lag <= 10
+                                    put(m9, 73)  # S-1
+                                    put(r8, 74)  # C-7
+                        #### PURE OTHER PINE STANDS
+                        m6, r5 = split(r5, p[37])  # SPECIES_CD_1 in ['PA', 'PF', 'PW']
+                        if m6.any():
+                            m7, r6 = split(m6, p[35])  # BCLCS_LEVEL_5 == 'DE'
+                            put(m7, 75)  # C-3
+                            m7, r6 = split(r6, s.isin('BCLCS_LEVEL_5', ['SP', 'OP']))  # BCLCS_LEVEL_5 in ['SP', 'OP']
+                            if m7.any():
+                                m8, r7 = split(m7, p[38])  # stocking >= 900
+                                put(m8, 76)  # C-3
+                                m8, r7 = split(r7, p[39])  # stocking >= 600
+                                put(m8, 77)  # C-7
+                                put(r7, 78)  # C-5
+                        #### PURE DOUGLAS-FIR STANDS
+                        m6, r5 = split(r5, s.isin('SPECIES_CD_1', ['FD', 'FDC', 'FDI', 'F']))  # SPECIES_CD_1 in ['FD', 'FDC', 'FDI', 'F']
+                        if m6.any():
+                            #### SITE HARVESTED WITHIN LAST 6 YEARS
+                            m7, r6 = split(m6, ~s.none['HARVEST_DATE'] & p[0])  # harv_lag is not None and harv_lag <= 6
+                            if m7.any():
+                                m8, r7 = split(m7, p[40] | (p[11] & p[6]))  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')
+                                put(m8, 79)  # S-3
+                                put(r7, 80)  # S-1
+                            #### SITE HARVESTED LONGER THAN 6 YEARS AGO
+                            m7 = r6
+                            if m7.any():
+                                m8, r7 = split(m7, p[22])  # PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 < 4
+                                if m8.any():
+                                    m9, r8 = split(m8, p[40] | (p[11] & p[6]))  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')
+                                    put(m9, 81)  # D-1, growing season: 82 D-2
+                                    put(r8, 83)  # O-1a, growing season: 84 O-1b
+                                m8, r7 = split(r7, p[41])  # PROJ_HEIGHT_1 is not None and PROJ_HEIGHT_1 >= 4
+                                if m8.any():
+                                    m9, r8 = split(m8, p[42])  # CROWN_CLOSURE is not None and CROWN_CLOSURE > 55
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[23])  # PROJ_HEIGHT_1 <= 12
+                                        if m10.any():
+                                            m11, r10 = split(m10, p[40] | (p[11] & p[6]))  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')
+                                            put(m11, 85)  # C-3
+                                            m11 = r10
+                                            if m11.any():
+                                                m12, r11 = split(m11, p[43])  # STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD > 34
+                                                put(m12, 86)  # C-4
+                                                put(r11, 87)  # C-3
+                                        m10, r9 = split(r9, p[25])  # PROJ_HEIGHT_1 > 12
+                                        if m10.any():
+                                            m11, r10 = split(m10, p[40] | (p[11] & p[6]))  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')
+                                            put(m11, 88)  # C-5
+                                            put(r10, 89)  # C-7
+                                    m9, r8 = split(r8, p[44])  # CROWN_CLOSURE is None or CROWN_CLOSURE >= 26
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[40] | (p[11] & p[6]))  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')
+                                        put(m10, 90)  # C-5
+                                        put(r9, 91)  # C-7
+                                    m9 = r8
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[40] | (p[11] & p[6]))  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')
+                                        put(m10, 92)  # D-1, growing season: 93 D-2
+                                        put(r9, 94)  # O-1a, growing season: 95 O-1b
+                                put(r7, 96)  # VegForestNoBurnPureFd_ProjHeight-ERROR
+                        #### PURE ENGELMANN SPRUCE STANDS
+                        m6, r5 = split(r5, p[45])  # SPECIES_CD_1 == 'SE'
+                        if m6.any():
+                            m7, r6 = split(m6, ~s.none['HARVEST_DATE'] & p[34])  # harv_lag is not None and harv_lag <= 10
+                            put(m7, 97)  # S-2
+                            m7 = r6
+                            if m7.any():
+                                m8, r7 = split(m7, p[20])  # BCLCS_LEVEL_5 == 'SP'
+                                put(m8, 98)  # D-1, growing season: 99 D-2
+                                m8, r7 = split(r7, p[35])  # BCLCS_LEVEL_5 == 'DE'
+                                put(m8, 100)  # C-2
+                                m8, r7 = split(r7, p[36])  # BCLCS_LEVEL_5 == 'OP'
+                                put(m8, 101)  # C-3
+                        #### PURE SITKA SPRUCE STANDS
+                        m6, r5 = split(r5, p[46])  # SPECIES_CD_1 == 'SS'
+                        if m6.any():
+                            m7, r6 = split(m6, ~s.none['HARVEST_DATE'] & p[0])  # harv_lag is not None and harv_lag <= 6
+                            put(m7, 102)  # S-3
+                            m7 = r6
+                            if m7.any():
+                                m8, r7 = split(m7, p[20])  # BCLCS_LEVEL_5 == 'SP'
+                                put(m8, 103)  # D-1, growing season: 104 D-2
+                                m8, r7 = split(r7, p[33])  # BCLCS_LEVEL_5 in ['DE', 'OP']
+                                put(m8, 105)  # C-5
+                        #### PURE BLACK OR WHITE SPRUCE STANDS
+                        m6, r5 = split(r5, s.isin('SPECIES_CD_1', ['SB', 'SW']))  # SPECIES_CD_1 in ['SB', 'SW']
+                        if m6.any():
+                            m7, r6 = split(m6, ~s.none['HARVEST_DATE'] & p[34])  # harv_lag is not None and harv_lag <= 10
+                            put(m7, 106)  # S-2
+                            m7 = r6
+                            if m7.any():
+                                m8, r7 = split(m7, p[33])  # BCLCS_LEVEL_5 in ['DE', 'OP']
+                                put(m8, 107)  # C-2
+                                m8, r7 = split(r7, p[20])  # BCLCS_LEVEL_5 == 'SP'
+                                if m8.any():
+                                    m9, r8 = split(m8, p[47])  # BEC_ZONE_CODE in ['BWBS', 'SWB']
+                                    put(m9, 108)  # C-1
+                                    put(r8, 109, 30)  # M-1, growing season: 110 M-2
+                        #### PURE SPRUCE (UNKNOWN OR HYBRID) STANDS
+                        m6, r5 = split(r5, p[48])  # SPECIES_CD_1.startswith('S')
+                        if m6.any():
+                            m7, r6 = split(m6, ~s.none['HARVEST_DATE'] & p[19])  # harv_lag is not None and harv_lag <= 7
+                            put(m7, 111)  # S-2
+                            m7 = r6
+                            if m7.any():
+                                m8, r7 = split(m7, p[47])  # BEC_ZONE_CODE in ['BWBS', 'SWB']
+                                if m8.any():
+                                    m9, r8 = split(m8, p[33])  # BCLCS_LEVEL_5 in ['DE', 'OP']
+                                    put(m9, 112)  # C-2
+                                    put(r8, 113)  # C-1
+                                m8 = r7
+                                if m8.any():
+                                    m9, r8 = split(m8, p[20])  # BCLCS_LEVEL_5 == 'SP'
+                                    put(m9, 114)  # C-7
+                                    m9 = r8
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[49])  # BEC_ZONE_CODE in ['CWH', 'CDF']
+                                        put(m10, 115)  # C-5
+                                        m10 = r9
+                                        if m10.any():
+                                            m11, r10 = split(m10, p[22])  # PROJ_HEIGHT_1 < 4
+                                            put(m11, 116)  # O-1a, growing season: 117 O-1b
+                                            m11, r10 = split(r10, p[41])  # PROJ_HEIGHT_1 >= 4
+                                            if m11.any():
+                                                m12, r11 = split(m11, p[36])  # BCLCS_LEVEL_5 == 'OP'
+                                                put(m12, 118)  # C-3
+                                                m12, r11 = split(r11, p[35])  # BCLCS_LEVEL_5 == 'DE'
+                                                put(m12, 119)  # C-2
+                                                put(r11, 120)  # VegForestPureOtherSpruceInterior_NoBCLCSLv5-ERROR
+                                            put(r10, 121)  # VegForestPureOtherSpruceInterior_ProjHeight-ERROR
+                        #### PURE REDCEDAR, YELLOW CEDAR OR HEMLOCK STANDS
+                        m6, r5 = split(r5, s.isin('SPECIES_CD_1', ['C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM']))  # SPECIES_CD_1 in ['C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM']
+                        if m6.any():
+                            m7, r6 = split(m6, ~s.none['HARVEST_DATE'] & p[0])  # harv_lag is not None and harv_lag <= 6
+                            put(m7, 122)  # S-3
+                            m7 = r6
+                            if m7.any():
+                                m8, r7 = split(m7, p[35])  # BCLCS_LEVEL_5 == 'DE'
+                                if m8.any():
+                                    m9, r8 = split(m8, p[22])  # PROJ_HEIGHT_1 < 4
+                                    put(m9, 123)  # D-1, growing season: 124 D-2
+                                    m9, r8 = split(r8, p[50])  # PROJ_HEIGHT_1 <= 15
+                                    put(m9, 125)  # C-3
+                                    m9, r8 = split(r8, (s.PROJ_HEIGHT_1 > 15))  # PROJ_HEIGHT_1 > 15
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[51])  # PROJ_AGE_1 < 60
+                                        put(m10, 126)  # C-3
+                                        m10, r9 = split(r9, p[52])  # PROJ_AGE_1 <= 99
+                                        put(m10, 127, 30)  # M-1, growing season: 128 M-2
+                                        put(r9, 129)  # C-5
+                                m8, r7 = split(r7, p[36])  # BCLCS_LEVEL_5 == 'OP'
+                                put(m8, 130)  # C-5
+                                m8, r7 = split(r7, p[20])  # BCLCS_LEVEL_5 == 'SP'
+                                put(m8, 131)  # D-1, growing season: 132 D-2
+                        #### PURE TRUE FIR STANDS
+                        m6, r5 = split(r5, p[53])  # SPECIES_CD_1.startswith('B')
+                        if m6.any():
+                            m7, r6 = split(m6, p[54])  # SPECIES_CD_1 == 'BG'
+                            put(m7, 133)  # C-7
+                            m7, r6 = split(r6, p[55])  # SPECIES_CD_1 == 'BA'
+                            put(m7, 134, 30)  # M-1, growing season: 135 M-2
+                            m7 = r6
+                            if m7.any():
+                                m8, r7 = split(m7, p[20])  # BCLCS_LEVEL_5 == 'SP'
+                                put(m8, 136)  # C-7
+                                put(r7, 137)  # C-5
+                        #### PURE YEW STANDS
+                        m6, r5 = split(r5, p[56])  # SPECIES_CD_1 in ['T', 'TW']
+                        put(m6, 138)  # C-5
+                        #### PURE JUNIPER STANDS
+                        m6, r5 = split(r5, p[57])  # SPECIES_CD_1 in ['J', 'JR']
+                        put(m6, 139)  # O-1a, growing season: 140 O-1b
+                        put(r5, 141)  # VegForestedPureSpeciesStand_Species-ERROR
+                    #### DECIDUOUS/BROADLEAF OR LARCH STAND
+                    put(r4, 142)  # D-1, growing season: 143 D-2
+                #### MIXED-SPECIES STANDS
+                m4, r3 = split(r3, (s.SPECIES_PCT_1 < 80))  # SPECIES_PCT_1 < 80
+                if m4.any():
+                    #### MIXED-SPECIES DECIDUOUS STANDS
+                    m5, r4 = split(m4, (s.pct_cnfr <= 20))  # pct_cnfr <= 20
+                    put(m5, 144)  # D-1, growing season: 145 D-2
+                    #### MIXED-SPECIES CONIFER OR MIXEDWOOD STANDS
+                    m5, r4 = split(r4, (s.pct_cnfr > 20))  # pct_cnfr > 20
+                    if m5.any():
+                        #### 21-40% CONIFER = DECIDUOUS DOMINATED MIXEDWOOD STANDS
+                        m6, r5 = split(m5, (s.pct_cnfr <= 40))  # pct_cnfr <= 40
+                        if m6.any():
+                            m7, r6 = split(m6, ~s.none['HARVEST_DATE'] & p[0])  # harv_lag is not None and harv_lag <= 6
+                            put(m7, 146)  # S-2
+                            m7 = r6
+                            if m7.any():
+                                #### DOMINANT CONIFER = BLACK, WHITE, ENGELMANN, OR HYBRID SPRUCE
+                                m8, r7 = split(m7, s.dom_conifers[('SB', 'SW', 'SE', 'SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX')])  # dominant('SB', 'SW', 'SE', 'SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX')
+                                put(m8, 147, s.pct_cnfr)  # M-1, growing season: 148 M-2
+                                #### DOMINANT CONIFER = UNKNOWN SPRUCE
+                                m8, r7 = split(r7, s.dom_conifers[('S',)])  # dominant('S')
+                                if m8.any():
+                                    m9, r8 = split(m8, p[1])  # COAST_INTERIOR_CD == 'C'
+                                    put(m9, 149, s.pct_cnfr * 0.5)  # M-1, growing season: 150 M-2
+                                    put(r8, 151, s.pct_cnfr)  # M-1, growing season: 152 M-2
+                                #### DOMINANT CONIFER = ANY OTHER CONIFER
+                                m8 = r7
+                                if m8.any():
+                                    m9, r8 = split(m8, p[20])  # BCLCS_LEVEL_5 == 'SP'
+                                    put(m9, 153, s.pct_cnfr * 0.5)  # M-1, growing season: 154 M-2
+                                    put(r8, 155, s.pct_cnfr * 0.7)  # M-1, growing season: 156 M-2
+                        #### 41-65% CONIFER = CONIFER_DOMINATED MIXEDWOOD STANDS
+                        m6, r5 = split(r5, (s.pct_cnfr <= 65))  # pct_cnfr <= 65
+                        if m6.any():
+                            m7, r6 = split(m6, ~s.none['HARVEST_DATE'] & p[0])  # harv_lag is not None and harv_lag <= 6
+                            put(m7, 157)  # S-1
+                            m7 = r6
+                            if m7.any():
+                                #### DOMINANT CONIFER = LODGEPOLE PINE
+                                m8, r7 = split(m7, s.dom_conifers[('PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P')])  # dominant('PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P')
+                                if m8.any():
+                                    m9, r8 = split(m8, p[20])  # BCLCS_LEVEL_5 == 'SP'
+                                    put(m9, 158, s.pct_cnfr * 0.6)  # M-1, growing season: 159 M-2
+                                    m9, r8 = split(r8, p[36])  # BCLCS_LEVEL_5 == 'OP'
+                                    put(m9, 160, s.pct_cnfr * 0.7)  # M-1, growing season: 161 M-2
+                                    m9, r8 = split(r8, p[35])  # BCLCS_LEVEL_5 == 'DE'
+                                    put(m9, 162, s.pct_cnfr * 0.8)  # M-1, growing season: 163 M-2
+                                #### DOMINANT CONIFER = PONDEROSA PINE
+                                m8, r7 = split(r7, s.dom_conifers[('PY',)])  # dominant('PY')
+                                put(m8, 164, s.pct_cnfr * 0.6)  # M-1, growing season: 165 M-2
+                                #### DOMINANT CONIFER = OTHER PINE
+                                m8, r7 = split(r7, s.dom_conifers[('PA', 'PF', 'PW')])  # dominant('PA', 'PF', 'PW')
+                                put(m8, 166, s.pct_cnfr * 0.5)  # M-1, growing season: 167 M-2
+                                #### DOMINANT CONIFER = DOUGLAS-FIR
+                                m8, r7 = split(r7, s.dom_conifers[('F', 'FD', 'FDC', 'FDI')])  # dominant('F', 'FD', 'FDC', 'FDI')
+                                if m8.any():
+                                    m9, r8 = split(m8, p[5])  # BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH']
+                                    put(m9, 168, s.pct_cnfr * 0.5)  # M-1, growing season: 169 M-2
+                                    put(r8, 170, s.pct_cnfr * 0.6)  # M-1, growing season: 171 M-2
+                                #### DOMINANT CONIFER = ENGELMANN SPRUCE
+                                m8, r7 = split(r7, s.dom_conifers[('SE',)])  # dominant('SE')
+                                if m8.any():
+                                    m9, r8 = split(m8, p[20])  # BCLCS_LEVEL_5 == 'SP'
+                                    put(m9, 172, s.pct_cnfr * 0.6)  # M-1, growing season: 173 M-2
+                                    m9, r8 = split(r8, p[58])  # BCLCS_LEVEL_5 in ['OP', 'DE']
+                                    put(m9, 174, s.pct_cnfr * 0.9)  # M-1, growing season: 175 M-2
+                                #### DOMINANT CONIFER = SITKA SPRUCE
+                                m8, r7 = split(r7, s.dom_conifers[('SS',)])  # dominant('SS')
+                                put(m8, 176, s.pct_cnfr * 0.4)  # M-1, growing season: 177 M-2
+                                #### DOMINANT CONIFER = BLACK OR WHITE SPRUCE
+                                m8, r7 = split(r7, s.dom_conifers[('SB', 'SW')])  # dominant('SB', 'SW')
+                                put(m8, 178, s.pct_cnfr)  # M-1, growing season: 179 M-2
+                                #### DOMINANT CONIFER = UNKNOWN OR HYBRID SPRUCE
+                                m8, r7 = split(r7, s.dom_conifers[('SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX', 'S')])  # dominant('SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX', 'S')
+                                if m8.any():
+                                    m9, r8 = split(m8, p[47])  # BEC_ZONE_CODE in ['BWBS', 'SWB']
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[33])  # BCLCS_LEVEL_5 in ['DE', 'OP']
+                                        put(m10, 180, s.pct_cnfr)  # M-1, growing season: 181 M-2
+                                        m10, r9 = split(r9, p[20])  # BCLCS_LEVEL_5 in ['SP']
+                                        put(m10, 182, s.pct_cnfr * 0.6)  # M-1, growing season: 183 M-2
+                                    m9 = r8
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[20])  # BCLCS_LEVEL_5 in ['SP']
+                                        put(m10, 184, s.pct_cnfr * 0.6)  # M-1, growing season: 185 M-2
+                                        m10, r9 = split(r9, p[33])  # BCLCS_LEVEL_5 in ['DE', 'OP']
+                                        if m10.any():
+                                            m11, r10 = split(m10, p[59])  # COAST_INTERIOR_CD == 'I'
+                                            put(m11, 186, s.pct_cnfr * 0.8)  # M-1, growing season: 187 M-2
+                                            m11, r10 = split(r10, p[1])  # COAST_INTERIOR_CD == 'C'
+                                            put(m11, 188, s.pct_cnfr * 0.5)  # M-1, growing season: 189 M-2
+                                        put(r9, 190)  # VegForestMixedSpeciesCnfrLT65_BCLCSLv5-ERROR
+                                #### DOMINANT CONIFER = REDCEDAR, YELLOW CEDAR OR HEMLOCK
+                                m8, r7 = split(r7, s.dom_conifers[('C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM')])  # dominant('C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM')
+                                put(m8, 191, s.pct_cnfr * 0.4)  # M-1, growing season: 192 M-2
+                                #### DOMINANT CONIFER = FIR
+                                m8, r7 = split(r7, s.dom_conifers[('B', 'BA', 'BG', 'BL')])  # dominant('B', 'BA', 'BG', 'BL')
+                                put(m8, 193, s.pct_cnfr * 0.6)  # M-1, growing season: 194 M-2
+                                #### DOMINANT CONIFER = YEW
+                                m8, r7 = split(r7, s.dom_conifers[('T', 'TW')])  # dominant('T', 'TW')
+                                put(m8, 195)  # C-5
+                                #### DOMINANT CONIFER = JUNIPER
+                                m8, r7 = split(r7, s.dom_conifers[('J', 'JR')])  # dominant('J', 'JR')
+                                put(m8, 196)  # O-1a, growing season: 197 O-1b
+                        #### 66-80% CONIFER = CONIFER_DOMINATED MIXEDWOOD STANDS
+                        m6, r5 = split(r5, (s.pct_cnfr <= 80))  # pct_cnfr <= 80
+                        if m6.any():
+                            m7, r6 = split(m6, ~s.none['HARVEST_DATE'] & p[0])  # harv_lag is not None and harv_lag <= 6
+                            put(m7, 198)  # S-1
+                            m7 = r6
+                            if m7.any():
+                                #### DOMINANT CONIFER = LODGEPOLE PINE
+                                m8, r7 = split(m7, s.dom_conifers[('PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P')])  # dominant('PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P')
+                                if m8.any():
+                                    m9, r8 = split(m8, p[20])  # BCLCS_LEVEL_5 in ['SP']
+                                    put(m9, 199, s.pct_cnfr * 0.5)  # M-1, growing season: 200 M-2
+                                    m9, r8 = split(r8, p[36])  # BCLCS_LEVEL_5 in ['OP']
+                                    put(m9, 201, s.pct_cnfr * 0.7)  # M-1, growing season: 202 M-2
+                                    m9, r8 = split(r8, p[35])  # BCLCS_LEVEL_5 in ['DE']
+                                    put(m9, 203, s.pct_cnfr * 0.8)  # M-1, growing season: 204 M-2
+                                #### DOMINANT CONIFER = PONDEROSA PINE
+                                m8, r7 = split(r7, s.dom_conifers[('PY',)])  # dominant('PY')
+                                put(m8, 205)  # C-7
+                                #### DOMINANT CONIFER = OTHER PINE
+                                m8, r7 = split(r7, s.dom_conifers[('PA', 'PF', 'PW')])  # dominant('PA', 'PF', 'PW')
+                                put(m8, 206)  # C-5
+                                #### DOMINANT CONIFER = DOUGLAS-FIR
+                                m8, r7 = split(r7, s.dom_conifers[('F', 'FD', 'FDC', 'FDI')])  # dominant('F', 'FD', 'FDC', 'FDI')
+                                if m8.any():
+                                    m9, r8 = split(m8, p[49] | (p[11] & p[6]))  # BEC_ZONE_CODE in ['CWH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')
+                                    put(m9, 207)  # C-5
+                                    m9 = r8
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[35])  # BCLCS_LEVEL_5 in ['DE']
+                                        put(m10, 208, s.pct_cnfr * 0.7)  # M-1, growing season: 209 M-2
+                                        put(r9, 210)  # C-7
+                                #### DOMINANT CONIFER = ENGELMANN SPRUCE
+                                m8, r7 = split(r7, s.dom_conifers[('SE',)])  # dominant('SE')
+                                if m8.any():
+                                    m9, r8 = split(m8, p[20])  # BCLCS_LEVEL_5 in ['SP']
+                                    put(m9, 211, s.pct_cnfr * 0.6)  # M-1, growing season: 212 M-2
+                                    m9, r8 = split(r8, p[58])  # BCLCS_LEVEL_5 in ['OP', 'DE']
+                                    put(m9, 213, s.pct_cnfr * 0.7)  # M-1, growing season: 214 M-2
+                                #### DOMINANT CONIFER = SITKA SPRUCE
+                                m8, r7 = split(r7, s.dom_conifers[('SS',)])  # dominant('SS')
+                                put(m8, 215)  # C-5
+                                #### DOMINANT CONIFER = BLACK OR WHITE SPRUCE
+                                m8, r7 = split(r7, s.dom_conifers[('SB', 'SW')])  # dominant('SB', 'SW')
+                                put(m8, 216, s.pct_cnfr)  # M-1, growing season: 217 M-2
+                                #### DOMINANT CONIFER = UNKNOWN OR HYBRID SPRUCE
+                                m8, r7 = split(r7, s.dom_conifers[('SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX', 'S')])  # dominant('SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX', 'S')
+                                if m8.any():
+                                    m9, r8 = split(m8, p[47])  # BEC_ZONE_CODE in ['BWBS', 'SWB']
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[33])  # BCLCS_LEVEL_5 in ['DE', 'OP']
+                                        put(m10, 218, s.pct_cnfr)  # M-1, growing season: 219 M-2
+                                        m10, r9 = split(r9, p[20])  # BCLCS_LEVEL_5 in ['SP']
+                                        put(m10, 220, s.pct_cnfr * 0.6)  # M-1, growing season: 221 M-2
+                                    m9 = r8
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[20])  # BCLCS_LEVEL_5 in ['SP']
+                                        put(m10, 222, s.pct_cnfr * 0.6)  # M-1, growing season: 223 M-2
+                                        m10 = r9
+                                        if m10.any():
+                                            m11, r10 = split(m10, p[59])  # COAST_INTERIOR_CD == 'I'
+                                            put(m11, 224, s.pct_cnfr * 0.8)  # M-1, growing season: 225 M-2
+                                            put(r10, 226)  # C-5
+                                #### DOMINANT CONIFER = REDCEDAR, YELLOW CEDAR OR HEMLOCK
+                                m8, r7 = split(r7, s.dom_conifers[('C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM')])  # dominant('C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM')
+                                put(m8, 227)  # C-5
+                                #### DOMINANT CONIFER = FIR
+                                m8, r7 = split(r7, s.dom_conifers[('B', 'BA', 'BG', 'BL')])  # dominant('B', 'BA', 'BG', 'BL')
+                                put(m8, 228)  # C-7
+                                #### DOMINANT CONIFER = YEW
+                                m8, r7 = split(r7, s.dom_conifers[('T', 'TW')])  # dominant('T', 'TW')
+                                put(m8, 229)  # C-5
+                                #### DOMINANT CONIFER = JUNIPER
+                                m8, r7 = split(r7, s.dom_conifers[('J', 'JR')])  # dominant('J', 'JR')
+                                put(m8, 230)  # C-7
+                        #### 81-100% CONIFER = PURE CONIFER, MIXED-SPECIES STANDS
+                        m6, r5 = split(r5, (s.pct_cnfr <= 100))  # pct_cnfr <= 100
+                        if m6.any():
+                            #### DOMINANT CONIFER = LODGEPONE PINE
+                            m7, r6 = split(m6, s.isin('SPECIES_CD_1', ['P', 'PL', 'PLI', 'PLC', 'PJ', 'PXJ']))  # SPECIES_CD_1 in ['P', 'PL', 'PLI', 'PLC', 'PJ', 'PXJ']
+                            if m7.any():
+                                m8, r7 = split(m7, ~s.none['HARVEST_DATE'] & p[19])  # harv_lag is not None and harv_lag <= 7
+                                put(m8, 231)  # S-1
+                                m8 = r7
+                                if m8.any():
+                                    m9, r8 = split(m8, p[20])  # BCLCS_LEVEL_5 in ['SP']
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[21] | (p[11] & p[6]))  # BEC_ZONE_CODE in ['CWH', 'CDF', 'MH'] or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')
+                                        put(m10, 232)  # D-1, growing season: 233 D-2
+                                        put(r9, 234)  # C-7
+                                    m9 = r8
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[22])  # PROJ_HEIGHT_1 < 4
+                                        put(m10, 235)  # O-1a, growing season: 236 O-1b
+                                        m10, r9 = split(r9, p[41])  # PROJ_HEIGHT_1 >= 4
+                                        if m10.any():
+                                            m11, r10 = split(m10, s.startswith('SPECIES_CD_2', 'S') | s.startswith('SPECIES_CD_2', 'B'), s.null['SPECIES_CD_2'])  # SPECIES_CD_2.startswith('S') or SPECIES_CD_2.startswith('B')
+                                            if m11.any():
+                                                m12, r11 = split(m11, p[23])  # PROJ_HEIGHT_1 <= 12
+                                                if m12.any():
+                                                    m13, r12 = split(m12, p[24])  # stocking > 8000
+                                                    put(m13, 237)  # C-4
+                                                    put(r12, 238)  # C-3
+                                                m12 = r11
+                                                if m12.any():
+                                                    m13, r12 = split(m12, p[26])  # CROWN_CLOSURE < 40
+                                                    if m13.any():
+                                                        m14, r13 = split(m13, p[27])  # BEC_ZONE_CODE in ['BG', 'PP', 'IDF', 'MS']
+                                                        put(m14, 239)  # C-7
+                                                        m14, r13 = split(r13, p[3])  # BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']
+                                                        put(m14, 240)  # C-5
+                                                        put(r13, 241)  # C-3
+                                                    m13 = r12
+                                                    if m13.any():
+                                                        m14, r13 = split(m13, p[28])  # EARLIEST_NONLOGGING_DIST_TYPE == 'IBM'
+                                                        if m14.any():
+                                                            m15, r14 = split(m14, p[29], s.none['EARLIEST_NONLOGGING_DIST_DATE'])  # dist_lag <= 5
+                                                            if m15.any():
+                                                                m16, r15 = split(m15, p[35])  # BCLCS_LEVEL_5 in ['DE']
+                                                                if m16.any():
+                                                                    m17, r16 = split(m16, p[30])  # STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD > 50
+                                                                    put(m17, 242, 65)  # M-3
+                                                                    m17, r16 = split(r16, p[31])  # STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD >= 25
+                                                                    put(m17, 243)  # C-2
+                                                                    put(r16, 244)  # C-2
+                                                                m16 = r15
+                                                                if m16.any():
+                                                                    m17, r16 = split(m16, p[30])  # STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD > 50
+                                                                    put(m17, 245, 65)  # M-3
+                                                                    m17, r16 = split(r16, p[31])  # STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD >= 25
+                                                                    put(m17, 246)  # C-2
+                                                                    put(r16, 247)  # C-3
+                                                            m15 = r14
+                                                            if m15.any():
+                                                                m16, r15 = split(m15, p[35])  # BCLCS_LEVEL_5 in ['DE']
+                                                                if m16.any():
+                                                                    m17, r16 = split(m16, p[30])  # STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD > 50
+                                                                    put(m17, 248)  # C-2
+                                                                    m17, r16 = split(r16, p[31])  # STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD >= 25
+                                                                    put(m17, 249)  # C-2
+                                                                    put(r16, 250)  # C-3
+                                                                m16 = r15
+                                                                if m16.any():
+                                                                    m17, r16 = split(m16, p[30])  # STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD > 50
+                                                                    put(m17, 251)  # C-2
+                                                                    m17, r16 = split(r16, p[31])  # STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD >= 25
+                                                                    put(m17, 252)  # C-3
+                                                                    put(r16, 253)  # C-3
+                                                        put(r13, 254)  # C-3
+                                            m11 = r10
+                                            if m11.any():
+                                                m12, r11 = split(m11, p[26])  # CROWN_CLOSURE < 40
+                                                if m12.any():
+                                                    m13, r12 = split(m12, s.isin('BEC_ZONE_CODE', ['IDF', 'PP', 'BG', 'SBPS', 'MS']))  # BEC_ZONE_CODE in ['IDF', 'PP', 'BG', 'SBPS', 'MS']
+                                                    put(m13, 255)  # C-7
+                                                    m13, r12 = split(r12, p[5])  # BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH']
+                                                    put(m13, 256)  # C-5
+                                                    put(r12, 257)  # C-3
+                                                put(r11, 258)  # C-3
+                            #### DOMINANT CONIFER = PONDEROSA PINE
+                            m7, r6 = split(r6, p[32])  # SPECIES_CD_1 in ['PY']
+                            if m7.any():
+                                m8, r7 = split(m7, ~s.none['HARVEST_DATE'] & p[19])  # harv_lag is not None and harv_lag <= 7
+                                put(m8, 259)  # S-1
+                                m8 = r7
+                                if m8.any():
+                                    m9, r8 = split(m8, p[22])  # PROJ_HEIGHT_1 < 4
+                                    put(m9, 260)  # O-1a, growing season: 261 O-1b
+                                    m9 = r8
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[35])  # BCLCS_LEVEL_5 in ['DE']
+                                        put(m10, 262)  # C-3
+                                        put(r9, 263)  # C-7
+                            #### DOMINANT CONIFER = OTHER PINE
+                            m7, r6 = split(r6, p[37])  # SPECIES_CD_1 in ['PA', 'PF', 'PW']
+                            if m7.any():
+                                m8, r7 = split(m7, p[35])  # BCLCS_LEVEL_5 in ['DE']
+                                put(m8, 264)  # C-3
+                                m8 = r7
+                                if m8.any():
+                                    m9, r8 = split(m8, p[38])  # stocking >= 900
+                                    put(m9, 265)  # C-3
+                                    m9, r8 = split(r8, p[39])  # stocking >= 600
+                                    put(m9, 266)  # C-7
+                                    put(r8, 267)  # C-5
+                            #### DOMINANT CONIFER = DOUGLAS-FIR
+                            m7, r6 = split(r6, s.startswith('SPECIES_CD_1', 'F'))  # SPECIES_CD_1.startswith('F')
+                            if m7.any():
+                                m8, r7 = split(m7, ~s.none['HARVEST_DATE'] & p[0])  # harv_lag is not None and harv_lag <= 6
+                                if m8.any():
+                                    m9, r8 = split(m8, p[40] | (p[11] & p[6]))  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')
+                                    put(m9, 268)  # S-3
+                                    put(r8, 269)  # S-1
+                                m8 = r7
+                                if m8.any():
+                                    m9, r8 = split(m8, p[22])  # PROJ_HEIGHT_1 < 4
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[40] | (p[11] & p[6]))  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')
+                                        put(m10, 270)  # D-1, growing season: 271 D-2
+                                        put(r9, 272)  # O-1a, growing season: 273 O-1b
+                                    m9 = r8
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[42])  # CROWN_CLOSURE > 55
+                                        if m10.any():
+                                            m11, r10 = split(m10, p[23])  # PROJ_HEIGHT_1 <= 12
+                                            if m11.any():
+                                                m12, r11 = split(m11, p[40] | (p[11] & p[6]))  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')
+                                                put(m12, 274)  # C-5
+                                                m12 = r11
+                                                if m12.any():
+                                                    m13, r12 = split(m12, p[43])  # STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD > 34
+                                                    put(m13, 275)  # C-4
+                                                    m13 = r12
+                                                    if m13.any():
+                                                        m14, r13 = split(m13, s.eq('SPECIES_CD_2', 'PY'))  # SPECIES_CD_2 == 'PY'
+                                                        put(m14, 276)  # C-7
+                                                        put(r13, 277)  # C-3
+                                            m11, r10 = split(r10, p[25])  # PROJ_HEIGHT_1 > 12
+                                            if m11.any():
+                                                m12, r11 = split(m11, p[40] | (p[11] & p[6]))  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')
+                                                put(m12, 278)  # C-5
+                                                put(r11, 279)  # C-7
+                                        m10, r9 = split(r9, p[44])  # CROWN_CLOSURE >= 26 or CROWN_CLOSURE is None
+                                        if m10.any():
+                                            m11, r10 = split(m10, p[40] | (p[11] & p[6]))  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')
+                                            put(m11, 280)  # C-5
+                                            put(r10, 281)  # C-7
+                                        m10 = r9
+                                        if m10.any():
+                                            m11, r10 = split(m10, p[40] | (p[11] & p[6]))  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')
+                                            put(m11, 282)  # D-1, growing season: 283 D-2
+                                            put(r10, 284)  # O-1a, growing season: 285 O-1b
+                            #### DOMINANT CONIFER = SPRUCE
+                            m7, r6 = split(r6, p[48])  # SPECIES_CD_1.startswith('S')
+                            if m7.any():
+                                m8, r7 = split(m7, ~s.none['HARVEST_DATE'] & p[0])  # harv_lag is not None and harv_lag <= 6
+                                if m8.any():
+                                    m9, r8 = split(m8, p[40] | (p[11] & p[6]))  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF'] or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')
+                                    put(m9, 286)  # S-3
+                                    put(r8, 287)  # S-2
+                                m8 = r7
+                                if m8.any():
+                                    m9, r8 = split(m8, p[45])  # SPECIES_CD_1 == 'SE'
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[20])  # BCLCS_LEVEL_5 in ['SP']
+                                        put(m10, 288)  # C-7
+                                        m10 = r9
+                                        if m10.any():
+                                            m11, r10 = split(m10, s.isin('SPECIES_CD_2', ['BL', 'B', 'PL', 'P', 'PLI']))  # SPECIES_CD_2 in ['BL', 'B', 'PL', 'P', 'PLI']
+                                            if m11.any():
+                                                m12, r11 = split(m11, p[35])  # BCLCS_LEVEL_5 in ['DE']
+                                                put(m12, 289)  # C-2
+                                                put(r11, 290)  # C-3
+                                            m11, r10 = split(r10, s.isin('SPECIES_CD_2', ['HW', 'HM', 'CW', 'YC']))  # SPECIES_CD_2 in ['HW', 'HM', 'CW', 'YC']
+                                            if m11.any():
+                                                m12, r11 = split(m11, p[35])  # BCLCS_LEVEL_5 in ['DE']
+                                                put(m12, 291)  # C-3
+                                                put(r11, 292)  # C-5
+                                            put(r10, 293)  # C-3
+                                    m9, r8 = split(r8, p[46])  # SPECIES_CD_1 in ['SS']
+                                    put(m9, 294)  # C-5
+                                    m9, r8 = split(r8, s.eq('SPECIES_CD_1', 'SB'))  # SPECIES_CD_1 in ['SB']
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[33])  # BCLCS_LEVEL_5 in ['DE', 'OP']
+                                        put(m10, 295)  # C-2
+                                        m10 = r9
+                                        if m10.any():
+                                            m11, r10 = split(m10, p[7])  # BEC_ZONE_CODE in ['BWBS']
+                                            put(m11, 296)  # C-1
+                                            put(r10, 297)  # C-3
+                                    m9 = r8
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[7])  # BEC_ZONE_CODE in ['BWBS']
+                                        if m10.any():
+                                            m11, r10 = split(m10, p[35])  # BCLCS_LEVEL_5 in ['DE']
+                                            put(m11, 298)  # C-2
+                                            m11, r10 = split(r10, p[36])  # BCLCS_LEVEL_5 in ['OP']
+                                            put(m11, 299)  # C-3
+                                            put(r10, 300)  # C-1
+                                        m10 = r9
+                                        if m10.any():
+                                            m11, r10 = split(m10, p[40])  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']
+                                            if m11.any():
+                                                m12, r11 = split(m11, s.isin('SPECIES_CD_2', ['BL', 'B']) | s.startswith('SPECIES_CD_2', 'P'), s.null['SPECIES_CD_2'])  # SPECIES_CD_2 in ['BL', 'B'] or SPECIES_CD_2.startswith('P')
+                                                if m12.any():
+                                                    m13, r12 = split(m12, p[20])  # BCLCS_LEVEL_5 in ['SP']
+                                                    put(m13, 301)  # C-7
+                                                    put(r12, 302)  # C-3
+                                                put(r11, 303)  # C-5
+                                            m11 = r10
+                                            if m11.any():
+                                                m12, r11 = split(m11, p[20])  # BCLCS_LEVEL_5 in ['SP']
+                                                put(m12, 304)  # C-7
+                                                m12 = r11
+                                                if m12.any():
+                                                    m13, r12 = split(m12, p[35])  # BCLCS_LEVEL_5 in ['DE']
+                                                    put(m13, 305)  # C-2
+                                                    m13 = r12
+                                                    if m13.any():
+                                                        m14, r13 = split(m13, p[43])  # STAND_PERCENTAGE_DEAD is not None and STAND_PERCENTAGE_DEAD > 34
+                                                        put(m14, 306)  # C-2
+                                                        m14 = r13
+                                                        if m14.any():
+                                                            m15, r14 = split(m14, s.isin('SPECIES_CD_2', ['PL', 'PLI', 'P']))  # SPECIES_CD_2 in ['PL', 'PLI', 'P']
+                                                            put(m15, 307)  # C-2
+                                                            put(r14, 308)  # C-3
+                            #### DOMINANT CONIFER = REDCEDAR, YELLOW CEDAR OR HEMLOCK
+                            m7, r6 = split(r6, (s.startswith('SPECIES_CD_1', 'C') | s.startswith('SPECIES_CD_1', 'Y')) | p[60])  # SPECIES_CD_1.startswith('C') or SPECIES_CD_1.startswith('Y') or SPECIES_CD_1.startswith('H')
+                            if m7.any():
+                                m8, r7 = split(m7, ~s.none['HARVEST_DATE'] & p[0])  # harv_lag is not None and harv_lag <= 6
+                                put(m8, 309)  # S-3
+                                m8 = r7
+                                if m8.any():
+                                    m9, r8 = split(m8, p[35])  # BCLCS_LEVEL_5 == 'DE'
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[22])  # PROJ_HEIGHT_1 < 4
+                                        put(m10, 310)  # D-1, growing season: 311 D-2
+                                        m10, r9 = split(r9, p[50])  # PROJ_HEIGHT_1 <= 15
+                                        put(m10, 312)  # C-3
+                                        m10 = r9
+                                        if m10.any():
+                                            m11, r10 = split(m10, p[51])  # PROJ_AGE_1 < 60
+                                            put(m11, 313)  # C-3
+                                            m11, r10 = split(r10, p[52])  # PROJ_AGE_1 <= 99
+                                            put(m11, 314, 40)  # M-1, growing season: 315 M-2
+                                            put(r10, 316)  # C-5
+                                    m9, r8 = split(r8, p[36])  # BCLCS_LEVEL_5 in ['OP']
+                                    put(m9, 317)  # C-5
+                                    put(r8, 318)  # D-1, growing season: 319 D-2
+                            #### DOMINANT CONIFER = GRAND FIR
+                            m7, r6 = split(r6, p[54])  # SPECIES_CD_1 in ['BG']
+                            put(m7, 320)  # C-7
+                            #### DOMINANT CONIFER = AMABALIS FIR
+                            m7, r6 = split(r6, p[55])  # SPECIES_CD_1 in ['BA']
+                            if m7.any():
+                                m8, r7 = split(m7, p[61])  # SPECIES_CD_2 in ['SE', 'SW', 'S']
+                                put(m8, 321)  # C-3
+                                put(r7, 322, 40)  # M-1, growing season: 323 M-2
+                            #### DOMINANT CONIFER = OTHER FIR
+                            m7, r6 = split(r6, s.isin('SPECIES_CD_1', ['B', 'BL']))  # SPECIES_CD_1 in ['B', 'BL']
+                            if m7.any():
+                                m8, r7 = split(m7, p[1])  # COAST_INTERIOR_CD == 'C'
+                                put(m8, 324, 40)  # M-1, growing season: 325 M-2
+                                m8 = r7
+                                if m8.any():
+                                    m9, r8 = split(m8, p[20])  # BCLCS_LEVEL_5 in ['SP']
+                                    put(m9, 326)  # C-7
+                                    m9, r8 = split(r8, p[35])  # BCLCS_LEVEL_5 in ['DE']
+                                    if m9.any():
+                                        m10, r9 = split(m9, p[61])  # SPECIES_CD_2 in ['SE', 'SW', 'S']
+                                        put(m10, 327)  # C-2
+                                        put(r9, 328)  # C-3
+                                    put(r8, 329)  # C-3
+                            #### DOMINANT CONIFER = YEW
+                            m7, r6 = split(r6, p[56])  # SPECIES_CD_1 in ['T', 'TW']
+                            put(m7, 330)  # C-5
+                            #### DOMINANT CONIFER = JUNIPER
+                            m7, r6 = split(r6, p[57])  # SPECIES_CD_1 in ['J', 'JR']
+                            put(m7, 331)  # C-7
+        #### NON-FORESTED SITE
+        m2 = r1
+        if m2.any():
+            #### SITE RECENTLY BURNED
+            m3, r2 = split(m2, (s.is_burned & ~s.none['EARLIEST_NONLOGGING_DIST_DATE']) & p[14])  # is_burned and dist_lag is not None and (dist_lag < 11)
+            if m3.any():
+                m4, r3 = split(m3, p[18])  # dist_lag <= 1
+                put(m4, 332)  # N
+                m4, r3 = split(r3, p[15])  # dist_lag <= 3
+                put(m4, 333)  # D-1, growing season: 334 D-2
+                put(r3, 335)  # O-1a, growing season: 336 O-1b
+            #### SITE NOT RECENTLY BURNED
+            m3 = r2
+            if m3.any():
+                #### SITE LOGGED
+                m4, r3 = split(m3, s.is_logged)  # is_logged
+                if m4.any():
+                    m5, r4 = split(m4, ~s.null['SPECIES_CD_1'])  # SPECIES_CD_1 is not None
+                    if m5.any():
+                        m6, r5 = split(m5, p[19])  # harv_lag <= 7
+                        if m6.any():
+                            m7, r6 = split(m6, s.startswith('SPECIES_CD_1', 'P'))  # str(SPECIES_CD_1).startswith('P')
+                            put(m7, 337)  # S-1
+                            m7, r6 = split(r6, p[48] | p[53])  # str(SPECIES_CD_1).startswith('S') or str(SPECIES_CD_1).startswith('B')
+                            put(m7, 338)  # S-2
+                            m7, r6 = split(r6, s.isin('SPECIES_CD_1', ['CW', 'YC']) | p[60])  # SPECIES_CD_1 in ['CW', 'YC'] or str(SPECIES_CD_1).startswith('H')
+                            put(m7, 339)  # S-3
+                            m7, r6 = split(r6, s.startswith('SPECIES_CD_1', 'FD'))  # str(SPECIES_CD_1).startswith('FD')
+                            if m7.any():
+                                m8, r7 = split(m7, s.isin('BEC_ZONE_CODE', ['CWH', 'ICH']))  # BEC_ZONE_CODE in ['CWH', 'ICH']
+                                put(m8, 340)  # S-3
+                                put(r7, 341)  # S-1
+                            put(r6, 342)  # S-1
+                        m6, r5 = split(r5, p[2])  # harv_lag <= 24
+                        if m6.any():
+                            m7, r6 = split(m6, s.isin('BEC_ZONE_CODE', ['CWH', 'MH']) | (p[11] & p[6]))  # BEC_ZONE_CODE in ['CWH', 'MH'] or (BEC_ZONE_CODE == 'ICH' and dry_wet == 'wet')
+                            put(m7, 343)  # D-1, growing season: 344 D-2
+                            put(r6, 345)  # O-1a, growing season: 346 O-1b
+                        m6 = r5
+                        if m6.any():
+                            m7, r6 = split(m6, p[4])  # BEC_ZONE_CODE in ['CMA', 'IMA']
+                            put(m7, 347)  # N
+                            m7, r6 = split(r6, p[62])  # BEC_ZONE_CODE == 'BAFA'
+                            put(m7, 348)  # D-1, growing season: 349 D-2
+                            m7, r6 = split(r6, p[13])  # BEC_ZONE_CODE == 'CWH'
+                            if m7.any():
+                                m8, r7 = split(m7, p[12])  # dry_wet == 'dry'
+                                put(m8, 350, 40)  # M-1, growing season: 351 M-2
+                                put(r7, 352)  # C-5
+                            m7, r6 = split(r6, p[7])  # BEC_ZONE_CODE == 'BWBS'
+                            put(m7, 353)  # C-2
+                            m7, r6 = split(r6, p[8])  # BEC_ZONE_CODE == 'SWB'
+                            put(m7, 354, 50)  # M-1, growing season: 355 M-2
+                            m7, r6 = split(r6, p[9])  # BEC_ZONE_CODE == 'SBS'
+                            put(m7, 356)  # C-3
+                            m7, r6 = split(r6, p[63])  # BEC_ZONE_CODE == 'SBPS'
+                            put(m7, 357)  # C-7
+                            m7, r6 = split(r6, p[64])  # BEC_ZONE_CODE == 'MS'
+                            put(m7, 358)  # C-3
+                            m7, r6 = split(r6, p[10])  # BEC_ZONE_CODE == 'IDF'
+                            if m7.any():
+                                m8, r7 = split(m7, p[12])  # dry_wet == 'dry'
+                                put(m8, 359)  # C-7
+                                put(r7, 360)  # C-3
+                            m7, r6 = split(r6, p[65])  # BEC_ZONE_CODE == 'PP'
+                            put(m7, 361)  # O-1a, growing season: 362 O-1b
+                            m7, r6 = split(r6, p[66])  # BEC_ZONE_CODE == 'BG'
+                            put(m7, 363)  # O-1a, growing season: 364 O-1b
+                            m7, r6 = split(r6, p[67])  # BEC_ZONE_CODE == 'MH'
+                            put(m7, 365)  # D-1, growing season: 366 D-2
+                            m7, r6 = split(r6, p[68])  # BEC_ZONE_CODE == 'ESSF'
+                            put(m7, 367)  # C-3
+                            m7, r6 = split(r6, p[69])  # BEC_ZONE_CODE == 'CDF'
+                            if m7.any():
+                                m8, r7 = split(m7, p[12])  # dry_wet == 'dry'
+                                put(m8, 368)  # C-7
+                                put(r7, 369)  # C-5
+                            m7, r6 = split(r6, p[11])  # BEC_ZONE_CODE == 'ICH'
+                            if m7.any():
+                                m8, r7 = split(m7, p[12])  # dry_wet == 'dry'
+                                put(m8, 370)  # C-3
+                                put(r7, 371)  # C-5
+                            put(r6, 372)  # VegNonForestUnburnedLoggedGT24HasSpecies_BEC-ERROR
+                    m5 = r4
+                    if m5.any():
+                        m6, r5 = split(m5, (s.harv_lag <= 5))  # harv_lag <= 5
+                        put(m6, 373)  # S-1
+                        m6, r5 = split(r5, p[2])  # harv_lag <= 24
+                        if m6.any():
+                            m7, r6 = split(m6, p[3])  # BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']
+                            put(m7, 374)  # D-1, growing season: 375 D-2
+                            put(r6, 376)  # O-1a, growing season: 377 O-1b
+                        m6 = r5
+                        if m6.any():
+                            m7, r6 = split(m6, p[4])  # BEC_ZONE_CODE in ['CMA', 'IMA']
+                            put(m7, 378)  # N
+                            m7, r6 = split(r6, p[62])  # BEC_ZONE_CODE == 'BAFA'
+                            put(m7, 379)  # D-1, growing season: 380 D-2
+                            m7, r6 = split(r6, p[13])  # BEC_ZONE_CODE == 'CWH'
+                            if m7.any():
+                                m8, r7 = split(m7, p[12])  # dry_wet == 'dry'
+                                put(m8, 381, 40)  # M-1, growing season: 382 M-2
+                                put(r7, 383)  # C-5
+                            m7, r6 = split(r6, p[7])  # BEC_ZONE_CODE == 'BWBS'
+                            put(m7, 384)  # C-2
+                            m7, r6 = split(r6, p[8])  # BEC_ZONE_CODE == 'SWB'
+                            put(m7, 385, 25)  # M-1, growing season: 386 M-2
+                            m7, r6 = split(r6, p[9])  # BEC_ZONE_CODE == 'SBS'
+                            put(m7, 387)  # C-3
+                            m7, r6 = split(r6, p[63])  # BEC_ZONE_CODE == 'SBPS'
+                            put(m7, 388)  # C-7
+                            m7, r6 = split(r6, p[64])  # BEC_ZONE_CODE == 'MS'
+                            put(m7, 389)  # C-7
+                            m7, r6 = split(r6, p[10])  # BEC_ZONE_CODE == 'IDF'
+                            if m7.any():
+                                m8, r7 = split(m7, p[12])  # dry_wet == 'dry'
+                                put(m8, 390)  # C-7
+                                put(r7, 391, 50)  # M-1, growing season: 392 M-2
+                            m7, r6 = split(r6, p[65])  # BEC_ZONE_CODE == 'PP'
+                            put(m7, 393)  # O-1a, growing season: 394 O-1b
+                            m7, r6 = split(r6, p[66])  # BEC_ZONE_CODE == 'BG'
+                            put(m7, 395)  # O-1a, growing season: 396 O-1b
+                            m7, r6 = split(r6, p[67])  # BEC_ZONE_CODE == 'MH'
+                            put(m7, 397)  # D-1, growing season: 398 D-2
+                            m7, r6 = split(r6, p[68])  # BEC_ZONE_CODE == 'ESSF'
+                            put(m7, 399)  # C-7
+                            m7, r6 = split(r6, p[69])  # BEC_ZONE_CODE == 'CDF'
+                            if m7.any():
+                                m8, r7 = split(m7, p[12])  # dry_wet == 'dry'
+                                put(m8, 400)  # C-7
+                                put(r7, 401)  # C-5
+                            m7, r6 = split(r6, p[11])  # BEC_ZONE_CODE == 'ICH'
+                            if m7.any():
+                                m8, r7 = split(m7, p[12])  # dry_wet == 'dry'
+                                put(m8, 402, 40)  # M-1, growing season: 403 M-2
+                                put(r7, 404)  # C-5
+                            put(r6, 405)  # VegNonForestUnburnedLoggedGT24NoSpecies_BEC-ERROR
+                #### SITE NOT LOGGED
+                m4 = r3
+                if m4.any():
+                    m5, r4 = split(m4, ~s.null['SPECIES_CD_1'])  # SPECIES_CD_1 is not None
+                    if m5.any():
+                        m6, r5 = split(m5, p[4])  # BEC_ZONE_CODE in ['CMA', 'IMA']
+                        put(m6, 406)  # N
+                        m6, r5 = split(r5, s.isin('BEC_ZONE_CODE', ['CWH', 'MH', 'ICH', 'BAFA']))  # BEC_ZONE_CODE in ['CWH', 'MH', 'ICH', 'BAFA']
+                        put(m6, 407)  # D-1, growing season: 408 D-2
+                        put(r5, 409)  # O-1a, growing season: 410 O-1b
+                    m5 = r4
+                    if m5.any():
+                        m6, r5 = split(m5, s.eq('INVENTORY_STANDARD_CD', 'F'))  # INVENTORY_STANDARD_CD == 'F'
+                        if m6.any():
+                            m7, r6 = split(m6, np.isin(s.NON_PRODUCTIVE_CD, [11, 12, 13]))  # NON_PRODUCTIVE_CD in [11, 12, 13]
+                            if m7.any():
+                                m8, r7 = split(m7, p[3])  # BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']
+                                put(m8, 411)  # D-1, growing season: 412 D-2
+                                put(r7, 413)  # O-1a, growing season: 414 O-1b
+                            m7, r6 = split(r6, (s.NON_PRODUCTIVE_CD == 35))  # NON_PRODUCTIVE_CD == 35
+                            put(m7, 415)  # W
+                            m7, r6 = split(r6, (s.NON_PRODUCTIVE_CD == 42))  # NON_PRODUCTIVE_CD == 42
+                            put(m7, 416)  # N
+                            m7, r6 = split(r6, np.isin(s.NON_PRODUCTIVE_CD, [60, 62, 63]))  # NON_PRODUCTIVE_CD in [60, 62, 63]
+                            put(m7, 417)  # O-1a, growing season: 418 O-1b
+                            put(r6, 424)  # N
+                        m6 = r5
+                        if m6.any():
+                            m7, r6 = split(m6, s.isin('LAND_COVER_CLASS_CD_1', ['LA', 'RE', 'RI', 'OC']))  # LAND_COVER_CLASS_CD_1 in ['LA', 'RE', 'RI', 'OC']
+                            put(m7, 425)  # W
+                            m7, r6 = split(r6, s.eq('LAND_COVER_CLASS_CD_1', 'HG'))  # LAND_COVER_CLASS_CD_1 == 'HG'
+                            put(m7, 426)  # O-1a, growing season: 427 O-1b
+                            m7, r6 = split(r6, s.isin('LAND_COVER_CLASS_CD_1', ['BY', 'BM', 'BL']))  # LAND_COVER_CLASS_CD_1 in ['BY', 'BM', 'BL']
+                            put(m7, 428)  # D-1, growing season: 429 D-2
+                            m7, r6 = split(r6, s.isin('LAND_COVER_CLASS_CD_1', ['SL', 'ST', 'HE', 'HF']) | s.null['LAND_COVER_CLASS_CD_1'])  # LAND_COVER_CLASS_CD_1 in ['SL', 'ST', 'HE', 'HF', None]
+                            if m7.any():
+                                m8, r7 = split(m7, p[4])  # BEC_ZONE_CODE in ['CMA', 'IMA']
+                                put(m8, 430)  # N
+                                m8, r7 = split(r7, p[3])  # BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']
+                                put(m8, 431)  # D-1, growing season: 432 D-2
+                                put(r7, 433)  # O-1a, growing season: 434 O-1b
+                            put(r6, 435)  # N
+
+
+# Operations of the flat node table
+OP_LEAF, OP_NOTNULL, OP_IN, OP_EQ, OP_NE, OP_LT, OP_LE, OP_GT, OP_GE = range(9)
+
+
+# Flat node table of the decision tree, with the root first and every node before its children.
+# Nodes send stands to their yes, no or null child (the null child if the feature is NaN), and
+# leaves hold the rule ID reached by a stand (0: no leaf reached, -1: decisionTree raises an exception).
+NODES = [
+    # (operation, feature, value or code set, yes, no, null)
+    (OP_NE, 40, 0, 1, 2, 2),  # is_vegetated
+    (OP_IN, 42, 87, 59, 2, 2),  # BCLCS_LEVEL_1 in ['V', 'N']
+    (OP_NE, 9, 0, 3, 39, 39),  # is_logged
+    (OP_LE, 7, 6.0, 5, 8, 4),  # harv_lag <= 6
+    (OP_NE, 6, 0, 707, 8, 8),  # harv_lag is None
+    (OP_IN, 15, 35, 6, 7, 7),  # COAST_INTERIOR_CD == 'C'
+    (OP_LEAF, -1, 1, -1, -1, -1),  # rule 1: S-3
+    (OP_LEAF, -1, 2, -1, -1, -1),  # rule 2: S-1
+    (OP_LE, 7, 24.0, 10, 13, 9),  # harv_lag <= 24
+    (OP_NE, 6, 0, 707, 13, 13),  # harv_lag is None
+    (OP_IN, 0, 0, 11, 12, 12),  # BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']
+    (OP_LEAF, -1, 3, -1, -1, -1),  # rule 3: D-1, growing season: 4 D-2
+    (OP_LEAF, -1, 5, -1, -1, -1),  # rule 5: O-1a, growing season: 6 O-1b
+    (OP_IN, 0, 1, 14, 15, 15),  # BEC_ZONE_CODE in ['CMA', 'IMA']
+    (OP_LEAF, -1, 7, -1, -1, -1),  # rule 7: N
+    (OP_IN, 0, 86, 16, 17, 17),  # BEC_ZONE_CODE in ['BAFA', 'MH']
+    (OP_LEAF, -1, 8, -1, -1, -1),  # rule 8: D-1, growing season: 9 D-2
+    (OP_IN, 0, 58, 18, 20, 20),  # BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH']
+    (OP_NE, 8, 0, 19, 20, 20),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 10, -1, -1, -1),  # rule 10: C-5
+    (OP_IN, 0, 47, 21, 22, 22),  # BEC_ZONE_CODE in ['BWBS']
+    (OP_LEAF, -1, 11, -1, -1, -1),  # rule 11: C-2
+    (OP_IN, 0, 18, 23, 24, 24),  # BEC_ZONE_CODE == 'SWB'
+    (OP_LEAF, -1, 12, -1, -1, -1),  # rule 12: M-1, growing season: 13 M-2
+    (OP_IN, 0, 17, 29, 25, 25),  # BEC_ZONE_CODE == 'SBS'
+    (OP_IN, 0, 14, 26, 27, 27),  # BEC_ZONE_CODE == 'IDF'
+    (OP_NE, 8, 0, 29, 27, 27),  # dry_wet == 'wet'
+    (OP_IN, 0, 8, 28, 30, 30),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 5, 0, 29, 30, 30),  # dry_wet == 'dry'
+    (OP_LEAF, -1, 14, -1, -1, -1),  # rule 14: C-3
+    (OP_IN, 0, 85, 33, 31, 31),  # BEC_ZONE_CODE in ['SBPS', 'MS', 'ESSF']
+    (OP_IN, 0, 84, 32, 34, 34),  # BEC_ZONE_CODE in ['IDF', 'CDF']
+    (OP_NE, 5, 0, 33, 34, 34),  # dry_wet == 'dry'
+    (OP_LEAF, -1, 15, -1, -1, -1),  # rule 15: C-7
+    (OP_IN, 0, 83, 35, 36, 36),  # BEC_ZONE_CODE in ['PP', 'BG']
+    (OP_LEAF, -1, 16, -1, -1, -1),  # rule 16: O-1a, growing season: 17 O-1b
+    (OP_IN, 0, 20, 37, 790, 790),  # BEC_ZONE_CODE == 'CWH'
+    (OP_NE, 5, 0, 38, 790, 790),  # dry_wet == 'dry'
+    (OP_LEAF, -1, 18, -1, -1, -1),  # rule 18: M-1, growing season: 19 M-2
+    (OP_NE, 12, 0, 40, 52, 52),  # is_burned
+    (OP_NE, 10, 0, 52, 41, 41),  # dist_lag is None
+    (OP_LT, 11, 11.0, 43, 52, 42),  # dist_lag < 11
+    (OP_NE, 10, 0, 707, 52, 52),  # dist_lag is None
+    (OP_LE, 11, 3.0, 45, 46, 44),  # dist_lag <= 3
+    (OP_NE, 10, 0, 707, 46, 46),  # dist_lag is None
+    (OP_LEAF, -1, 20, -1, -1, -1),  # rule 20: N
+    (OP_LE, 11, 6.0, 48, 49, 47),  # dist_lag <= 6
+    (OP_NE, 10, 0, 707, 49, 49),  # dist_lag is None
+    (OP_LEAF, -1, 21, -1, -1, -1),  # rule 21: D-1, growing season: 22 D-2
+    (OP_LE, 11, 10.0, 51, 790, 50),  # dist_lag <= 10
+    (OP_NE, 10, 0, 707, 790, 790),  # dist_lag is None
+    (OP_LEAF, -1, 23, -1, -1, -1),  # rule 23: O-1a, growing season: 24 O-1b
+    (OP_IN, 41, 82, 53, 58, 53),  # BCLCS_LEVEL_2 in ['L']
+    (OP_NOTNULL, 4, 0, 54, 54, 57),  # SPECIES_CD_1 is None
+    (OP_IN, 0, 0, 55, 56, 56),  # BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']
+    (OP_LEAF, -1, 25, -1, -1, -1),  # rule 25: D-1, growing season: 26 D-2
+    (OP_LEAF, -1, 27, -1, -1, -1),  # rule 27: O-1a, growing season: 28 O-1b
+    (OP_LEAF, -1, 29, -1, -1, -1),  # rule 29: N
+    (OP_LEAF, -1, 30, -1, -1, -1),  # rule 30: N
+    (OP_NE, 40, 0, 60, 790, 790),  # is_vegetated
+    (OP_NE, 39, 0, 61, 628, 628),  # is_forested
+    (OP_NE, 12, 0, 62, 85, 85),  # is_burned
+    (OP_NE, 10, 0, 85, 63, 63),  # dist_lag is None
+    (OP_LE, 11, 10.0, 65, 85, 64),  # dist_lag <= 10
+    (OP_NE, 10, 0, 707, 85, 85),  # dist_lag is None
+    (OP_GE, 22, 60.0, 66, 81, 81),  # pct_cnfr >= 60
+    (OP_GT, 19, 40.0, 67, 74, 74),  # CROWN_CLOSURE > 40
+    (OP_LE, 11, 3.0, 69, 70, 68),  # dist_lag <= 3
+    (OP_NE, 10, 0, 707, 70, 70),  # dist_lag is None
+    (OP_LEAF, -1, 31, -1, -1, -1),  # rule 31: N
+    (OP_LE, 11, 6.0, 72, 73, 71),  # dist_lag <= 6
+    (OP_NE, 10, 0, 707, 73, 73),  # dist_lag is None
+    (OP_LEAF, -1, 32, -1, -1, -1),  # rule 32: D-1, growing season: 33 D-2
+    (OP_LEAF, -1, 34, -1, -1, -1),  # rule 34: C-5
+    (OP_LE, 11, 1.0, 76, 77, 75),  # dist_lag <= 1
+    (OP_NE, 10, 0, 707, 77, 77),  # dist_lag is None
+    (OP_LEAF, -1, 35, -1, -1, -1),  # rule 35: N
+    (OP_LE, 11, 6.0, 79, 80, 78),  # dist_lag <= 6
+    (OP_NE, 10, 0, 707, 80, 80),  # dist_lag is None
+    (OP_LEAF, -1, 36, -1, -1, -1),  # rule 36: D-1, growing season: 37 D-2
+    (OP_LEAF, -1, 38, -1, -1, -1),  # rule 38: O-1a, growing season: 39 O-1b
+    (OP_LE, 11, 1.0, 83, 84, 82),  # dist_lag <= 1
+    (OP_NE, 10, 0, 707, 84, 84),  # dist_lag is None
+    (OP_LEAF, -1, 40, -1, -1, -1),  # rule 40: N
+    (OP_LEAF, -1, 41, -1, -1, -1),  # rule 41: D-1, growing season: 42 D-2
+    (OP_NOTNULL, 4, 0, 86, 86, 87),  # SPECIES_CD_1 is None
+    (OP_EQ, 37, 0.0, 87, 88, 88),  # SPECIES_PCT_1 == 0
+    (OP_LEAF, -1, 43, -1, -1, -1),  # rule 43: VegForestNoBurn_Species-ERROR
+    (OP_GE, 37, 80.0, 89, 295, 295),  # SPECIES_PCT_1 >= 80
+    (OP_NE, 38, 0, 90, 294, 294),  # SPECIES_CD_1 in coniferList
+    (OP_IN, 4, 81, 91, 128, 128),  # SPECIES_CD_1 in ['PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P']
+    (OP_NE, 6, 0, 95, 92, 92),  # harv_lag is None
+    (OP_LE, 7, 7.0, 94, 95, 93),  # harv_lag <= 7
+    (OP_NE, 6, 0, 707, 95, 95),  # harv_lag is None
+    (OP_LEAF, -1, 44, -1, -1, -1),  # rule 44: S-1
+    (OP_IN, 14, 70, 96, 101, 101),  # BCLCS_LEVEL_5 == 'SP'
+    (OP_IN, 0, 64, 99, 97, 97),  # BEC_ZONE_CODE in ['CWH', 'CDF', 'MH']
+    (OP_IN, 0, 80, 98, 100, 100),  # BEC_ZONE_CODE in ['ICH']
+    (OP_NE, 8, 0, 99, 100, 100),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 45, -1, -1, -1),  # rule 45: D-1, growing season: 46 D-2
+    (OP_LEAF, -1, 47, -1, -1, -1),  # rule 47: C-7
+    (OP_LT, 17, 4.0, 102, 103, 103),  # PROJ_HEIGHT_1 < 4
+    (OP_LEAF, -1, 48, -1, -1, -1),  # rule 48: O-1a, growing season: 49 O-1b
+    (OP_LE, 17, 12.0, 104, 107, 107),  # PROJ_HEIGHT_1 <= 12
+    (OP_GT, 20, 8000.0, 105, 106, 106),  # stocking > 8000
+    (OP_LEAF, -1, 50, -1, -1, -1),  # rule 50: C-4
+    (OP_LEAF, -1, 51, -1, -1, -1),  # rule 51: C-3
+    (OP_GT, 17, 12.0, 108, 790, 790),  # PROJ_HEIGHT_1 > 12
+    (OP_LT, 19, 40.0, 109, 114, 114),  # CROWN_CLOSURE < 40
+    (OP_IN, 0, 61, 110, 111, 111),  # BEC_ZONE_CODE in ['BG', 'PP', 'IDF', 'MS']
+    (OP_LEAF, -1, 52, -1, -1, -1),  # rule 52: C-7
+    (OP_IN, 0, 0, 112, 113, 113),  # BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']
+    (OP_LEAF, -1, 53, -1, -1, -1),  # rule 53: C-5
+    (OP_LEAF, -1, 54, -1, -1, -1),  # rule 54: C-3
+    (OP_IN, 21, 60, 115, 127, 127),  # EARLIEST_NONLOGGING_DIST_TYPE == 'IBM'
+    (OP_LE, 11, 5.0, 117, 122, 116),  # dist_lag <= 5
+    (OP_NE, 10, 0, 707, 122, 122),  # dist_lag is None
+    (OP_GT, 18, 50.0, 118, 119, 119),  # STAND_PERCENTAGE_DEAD > 50
+    (OP_LEAF, -1, 55, -1, -1, -1),  # rule 55: M-3
+    (OP_GE, 18, 25.0, 120, 121, 121),  # STAND_PERCENTAGE_DEAD >= 25
+    (OP_LEAF, -1, 56, -1, -1, -1),  # rule 56: C-2
+    (OP_LEAF, -1, 57, -1, -1, -1),  # rule 57: C-3
+    (OP_GT, 18, 50.0, 123, 124, 124),  # STAND_PERCENTAGE_DEAD > 50
+    (OP_LEAF, -1, 58, -1, -1, -1),  # rule 58: C-2
+    (OP_GE, 18, 25.0, 125, 126, 126),  # STAND_PERCENTAGE_DEAD >= 25
+    (OP_LEAF, -1, 59, -1, -1, -1),  # rule 59: C-3
+    (OP_LEAF, -1, 60, -1, -1, -1),  # rule 60: C-3
+    (OP_LEAF, -1, 61, -1, -1, -1),  # rule 61: C-3
+    (OP_IN, 4, 79, 129, 156, 156),  # SPECIES_CD_1 == 'PY'
+    (OP_IN, 14, 48, 130, 148, 148),  # BCLCS_LEVEL_5 in ['DE', 'OP']
+    (OP_NE, 6, 0, 134, 131, 131),  # harv_lag is None
+    (OP_LE, 7, 10.0, 133, 134, 132),  # harv_lag <= 10
+    (OP_NE, 6, 0, 707, 134, 134),  # harv_lag is None
+    (OP_LEAF, -1, 62, -1, -1, -1),  # rule 62: S-1
+    (OP_LT, 17, 4.0, 135, 136, 136),  # PROJ_HEIGHT_1 < 4
+    (OP_LEAF, -1, 63, -1, -1, -1),  # rule 63: O-1a, growing season: 64 O-1b
+    (OP_LE, 17, 12.0, 137, 142, 142),  # PROJ_HEIGHT_1 <= 12
+    (OP_GT, 20, 8000.0, 138, 139, 139),  # stocking > 8000
+    (OP_LEAF, -1, 65, -1, -1, -1),  # rule 65: C-4
+    (OP_GE, 20, 3000.0, 140, 141, 141),  # stocking >= 3000
+    (OP_LEAF, -1, 66, -1, -1, -1),  # rule 66: C-3
+    (OP_LEAF, -1, 67, -1, -1, -1),  # rule 67: C-7
+    (OP_LE, 17, 17.0, 143, 147, 147),  # PROJ_HEIGHT_1 <= 17
+    (OP_IN, 14, 40, 144, 145, 145),  # BCLCS_LEVEL_5 == 'DE'
+    (OP_LEAF, -1, 68, -1, -1, -1),  # rule 68: C-3
+    (OP_IN, 14, 71, 146, 790, 790),  # BCLCS_LEVEL_5 == 'OP'
+    (OP_LEAF, -1, 69, -1, -1, -1),  # rule 69: C-7
+    (OP_LEAF, -1, 70, -1, -1, -1),  # rule 70: C-7
+    (OP_IN, 14, 70, 149, 790, 790),  # BCLCS_LEVEL_5 == 'SP'
+    (OP_GE, 18, 40.0, 150, 151, 151),  # STAND_PERCENTAGE_DEAD >= 40
+    (OP_LEAF, -1, 71, -1, -1, -1),  # rule 71: O-1a, growing season: 72 O-1b
+    (OP_NE, 6, 0, 155, 152, 152),  # harv_lag is None
+    (OP_LE, 7, 10.0, 154, 155, 153),  # harv_lag <= 10
+    (OP_NE, 6, 0, 707, 155, 155),  # harv_lag is None
+    (OP_LEAF, -1, 73, -1, -1, -1),  # rule 73: S-1
+    (OP_LEAF, -1, 74, -1, -1, -1),  # rule 74: C-7
+    (OP_IN, 4, 56, 157, 165, 165),  # SPECIES_CD_1 in ['PA', 'PF', 'PW']
+    (OP_IN, 14, 40, 158, 159, 159),  # BCLCS_LEVEL_5 == 'DE'
+    (OP_LEAF, -1, 75, -1, -1, -1),  # rule 75: C-3
+    (OP_IN, 14, 78, 160, 790, 790),  # BCLCS_LEVEL_5 in ['SP', 'OP']
+    (OP_GE, 20, 900.0, 161, 162, 162),  # stocking >= 900
+    (OP_LEAF, -1, 76, -1, -1, -1),  # rule 76: C-3
+    (OP_GE, 20, 600.0, 163, 164, 164),  # stocking >= 600
+    (OP_LEAF, -1, 77, -1, -1, -1),  # rule 77: C-7
+    (OP_LEAF, -1, 78, -1, -1, -1),  # rule 78: C-5
+    (OP_IN, 4, 77, 166, 208, 208),  # SPECIES_CD_1 in ['FD', 'FDC', 'FDI', 'F']
+    (OP_NE, 6, 0, 174, 167, 167),  # harv_lag is None
+    (OP_LE, 7, 6.0, 169, 174, 168),  # harv_lag <= 6
+    (OP_NE, 6, 0, 707, 174, 174),  # harv_lag is None
+    (OP_IN, 0, 46, 172, 170, 170),  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']
+    (OP_IN, 0, 8, 171, 173, 173),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 8, 0, 172, 173, 173),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 79, -1, -1, -1),  # rule 79: S-3
+    (OP_LEAF, -1, 80, -1, -1, -1),  # rule 80: S-1
+    (OP_LT, 17, 4.0, 175, 180, 180),  # PROJ_HEIGHT_1 < 4
+    (OP_IN, 0, 46, 178, 176, 176),  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']
+    (OP_IN, 0, 8, 177, 179, 179),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 8, 0, 178, 179, 179),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 81, -1, -1, -1),  # rule 81: D-1, growing season: 82 D-2
+    (OP_LEAF, -1, 83, -1, -1, -1),  # rule 83: O-1a, growing season: 84 O-1b
+    (OP_GE, 17, 4.0, 181, 207, 207),  # PROJ_HEIGHT_1 >= 4
+    (OP_GT, 19, 55.0, 182, 196, 196),  # CROWN_CLOSURE > 55
+    (OP_LE, 17, 12.0, 183, 190, 190),  # PROJ_HEIGHT_1 <= 12
+    (OP_IN, 0, 46, 186, 184, 184),  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']
+    (OP_IN, 0, 8, 185, 187, 187),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 8, 0, 186, 187, 187),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 85, -1, -1, -1),  # rule 85: C-3
+    (OP_GT, 18, 34.0, 188, 189, 189),  # STAND_PERCENTAGE_DEAD > 34
+    (OP_LEAF, -1, 86, -1, -1, -1),  # rule 86: C-4
+    (OP_LEAF, -1, 87, -1, -1, -1),  # rule 87: C-3
+    (OP_GT, 17, 12.0, 191, 790, 790),  # PROJ_HEIGHT_1 > 12
+    (OP_IN, 0, 46, 194, 192, 192),  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']
+    (OP_IN, 0, 8, 193, 195, 195),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 8, 0, 194, 195, 195),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 88, -1, -1, -1),  # rule 88: C-5
+    (OP_LEAF, -1, 89, -1, -1, -1),  # rule 89: C-7
+    (OP_GE, 19, 26.0, 197, 202, 202),  # CROWN_CLOSURE >= 26
+    (OP_IN, 0, 46, 200, 198, 198),  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']
+    (OP_IN, 0, 8, 199, 201, 201),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 8, 0, 200, 201, 201),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 90, -1, -1, -1),  # rule 90: C-5
+    (OP_LEAF, -1, 91, -1, -1, -1),  # rule 91: C-7
+    (OP_IN, 0, 46, 205, 203, 203),  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']
+    (OP_IN, 0, 8, 204, 206, 206),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 8, 0, 205, 206, 206),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 92, -1, -1, -1),  # rule 92: D-1, growing season: 93 D-2
+    (OP_LEAF, -1, 94, -1, -1, -1),  # rule 94: O-1a, growing season: 95 O-1b
+    (OP_LEAF, -1, 96, -1, -1, -1),  # rule 96: VegForestNoBurnPureFd_ProjHeight-ERROR
+    (OP_IN, 4, 53, 209, 219, 219),  # SPECIES_CD_1 == 'SE'
+    (OP_NE, 6, 0, 213, 210, 210),  # harv_lag is None
+    (OP_LE, 7, 10.0, 212, 213, 211),  # harv_lag <= 10
+    (OP_NE, 6, 0, 707, 213, 213),  # harv_lag is None
+    (OP_LEAF, -1, 97, -1, -1, -1),  # rule 97: S-2
+    (OP_IN, 14, 70, 214, 215, 215),  # BCLCS_LEVEL_5 == 'SP'
+    (OP_LEAF, -1, 98, -1, -1, -1),  # rule 98: D-1, growing season: 99 D-2
+    (OP_IN, 14, 40, 216, 217, 217),  # BCLCS_LEVEL_5 == 'DE'
+    (OP_LEAF, -1, 100, -1, -1, -1),  # rule 100: C-2
+    (OP_IN, 14, 71, 218, 790, 790),  # BCLCS_LEVEL_5 == 'OP'
+    (OP_LEAF, -1, 101, -1, -1, -1),  # rule 101: C-3
+    (OP_IN, 4, 76, 220, 228, 228),  # SPECIES_CD_1 == 'SS'
+    (OP_NE, 6, 0, 224, 221, 221),  # harv_lag is None
+    (OP_LE, 7, 6.0, 223, 224, 222),  # harv_lag <= 6
+    (OP_NE, 6, 0, 707, 224, 224),  # harv_lag is None
+    (OP_LEAF, -1, 102, -1, -1, -1),  # rule 102: S-3
+    (OP_IN, 14, 70, 225, 226, 226),  # BCLCS_LEVEL_5 == 'SP'
+    (OP_LEAF, -1, 103, -1, -1, -1),  # rule 103: D-1, growing season: 104 D-2
+    (OP_IN, 14, 48, 227, 790, 790),  # BCLCS_LEVEL_5 in ['DE', 'OP']
+    (OP_LEAF, -1, 105, -1, -1, -1),  # rule 105: C-5
+    (OP_IN, 4, 75, 229, 239, 239),  # SPECIES_CD_1 in ['SB', 'SW']
+    (OP_NE, 6, 0, 233, 230, 230),  # harv_lag is None
+    (OP_LE, 7, 10.0, 232, 233, 231),  # harv_lag <= 10
+    (OP_NE, 6, 0, 707, 233, 233),  # harv_lag is None
+    (OP_LEAF, -1, 106, -1, -1, -1),  # rule 106: S-2
+    (OP_IN, 14, 48, 234, 235, 235),  # BCLCS_LEVEL_5 in ['DE', 'OP']
+    (OP_LEAF, -1, 107, -1, -1, -1),  # rule 107: C-2
+    (OP_IN, 14, 70, 236, 790, 790),  # BCLCS_LEVEL_5 == 'SP'
+    (OP_IN, 0, 67, 237, 238, 238),  # BEC_ZONE_CODE in ['BWBS', 'SWB']
+    (OP_LEAF, -1, 108, -1, -1, -1),  # rule 108: C-1
+    (OP_LEAF, -1, 109, -1, -1, -1),  # rule 109: M-1, growing season: 110 M-2
+    (OP_IN, 4, 28, 240, 261, 707),  # SPECIES_CD_1.startswith('S')
+    (OP_NE, 6, 0, 244, 241, 241),  # harv_lag is None
+    (OP_LE, 7, 7.0, 243, 244, 242),  # harv_lag <= 7
+    (OP_NE, 6, 0, 707, 244, 244),  # harv_lag is None
+    (OP_LEAF, -1, 111, -1, -1, -1),  # rule 111: S-2
+    (OP_IN, 0, 67, 245, 248, 248),  # BEC_ZONE_CODE in ['BWBS', 'SWB']
+    (OP_IN, 14, 48, 246, 247, 247),  # BCLCS_LEVEL_5 in ['DE', 'OP']
+    (OP_LEAF, -1, 112, -1, -1, -1),  # rule 112: C-2
+    (OP_LEAF, -1, 113, -1, -1, -1),  # rule 113: C-1
+    (OP_IN, 14, 70, 249, 250, 250),  # BCLCS_LEVEL_5 == 'SP'
+    (OP_LEAF, -1, 114, -1, -1, -1),  # rule 114: C-7
+    (OP_IN, 0, 69, 251, 252, 252),  # BEC_ZONE_CODE in ['CWH', 'CDF']
+    (OP_LEAF, -1, 115, -1, -1, -1),  # rule 115: C-5
+    (OP_LT, 17, 4.0, 253, 254, 254),  # PROJ_HEIGHT_1 < 4
+    (OP_LEAF, -1, 116, -1, -1, -1),  # rule 116: O-1a, growing season: 117 O-1b
+    (OP_GE, 17, 4.0, 255, 260, 260),  # PROJ_HEIGHT_1 >= 4
+    (OP_IN, 14, 71, 256, 257, 257),  # BCLCS_LEVEL_5 == 'OP'
+    (OP_LEAF, -1, 118, -1, -1, -1),  # rule 118: C-3
+    (OP_IN, 14, 40, 258, 259, 259),  # BCLCS_LEVEL_5 == 'DE'
+    (OP_LEAF, -1, 119, -1, -1, -1),  # rule 119: C-2
+    (OP_LEAF, -1, 120, -1, -1, -1),  # rule 120: VegForestPureOtherSpruceInterior_NoBCLCSLv5-ERROR
+    (OP_LEAF, -1, 121, -1, -1, -1),  # rule 121: VegForestPureOtherSpruceInterior_ProjHeight-ERROR
+    (OP_IN, 4, 74, 262, 281, 281),  # SPECIES_CD_1 in ['C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM']
+    (OP_NE, 6, 0, 266, 263, 263),  # harv_lag is None
+    (OP_LE, 7, 6.0, 265, 266, 264),  # harv_lag <= 6
+    (OP_NE, 6, 0, 707, 266, 266),  # harv_lag is None
+    (OP_LEAF, -1, 122, -1, -1, -1),  # rule 122: S-3
+    (OP_IN, 14, 40, 267, 277, 277),  # BCLCS_LEVEL_5 == 'DE'
+    (OP_LT, 17, 4.0, 268, 269, 269),  # PROJ_HEIGHT_1 < 4
+    (OP_LEAF, -1, 123, -1, -1, -1),  # rule 123: D-1, growing season: 124 D-2
+    (OP_LE, 17, 15.0, 270, 271, 271),  # PROJ_HEIGHT_1 <= 15
+    (OP_LEAF, -1, 125, -1, -1, -1),  # rule 125: C-3
+    (OP_GT, 17, 15.0, 272, 790, 790),  # PROJ_HEIGHT_1 > 15
+    (OP_LT, 16, 60.0, 273, 274, 274),  # PROJ_AGE_1 < 60
+    (OP_LEAF, -1, 126, -1, -1, -1),  # rule 126: C-3
+    (OP_LE, 16, 99.0, 275, 276, 276),  # PROJ_AGE_1 <= 99
+    (OP_LEAF, -1, 127, -1, -1, -1),  # rule 127: M-1, growing season: 128 M-2
+    (OP_LEAF, -1, 129, -1, -1, -1),  # rule 129: C-5
+    (OP_IN, 14, 71, 278, 279, 279),  # BCLCS_LEVEL_5 == 'OP'
+    (OP_LEAF, -1, 130, -1, -1, -1),  # rule 130: C-5
+    (OP_IN, 14, 70, 280, 790, 790),  # BCLCS_LEVEL_5 == 'SP'
+    (OP_LEAF, -1, 131, -1, -1, -1),  # rule 131: D-1, growing season: 132 D-2
+    (OP_IN, 4, 27, 282, 289, 707),  # SPECIES_CD_1.startswith('B')
+    (OP_IN, 4, 73, 283, 284, 284),  # SPECIES_CD_1 == 'BG'
+    (OP_LEAF, -1, 133, -1, -1, -1),  # rule 133: C-7
+    (OP_IN, 4, 72, 285, 286, 286),  # SPECIES_CD_1 == 'BA'
+    (OP_LEAF, -1, 134, -1, -1, -1),  # rule 134: M-1, growing season: 135 M-2
+    (OP_IN, 14, 70, 287, 288, 288),  # BCLCS_LEVEL_5 == 'SP'
+    (OP_LEAF, -1, 136, -1, -1, -1),  # rule 136: C-7
+    (OP_LEAF, -1, 137, -1, -1, -1),  # rule 137: C-5
+    (OP_IN, 4, 31, 290, 291, 291),  # SPECIES_CD_1 in ['T', 'TW']
+    (OP_LEAF, -1, 138, -1, -1, -1),  # rule 138: C-5
+    (OP_IN, 4, 30, 292, 293, 293),  # SPECIES_CD_1 in ['J', 'JR']
+    (OP_LEAF, -1, 139, -1, -1, -1),  # rule 139: O-1a, growing season: 140 O-1b
+    (OP_LEAF, -1, 141, -1, -1, -1),  # rule 141: VegForestedPureSpeciesStand_Species-ERROR
+    (OP_LEAF, -1, 142, -1, -1, -1),  # rule 142: D-1, growing season: 143 D-2
+    (OP_LT, 37, 80.0, 296, 790, 790),  # SPECIES_PCT_1 < 80
+    (OP_LE, 22, 20.0, 297, 298, 298),  # pct_cnfr <= 20
+    (OP_LEAF, -1, 144, -1, -1, -1),  # rule 144: D-1, growing season: 145 D-2
+    (OP_GT, 22, 20.0, 299, 790, 790),  # pct_cnfr > 20
+    (OP_LE, 22, 40.0, 300, 313, 313),  # pct_cnfr <= 40
+    (OP_NE, 6, 0, 304, 301, 301),  # harv_lag is None
+    (OP_LE, 7, 6.0, 303, 304, 302),  # harv_lag <= 6
+    (OP_NE, 6, 0, 707, 304, 304),  # harv_lag is None
+    (OP_LEAF, -1, 146, -1, -1, -1),  # rule 146: S-2
+    (OP_NE, 36, 0, 305, 306, 306),  # dominant('SB', 'SW', 'SE', 'SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX')
+    (OP_LEAF, -1, 147, -1, -1, -1),  # rule 147: M-1, growing season: 148 M-2
+    (OP_NE, 35, 0, 307, 310, 310),  # dominant('S',)
+    (OP_IN, 15, 35, 308, 309, 309),  # COAST_INTERIOR_CD == 'C'
+    (OP_LEAF, -1, 149, -1, -1, -1),  # rule 149: M-1, growing season: 150 M-2
+    (OP_LEAF, -1, 151, -1, -1, -1),  # rule 151: M-1, growing season: 152 M-2
+    (OP_IN, 14, 70, 311, 312, 312),  # BCLCS_LEVEL_5 == 'SP'
+    (OP_LEAF, -1, 153, -1, -1, -1),  # rule 153: M-1, growing season: 154 M-2
+    (OP_LEAF, -1, 155, -1, -1, -1),  # rule 155: M-1, growing season: 156 M-2
+    (OP_LE, 22, 65.0, 314, 364, 364),  # pct_cnfr <= 65
+    (OP_NE, 6, 0, 318, 315, 315),  # harv_lag is None
+    (OP_LE, 7, 6.0, 317, 318, 316),  # harv_lag <= 6
+    (OP_NE, 6, 0, 707, 318, 318),  # harv_lag is None
+    (OP_LEAF, -1, 157, -1, -1, -1),  # rule 157: S-1
+    (OP_NE, 34, 0, 319, 325, 325),  # dominant('PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P')
+    (OP_IN, 14, 70, 320, 321, 321),  # BCLCS_LEVEL_5 == 'SP'
+    (OP_LEAF, -1, 158, -1, -1, -1),  # rule 158: M-1, growing season: 159 M-2
+    (OP_IN, 14, 71, 322, 323, 323),  # BCLCS_LEVEL_5 == 'OP'
+    (OP_LEAF, -1, 160, -1, -1, -1),  # rule 160: M-1, growing season: 161 M-2
+    (OP_IN, 14, 40, 324, 790, 790),  # BCLCS_LEVEL_5 == 'DE'
+    (OP_LEAF, -1, 162, -1, -1, -1),  # rule 162: M-1, growing season: 163 M-2
+    (OP_NE, 33, 0, 326, 327, 327),  # dominant('PY',)
+    (OP_LEAF, -1, 164, -1, -1, -1),  # rule 164: M-1, growing season: 165 M-2
+    (OP_NE, 32, 0, 328, 329, 329),  # dominant('PA', 'PF', 'PW')
+    (OP_LEAF, -1, 166, -1, -1, -1),  # rule 166: M-1, growing season: 167 M-2
+    (OP_NE, 31, 0, 330, 333, 333),  # dominant('F', 'FD', 'FDC', 'FDI')
+    (OP_IN, 0, 58, 331, 332, 332),  # BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH']
+    (OP_LEAF, -1, 168, -1, -1, -1),  # rule 168: M-1, growing season: 169 M-2
+    (OP_LEAF, -1, 170, -1, -1, -1),  # rule 170: M-1, growing season: 171 M-2
+    (OP_NE, 30, 0, 334, 338, 338),  # dominant('SE',)
+    (OP_IN, 14, 70, 335, 336, 336),  # BCLCS_LEVEL_5 == 'SP'
+    (OP_LEAF, -1, 172, -1, -1, -1),  # rule 172: M-1, growing season: 173 M-2
+    (OP_IN, 14, 68, 337, 790, 790),  # BCLCS_LEVEL_5 in ['OP', 'DE']
+    (OP_LEAF, -1, 174, -1, -1, -1),  # rule 174: M-1, growing season: 175 M-2
+    (OP_NE, 29, 0, 339, 340, 340),  # dominant('SS',)
+    (OP_LEAF, -1, 176, -1, -1, -1),  # rule 176: M-1, growing season: 177 M-2
+    (OP_NE, 28, 0, 341, 342, 342),  # dominant('SB', 'SW')
+    (OP_LEAF, -1, 178, -1, -1, -1),  # rule 178: M-1, growing season: 179 M-2
+    (OP_NE, 27, 0, 343, 356, 356),  # dominant('SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX', 'S')
+    (OP_IN, 0, 67, 344, 348, 348),  # BEC_ZONE_CODE in ['BWBS', 'SWB']
+    (OP_IN, 14, 48, 345, 346, 346),  # BCLCS_LEVEL_5 in ['DE', 'OP']
+    (OP_LEAF, -1, 180, -1, -1, -1),  # rule 180: M-1, growing season: 181 M-2
+    (OP_IN, 14, 34, 347, 790, 790),  # BCLCS_LEVEL_5 in ['SP']
+    (OP_LEAF, -1, 182, -1, -1, -1),  # rule 182: M-1, growing season: 183 M-2
+    (OP_IN, 14, 34, 349, 350, 350),  # BCLCS_LEVEL_5 in ['SP']
+    (OP_LEAF, -1, 184, -1, -1, -1),  # rule 184: M-1, growing season: 185 M-2
+    (OP_IN, 14, 48, 351, 355, 355),  # BCLCS_LEVEL_5 in ['DE', 'OP']
+    (OP_IN, 15, 66, 352, 353, 353),  # COAST_INTERIOR_CD == 'I'
+    (OP_LEAF, -1, 186, -1, -1, -1),  # rule 186: M-1, growing season: 187 M-2
+    (OP_IN, 15, 35, 354, 790, 790),  # COAST_INTERIOR_CD == 'C'
+    (OP_LEAF, -1, 188, -1, -1, -1),  # rule 188: M-1, growing season: 189 M-2
+    (OP_LEAF, -1, 190, -1, -1, -1),  # rule 190: VegForestMixedSpeciesCnfrLT65_BCLCSLv5-ERROR
+    (OP_NE, 26, 0, 357, 358, 358),  # dominant('C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM')
+    (OP_LEAF, -1, 191, -1, -1, -1),  # rule 191: M-1, growing season: 192 M-2
+    (OP_NE, 25, 0, 359, 360, 360),  # dominant('B', 'BA', 'BG', 'BL')
+    (OP_LEAF, -1, 193, -1, -1, -1),  # rule 193: M-1, growing season: 194 M-2
+    (OP_NE, 24, 0, 361, 362, 362),  # dominant('T', 'TW')
+    (OP_LEAF, -1, 195, -1, -1, -1),  # rule 195: C-5
+    (OP_NE, 23, 0, 363, 790, 790),  # dominant('J', 'JR')
+    (OP_LEAF, -1, 196, -1, -1, -1),  # rule 196: O-1a, growing season: 197 O-1b
+    (OP_LE, 22, 80.0, 365, 416, 416),  # pct_cnfr <= 80
+    (OP_NE, 6, 0, 369, 366, 366),  # harv_lag is None
+    (OP_LE, 7, 6.0, 368, 369, 367),  # harv_lag <= 6
+    (OP_NE, 6, 0, 707, 369, 369),  # harv_lag is None
+    (OP_LEAF, -1, 198, -1, -1, -1),  # rule 198: S-1
+    (OP_NE, 34, 0, 370, 376, 376),  # dominant('PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P')
+    (OP_IN, 14, 34, 371, 372, 372),  # BCLCS_LEVEL_5 in ['SP']
+    (OP_LEAF, -1, 199, -1, -1, -1),  # rule 199: M-1, growing season: 200 M-2
+    (OP_IN, 14, 39, 373, 374, 374),  # BCLCS_LEVEL_5 in ['OP']
+    (OP_LEAF, -1, 201, -1, -1, -1),  # rule 201: M-1, growing season: 202 M-2
+    (OP_IN, 14, 33, 375, 790, 790),  # BCLCS_LEVEL_5 in ['DE']
+    (OP_LEAF, -1, 203, -1, -1, -1),  # rule 203: M-1, growing season: 204 M-2
+    (OP_NE, 33, 0, 377, 378, 378),  # dominant('PY',)
+    (OP_LEAF, -1, 205, -1, -1, -1),  # rule 205: C-7
+    (OP_NE, 32, 0, 379, 380, 380),  # dominant('PA', 'PF', 'PW')
+    (OP_LEAF, -1, 206, -1, -1, -1),  # rule 206: C-5
+    (OP_NE, 31, 0, 381, 388, 388),  # dominant('F', 'FD', 'FDC', 'FDI')
+    (OP_IN, 0, 69, 384, 382, 382),  # BEC_ZONE_CODE in ['CWH', 'CDF']
+    (OP_IN, 0, 8, 383, 385, 385),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 8, 0, 384, 385, 385),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 207, -1, -1, -1),  # rule 207: C-5
+    (OP_IN, 14, 33, 386, 387, 387),  # BCLCS_LEVEL_5 in ['DE']
+    (OP_LEAF, -1, 208, -1, -1, -1),  # rule 208: M-1, growing season: 209 M-2
+    (OP_LEAF, -1, 210, -1, -1, -1),  # rule 210: C-7
+    (OP_NE, 30, 0, 389, 393, 393),  # dominant('SE',)
+    (OP_IN, 14, 34, 390, 391, 391),  # BCLCS_LEVEL_5 in ['SP']
+    (OP_LEAF, -1, 211, -1, -1, -1),  # rule 211: M-1, growing season: 212 M-2
+    (OP_IN, 14, 68, 392, 790, 790),  # BCLCS_LEVEL_5 in ['OP', 'DE']
+    (OP_LEAF, -1, 213, -1, -1, -1),  # rule 213: M-1, growing season: 214 M-2
+    (OP_NE, 29, 0, 394, 395, 395),  # dominant('SS',)
+    (OP_LEAF, -1, 215, -1, -1, -1),  # rule 215: C-5
+    (OP_NE, 28, 0, 396, 397, 397),  # dominant('SB', 'SW')
+    (OP_LEAF, -1, 216, -1, -1, -1),  # rule 216: M-1, growing season: 217 M-2
+    (OP_NE, 27, 0, 398, 408, 408),  # dominant('SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX', 'S')
+    (OP_IN, 0, 67, 399, 403, 403),  # BEC_ZONE_CODE in ['BWBS', 'SWB']
+    (OP_IN, 14, 48, 400, 401, 401),  # BCLCS_LEVEL_5 in ['DE', 'OP']
+    (OP_LEAF, -1, 218, -1, -1, -1),  # rule 218: M-1, growing season: 219 M-2
+    (OP_IN, 14, 34, 402, 790, 790),  # BCLCS_LEVEL_5 in ['SP']
+    (OP_LEAF, -1, 220, -1, -1, -1),  # rule 220: M-1, growing season: 221 M-2
+    (OP_IN, 14, 34, 404, 405, 405),  # BCLCS_LEVEL_5 in ['SP']
+    (OP_LEAF, -1, 222, -1, -1, -1),  # rule 222: M-1, growing season: 223 M-2
+    (OP_IN, 15, 66, 406, 407, 407),  # COAST_INTERIOR_CD == 'I'
+    (OP_LEAF, -1, 224, -1, -1, -1),  # rule 224: M-1, growing season: 225 M-2
+    (OP_LEAF, -1, 226, -1, -1, -1),  # rule 226: C-5
+    (OP_NE, 26, 0, 409, 410, 410),  # dominant('C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM')
+    (OP_LEAF, -1, 227, -1, -1, -1),  # rule 227: C-5
+    (OP_NE, 25, 0, 411, 412, 412),  # dominant('B', 'BA', 'BG', 'BL')
+    (OP_LEAF, -1, 228, -1, -1, -1),  # rule 228: C-7
+    (OP_NE, 24, 0, 413, 414, 414),  # dominant('T', 'TW')
+    (OP_LEAF, -1, 229, -1, -1, -1),  # rule 229: C-5
+    (OP_NE, 23, 0, 415, 790, 790),  # dominant('J', 'JR')
+    (OP_LEAF, -1, 230, -1, -1, -1),  # rule 230: C-7
+    (OP_LE, 22, 100.0, 417, 790, 790),  # pct_cnfr <= 100
+    (OP_IN, 4, 65, 418, 476, 476),  # SPECIES_CD_1 in ['P', 'PL', 'PLI', 'PLC', 'PJ', 'PXJ']
+    (OP_NE, 6, 0, 422, 419, 419),  # harv_lag is None
+    (OP_LE, 7, 7.0, 421, 422, 420),  # harv_lag <= 7
+    (OP_NE, 6, 0, 707, 422, 422),  # harv_lag is None
+    (OP_LEAF, -1, 231, -1, -1, -1),  # rule 231: S-1
+    (OP_IN, 14, 34, 423, 428, 428),  # BCLCS_LEVEL_5 in ['SP']
+    (OP_IN, 0, 64, 426, 424, 424),  # BEC_ZONE_CODE in ['CWH', 'CDF', 'MH']
+    (OP_IN, 0, 8, 425, 427, 427),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 8, 0, 426, 427, 427),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 232, -1, -1, -1),  # rule 232: D-1, growing season: 233 D-2
+    (OP_LEAF, -1, 234, -1, -1, -1),  # rule 234: C-7
+    (OP_LT, 17, 4.0, 429, 430, 430),  # PROJ_HEIGHT_1 < 4
+    (OP_LEAF, -1, 235, -1, -1, -1),  # rule 235: O-1a, growing season: 236 O-1b
+    (OP_GE, 17, 4.0, 431, 790, 790),  # PROJ_HEIGHT_1 >= 4
+    (OP_IN, 13, 63, 433, 432, 707),  # SPECIES_CD_2.startswith('S')
+    (OP_IN, 13, 62, 433, 469, 707),  # SPECIES_CD_2.startswith('B')
+    (OP_LE, 17, 12.0, 434, 437, 437),  # PROJ_HEIGHT_1 <= 12
+    (OP_GT, 20, 8000.0, 435, 436, 436),  # stocking > 8000
+    (OP_LEAF, -1, 237, -1, -1, -1),  # rule 237: C-4
+    (OP_LEAF, -1, 238, -1, -1, -1),  # rule 238: C-3
+    (OP_LT, 19, 40.0, 438, 443, 443),  # CROWN_CLOSURE < 40
+    (OP_IN, 0, 61, 439, 440, 440),  # BEC_ZONE_CODE in ['BG', 'PP', 'IDF', 'MS']
+    (OP_LEAF, -1, 239, -1, -1, -1),  # rule 239: C-7
+    (OP_IN, 0, 0, 441, 442, 442),  # BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']
+    (OP_LEAF, -1, 240, -1, -1, -1),  # rule 240: C-5
+    (OP_LEAF, -1, 241, -1, -1, -1),  # rule 241: C-3
+    (OP_IN, 21, 60, 444, 468, 468),  # EARLIEST_NONLOGGING_DIST_TYPE == 'IBM'
+    (OP_LE, 11, 5.0, 446, 457, 445),  # dist_lag <= 5
+    (OP_NE, 10, 0, 707, 457, 457),  # dist_lag is None
+    (OP_IN, 14, 33, 447, 452, 452),  # BCLCS_LEVEL_5 in ['DE']
+    (OP_GT, 18, 50.0, 448, 449, 449),  # STAND_PERCENTAGE_DEAD > 50
+    (OP_LEAF, -1, 242, -1, -1, -1),  # rule 242: M-3
+    (OP_GE, 18, 25.0, 450, 451, 451),  # STAND_PERCENTAGE_DEAD >= 25
+    (OP_LEAF, -1, 243, -1, -1, -1),  # rule 243: C-2
+    (OP_LEAF, -1, 244, -1, -1, -1),  # rule 244: C-2
+    (OP_GT, 18, 50.0, 453, 454, 454),  # STAND_PERCENTAGE_DEAD > 50
+    (OP_LEAF, -1, 245, -1, -1, -1),  # rule 245: M-3
+    (OP_GE, 18, 25.0, 455, 456, 456),  # STAND_PERCENTAGE_DEAD >= 25
+    (OP_LEAF, -1, 246, -1, -1, -1),  # rule 246: C-2
+    (OP_LEAF, -1, 247, -1, -1, -1),  # rule 247: C-3
+    (OP_IN, 14, 33, 458, 463, 463),  # BCLCS_LEVEL_5 in ['DE']
+    (OP_GT, 18, 50.0, 459, 460, 460),  # STAND_PERCENTAGE_DEAD > 50
+    (OP_LEAF, -1, 248, -1, -1, -1),  # rule 248: C-2
+    (OP_GE, 18, 25.0, 461, 462, 462),  # STAND_PERCENTAGE_DEAD >= 25
+    (OP_LEAF, -1, 249, -1, -1, -1),  # rule 249: C-2
+    (OP_LEAF, -1, 250, -1, -1, -1),  # rule 250: C-3
+    (OP_GT, 18, 50.0, 464, 465, 465),  # STAND_PERCENTAGE_DEAD > 50
+    (OP_LEAF, -1, 251, -1, -1, -1),  # rule 251: C-2
+    (OP_GE, 18, 25.0, 466, 467, 467),  # STAND_PERCENTAGE_DEAD >= 25
+    (OP_LEAF, -1, 252, -1, -1, -1),  # rule 252: C-3
+    (OP_LEAF, -1, 253, -1, -1, -1),  # rule 253: C-3
+    (OP_LEAF, -1, 254, -1, -1, -1),  # rule 254: C-3
+    (OP_LT, 19, 40.0, 470, 475, 475),  # CROWN_CLOSURE < 40
+    (OP_IN, 0, 59, 471, 472, 472),  # BEC_ZONE_CODE in ['IDF', 'PP', 'BG', 'SBPS', 'MS']
+    (OP_LEAF, -1, 255, -1, -1, -1),  # rule 255: C-7
+    (OP_IN, 0, 58, 473, 474, 474),  # BEC_ZONE_CODE in ['CWH', 'CDF', 'ICH']
+    (OP_LEAF, -1, 256, -1, -1, -1),  # rule 256: C-5
+    (OP_LEAF, -1, 257, -1, -1, -1),  # rule 257: C-3
+    (OP_LEAF, -1, 258, -1, -1, -1),  # rule 258: C-3
+    (OP_IN, 4, 57, 477, 486, 486),  # SPECIES_CD_1 in ['PY']
+    (OP_NE, 6, 0, 481, 478, 478),  # harv_lag is None
+    (OP_LE, 7, 7.0, 480, 481, 479),  # harv_lag <= 7
+    (OP_NE, 6, 0, 707, 481, 481),  # harv_lag is None
+    (OP_LEAF, -1, 259, -1, -1, -1),  # rule 259: S-1
+    (OP_LT, 17, 4.0, 482, 483, 483),  # PROJ_HEIGHT_1 < 4
+    (OP_LEAF, -1, 260, -1, -1, -1),  # rule 260: O-1a, growing season: 261 O-1b
+    (OP_IN, 14, 33, 484, 485, 485),  # BCLCS_LEVEL_5 in ['DE']
+    (OP_LEAF, -1, 262, -1, -1, -1),  # rule 262: C-3
+    (OP_LEAF, -1, 263, -1, -1, -1),  # rule 263: C-7
+    (OP_IN, 4, 56, 487, 494, 494),  # SPECIES_CD_1 in ['PA', 'PF', 'PW']
+    (OP_IN, 14, 33, 488, 489, 489),  # BCLCS_LEVEL_5 in ['DE']
+    (OP_LEAF, -1, 264, -1, -1, -1),  # rule 264: C-3
+    (OP_GE, 20, 900.0, 490, 491, 491),  # stocking >= 900
+    (OP_LEAF, -1, 265, -1, -1, -1),  # rule 265: C-3
+    (OP_GE, 20, 600.0, 492, 493, 493),  # stocking >= 600
+    (OP_LEAF, -1, 266, -1, -1, -1),  # rule 266: C-7
+    (OP_LEAF, -1, 267, -1, -1, -1),  # rule 267: C-5
+    (OP_IN, 4, 55, 495, 537, 707),  # SPECIES_CD_1.startswith('F')
+    (OP_NE, 6, 0, 503, 496, 496),  # harv_lag is None
+    (OP_LE, 7, 6.0, 498, 503, 497),  # harv_lag <= 6
+    (OP_NE, 6, 0, 707, 503, 503),  # harv_lag is None
+    (OP_IN, 0, 46, 501, 499, 499),  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']
+    (OP_IN, 0, 8, 500, 502, 502),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 8, 0, 501, 502, 502),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 268, -1, -1, -1),  # rule 268: S-3
+    (OP_LEAF, -1, 269, -1, -1, -1),  # rule 269: S-1
+    (OP_LT, 17, 4.0, 504, 509, 509),  # PROJ_HEIGHT_1 < 4
+    (OP_IN, 0, 46, 507, 505, 505),  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']
+    (OP_IN, 0, 8, 506, 508, 508),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 8, 0, 507, 508, 508),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 270, -1, -1, -1),  # rule 270: D-1, growing season: 271 D-2
+    (OP_LEAF, -1, 272, -1, -1, -1),  # rule 272: O-1a, growing season: 273 O-1b
+    (OP_GT, 19, 55.0, 510, 526, 526),  # CROWN_CLOSURE > 55
+    (OP_LE, 17, 12.0, 511, 520, 520),  # PROJ_HEIGHT_1 <= 12
+    (OP_IN, 0, 46, 514, 512, 512),  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']
+    (OP_IN, 0, 8, 513, 515, 515),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 8, 0, 514, 515, 515),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 274, -1, -1, -1),  # rule 274: C-5
+    (OP_GT, 18, 34.0, 516, 517, 517),  # STAND_PERCENTAGE_DEAD > 34
+    (OP_LEAF, -1, 275, -1, -1, -1),  # rule 275: C-4
+    (OP_IN, 13, 54, 518, 519, 519),  # SPECIES_CD_2 == 'PY'
+    (OP_LEAF, -1, 276, -1, -1, -1),  # rule 276: C-7
+    (OP_LEAF, -1, 277, -1, -1, -1),  # rule 277: C-3
+    (OP_GT, 17, 12.0, 521, 790, 790),  # PROJ_HEIGHT_1 > 12
+    (OP_IN, 0, 46, 524, 522, 522),  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']
+    (OP_IN, 0, 8, 523, 525, 525),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 8, 0, 524, 525, 525),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 278, -1, -1, -1),  # rule 278: C-5
+    (OP_LEAF, -1, 279, -1, -1, -1),  # rule 279: C-7
+    (OP_GE, 19, 26.0, 527, 532, 532),  # CROWN_CLOSURE >= 26
+    (OP_IN, 0, 46, 530, 528, 528),  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']
+    (OP_IN, 0, 8, 529, 531, 531),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 8, 0, 530, 531, 531),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 280, -1, -1, -1),  # rule 280: C-5
+    (OP_LEAF, -1, 281, -1, -1, -1),  # rule 281: C-7
+    (OP_IN, 0, 46, 535, 533, 533),  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']
+    (OP_IN, 0, 8, 534, 536, 536),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 8, 0, 535, 536, 536),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 282, -1, -1, -1),  # rule 282: D-1, growing season: 283 D-2
+    (OP_LEAF, -1, 284, -1, -1, -1),  # rule 284: O-1a, growing season: 285 O-1b
+    (OP_IN, 4, 28, 538, 588, 707),  # SPECIES_CD_1.startswith('S')
+    (OP_NE, 6, 0, 546, 539, 539),  # harv_lag is None
+    (OP_LE, 7, 6.0, 541, 546, 540),  # harv_lag <= 6
+    (OP_NE, 6, 0, 707, 546, 546),  # harv_lag is None
+    (OP_IN, 0, 46, 544, 542, 542),  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']
+    (OP_IN, 0, 8, 543, 545, 545),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 8, 0, 544, 545, 545),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 286, -1, -1, -1),  # rule 286: S-3
+    (OP_LEAF, -1, 287, -1, -1, -1),  # rule 287: S-2
+    (OP_IN, 4, 53, 547, 558, 558),  # SPECIES_CD_1 == 'SE'
+    (OP_IN, 14, 34, 548, 549, 549),  # BCLCS_LEVEL_5 in ['SP']
+    (OP_LEAF, -1, 288, -1, -1, -1),  # rule 288: C-7
+    (OP_IN, 13, 52, 550, 553, 553),  # SPECIES_CD_2 in ['BL', 'B', 'PL', 'P', 'PLI']
+    (OP_IN, 14, 33, 551, 552, 552),  # BCLCS_LEVEL_5 in ['DE']
+    (OP_LEAF, -1, 289, -1, -1, -1),  # rule 289: C-2
+    (OP_LEAF, -1, 290, -1, -1, -1),  # rule 290: C-3
+    (OP_IN, 13, 51, 554, 557, 557),  # SPECIES_CD_2 in ['HW', 'HM', 'CW', 'YC']
+    (OP_IN, 14, 33, 555, 556, 556),  # BCLCS_LEVEL_5 in ['DE']
+    (OP_LEAF, -1, 291, -1, -1, -1),  # rule 291: C-3
+    (OP_LEAF, -1, 292, -1, -1, -1),  # rule 292: C-5
+    (OP_LEAF, -1, 293, -1, -1, -1),  # rule 293: C-3
+    (OP_IN, 4, 50, 559, 560, 560),  # SPECIES_CD_1 in ['SS']
+    (OP_LEAF, -1, 294, -1, -1, -1),  # rule 294: C-5
+    (OP_IN, 4, 49, 561, 566, 566),  # SPECIES_CD_1 in ['SB']
+    (OP_IN, 14, 48, 562, 563, 563),  # BCLCS_LEVEL_5 in ['DE', 'OP']
+    (OP_LEAF, -1, 295, -1, -1, -1),  # rule 295: C-2
+    (OP_IN, 0, 47, 564, 565, 565),  # BEC_ZONE_CODE in ['BWBS']
+    (OP_LEAF, -1, 296, -1, -1, -1),  # rule 296: C-1
+    (OP_LEAF, -1, 297, -1, -1, -1),  # rule 297: C-3
+    (OP_IN, 0, 47, 567, 572, 572),  # BEC_ZONE_CODE in ['BWBS']
+    (OP_IN, 14, 33, 568, 569, 569),  # BCLCS_LEVEL_5 in ['DE']
+    (OP_LEAF, -1, 298, -1, -1, -1),  # rule 298: C-2
+    (OP_IN, 14, 39, 570, 571, 571),  # BCLCS_LEVEL_5 in ['OP']
+    (OP_LEAF, -1, 299, -1, -1, -1),  # rule 299: C-3
+    (OP_LEAF, -1, 300, -1, -1, -1),  # rule 300: C-1
+    (OP_IN, 0, 46, 573, 579, 579),  # BEC_ZONE_CODE in ['CWH', 'MH', 'CDF']
+    (OP_IN, 13, 45, 575, 574, 574),  # SPECIES_CD_2 in ['BL', 'B']
+    (OP_IN, 13, 44, 575, 578, 707),  # SPECIES_CD_2.startswith('P')
+    (OP_IN, 14, 34, 576, 577, 577),  # BCLCS_LEVEL_5 in ['SP']
+    (OP_LEAF, -1, 301, -1, -1, -1),  # rule 301: C-7
+    (OP_LEAF, -1, 302, -1, -1, -1),  # rule 302: C-3
+    (OP_LEAF, -1, 303, -1, -1, -1),  # rule 303: C-5
+    (OP_IN, 14, 34, 580, 581, 581),  # BCLCS_LEVEL_5 in ['SP']
+    (OP_LEAF, -1, 304, -1, -1, -1),  # rule 304: C-7
+    (OP_IN, 14, 33, 582, 583, 583),  # BCLCS_LEVEL_5 in ['DE']
+    (OP_LEAF, -1, 305, -1, -1, -1),  # rule 305: C-2
+    (OP_GT, 18, 34.0, 584, 585, 585),  # STAND_PERCENTAGE_DEAD > 34
+    (OP_LEAF, -1, 306, -1, -1, -1),  # rule 306: C-2
+    (OP_IN, 13, 43, 586, 587, 587),  # SPECIES_CD_2 in ['PL', 'PLI', 'P']
+    (OP_LEAF, -1, 307, -1, -1, -1),  # rule 307: C-2
+    (OP_LEAF, -1, 308, -1, -1, -1),  # rule 308: C-3
+    (OP_IN, 4, 42, 591, 589, 707),  # SPECIES_CD_1.startswith('C')
+    (OP_IN, 4, 41, 591, 590, 707),  # SPECIES_CD_1.startswith('Y')
+    (OP_IN, 4, 25, 591, 608, 707),  # SPECIES_CD_1.startswith('H')
+    (OP_NE, 6, 0, 595, 592, 592),  # harv_lag is None
+    (OP_LE, 7, 6.0, 594, 595, 593),  # harv_lag <= 6
+    (OP_NE, 6, 0, 707, 595, 595),  # harv_lag is None
+    (OP_LEAF, -1, 309, -1, -1, -1),  # rule 309: S-3
+    (OP_IN, 14, 40, 596, 605, 605),  # BCLCS_LEVEL_5 == 'DE'
+    (OP_LT, 17, 4.0, 597, 598, 598),  # PROJ_HEIGHT_1 < 4
+    (OP_LEAF, -1, 310, -1, -1, -1),  # rule 310: D-1, growing season: 311 D-2
+    (OP_LE, 17, 15.0, 599, 600, 600),  # PROJ_HEIGHT_1 <= 15
+    (OP_LEAF, -1, 312, -1, -1, -1),  # rule 312: C-3
+    (OP_LT, 16, 60.0, 601, 602, 602),  # PROJ_AGE_1 < 60
+    (OP_LEAF, -1, 313, -1, -1, -1),  # rule 313: C-3
+    (OP_LE, 16, 99.0, 603, 604, 604),  # PROJ_AGE_1 <= 99
+    (OP_LEAF, -1, 314, -1, -1, -1),  # rule 314: M-1, growing season: 315 M-2
+    (OP_LEAF, -1, 316, -1, -1, -1),  # rule 316: C-5
+    (OP_IN, 14, 39, 606, 607, 607),  # BCLCS_LEVEL_5 in ['OP']
+    (OP_LEAF, -1, 317, -1, -1, -1),  # rule 317: C-5
+    (OP_LEAF, -1, 318, -1, -1, -1),  # rule 318: D-1, growing season: 319 D-2
+    (OP_IN, 4, 38, 609, 610, 610),  # SPECIES_CD_1 in ['BG']
+    (OP_LEAF, -1, 320, -1, -1, -1),  # rule 320: C-7
+    (OP_IN, 4, 37, 611, 614, 614),  # SPECIES_CD_1 in ['BA']
+    (OP_IN, 13, 32, 612, 613, 613),  # SPECIES_CD_2 in ['SE', 'SW', 'S']
+    (OP_LEAF, -1, 321, -1, -1, -1),  # rule 321: C-3
+    (OP_LEAF, -1, 322, -1, -1, -1),  # rule 322: M-1, growing season: 323 M-2
+    (OP_IN, 4, 36, 615, 624, 624),  # SPECIES_CD_1 in ['B', 'BL']
+    (OP_IN, 15, 35, 616, 617, 617),  # COAST_INTERIOR_CD == 'C'
+    (OP_LEAF, -1, 324, -1, -1, -1),  # rule 324: M-1, growing season: 325 M-2
+    (OP_IN, 14, 34, 618, 619, 619),  # BCLCS_LEVEL_5 in ['SP']
+    (OP_LEAF, -1, 326, -1, -1, -1),  # rule 326: C-7
+    (OP_IN, 14, 33, 620, 623, 623),  # BCLCS_LEVEL_5 in ['DE']
+    (OP_IN, 13, 32, 621, 622, 622),  # SPECIES_CD_2 in ['SE', 'SW', 'S']
+    (OP_LEAF, -1, 327, -1, -1, -1),  # rule 327: C-2
+    (OP_LEAF, -1, 328, -1, -1, -1),  # rule 328: C-3
+    (OP_LEAF, -1, 329, -1, -1, -1),  # rule 329: C-3
+    (OP_IN, 4, 31, 625, 626, 626),  # SPECIES_CD_1 in ['T', 'TW']
+    (OP_LEAF, -1, 330, -1, -1, -1),  # rule 330: C-5
+    (OP_IN, 4, 30, 627, 790, 790),  # SPECIES_CD_1 in ['J', 'JR']
+    (OP_LEAF, -1, 331, -1, -1, -1),  # rule 331: C-7
+    (OP_NE, 12, 0, 629, 639, 639),  # is_burned
+    (OP_NE, 10, 0, 639, 630, 630),  # dist_lag is None
+    (OP_LT, 11, 11.0, 632, 639, 631),  # dist_lag < 11
+    (OP_NE, 10, 0, 707, 639, 639),  # dist_lag is None
+    (OP_LE, 11, 1.0, 634, 635, 633),  # dist_lag <= 1
+    (OP_NE, 10, 0, 707, 635, 635),  # dist_lag is None
+    (OP_LEAF, -1, 332, -1, -1, -1),  # rule 332: N
+    (OP_LE, 11, 3.0, 637, 638, 636),  # dist_lag <= 3
+    (OP_NE, 10, 0, 707, 638, 638),  # dist_lag is None
+    (OP_LEAF, -1, 333, -1, -1, -1),  # rule 333: D-1, growing season: 334 D-2
+    (OP_LEAF, -1, 335, -1, -1, -1),  # rule 335: O-1a, growing season: 336 O-1b
+    (OP_NE, 9, 0, 640, 750, 750),  # is_logged
+    (OP_NOTNULL, 4, 0, 641, 641, 702),  # SPECIES_CD_1 is None
+    (OP_LE, 7, 7.0, 643, 656, 642),  # harv_lag <= 7
+    (OP_NE, 6, 0, 707, 656, 656),  # harv_lag is None
+    (OP_IN, 4, 29, 644, 645, 645),  # SPECIES_CD_1.startswith('P')
+    (OP_LEAF, -1, 337, -1, -1, -1),  # rule 337: S-1
+    (OP_IN, 4, 28, 647, 646, 646),  # SPECIES_CD_1.startswith('S')
+    (OP_IN, 4, 27, 647, 648, 648),  # SPECIES_CD_1.startswith('B')
+    (OP_LEAF, -1, 338, -1, -1, -1),  # rule 338: S-2
+    (OP_IN, 4, 26, 650, 649, 649),  # SPECIES_CD_1 in ['CW', 'YC']
+    (OP_IN, 4, 25, 650, 651, 651),  # SPECIES_CD_1.startswith('H')
+    (OP_LEAF, -1, 339, -1, -1, -1),  # rule 339: S-3
+    (OP_IN, 4, 24, 652, 655, 655),  # SPECIES_CD_1.startswith('FD')
+    (OP_IN, 0, 23, 653, 654, 654),  # BEC_ZONE_CODE in ['CWH', 'ICH']
+    (OP_LEAF, -1, 340, -1, -1, -1),  # rule 340: S-3
+    (OP_LEAF, -1, 341, -1, -1, -1),  # rule 341: S-1
+    (OP_LEAF, -1, 342, -1, -1, -1),  # rule 342: S-1
+    (OP_LE, 7, 24.0, 658, 663, 657),  # harv_lag <= 24
+    (OP_NE, 6, 0, 707, 663, 663),  # harv_lag is None
+    (OP_IN, 0, 22, 661, 659, 659),  # BEC_ZONE_CODE in ['CWH', 'MH']
+    (OP_IN, 0, 8, 660, 662, 662),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 8, 0, 661, 662, 662),  # dry_wet == 'wet'
+    (OP_LEAF, -1, 343, -1, -1, -1),  # rule 343: D-1, growing season: 344 D-2
+    (OP_LEAF, -1, 345, -1, -1, -1),  # rule 345: O-1a, growing season: 346 O-1b
+    (OP_IN, 0, 1, 664, 665, 665),  # BEC_ZONE_CODE in ['CMA', 'IMA']
+    (OP_LEAF, -1, 347, -1, -1, -1),  # rule 347: N
+    (OP_IN, 0, 21, 666, 667, 667),  # BEC_ZONE_CODE == 'BAFA'
+    (OP_LEAF, -1, 348, -1, -1, -1),  # rule 348: D-1, growing season: 349 D-2
+    (OP_IN, 0, 20, 668, 671, 671),  # BEC_ZONE_CODE == 'CWH'
+    (OP_NE, 5, 0, 669, 670, 670),  # dry_wet == 'dry'
+    (OP_LEAF, -1, 350, -1, -1, -1),  # rule 350: M-1, growing season: 351 M-2
+    (OP_LEAF, -1, 352, -1, -1, -1),  # rule 352: C-5
+    (OP_IN, 0, 19, 672, 673, 673),  # BEC_ZONE_CODE == 'BWBS'
+    (OP_LEAF, -1, 353, -1, -1, -1),  # rule 353: C-2
+    (OP_IN, 0, 18, 674, 675, 675),  # BEC_ZONE_CODE == 'SWB'
+    (OP_LEAF, -1, 354, -1, -1, -1),  # rule 354: M-1, growing season: 355 M-2
+    (OP_IN, 0, 17, 676, 677, 677),  # BEC_ZONE_CODE == 'SBS'
+    (OP_LEAF, -1, 356, -1, -1, -1),  # rule 356: C-3
+    (OP_IN, 0, 16, 678, 679, 679),  # BEC_ZONE_CODE == 'SBPS'
+    (OP_LEAF, -1, 357, -1, -1, -1),  # rule 357: C-7
+    (OP_IN, 0, 15, 680, 681, 681),  # BEC_ZONE_CODE == 'MS'
+    (OP_LEAF, -1, 358, -1, -1, -1),  # rule 358: C-3
+    (OP_IN, 0, 14, 682, 685, 685),  # BEC_ZONE_CODE == 'IDF'
+    (OP_NE, 5, 0, 683, 684, 684),  # dry_wet == 'dry'
+    (OP_LEAF, -1, 359, -1, -1, -1),  # rule 359: C-7
+    (OP_LEAF, -1, 360, -1, -1, -1),  # rule 360: C-3
+    (OP_IN, 0, 13, 686, 687, 687),  # BEC_ZONE_CODE == 'PP'
+    (OP_LEAF, -1, 361, -1, -1, -1),  # rule 361: O-1a, growing season: 362 O-1b
+    (OP_IN, 0, 12, 688, 689, 689),  # BEC_ZONE_CODE == 'BG'
+    (OP_LEAF, -1, 363, -1, -1, -1),  # rule 363: O-1a, growing season: 364 O-1b
+    (OP_IN, 0, 11, 690, 691, 691),  # BEC_ZONE_CODE == 'MH'
+    (OP_LEAF, -1, 365, -1, -1, -1),  # rule 365: D-1, growing season: 366 D-2
+    (OP_IN, 0, 10, 692, 693, 693),  # BEC_ZONE_CODE == 'ESSF'
+    (OP_LEAF, -1, 367, -1, -1, -1),  # rule 367: C-3
+    (OP_IN, 0, 9, 694, 697, 697),  # BEC_ZONE_CODE == 'CDF'
+    (OP_NE, 5, 0, 695, 696, 696),  # dry_wet == 'dry'
+    (OP_LEAF, -1, 368, -1, -1, -1),  # rule 368: C-7
+    (OP_LEAF, -1, 369, -1, -1, -1),  # rule 369: C-5
+    (OP_IN, 0, 8, 698, 701, 701),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 5, 0, 699, 700, 700),  # dry_wet == 'dry'
+    (OP_LEAF, -1, 370, -1, -1, -1),  # rule 370: C-3
+    (OP_LEAF, -1, 371, -1, -1, -1),  # rule 371: C-5
+    (OP_LEAF, -1, 372, -1, -1, -1),  # rule 372: VegNonForestUnburnedLoggedGT24HasSpecies_BEC-ERROR
+    (OP_LE, 7, 5.0, 704, 705, 703),  # harv_lag <= 5
+    (OP_NE, 6, 0, 707, 705, 705),  # harv_lag is None
+    (OP_LEAF, -1, 373, -1, -1, -1),  # rule 373: S-1
+    (OP_LE, 7, 24.0, 708, 711, 706),  # harv_lag <= 24
+    (OP_NE, 6, 0, 707, 711, 711),  # harv_lag is None
+    (OP_LEAF, -1, -1, -1, -1, -1),  # FAIL
+    (OP_IN, 0, 0, 709, 710, 710),  # BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']
+    (OP_LEAF, -1, 374, -1, -1, -1),  # rule 374: D-1, growing season: 375 D-2
+    (OP_LEAF, -1, 376, -1, -1, -1),  # rule 376: O-1a, growing season: 377 O-1b
+    (OP_IN, 0, 1, 712, 713, 713),  # BEC_ZONE_CODE in ['CMA', 'IMA']
+    (OP_LEAF, -1, 378, -1, -1, -1),  # rule 378: N
+    (OP_IN, 0, 21, 714, 715, 715),  # BEC_ZONE_CODE == 'BAFA'
+    (OP_LEAF, -1, 379, -1, -1, -1),  # rule 379: D-1, growing season: 380 D-2
+    (OP_IN, 0, 20, 716, 719, 719),  # BEC_ZONE_CODE == 'CWH'
+    (OP_NE, 5, 0, 717, 718, 718),  # dry_wet == 'dry'
+    (OP_LEAF, -1, 381, -1, -1, -1),  # rule 381: M-1, growing season: 382 M-2
+    (OP_LEAF, -1, 383, -1, -1, -1),  # rule 383: C-5
+    (OP_IN, 0, 19, 720, 721, 721),  # BEC_ZONE_CODE == 'BWBS'
+    (OP_LEAF, -1, 384, -1, -1, -1),  # rule 384: C-2
+    (OP_IN, 0, 18, 722, 723, 723),  # BEC_ZONE_CODE == 'SWB'
+    (OP_LEAF, -1, 385, -1, -1, -1),  # rule 385: M-1, growing season: 386 M-2
+    (OP_IN, 0, 17, 724, 725, 725),  # BEC_ZONE_CODE == 'SBS'
+    (OP_LEAF, -1, 387, -1, -1, -1),  # rule 387: C-3
+    (OP_IN, 0, 16, 726, 727, 727),  # BEC_ZONE_CODE == 'SBPS'
+    (OP_LEAF, -1, 388, -1, -1, -1),  # rule 388: C-7
+    (OP_IN, 0, 15, 728, 729, 729),  # BEC_ZONE_CODE == 'MS'
+    (OP_LEAF, -1, 389, -1, -1, -1),  # rule 389: C-7
+    (OP_IN, 0, 14, 730, 733, 733),  # BEC_ZONE_CODE == 'IDF'
+    (OP_NE, 5, 0, 731, 732, 732),  # dry_wet == 'dry'
+    (OP_LEAF, -1, 390, -1, -1, -1),  # rule 390: C-7
+    (OP_LEAF, -1, 391, -1, -1, -1),  # rule 391: M-1, growing season: 392 M-2
+    (OP_IN, 0, 13, 734, 735, 735),  # BEC_ZONE_CODE == 'PP'
+    (OP_LEAF, -1, 393, -1, -1, -1),  # rule 393: O-1a, growing season: 394 O-1b
+    (OP_IN, 0, 12, 736, 737, 737),  # BEC_ZONE_CODE == 'BG'
+    (OP_LEAF, -1, 395, -1, -1, -1),  # rule 395: O-1a, growing season: 396 O-1b
+    (OP_IN, 0, 11, 738, 739, 739),  # BEC_ZONE_CODE == 'MH'
+    (OP_LEAF, -1, 397, -1, -1, -1),  # rule 397: D-1, growing season: 398 D-2
+    (OP_IN, 0, 10, 740, 741, 741),  # BEC_ZONE_CODE == 'ESSF'
+    (OP_LEAF, -1, 399, -1, -1, -1),  # rule 399: C-7
+    (OP_IN, 0, 9, 742, 745, 745),  # BEC_ZONE_CODE == 'CDF'
+    (OP_NE, 5, 0, 743, 744, 744),  # dry_wet == 'dry'
+    (OP_LEAF, -1, 400, -1, -1, -1),  # rule 400: C-7
+    (OP_LEAF, -1, 401, -1, -1, -1),  # rule 401: C-5
+    (OP_IN, 0, 8, 746, 749, 749),  # BEC_ZONE_CODE == 'ICH'
+    (OP_NE, 5, 0, 747, 748, 748),  # dry_wet == 'dry'
+    (OP_LEAF, -1, 402, -1, -1, -1),  # rule 402: M-1, growing season: 403 M-2
+    (OP_LEAF, -1, 404, -1, -1, -1),  # rule 404: C-5
+    (OP_LEAF, -1, 405, -1, -1, -1),  # rule 405: VegNonForestUnburnedLoggedGT24NoSpecies_BEC-ERROR
+    (OP_NOTNULL, 4, 0, 751, 751, 756),  # SPECIES_CD_1 is None
+    (OP_IN, 0, 1, 752, 753, 753),  # BEC_ZONE_CODE in ['CMA', 'IMA']
+    (OP_LEAF, -1, 406, -1, -1, -1),  # rule 406: N
+    (OP_IN, 0, 7, 754, 755, 755),  # BEC_ZONE_CODE in ['CWH', 'MH', 'ICH', 'BAFA']
+    (OP_LEAF, -1, 407, -1, -1, -1),  # rule 407: D-1, growing season: 408 D-2
+    (OP_LEAF, -1, 409, -1, -1, -1),  # rule 409: O-1a, growing season: 410 O-1b
+    (OP_IN, 3, 6, 757, 777, 777),  # INVENTORY_STANDARD_CD == 'F'
+    (OP_EQ, 2, 11.0, 760, 758, 758),  # NON_PRODUCTIVE_CD == 11
+    (OP_EQ, 2, 12.0, 760, 759, 759),  # NON_PRODUCTIVE_CD == 12
+    (OP_EQ, 2, 13.0, 760, 763, 763),  # NON_PRODUCTIVE_CD == 13
+    (OP_IN, 0, 0, 761, 762, 762),  # BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']
+    (OP_LEAF, -1, 411, -1, -1, -1),  # rule 411: D-1, growing season: 412 D-2
+    (OP_LEAF, -1, 413, -1, -1, -1),  # rule 413: O-1a, growing season: 414 O-1b
+    (OP_EQ, 2, 35.0, 764, 765, 765),  # NON_PRODUCTIVE_CD == 35
+    (OP_LEAF, -1, 415, -1, -1, -1),  # rule 415: W
+    (OP_EQ, 2, 42.0, 766, 767, 767),  # NON_PRODUCTIVE_CD == 42
+    (OP_LEAF, -1, 416, -1, -1, -1),  # rule 416: N
+    (OP_EQ, 2, 60.0, 770, 768, 768),  # NON_PRODUCTIVE_CD == 60
+    (OP_EQ, 2, 62.0, 770, 769, 769),  # NON_PRODUCTIVE_CD == 62
+    (OP_EQ, 2, 63.0, 770, 776, 776),  # NON_PRODUCTIVE_CD == 63
+    (OP_LEAF, -1, 417, -1, -1, -1),  # rule 417: O-1a, growing season: 418 O-1b
+    (OP_IN, 0, 1, 772, 773, 773),  # BEC_ZONE_CODE in ['CMA', 'IMA']
+    (OP_LEAF, -1, 419, -1, -1, -1),  # rule 419: N
+    (OP_IN, 0, 0, 774, 775, 775),  # BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']
+    (OP_LEAF, -1, 420, -1, -1, -1),  # rule 420: D-1, growing season: 421 D-2
+    (OP_LEAF, -1, 422, -1, -1, -1),  # rule 422: O-1a, growing season: 423 O-1b
+    (OP_LEAF, -1, 424, -1, -1, -1),  # rule 424: N
+    (OP_IN, 1, 5, 778, 779, 779),  # LAND_COVER_CLASS_CD_1 in ['LA', 'RE', 'RI', 'OC']
+    (OP_LEAF, -1, 425, -1, -1, -1),  # rule 425: W
+    (OP_IN, 1, 4, 780, 781, 781),  # LAND_COVER_CLASS_CD_1 == 'HG'
+    (OP_LEAF, -1, 426, -1, -1, -1),  # rule 426: O-1a, growing season: 427 O-1b
+    (OP_IN, 1, 3, 782, 783, 783),  # LAND_COVER_CLASS_CD_1 in ['BY', 'BM', 'BL']
+    (OP_LEAF, -1, 428, -1, -1, -1),  # rule 428: D-1, growing season: 429 D-2
+    (OP_IN, 1, 2, 784, 789, 784),  # LAND_COVER_CLASS_CD_1 in ['SL', 'ST', 'HE', 'HF']
+    (OP_IN, 0, 1, 785, 786, 786),  # BEC_ZONE_CODE in ['CMA', 'IMA']
+    (OP_LEAF, -1, 430, -1, -1, -1),  # rule 430: N
+    (OP_IN, 0, 0, 787, 788, 788),  # BEC_ZONE_CODE in ['CWH', 'MH', 'ICH']
+    (OP_LEAF, -1, 431, -1, -1, -1),  # rule 431: D-1, growing season: 432 D-2
+    (OP_LEAF, -1, 433, -1, -1, -1),  # rule 433: O-1a, growing season: 434 O-1b
+    (OP_LEAF, -1, 435, -1, -1, -1),  # rule 435: N
+    (OP_LEAF, -1, 0, -1, -1, -1),  # no leaf reached
+]
+
+# Fuel type modifiers of the rule IDs, as (feature, value): the value times the feature, or the value
+# if the feature is -1
+MODIFIERS = {
+    12: (-1, 50.0), 18: (-1, 40.0), 55: (-1, 65.0), 109: (-1, 30.0), 127: (-1, 30.0), 134: (-1, 30.0), 147: (22, 1.0),
+    149: (22, 0.5), 151: (22, 1.0), 153: (22, 0.5), 155: (22, 0.7), 158: (22, 0.6), 160: (22, 0.7), 162: (22, 0.8),
+    164: (22, 0.6), 166: (22, 0.5), 168: (22, 0.5), 170: (22, 0.6), 172: (22, 0.6), 174: (22, 0.9), 176: (22, 0.4),
+    178: (22, 1.0), 180: (22, 1.0), 182: (22, 0.6), 184: (22, 0.6), 186: (22, 0.8), 188: (22, 0.5), 191: (22, 0.4),
+    193: (22, 0.6), 199: (22, 0.5), 201: (22, 0.7), 203: (22, 0.8), 208: (22, 0.7), 211: (22, 0.6), 213: (22, 0.7),
+    216: (22, 1.0), 218: (22, 1.0), 220: (22, 0.6), 222: (22, 0.6), 224: (22, 0.8), 242: (-1, 65.0), 245: (-1, 65.0),
+    314: (-1, 40.0), 322: (-1, 40.0), 324: (-1, 40.0), 350: (-1, 40.0), 354: (-1, 50.0), 381: (-1, 40.0),
+    385: (-1, 25.0), 391: (-1, 50.0), 402: (-1, 40.0),
+}
+
+
+def flat_inputs(s) -> tuple:
+    """
+    Function to get the inputs of the flat node table for a batch of stands.
+    :param s: the StandBatch
+    :return: a tuple of (features, code sets), where features is a float array of the features of each stand
+        (NaN if null), and code sets is a boolean array of the codes (StandBatch categories) in each code set
+    """
+    features = np.empty((len(s), 43), dtype='float64', order='F')
+    features[:, 0] = np.where(s.null['BEC_ZONE_CODE'], np.nan, s.BEC_ZONE_CODE)
+    features[:, 1] = np.where(s.null['LAND_COVER_CLASS_CD_1'], np.nan, s.LAND_COVER_CLASS_CD_1)
+    features[:, 2] = s.NON_PRODUCTIVE_CD
+    features[:, 3] = np.where(s.null['INVENTORY_STANDARD_CD'], np.nan, s.INVENTORY_STANDARD_CD)
+    features[:, 4] = np.where(s.null['SPECIES_CD_1'], np.nan, s.SPECIES_CD_1)
+    features[:, 5] = s.member(_DRY_SUBZONE)  # dry_wet == 'dry'
+    features[:, 6] = s.none['HARVEST_DATE']  # harv_lag is None
+    features[:, 7] = s.harv_lag
+    features[:, 8] = s.member(_WET_SUBZONE)  # dry_wet == 'wet'
+    features[:, 9] = s.is_logged
+    features[:, 10] = s.none['EARLIEST_NONLOGGING_DIST_DATE']  # dist_lag is None
+    features[:, 11] = s.dist_lag
+    features[:, 12] = s.is_burned
+    features[:, 13] = np.where(s.null['SPECIES_CD_2'], np.nan, s.SPECIES_CD_2)
+    features[:, 14] = np.where(s.null['BCLCS_LEVEL_5'], np.nan, s.BCLCS_LEVEL_5)
+    features[:, 15] = np.where(s.null['COAST_INTERIOR_CD'], np.nan, s.COAST_INTERIOR_CD)
+    features[:, 16] = s.PROJ_AGE_1
+    features[:, 17] = s.PROJ_HEIGHT_1
+    features[:, 18] = s.STAND_PERCENTAGE_DEAD
+    features[:, 19] = s.CROWN_CLOSURE
+    features[:, 20] = s.stocking
+    features[:, 21] = np.where(s.null['EARLIEST_NONLOGGING_DIST_TYPE'], np.nan, s.EARLIEST_NONLOGGING_DIST_TYPE)
+    features[:, 22] = s.pct_cnfr
+    features[:, 23] = s.dom_conifers[('J', 'JR')]
+    features[:, 24] = s.dom_conifers[('T', 'TW')]
+    features[:, 25] = s.dom_conifers[('B', 'BA', 'BG', 'BL')]
+    features[:, 26] = s.dom_conifers[('C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM')]
+    features[:, 27] = s.dom_conifers[('SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX', 'S')]
+    features[:, 28] = s.dom_conifers[('SB', 'SW')]
+    features[:, 29] = s.dom_conifers[('SS',)]
+    features[:, 30] = s.dom_conifers[('SE',)]
+    features[:, 31] = s.dom_conifers[('F', 'FD', 'FDC', 'FDI')]
+    features[:, 32] = s.dom_conifers[('PA', 'PF', 'PW')]
+    features[:, 33] = s.dom_conifers[('PY',)]
+    features[:, 34] = s.dom_conifers[('PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P')]
+    features[:, 35] = s.dom_conifers[('S',)]
+    features[:, 36] = s.dom_conifers[('SB', 'SW', 'SE', 'SX', 'SXB', 'SXE', 'SXL', 'SXS', 'SXW', 'SXX')]
+    features[:, 37] = s.SPECIES_PCT_1
+    features[:, 38] = s.member(_CONIFER_BITS[0])  # SPECIES_CD_1 in coniferList
+    features[:, 39] = s.is_forested
+    features[:, 40] = s.is_vegetated
+    features[:, 41] = np.where(s.null['BCLCS_LEVEL_2'], np.nan, s.BCLCS_LEVEL_2)
+    features[:, 42] = np.where(s.null['BCLCS_LEVEL_1'], np.nan, s.BCLCS_LEVEL_1)
+
+    width = max(len(s.categories[name]) for name in [
+        'BEC_ZONE_CODE', 'LAND_COVER_CLASS_CD_1', 'INVENTORY_STANDARD_CD', 'SPECIES_CD_1', 'SPECIES_CD_2',
+        'BCLCS_LEVEL_5', 'COAST_INTERIOR_CD', 'EARLIEST_NONLOGGING_DIST_TYPE', 'BCLCS_LEVEL_2', 'BCLCS_LEVEL_1',
+    ])
+    codeSets = np.zeros((88, width), dtype=bool)
+    c = s.categories['BEC_ZONE_CODE']
+    codeSets[0, :len(c)] = np.isin(c, ['CWH', 'MH', 'ICH'])
+    codeSets[1, :len(c)] = np.isin(c, ['CMA', 'IMA'])
+    codeSets[7, :len(c)] = np.isin(c, ['CWH', 'MH', 'ICH', 'BAFA'])
+    codeSets[8, :len(c)] = c == 'ICH'
+    codeSets[9, :len(c)] = c == 'CDF'
+    codeSets[10, :len(c)] = c == 'ESSF'
+    codeSets[11, :len(c)] = c == 'MH'
+    codeSets[12, :len(c)] = c == 'BG'
+    codeSets[13, :len(c)] = c == 'PP'
+    codeSets[14, :len(c)] = c == 'IDF'
+    codeSets[15, :len(c)] = c == 'MS'
+    codeSets[16, :len(c)] = c == 'SBPS'
+    codeSets[17, :len(c)] = c == 'SBS'
+    codeSets[18, :len(c)] = c == 'SWB'
+    codeSets[19, :len(c)] = c == 'BWBS'
+    codeSets[20, :len(c)] = c == 'CWH'
+    codeSets[21, :len(c)] = c == 'BAFA'
+    codeSets[22, :len(c)] = np.isin(c, ['CWH', 'MH'])
+    codeSets[23, :len(c)] = np.isin(c, ['CWH', 'ICH'])
+    codeSets[46, :len(c)] = np.isin(c, ['CWH', 'MH', 'CDF'])
+    codeSets[47, :len(c)] = np.isin(c, ['BWBS'])
+    codeSets[58, :len(c)] = np.isin(c, ['CWH', 'CDF', 'ICH'])
+    codeSets[59, :len(c)] = np.isin(c, ['IDF', 'PP', 'BG', 'SBPS', 'MS'])
+    codeSets[61, :len(c)] = np.isin(c, ['BG', 'PP', 'IDF', 'MS'])
+    codeSets[64, :len(c)] = np.isin(c, ['CWH', 'CDF', 'MH'])
+    codeSets[67, :len(c)] = np.isin(c, ['BWBS', 'SWB'])
+    codeSets[69, :len(c)] = np.isin(c, ['CWH', 'CDF'])
+    codeSets[80, :len(c)] = np.isin(c, ['ICH'])
+    codeSets[83, :len(c)] = np.isin(c, ['PP', 'BG'])
+    codeSets[84, :len(c)] = np.isin(c, ['IDF', 'CDF'])
+    codeSets[85, :len(c)] = np.isin(c, ['SBPS', 'MS', 'ESSF'])
+    codeSets[86, :len(c)] = np.isin(c, ['BAFA', 'MH'])
+    c = s.categories['LAND_COVER_CLASS_CD_1']
+    codeSets[2, :len(c)] = np.isin(c, ['SL', 'ST', 'HE', 'HF'])
+    codeSets[3, :len(c)] = np.isin(c, ['BY', 'BM', 'BL'])
+    codeSets[4, :len(c)] = c == 'HG'
+    codeSets[5, :len(c)] = np.isin(c, ['LA', 'RE', 'RI', 'OC'])
+    c = s.categories['INVENTORY_STANDARD_CD']
+    codeSets[6, :len(c)] = c == 'F'
+    c = s.categories['SPECIES_CD_1']
+    codeSets[24, :len(c)] = np.char.startswith(c, 'FD')
+    codeSets[25, :len(c)] = np.char.startswith(c, 'H')
+    codeSets[26, :len(c)] = np.isin(c, ['CW', 'YC'])
+    codeSets[27, :len(c)] = np.char.startswith(c, 'B')
+    codeSets[28, :len(c)] = np.char.startswith(c, 'S')
+    codeSets[29, :len(c)] = np.char.startswith(c, 'P')
+    codeSets[30, :len(c)] = np.isin(c, ['J', 'JR'])
+    codeSets[31, :len(c)] = np.isin(c, ['T', 'TW'])
+    codeSets[36, :len(c)] = np.isin(c, ['B', 'BL'])
+    codeSets[37, :len(c)] = np.isin(c, ['BA'])
+    codeSets[38, :len(c)] = np.isin(c, ['BG'])
+    codeSets[41, :len(c)] = np.char.startswith(c, 'Y')
+    codeSets[42, :len(c)] = np.char.startswith(c, 'C')
+    codeSets[49, :len(c)] = np.isin(c, ['SB'])
+    codeSets[50, :len(c)] = np.isin(c, ['SS'])
+    codeSets[53, :len(c)] = c == 'SE'
+    codeSets[55, :len(c)] = np.char.startswith(c, 'F')
+    codeSets[56, :len(c)] = np.isin(c, ['PA', 'PF', 'PW'])
+    codeSets[57, :len(c)] = np.isin(c, ['PY'])
+    codeSets[65, :len(c)] = np.isin(c, ['P', 'PL', 'PLI', 'PLC', 'PJ', 'PXJ'])
+    codeSets[72, :len(c)] = c == 'BA'
+    codeSets[73, :len(c)] = c == 'BG'
+    codeSets[74, :len(c)] = np.isin(c, ['C', 'CW', 'Y', 'YC', 'H', 'HM', 'HW', 'HXM'])
+    codeSets[75, :len(c)] = np.isin(c, ['SB', 'SW'])
+    codeSets[76, :len(c)] = c == 'SS'
+    codeSets[77, :len(c)] = np.isin(c, ['FD', 'FDC', 'FDI', 'F'])
+    codeSets[79, :len(c)] = c == 'PY'
+    codeSets[81, :len(c)] = np.isin(c, ['PL', 'PLI', 'PLC', 'PJ', 'PXJ', 'P'])
+    c = s.categories['SPECIES_CD_2']
+    codeSets[32, :len(c)] = np.isin(c, ['SE', 'SW', 'S'])
+    codeSets[43, :len(c)] = np.isin(c, ['PL', 'PLI', 'P'])
+    codeSets[44, :len(c)] = np.char.startswith(c, 'P')
+    codeSets[45, :len(c)] = np.isin(c, ['BL', 'B'])
+    codeSets[51, :len(c)] = np.isin(c, ['HW', 'HM', 'CW', 'YC'])
+    codeSets[52, :len(c)] = np.isin(c, ['BL', 'B', 'PL', 'P', 'PLI'])
+    codeSets[54, :len(c)] = c == 'PY'
+    codeSets[62, :len(c)] = np.char.startswith(c, 'B')
+    codeSets[63, :len(c)] = np.char.startswith(c, 'S')
+    c = s.categories['BCLCS_LEVEL_5']
+    codeSets[33, :len(c)] = np.isin(c, ['DE'])
+    codeSets[34, :len(c)] = np.isin(c, ['SP'])
+    codeSets[39, :len(c)] = np.isin(c, ['OP'])
+    codeSets[40, :len(c)] = c == 'DE'
+    codeSets[48, :len(c)] = np.isin(c, ['DE', 'OP'])
+    codeSets[68, :len(c)] = np.isin(c, ['OP', 'DE'])
+    codeSets[70, :len(c)] = c == 'SP'
+    codeSets[71, :len(c)] = c == 'OP'
+    codeSets[78, :len(c)] = np.isin(c, ['SP', 'OP'])
+    c = s.categories['COAST_INTERIOR_CD']
+    codeSets[35, :len(c)] = c == 'C'
+    codeSets[66, :len(c)] = c == 'I'
+    c = s.categories['EARLIEST_NONLOGGING_DIST_TYPE']
+    codeSets[60, :len(c)] = c == 'IBM'
+    c = s.categories['BCLCS_LEVEL_2']
+    codeSets[82, :len(c)] = np.isin(c, ['L'])
+    c = s.categories['BCLCS_LEVEL_1']
+    codeSets[87, :len(c)] = np.isin(c, ['V', 'N'])
+    return features, codeSets
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+"""
+Consistency checks of the BC Wildfire Fuel Typing engines on a shared test corpus.
+
+bcwft_corpus.json holds 400 randomly generated stands, reaching about a hundred leaves of the decision tree, with
+missing values of every kind: None codes, null numbers, and harvest and disturbance dates that are None or NaT (the
+missing dates of a pandas DataFrame). It also holds the baseline results of the stands: the row reference, fuel type
+and fuel type modifier given by getFuelType before the batch engines were added (the decisionTree line numbers of
+that release are mapped to rule IDs by bcwft_rules.RULE_TABLE), with the lags measured to a fixed reference year.
+The stands were fed as a dictionary of lists, and as the rows of a pandas DataFrame (as the original fuel typing
+tool read them, with every missing date as NaT).
+
+check_baseline fuel types the stands with the scalar classifier (getFuelType) and every evaluator of the batch engine
+(classify_frame), and counts the stands with results that differ from the baseline. check_sql_baseline does the same
+for the SQL query of bcwft_sql, which reads NULL dates as NaT, against the DataFrame baseline. check_batch checks the
+batch engine against the scalar classifier for the growing and dormant seasons and both seasons at once. check_sql
+loads the corpus into an in-memory SQLite or DuckDB table (missing dates as NULL) and checks the SQL query against
+the batch engine with bcwft_sql.verify. The reference year is fixed, so the lags of the corpus do not change from
+year to year.
+
+Usage:
+    python bcwft_verify.py [--corpus CORPUS] [--reference-year YEAR] [--dialects {sqlite,duckdb} ...]
+"""
+__author__ = ['Gregory A. Greene, map.n.trowel@gmail.com']
+
+import os
+import sys
+import json
+import argparse
+from datetime import datetime as dt
+
+import bcwft2018
+import bcwft_sql
+from bcwft_rules import RULE_TABLE
+
+
+# Default test corpus, and the year its lags are measured to
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bcwft_corpus.json')
+_REFERENCE_YEAR = 2024
+
+_SEASONS = ['growing', 'dormant', 'both']
+_EVALUATORS = ['masks', 'flat', 'table']
+
+
+def load_corpus(path: str = CORPUS_PATH) -> dict:
+    """
+    Function to read a test corpus. Dates are stored as ISO 8601 strings, or "NaT", and missing numbers as null.
+    :param path: path to the corpus (a JSON object of "fields" and "rows")
+    :return: a dictionary of {field: list of values}, with dates as datetimes, None or NaT, and missing numbers as NaN
+    """
+    import pandas as pd
+    with open(path) as f:
+        corpus = json.load(f)
+    data = {fld: [row[k] for row in corpus['rows']] for k, fld in enumerate(corpus['fields'])}
+    for fld in bcwft2018._DATE_FIELDS:
+        data[fld] = [pd.NaT if value == 'NaT' else None if value is None else dt.fromisoformat(value)
+                     for value in data[fld]]
+    for fld in bcwft2018._NUMBER_FIELDS:
+        data[fld] = [float('nan') if value is None else value for value in data[fld]]
+    return data
+
+
+def load_baseline(path: str = CORPUS_PATH) -> tuple:
+    """
+    Function to read the baseline results of a test corpus, with the row references mapped to rule IDs.
+    :param path: path to the corpus (a JSON object with a "baseline" of "reference_year", "columns" and "rows")
+    :return: a tuple of (reference year, dictionary of {(input type, season): list of (rule ID, fuel type,
+        fuel type modifier)})
+    """
+    with open(path) as f:
+        baseline = json.load(f)['baseline']
+    ruleIDs = {rowRef: rule for rule, (rowRef, _) in RULE_TABLE.items()}
+    results = {}
+    for k, column in enumerate(baseline['columns']):
+        name, season = column.split()
+        results[(name, season)] = [(ruleIDs[row[k][0]] if row[k][0] is not None else None, row[k][1], row[k][2])
+                                   for row in baseline['rows']]
+    return baseline['reference_year'], results
+
+
+def _output_columns(season: str, results: tuple) -> list:
+    """
+    Function to align the results of a season with the bcwft_sql.output_fields of that season.
+    :return: a list of value sequences
+    """
+    if season == 'both':
+        (growingRef, growingFT, modifier), (dormantRef, dormantFT, _) = results
+        return [growingRef, growingFT, dormantRef, dormantFT, modifier]
+    return list(results)
+
+
+def _scalar_columns(ft: 'bcwft2018.FuelTyping', data: dict, season: str, reference_date) -> list:
+    """
+    Function to fuel type the stands of a corpus one at a time with getFuelType, recording stands that raise as
+    "FuelTyping-Error", and stands without a result as "NoneTypeReturn-ERROR" (as the batch engine does).
+    :return: a list of value lists (see _output_columns)
+    """
+    fields = ft.fldList[3:]
+    error = (None, 'FuelTyping-Error', None)
+    missing = (None, 'NoneTypeReturn-ERROR', None)
+    rows = []
+    for values in zip(*[data[fld] for fld in fields]):
+        try:
+            result = ft.getFuelType(season, *values, reference_date=reference_date)
+        except Exception:
+            result = error if season != 'both' else (error, error)
+        if result is None:
+            result = missing if season != 'both' else (missing, missing)
+        rows.append(_output_columns(season, result))
+    return [list(column) for column in zip(*rows)]
+
+
+def _same(a, b) -> bool:
+    """
+    Function to compare two result values (missing values are equal, numbers within 1e-9).
+    :return: True or False
+    """
+    if a is None or b is None or a != a or b != b:
+        return (a is None or a != a) and (b is None or b != b)
+    if isinstance(a, str) or isinstance(b, str):
+        return a == b
+    return abs(float(a) - float(b)) <= 1e-9
+
+
+def _mismatches(expected: list, columns: list) -> int:
+    """
+    Function to count the stands with a different value in any column.
+    :return: the number of stands
+    """
+    return sum(1 for i in range(len(expected[0]))
+               if not all(_same(column[i], result[i]) for column, result in zip(expected, columns)))
+
+
+def _frame_rows(frame) -> dict:
+    """
+    Function to get the rows of a pandas DataFrame as the original fuel typing tool passed them to getFuelType.
+    :return: a dictionary of {field: list of values}
+    """
+    rows = [tuple(row) for _, row in frame.iterrows()]
+    return {fld: [row[k] for row in rows] for k, fld in enumerate(frame.columns)}
+
+
+def check_baseline(data: dict, baseline: tuple) -> dict:
+    """
+    Function to check the scalar classifier and the evaluators of the batch engine against the baseline results of
+    a corpus.
+    :param data: a corpus (see load_corpus)
+    :param baseline: the baseline results of the corpus (see load_baseline)
+    :return: a dictionary of {(input type, season, engine): number of stands with different results}
+    """
+    import pandas as pd
+    referenceYear, results = baseline
+    ft = bcwft2018.FuelTyping()
+    frame = pd.DataFrame(data, columns=ft.fldList[3:])
+    inputs = {'dict': (data, data), 'DataFrame': (frame, _frame_rows(frame))}
+    mismatches = {}
+    for (name, season), expected in results.items():
+        batch, rows = inputs[name]
+        expected = [list(column) for column in zip(*expected)]
+        columns = {'getFuelType': _scalar_columns(ft, rows, season, referenceYear)}
+        for evaluator in _EVALUATORS:
+            columns[evaluator] = list(ft.classify_frame(batch, season, referenceYear, evaluator))
+        for engine, column in columns.items():
+            mismatches[(name, season, engine)] = _mismatches(expected, column)
+    return mismatches
+
+
+def check_batch(data: dict, reference_date=_REFERENCE_YEAR) -> dict:
+    """
+    Function to check the batch engine against the scalar classifier on the stands of a corpus. The dictionary of
+    lists keeps None and NaT dates apart, while the pandas DataFrame turns both into NaT.
+    :param data: a corpus (see load_corpus)
+    :param reference_date: the date (or year) harvest and disturbance lags are measured to
+    :return: a dictionary of {(input type, season): number of stands with different results}
+    """
+    import pandas as pd
+    ft = bcwft2018.FuelTyping()
+    frame = pd.DataFrame(data, columns=ft.fldList[3:])
+    inputs = {'dict': (data, data), 'DataFrame': (frame, frame.to_dict('list'))}
+    mismatches = {}
+    for name, (batch, rows) in inputs.items():
+        for season in _SEASONS:
+            expected = _scalar_columns(ft, rows, season, reference_date)
+            columns = _output_columns(season, ft.classify_frame(batch, season, reference_date))
+            mismatches[(name, season)] = _mismatches(expected, columns)
+    return mismatches
+
+
+def _sql_connection(data: dict, dialect: str, table: str):
+    """
+    Function to load a corpus into a table of an in-memory database, with dates as ISO 8601 text and missing values
+    (None, NaN and NaT) as NULL.
+    :return: the DB-API connection
+    """
+    if dialect == 'duckdb':
+        import duckdb
+        connection = duckdb.connect()
+        text, number = 'VARCHAR', 'DOUBLE'
+    else:
+        import sqlite3
+        connection = sqlite3.connect(':memory:')
+        text, number = 'TEXT', 'REAL'
+    fields = bcwft2018.FuelTyping().fldList[3:]
+    types = [number if fld in bcwft2018._NUMBER_FIELDS else text for fld in fields]
+    connection.execute(f"CREATE TABLE {table} ({', '.join(f'{fld} {t}' for fld, t in zip(fields, types))})")
+
+    def sql_value(fld, value):
+        if value is None or value != value:  # NaN != NaN, NaT != NaT
+            return None
+        return value.strftime('%Y-%m-%d') if fld in bcwft2018._DATE_FIELDS else value
+
+    rows = [tuple(sql_value(fld, value) for fld, value in zip(fields, values))
+            for values in zip(*[data[fld] for fld in fields])]
+    connection.executemany(f"INSERT INTO {table} VALUES ({', '.join('?' for _ in fields)})", rows)
+    return connection
+
+
+def _sql_table(data: dict, dialect: str, table: str) -> tuple:
+    """
+    Function to load a corpus into a table of an in-memory database (see _sql_connection), with a key column
+    ordering the stands as in the corpus.
+    :return: a tuple of (the DB-API connection, the key column)
+    """
+    connection = _sql_connection(data, dialect, table)
+    if dialect != 'duckdb':
+        return connection, 'rowid'
+    # DuckDB has a rowid pseudo-column, but its values are not guaranteed to follow the order the stands were
+    # inserted in, so the stands are ordered by an explicit stand index instead
+    connection.execute(f'ALTER TABLE {table} ADD COLUMN stand_id INTEGER')
+    connection.execute('CREATE SEQUENCE stand_ids')
+    connection.execute(f"UPDATE {table} SET stand_id = nextval('stand_ids')")
+    return connection, 'stand_id'
+
+
+def check_sql(data: dict, dialect: str = 'sqlite', reference_date=_REFERENCE_YEAR) -> dict:
+    """
+    Function to check the SQL query of bcwft_sql against the batch engine on the stands of a corpus.
+    :param data: a corpus (see load_corpus)
+    :param dialect: "sqlite" or "duckdb"
+    :param reference_date: the date (or year) harvest and disturbance lags are measured to
+    :return: a dictionary of {season: number of stands with different results}
+    """
+    connection, key = _sql_table(data, dialect, 'corpus')
+    try:
+        return {season: len(bcwft_sql.verify(connection, 'corpus', season, dialect, reference_date, key))
+                for season in _SEASONS}
+    finally:
+        connection.close()
+
+
+def check_sql_baseline(data: dict, baseline: tuple, dialect: str = 'sqlite') -> dict:
+    """
+    Function to check the SQL query of bcwft_sql against the DataFrame baseline results of a corpus.
+    :param data: a corpus (see load_corpus)
+    :param baseline: the baseline results of the corpus (see load_baseline)
+    :param dialect: "sqlite" or "duckdb"
+    :return: a dictionary of {season: number of stands with different results}
+    """
+    referenceYear, results = baseline
+    connection, key = _sql_table(data, dialect, 'corpus')
+    try:
+        mismatches = {}
+        for (name, season), expected in results.items():
+            if name != 'DataFrame':
+                continue
+            query = bcwft_sql.select_sql('corpus', season, dialect, referenceYear, key)
+            rows = connection.execute(f'SELECT * FROM ({query}) AS bcwft ORDER BY {key}').fetchall()
+            mismatches[season] = _mismatches([list(column) for column in zip(*expected)],
+                                             [list(column) for column in zip(*rows)][1:])
+        return mismatches
+    finally:
+        connection.close()
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description='Check the fuel typing engines against each other on a test corpus.')
+    parser.add_argument('--corpus', default=CORPUS_PATH, help='path to the test corpus (default: bcwft_corpus.json)')
+    parser.add_argument('--reference-year', type=int, default=_REFERENCE_YEAR,
+                        help=f'year harvest and disturbance lags are measured to (default: {_REFERENCE_YEAR})')
+    parser.add_argument('--dialects', nargs='*', default=['sqlite', 'duckdb'], choices=['sqlite', 'duckdb'],
+                        help='SQL dialects to check (default: sqlite duckdb)')
+    args = parser.parse_args(argv)
+
+    data = load_corpus(args.corpus)
+    baseline = load_baseline(args.corpus)
+    failed = False
+    for (name, season, engine), count in check_baseline(data, baseline).items():
+        print(f'{engine} ({name}) vs baseline, {season}: {count} mismatches')
+        failed = failed or count > 0
+    for dialect in args.dialects:
+        for season, count in check_sql_baseline(data, baseline, dialect).items():
+            print(f'bcwft_sql ({dialect}) vs baseline (DataFrame), {season}: {count} mismatches')
+            failed = failed or count > 0
+    for (name, season), count in check_batch(data, args.reference_year).items():
+        print(f'classify_frame ({name}) vs getFuelType, {season}: {count} mismatches')
+        failed = failed or count > 0
+    for dialect in args.dialects:
+        for season, count in check_sql(data, dialect, args.reference_year).items():
+            print(f'bcwft_sql ({dialect}) vs classify_frame, {season}: {count} mismatches')
+            failed = failed or count > 0
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))